@@ -3,16 +3,30 @@ r"""Contain functions for ``numpy.ndarray``s."""
 from __future__ import annotations
 
 __all__ = [
+    "QuantileSketch",
+    "SketchCache",
+    "array_key",
     "check_same_shape",
     "check_square_matrix",
     "filter_range",
     "find_range",
+    "get_quantile_sketch",
+    "has_nan",
+    "isnan",
     "multi_isnan",
     "nonnan",
     "rand_replace",
 ]
 
-from analora.array.checking import check_same_shape, check_square_matrix, multi_isnan
+from analora.array.checking import (
+    check_same_shape,
+    check_square_matrix,
+    has_nan,
+    isnan,
+    multi_isnan,
+)
 from analora.array.filtering import filter_range, nonnan
+from analora.array.key import array_key
 from analora.array.random import rand_replace
 from analora.array.range import find_range
+from analora.array.sketch import QuantileSketch, SketchCache, get_quantile_sketch
@@ -2,7 +2,7 @@ r"""Contain functions to check ``numpy.ndarray``s."""
 
 from __future__ import annotations
 
-__all__ = ["check_same_shape", "check_square_matrix", "multi_isnan"]
+__all__ = ["check_same_shape", "check_square_matrix", "has_nan", "isnan", "multi_isnan"]
 
 
 from typing import TYPE_CHECKING
@@ -66,17 +66,131 @@ def check_square_matrix(name: str, array: np.ndarray) -> None:
         raise ValueError(msg)
 
 
-def multi_isnan(arrays: Sequence[np.ndarray]) -> np.ndarray:
+def has_nan(arr: np.ndarray) -> bool:
+    r"""Indicate if an array contains at least one NaN value.
+
+    The check depends on the data type. Boolean, integer and string
+    arrays cannot contain NaN values, so they are not scanned. For
+    floating-point arrays, the sum is computed first because it is NaN
+    if the array contains a NaN value, and it does not need a
+    temporary mask. The sum can also be NaN if the array contains
+    infinite values with opposite signs, so the mask is only computed
+    in this case. Object arrays are checked element-wise.
+
+    Args:
+        arr: The array to check.
+
+    Returns:
+        ``True`` if the array contains at least one NaN value,
+            otherwise ``False``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.array import has_nan
+    >>> has_nan(np.array([1.0, 2.0, float("nan")]))
+    True
+    >>> has_nan(np.array([1.0, 2.0, 3.0]))
+    False
+    >>> has_nan(np.array([1, 2, 3]))
+    False
+
+    ```
+    """
+    kind = arr.dtype.kind
+    if kind in "biuSU":
+        return False
+    if kind in "fc":
+        with np.errstate(invalid="ignore", over="ignore"):
+            if not np.isnan(arr.sum()):
+                return False
+    return bool(isnan(arr).any())
+
+
+def isnan(arr: np.ndarray) -> np.ndarray:
+    r"""Test element-wise for NaN and return result as a boolean array.
+
+    Unlike ``numpy.isnan``, boolean, integer and string arrays are not
+    scanned, and object arrays are supported.
+
+    Args:
+        arr: The input array.
+
+    Returns:
+        A boolean array. ``True`` where the value is NaN,
+            ``False`` otherwise.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.array import isnan
+    >>> isnan(np.array([1.0, float("nan"), 3.0]))
+    array([False,  True, False])
+    >>> isnan(np.array([1, 2, 3]))
+    array([False, False, False])
+    >>> isnan(np.array(["a", float("nan"), 1], dtype=object))
+    array([False,  True, False])
+
+    ```
+    """
+    kind = arr.dtype.kind
+    if kind in "biuSU":
+        return np.zeros(arr.shape, dtype=bool)
+    if kind == "O":
+        # NaN is the only value which is not equal to itself.
+        return _object_isnan(arr).astype(bool)
+    return np.isnan(arr)
+
+
+_object_isnan = np.frompyfunc(lambda x: x != x, 1, 1)  # noqa: PLR0124
+
+
+def multi_isnan(
+    arrays: Sequence[np.ndarray],
+    *,
+    rowwise: bool = False,
+    out: np.ndarray | None = None,
+    chunk_size: int | None = None,
+) -> np.ndarray:
     r"""Test element-wise for NaN for all input arrays and return result
     as a boolean array.
 
+    The arrays without NaN values are not scanned element-wise, see
+    ``has_nan``, and the check does not compute a temporary mask. The
+    result is written in a single output array: the
+    mask of the first array with NaN values is written directly in the
+    output, and the masks of the other arrays use one temporary buffer
+    that is reused for all the arrays. In the rowwise mode, the rows of
+    floating-point arrays are summed first, and only the rows with a
+    NaN sum are scanned element-wise. With ``chunk_size``, the arrays
+    are processed in blocks of rows, so the temporary buffers do not
+    depend on the size of the arrays.
+
     Args:
         arrays: The input arrays to test. All the arrays must have the
-            same shape.
+            same shape, or the same first dimension if ``rowwise`` is
+            ``True``.
+        rowwise: If ``True``, the output has shape ``(n_rows,)`` and
+            is ``True`` where any value of the row is NaN in any
+            array. The 1d arrays are tested element-wise.
+        out: An optional preallocated boolean output array. It must
+            have the shape of the result.
+        chunk_size: The number of rows processed at once. If ``None``,
+            all the rows are processed at once.
 
     Returns:
         A boolean array. ``True`` where any array is NaN,
-            ``False`` otherwise.
+            ``False`` otherwise. It is ``out`` if ``out`` is not
+            ``None``.
+
+    Raises:
+        RuntimeError: if ``arrays`` is empty or if ``out`` has an
+            incorrect shape.
+        ValueError: if ``chunk_size`` is lower than 1.
 
     Example usage:
 
@@ -89,13 +203,133 @@ def multi_isnan(arrays: Sequence[np.ndarray]) -> np.ndarray:
     ... )
     >>> mask
     array([False,  True, False, False,  True])
+    >>> multi_isnan(
+    ...     [np.array([1, 0, float("nan")]), np.array([[1, 2], [float("nan"), 3], [4, 5]])],
+    ...     rowwise=True,
+    ... )
+    array([False,  True,  True])
 
     ```
     """
     if len(arrays) == 0:
         msg = "'arrays' cannot be empty"
         raise RuntimeError(msg)
-    mask = np.isnan(arrays[0])
-    for arr in arrays[1:]:
-        mask = np.logical_or(mask, np.isnan(arr))
+    if chunk_size is not None and chunk_size < 1:
+        msg = f"Incorrect chunk_size: {chunk_size}. chunk_size must be greater than or equal to 1"
+        raise ValueError(msg)
+    shape = arrays[0].shape[:1] if rowwise else arrays[0].shape
+    out = _prepare_output(out, shape)
+
+    arrays = [arr for arr in arrays if _may_have_nan(arr)]
+    if not arrays:
+        return out
+    if out.ndim == 0:
+        out[...] = any(isnan(arr).any() for arr in arrays)
+        return out
+
+    num_rows = shape[0]
+    step = num_rows if chunk_size is None else chunk_size
+    buffer = None
+    for start in range(0, num_rows, max(step, 1)):
+        block = out[start : start + step]
+        for i, arr in enumerate(arrays):
+            values = arr[start : start + step]
+            if rowwise and values.ndim > 1:
+                np.logical_or(block, _rowwise_isnan(values), out=block)
+            elif i == 0:
+                _isnan_into(values, out=block)
+            else:
+                if buffer is None:
+                    buffer = np.empty((min(step, num_rows), *shape[1:]), dtype=bool)
+                mask = buffer[: block.shape[0]]
+                _isnan_into(values, out=mask)
+                np.logical_or(block, mask, out=block)
+    return out
+
+
+def _may_have_nan(arr: np.ndarray) -> bool:
+    r"""Indicate if an array may contain NaN values.
+
+    Unlike ``has_nan``, no mask is computed for floating-point arrays
+    with a NaN sum, so the check does not allocate a temporary array.
+    The result can be a false positive if the array contains infinite
+    values with opposite signs.
+
+    Args:
+        arr: The array to check.
+
+    Returns:
+        ``False`` if the array cannot contain NaN values, otherwise
+            ``True``.
+    """
+    kind = arr.dtype.kind
+    if kind in "biuSU":
+        return False
+    if kind in "fc":
+        with np.errstate(invalid="ignore", over="ignore"):
+            return bool(np.isnan(arr.sum()))
+    return True
+
+
+def _prepare_output(out: np.ndarray | None, shape: tuple[int, ...]) -> np.ndarray:
+    r"""Prepare the boolean output array filled with ``False``.
+
+    Args:
+        out: An optional preallocated output array.
+        shape: The shape of the output array.
+
+    Returns:
+        The output array filled with ``False``.
+
+    Raises:
+        RuntimeError: if ``out`` has an incorrect shape.
+    """
+    if out is None:
+        return np.zeros(shape, dtype=bool)
+    if out.shape != shape:
+        msg = f"'out' has an incorrect shape: {out.shape} (expected: {shape})"
+        raise RuntimeError(msg)
+    out.fill(False)
+    return out
+
+
+def _isnan_into(arr: np.ndarray, out: np.ndarray) -> None:
+    r"""Test element-wise for NaN and write the result in an output
+    array.
+
+    Args:
+        arr: The input array.
+        out: The boolean output array with the same shape as ``arr``.
+    """
+    kind = arr.dtype.kind
+    if kind in "fc":
+        np.isnan(arr, out=out)
+    else:
+        out[...] = isnan(arr)
+
+
+def _rowwise_isnan(arr: np.ndarray) -> np.ndarray:
+    r"""Test for NaN in each row of an array.
+
+    Like in ``has_nan``, the rows of a floating-point array are summed
+    first, and only the rows with a NaN sum are scanned, so the
+    temporary arrays have one value per row.
+
+    Args:
+        arr: The input array of shape ``(n_rows, *)``.
+
+    Returns:
+        A boolean array of shape ``(n_rows,)``. ``True`` where any
+            value of the row is NaN, ``False`` otherwise.
+    """
+    arr = arr.reshape(arr.shape[0], -1)
+    if arr.dtype.kind not in "fc":
+        return isnan(arr).any(axis=1)
+    with np.errstate(invalid="ignore", over="ignore"):
+        mask = np.isnan(arr.sum(axis=1))
+    if mask.any():
+        # The sum is also NaN for rows with infinite values with
+        # opposite signs.
+        rows = np.flatnonzero(mask)
+        mask[rows] = np.isnan(arr[rows]).any(axis=1)
     return mask
@@ -4,20 +4,53 @@ from __future__ import annotations
 
 __all__ = ["filter_range", "nonnan"]
 
+from typing import TYPE_CHECKING
 
 import numpy as np
 
+from analora.array.checking import has_nan
 
-def filter_range(array: np.ndarray, xmin: float, xmax: float) -> np.ndarray:
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def filter_range(
+    array: np.ndarray,
+    xmin: float = float("-inf"),
+    xmax: float = float("inf"),
+    *,
+    mask: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+    chunk_size: int | None = None,
+) -> np.ndarray:
     r"""Filter in the values in a given range.
 
+    The values are compacted in the order of the flattened array.
+    If ``chunk_size`` is set, the comparison masks are computed for
+    ``chunk_size`` values at once, so the temporary arrays do not
+    depend on the size of the input array. The output array can be
+    the flattened input array itself to compact the values in-place.
+
     Args:
         array: The input array.
         xmin: The lower bound of the range.
         xmax: The upper bound of the range.
+        mask: An optional precomputed boolean mask with the same
+            shape as ``array``. If given, a value is kept only if
+            its mask value is ``True`` and it is in the range.
+        out: An optional 1-d array with at least ``array.size``
+            values, where the filtered values are written.
+        chunk_size: The number of values filtered at once.
+            If ``None``, all the values are filtered at once.
 
     Returns:
-        A 1-d array with only the values in the given range.
+        A 1-d array with only the values in the given range. The NaN
+            values are never in the range. If ``out`` is given, the
+            returned array is a view of ``out``.
+
+    Raises:
+        RuntimeError: if ``mask`` or ``out`` has an incorrect shape.
+        ValueError: if ``chunk_size`` is lower than 1.
 
     Example usage:
 
@@ -28,20 +61,71 @@ def filter_range(array: np.ndarray, xmin: float, xmax: float) -> np.ndarray:
     >>> out = filter_range(np.arange(10), xmin=-1, xmax=5)
     >>> out
     array([0, 1, 2, 3, 4, 5])
+    >>> filter_range(np.arange(10), xmin=2, mask=np.arange(10) % 2 == 0)
+    array([2, 4, 6, 8])
+    >>> filter_range(np.array([1.0, float("nan"), 3.0]))
+    array([1., 3.])
+    >>> array = np.arange(10)
+    >>> filter_range(array, xmin=3, xmax=5, out=array, chunk_size=4)
+    array([3, 4, 5])
 
     ```
     """
-    return np.extract(np.logical_and(xmin <= array, array <= xmax), array)
-
-
-def nonnan(array: np.ndarray) -> np.ndarray:
+    # The NaN values are never in the range, so the values are compared
+    # unless the range is unbounded and the array cannot contain NaN.
+    in_range = xmin > float("-inf") or xmax < float("inf") or array.dtype.kind not in "biu"
+    flat_mask = None if mask is None else _check_mask(mask, array)
+
+    def keep(values: np.ndarray, start: int, stop: int) -> np.ndarray | None:
+        if not in_range:
+            return None if flat_mask is None else flat_mask[start:stop]
+        selected = values >= xmin
+        selected &= values <= xmax
+        if flat_mask is not None:
+            selected &= flat_mask[start:stop]
+        return selected
+
+    return _compact(array, keep=keep, out=out, chunk_size=chunk_size)
+
+
+def nonnan(
+    array: np.ndarray,
+    *,
+    nan_mask: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+    chunk_size: int | None = None,
+    copy: bool = True,
+) -> np.ndarray:
     r"""Return the non-NaN values of an array.
 
+    The values are compacted like in ``filter_range``. If the array
+    does not contain NaN values and ``copy`` is ``False``, no copy is
+    made and the flattened array is returned.
+
     Args:
         array: The input array.
+        nan_mask: An optional precomputed boolean mask with the same
+            shape as ``array``, which indicates the NaN values
+            (e.g. computed by ``isnan`` or ``multi_isnan``). The
+            values where the mask is ``True`` are removed.
+        out: An optional 1-d array with at least ``array.size``
+            values, where the non-NaN values are written.
+        chunk_size: The number of values filtered at once.
+            If ``None``, all the values are filtered at once.
+        copy: If ``False`` and the array does not contain NaN values,
+            the returned array can be a view of the input array, so it
+            must not be modified in-place. This argument is ignored if
+            ``nan_mask`` or ``out`` is given.
 
     Returns:
         A 1d array with the non-NaN values of the input array.
+            If ``out`` is given, the returned array is a view of
+            ``out``.
+
+    Raises:
+        RuntimeError: if ``nan_mask`` or ``out`` has an incorrect
+            shape.
+        ValueError: if ``chunk_size`` is lower than 1.
 
     Example usage:
 
@@ -53,8 +137,102 @@ def nonnan(array: np.ndarray) -> np.ndarray:
     array([1., 2., 5., 6.])
     >>> nonnan(np.asarray([[1, 2, float("nan")], [4, 5, 6]]))
     array([1., 2., 4., 5., 6.])
+    >>> array = np.asarray([1.0, 2.0, 3.0])
+    >>> np.shares_memory(nonnan(array, copy=False), array)
+    True
 
     ```
     """
-    mask = np.isnan(array)
-    return array[~mask]
+    if nan_mask is None and out is None and not has_nan(array):
+        return array.ravel() if not copy else array.flatten()
+    flat_mask = None if nan_mask is None else _check_mask(nan_mask, array, name="nan_mask")
+
+    def keep(values: np.ndarray, start: int, stop: int) -> np.ndarray:
+        nan_values = np.isnan(values) if flat_mask is None else flat_mask[start:stop]
+        return np.logical_not(nan_values)
+
+    return _compact(array, keep=keep, out=out, chunk_size=chunk_size)
+
+
+def _check_mask(mask: np.ndarray, array: np.ndarray, name: str = "mask") -> np.ndarray:
+    r"""Check the shape of a mask and flatten it.
+
+    Args:
+        mask: The boolean mask.
+        array: The array associated to the mask.
+        name: The name of the mask argument, used in the error message.
+
+    Returns:
+        The flattened mask.
+
+    Raises:
+        RuntimeError: if the mask and the array have different shapes.
+    """
+    if mask.shape != array.shape:
+        msg = (
+            f"'{name}' has an incorrect shape: {mask.shape}. "
+            f"'{name}' must have the same shape as the array: {array.shape}"
+        )
+        raise RuntimeError(msg)
+    return mask.ravel()
+
+
+def _compact(
+    array: np.ndarray,
+    keep: Callable[[np.ndarray, int, int], np.ndarray | None],
+    out: np.ndarray | None,
+    chunk_size: int | None,
+) -> np.ndarray:
+    r"""Compact the selected values of an array, chunk by chunk.
+
+    The selected values of each chunk are copied before they are
+    written in the output array, and the output position is never
+    after the chunk position, so the output array can be the input
+    array itself.
+
+    Args:
+        array: The input array.
+        keep: A function that takes the values of a chunk, and the
+            start and stop positions of the chunk in the flattened
+            array, and returns the boolean mask of the values to
+            keep, or ``None`` to keep all the values.
+        out: An optional 1-d array where the values are written.
+        chunk_size: The number of values processed at once.
+
+    Returns:
+        A 1-d array with the selected values.
+
+    Raises:
+        RuntimeError: if ``out`` has an incorrect shape.
+        ValueError: if ``chunk_size`` is lower than 1.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        msg = f"Incorrect chunk_size: {chunk_size}. chunk_size must be greater than 0"
+        raise ValueError(msg)
+    array = array.ravel()
+    if out is not None and (out.ndim != 1 or out.size < array.size):
+        msg = (
+            f"'out' has an incorrect shape: {out.shape}. "
+            f"'out' must be a 1d array with at least {array.size:,} values"
+        )
+        raise RuntimeError(msg)
+    if chunk_size is None or chunk_size >= array.size:
+        selected = keep(array, 0, array.size)
+        if out is None:
+            return array.copy() if selected is None else array[selected]
+        values = array if selected is None else array[selected]
+        out[: values.size] = values
+        return out[: values.size]
+
+    if out is None:
+        out = np.empty(array.size, dtype=array.dtype)
+    count = 0
+    for start in range(0, array.size, chunk_size):
+        stop = min(start + chunk_size, array.size)
+        values = array[start:stop]
+        selected = keep(values, start, stop)
+        if selected is not None:
+            values = values[selected]
+        out[count : count + values.size] = values
+        count += values.size
+    return out[:count]
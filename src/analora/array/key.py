@@ -0,0 +1,52 @@
+r"""Contain a function to identify ``numpy.ndarray``s in caches."""
+
+from __future__ import annotations
+
+__all__ = ["array_key"]
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    import numpy as np
+
+
+def array_key(arr: np.ndarray) -> Hashable:
+    r"""Return a key that identifies the content of an array while it
+    is not modified.
+
+    The array is identified by its memory address, shape, strides and
+    data type, so two views of the same data have the same key only if
+    they have the same layout, e.g. a contiguous 1-d array and the
+    output of its ``ravel``. A view with another shape, e.g. the
+    output of ``ravel`` on a 2-d array, has a different key. The key
+    does not depend on the values, so a cache that uses this key must
+    keep a reference to the array, so its memory cannot be reused by
+    another array, and the array must not be modified in-place while
+    it is in the cache.
+
+    Args:
+        arr: The array.
+
+    Returns:
+        The key.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.array import array_key
+    >>> x = np.arange(6)
+    >>> array_key(x) == array_key(x.ravel())
+    True
+    >>> array_key(x) == array_key(x[1:])
+    False
+    >>> y = x.reshape(2, 3)
+    >>> array_key(y) == array_key(y.ravel())
+    False
+
+    ```
+    """
+    return (arr.__array_interface__["data"][0], arr.shape, arr.strides, arr.dtype.str)
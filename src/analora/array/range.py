@@ -6,14 +6,25 @@ __all__ = ["find_range"]
 
 import numpy as np
 
+from analora.array.sketch import get_quantile_sketch
+
 
 def find_range(
     values: np.ndarray,
     xmin: float | str | None = None,
     xmax: float | str | None = None,
+    approximate: bool = False,
 ) -> tuple[float, float]:
     r"""Find a valid range of value.
 
+    In the approximate mode, the minimum, maximum and quantiles are
+    computed with the quantile sketch of the array (see
+    ``QuantileSketch``), so the values are not copied and partitioned.
+    Inside a ``SketchCache`` block, the sketch is computed once for
+    each array, so finding several ranges of the same array does not
+    process the values again. The minimum and maximum values are
+    exact, and the quantiles have a bounded rank error.
+
     Args:
         values: The values used to find the quantiles.
         xmin: The minimum value of the range or its
@@ -22,6 +33,8 @@ def find_range(
         xmax: The maximum value of the range or its
             associated quantile. ``q0.9`` means the 90% quantile.
             ``0`` is the minimum value and ``1`` is the maximum value.
+        approximate: If ``True``, the quantiles are estimated with the
+            quantile sketch of the array.
 
     Returns:
         The range of values in the format ``(min, max)``.
@@ -40,11 +53,15 @@ def find_range(
     (5, 50)
     >>> find_range(data, xmin="q0.1", xmax="q0.9")
     (10.0, 90.0)
+    >>> find_range(data, xmin="q0.1", xmax="q0.9", approximate=True)
+    (10.0, 90.0)
 
     ```
     """
     if values.size == 0:
         return float("nan"), float("nan")
+    if approximate:
+        return _find_range_sketch(values, xmin=xmin, xmax=xmax)
     if xmin is None:
         xmin = np.nanmin(values).item()
     if xmax is None:
@@ -60,3 +77,31 @@ def find_range(
     if isinstance(xmax, np.number):
         xmax = xmax.item()
     return (xmin, xmax)
+
+
+def _find_range_sketch(
+    values: np.ndarray, xmin: float | str | None, xmax: float | str | None
+) -> tuple[float, float]:
+    r"""Find a valid range of value with the quantile sketch of the
+    array.
+
+    Args:
+        values: The values used to find the quantiles.
+        xmin: The minimum value of the range or its associated
+            quantile.
+        xmax: The maximum value of the range or its associated
+            quantile.
+
+    Returns:
+        The range of values in the format ``(min, max)``.
+    """
+    sketch = get_quantile_sketch(values)
+    if xmin is None:
+        xmin = sketch.min
+    elif isinstance(xmin, str):
+        xmin = sketch.quantile(float(xmin[1:]))
+    if xmax is None:
+        xmax = sketch.max
+    elif isinstance(xmax, str):
+        xmax = sketch.quantile(float(xmax[1:]))
+    return (xmin, xmax)
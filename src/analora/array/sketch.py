@@ -0,0 +1,432 @@
+r"""Implement a mergeable quantile sketch for ``numpy.ndarray``s."""
+
+from __future__ import annotations
+
+__all__ = ["QuantileSketch", "SketchCache", "get_quantile_sketch"]
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from analora.array.checking import has_nan
+from analora.array.key import array_key
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Sequence
+    from contextvars import Token
+
+    from typing_extensions import Self
+
+
+class QuantileSketch:
+    r"""Implement a mergeable quantile sketch.
+
+    The sketch summarizes the values with at most ``size`` weighted
+    centroids sorted by value, like a t-digest with centroids of
+    uniform weight. The values are processed in chunks: each chunk is
+    sorted and compressed, then all the centroids are compressed again,
+    so the memory does not depend on the number of values. The
+    minimum and maximum values are exact. Each compression changes the
+    rank of a value by at most about ``count / size``, so the rank
+    error of a quantile is at most about ``2 * count / size`` after
+    an update, plus ``count / size`` for each merge. When the
+    centroids are the values themselves (i.e. at most ``size``
+    values), the quantiles are exact. The NaN values are ignored.
+
+    Args:
+        size: The maximum number of centroids.
+
+    Raises:
+        ValueError: if ``size`` is lower than 2.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.array import QuantileSketch
+    >>> sketch = QuantileSketch(size=100)
+    >>> sketch.update(np.arange(1001))
+    >>> sketch
+    QuantileSketch(count=1,001, size=100, num_centroids=100)
+    >>> sketch.min, sketch.max
+    (0, 1000)
+    >>> sketch.quantile([0.1, 0.5, 0.9])
+    array([ 99.6, 500. , 900.4])
+
+    ```
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        if size < 2:
+            msg = f"Incorrect size: {size}. size must be greater than or equal to 2"
+            raise ValueError(msg)
+        self._size = size
+        self._means = np.array([], dtype=float)
+        self._weights = np.array([], dtype=float)
+        self._count = 0
+        self._min = float("nan")
+        self._max = float("nan")
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(count={self._count:,}, size={self._size:,}, "
+            f"num_centroids={self._means.size:,})"
+        )
+
+    @property
+    def count(self) -> int:
+        r"""The number of non-NaN values in the sketch."""
+        return self._count
+
+    @property
+    def max(self) -> float:
+        r"""The maximum value, or NaN if the sketch is empty."""
+        return self._max
+
+    @property
+    def min(self) -> float:
+        r"""The minimum value, or NaN if the sketch is empty."""
+        return self._min
+
+    @property
+    def size(self) -> int:
+        r"""The maximum number of centroids."""
+        return self._size
+
+    def merge(self, other: QuantileSketch) -> Self:
+        r"""Merge another sketch in the current sketch.
+
+        Args:
+            other: The sketch to merge.
+
+        Returns:
+            The current sketch.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.array import QuantileSketch
+        >>> sketch1, sketch2 = QuantileSketch(), QuantileSketch()
+        >>> sketch1.update(np.array([1, 2, 3]))
+        >>> sketch2.update(np.array([4, 5]))
+        >>> sketch1.merge(sketch2)
+        QuantileSketch(count=5, size=1,024, num_centroids=5)
+        >>> sketch1.quantile(0.5)
+        3.0
+
+        ```
+        """
+        if other.count == 0:
+            return self
+        self._merge_centroids([other._means], [other._weights])
+        self._count += other.count
+        self._update_min_max(other.min, other.max)
+        return self
+
+    def quantile(self, q: float | Sequence[float] | np.ndarray) -> float | np.ndarray:
+        r"""Estimate the quantiles of the values.
+
+        The quantiles are linearly interpolated between the centers of
+        the centroids, and the quantiles ``0`` and ``1`` are the exact
+        minimum and maximum values.
+
+        Args:
+            q: The probability or sequence of probabilities of the
+                quantiles to compute. The values must be in the range
+                ``[0, 1]``.
+
+        Returns:
+            The quantile or the array of quantiles. The quantiles are
+                NaN if the sketch is empty.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.array import QuantileSketch
+        >>> sketch = QuantileSketch()
+        >>> sketch.update(np.arange(101))
+        >>> sketch.quantile(0.1)
+        10.0
+        >>> sketch.quantile([0.0, 0.5, 1.0])
+        array([  0.,  50., 100.])
+
+        ```
+        """
+        q = np.asarray(q, dtype=float)
+        if self._count == 0:
+            out = np.full(q.shape, np.nan)
+        elif np.all(self._weights == 1):
+            # The centroids are the values, so the quantiles are exact.
+            out = np.quantile(self._means, q)
+        else:
+            cum_weights = np.cumsum(self._weights)
+            ranks = np.concatenate([[0.0], cum_weights - self._weights / 2, [cum_weights[-1]]])
+            values = np.concatenate([[self._min], self._means, [self._max]])
+            out = np.interp(q * cum_weights[-1], ranks, values)
+        return out.item() if out.ndim == 0 else out
+
+    def update(self, values: np.ndarray, chunk_size: int = 1_048_576) -> None:
+        r"""Update the sketch with new values.
+
+        Args:
+            values: The new values. The NaN values are ignored.
+            chunk_size: The number of values sorted at once.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.array import QuantileSketch
+        >>> sketch = QuantileSketch()
+        >>> sketch.update(np.array([1, float("nan"), 3]))
+        >>> sketch
+        QuantileSketch(count=2, size=1,024, num_centroids=2)
+
+        ```
+        """
+        values = np.ravel(values)
+        means, weights = [], []
+        for start in range(0, values.size, chunk_size):
+            chunk = values[start : start + chunk_size]
+            if has_nan(chunk):
+                chunk = chunk[~np.isnan(chunk)]
+            if chunk.size == 0:
+                continue
+            chunk = np.sort(chunk)
+            self._count += chunk.size
+            self._update_min_max(chunk[0].item(), chunk[-1].item())
+            mean, weight = _compress(chunk.astype(float), np.ones(chunk.size), self._size)
+            means.append(mean)
+            weights.append(weight)
+        if means:
+            self._merge_centroids(means, weights)
+
+    def _merge_centroids(self, means: list[np.ndarray], weights: list[np.ndarray]) -> None:
+        r"""Merge some centroids with the centroids of the sketch, and
+        compress them.
+
+        Args:
+            means: The means of the centroids to merge.
+            weights: The weights of the centroids to merge.
+        """
+        means = np.concatenate([self._means, *means])
+        weights = np.concatenate([self._weights, *weights])
+        order = np.argsort(means, kind="stable")
+        self._means, self._weights = _compress(means[order], weights[order], self._size)
+
+    def _update_min_max(self, vmin: float, vmax: float) -> None:
+        r"""Update the minimum and maximum values.
+
+        Args:
+            vmin: The minimum of the new values.
+            vmax: The maximum of the new values.
+        """
+        self._min = vmin if np.isnan(self._min) else min(self._min, vmin)
+        self._max = vmax if np.isnan(self._max) else max(self._max, vmax)
+
+
+class SketchCache:
+    r"""Implement a cache for the quantile sketches of the arrays.
+
+    While the cache is active, i.e. inside a ``with`` block,
+    ``get_quantile_sketch`` computes the sketch of each array once, so
+    the functions that need the quantiles of the same array, e.g.
+    ``find_range`` and the plotting functions, do not process the
+    values again. The arrays are identified by ``array_key``, and they
+    must not be modified in-place while the cache is active. The
+    cache is cleared when the ``with`` block exits. Outside a ``with``
+    block, no sketch is cached.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.array import SketchCache, find_range
+    >>> values = np.arange(1001)
+    >>> with SketchCache() as cache:
+    ...     find_range(values, xmin="q0.1", xmax="q0.9", approximate=True)
+    ...     find_range(values, xmin="q0.2", xmax="q0.8", approximate=True)
+    ...     cache
+    ...
+    (100.0, 900.0)
+    (200.0, 800.0)
+    SketchCache(num_sketches=1)
+
+    ```
+    """
+
+    def __init__(self) -> None:
+        # Each entry keeps a reference to the array so its memory cannot
+        # be reused by another array while the sketch is in the cache.
+        self._sketches: dict[Hashable, tuple[np.ndarray, QuantileSketch]] = {}
+        self._tokens: list[Token[SketchCache | None]] = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(num_sketches={len(self._sketches):,})"
+
+    def __enter__(self) -> Self:
+        self._tokens.append(_ACTIVE_SKETCH_CACHE.set(self))
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        _ACTIVE_SKETCH_CACHE.reset(self._tokens.pop())
+        if not self._tokens:
+            self.clear()
+
+    @classmethod
+    def current_or_new(cls) -> SketchCache:
+        r"""Return the active cache, or a new cache if no cache is
+        active.
+
+        This is used to share the sketches inside a function, e.g. a
+        plotting function, without discarding the sketches of an
+        active cache.
+
+        Returns:
+            The active cache or a new cache.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from analora.array import SketchCache
+        >>> with SketchCache() as cache:
+        ...     SketchCache.current_or_new() is cache
+        ...
+        True
+        >>> SketchCache.current_or_new() is cache
+        False
+
+        ```
+        """
+        cache = _ACTIVE_SKETCH_CACHE.get()
+        return cls() if cache is None else cache
+
+    def clear(self) -> None:
+        r"""Clear the cache.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.array import SketchCache
+        >>> cache = SketchCache()
+        >>> sketch = cache.get_sketch(np.arange(10))
+        >>> cache.clear()
+        >>> cache
+        SketchCache(num_sketches=0)
+
+        ```
+        """
+        self._sketches.clear()
+
+    def get_sketch(self, values: np.ndarray) -> QuantileSketch:
+        r"""Return the cached sketch of an array, or compute it if it is
+        not in the cache.
+
+        Args:
+            values: The array of values.
+
+        Returns:
+            The quantile sketch of the array. The returned sketch must
+                not be updated.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.array import SketchCache
+        >>> cache = SketchCache()
+        >>> values = np.arange(101)
+        >>> cache.get_sketch(values) is cache.get_sketch(values)
+        True
+
+        ```
+        """
+        key = array_key(values)
+        if key not in self._sketches:
+            sketch = QuantileSketch()
+            sketch.update(values)
+            self._sketches[key] = (values, sketch)
+        return self._sketches[key][1]
+
+
+_ACTIVE_SKETCH_CACHE: ContextVar[SketchCache | None] = ContextVar(
+    "analora_sketch_cache", default=None
+)
+
+
+def get_quantile_sketch(values: np.ndarray) -> QuantileSketch:
+    r"""Return the quantile sketch of an array.
+
+    If a ``SketchCache`` is active, the sketch is computed once per
+    array while the cache is active. Otherwise, a new sketch is
+    computed at each call.
+
+    Args:
+        values: The array of values.
+
+    Returns:
+        The quantile sketch of the array. The returned sketch must
+            not be updated.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.array import SketchCache, get_quantile_sketch
+    >>> values = np.arange(101)
+    >>> sketch = get_quantile_sketch(values)
+    >>> sketch
+    QuantileSketch(count=101, size=1,024, num_centroids=101)
+    >>> get_quantile_sketch(values) is sketch
+    False
+    >>> with SketchCache():
+    ...     get_quantile_sketch(values) is get_quantile_sketch(values)
+    ...
+    True
+
+    ```
+    """
+    cache = _ACTIVE_SKETCH_CACHE.get()
+    if cache is not None:
+        return cache.get_sketch(values)
+    sketch = QuantileSketch()
+    sketch.update(values)
+    return sketch
+
+
+def _compress(values: np.ndarray, weights: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray]:
+    r"""Compress sorted weighted values to at most ``size`` centroids.
+
+    The values are grouped by their cumulative weight, so each
+    centroid has a weight of about ``total_weight / size``.
+
+    Args:
+        values: The sorted values.
+        weights: The weights of the values.
+        size: The maximum number of centroids.
+
+    Returns:
+        A tuple with the means and the weights of the centroids.
+    """
+    if values.size <= size:
+        return values, weights
+    start_weights = np.cumsum(weights) - weights
+    groups = np.minimum((start_weights * (size / (start_weights[-1] + weights[-1]))), size - 1)
+    groups = groups.astype(np.intp)
+    group_weights = np.bincount(groups, weights=weights, minlength=size)
+    group_sums = np.bincount(groups, weights=weights * values, minlength=size)
+    nonempty = group_weights > 0
+    return group_sums[nonempty] / group_weights[nonempty], group_weights[nonempty]
@@ -7,13 +7,17 @@ __all__ = ["AccuracyEvaluator"]
 
 from analora.evaluator.state import BaseStateEvaluator
 from analora.metric import accuracy
+from analora.metric.classification.accuracy import accuracy_from_counts
 from analora.state import AccuracyState
-from analora.utils.imports import check_sklearn
 
 
 class AccuracyEvaluator(BaseStateEvaluator[AccuracyState]):
     r"""Implement the accuracy evaluator.
 
+    The accuracy is computed from the per-class counts of the state
+    (see ``AccuracyState.class_counts``), which are shared with the
+    other evaluators that use the same state.
+
     Args:
         state: The state containing the ground truth and predicted
             labels.
@@ -43,13 +47,17 @@ class AccuracyEvaluator(BaseStateEvaluator[AccuracyState]):
     ```
     """
 
-    def __init__(self, state: AccuracyState) -> None:
-        super().__init__(state)
-        check_sklearn()
-
     def _evaluate(self) -> dict[str, float]:
-        return accuracy(
-            y_true=self._state.y_true,
-            y_pred=self._state.y_pred,
-            nan_policy=self._state.nan_policy,
-        )
+        counts = self._state.class_counts
+        if counts is None:
+            # The labels contain NaN values, so the NaN policy is
+            # applied by the metric function, which requires sklearn.
+            return accuracy(
+                y_true=self._state.y_true,
+                y_pred=self._state.y_pred,
+                nan_policy=self._state.nan_policy,
+            )
+        count, correct = (int(x.sum()) for x in counts)
+        if count == 0:
+            correct = float("nan")
+        return accuracy_from_counts(count=count, correct=correct)
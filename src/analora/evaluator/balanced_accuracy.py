@@ -5,14 +5,19 @@ from __future__ import annotations
 __all__ = ["BalancedAccuracyEvaluator"]
 
 
+import numpy as np
+
 from analora.evaluator.state import BaseStateEvaluator
 from analora.metric import balanced_accuracy
 from analora.state import AccuracyState
-from analora.utils.imports import check_sklearn
 
 
 class BalancedAccuracyEvaluator(BaseStateEvaluator[AccuracyState]):
-    r"""Implement the accuracy evaluator.
+    r"""Implement the balanced accuracy evaluator.
+
+    The balanced accuracy is computed from the per-class counts of the
+    state (see ``AccuracyState.class_counts``), which are shared with
+    the other evaluators that use the same state.
 
     Args:
         state: The state containing the ground truth and predicted
@@ -43,13 +48,16 @@ class BalancedAccuracyEvaluator(BaseStateEvaluator[AccuracyState]):
     ```
     """
 
-    def __init__(self, state: AccuracyState) -> None:
-        super().__init__(state)
-        check_sklearn()
-
     def _evaluate(self) -> dict[str, float]:
-        return balanced_accuracy(
-            y_true=self._state.y_true,
-            y_pred=self._state.y_pred,
-            nan_policy=self._state.nan_policy,
-        )
+        counts = self._state.class_counts
+        if counts is None or counts[0].size == 0:
+            return balanced_accuracy(
+                y_true=self._state.y_true,
+                y_pred=self._state.y_pred,
+                nan_policy=self._state.nan_policy,
+            )
+        support, correct = counts
+        return {
+            "balanced_accuracy": float(np.mean(correct / support)),
+            "count": int(support.sum()),
+        }
@@ -3,9 +3,12 @@ r"""Contain functions to compute metrics."""
 from __future__ import annotations
 
 __all__ = [
+    "RankedScores",
+    "ReferenceDistribution",
     "accuracy",
     "average_precision",
     "balanced_accuracy",
+    "batched_divergences",
     "binary_average_precision",
     "binary_confusion_matrix",
     "binary_fbeta_score",
@@ -14,6 +17,7 @@ __all__ = [
     "binary_recall",
     "binary_roc_auc",
     "binary_top_k_accuracy",
+    "classification_report",
     "confusion_matrix",
     "energy_distance",
     "fbeta_score",
@@ -43,6 +47,8 @@ __all__ = [
     "multilabel_roc_auc",
     "ndcg",
     "pearsonr",
+    "pearsonr_matrix",
+    "per_class_counts",
     "precision",
     "r2_score",
     "recall",
@@ -50,6 +56,7 @@ __all__ = [
     "roc_auc",
     "root_mean_squared_error",
     "spearmanr",
+    "spearmanr_matrix",
     "top_k_accuracy",
     "wasserstein_distance",
 ]
@@ -62,7 +69,10 @@ from analora.metric.classification.ap import (
     multiclass_average_precision,
     multilabel_average_precision,
 )
-from analora.metric.classification.balanced_accuracy import balanced_accuracy
+from analora.metric.classification.balanced_accuracy import (
+    balanced_accuracy,
+    per_class_counts,
+)
 from analora.metric.classification.confmat import (
     binary_confusion_matrix,
     confusion_matrix,
@@ -88,12 +98,14 @@ from analora.metric.classification.precision import (
     multilabel_precision,
     precision,
 )
+from analora.metric.classification.ranking import RankedScores
 from analora.metric.classification.recall import (
     binary_recall,
     multiclass_recall,
     multilabel_recall,
     recall,
 )
+from analora.metric.classification.report import classification_report
 from analora.metric.classification.roc_auc import (
     binary_roc_auc,
     multiclass_roc_auc,
@@ -105,11 +117,14 @@ from analora.metric.classification.topk_accuracy import (
     multiclass_top_k_accuracy,
     top_k_accuracy,
 )
+from analora.metric.correlation.matrix import pearsonr_matrix, spearmanr_matrix
 from analora.metric.correlation.pearson import pearsonr
 from analora.metric.correlation.spearman import spearmanr
+from analora.metric.distribution.divergence import batched_divergences
 from analora.metric.distribution.energy import energy_distance
 from analora.metric.distribution.jensen_shannon import jensen_shannon_divergence
 from analora.metric.distribution.kl import kl_div
+from analora.metric.distribution.reference import ReferenceDistribution
 from analora.metric.distribution.wasserstein import wasserstein_distance
 from analora.metric.regression.abs_error import (
     mean_absolute_error,
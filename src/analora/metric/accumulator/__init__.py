@@ -0,0 +1,17 @@
+r"""Contain accumulators to compute metrics on batches of data."""
+
+from __future__ import annotations
+
+__all__ = [
+    "AccuracyAccumulator",
+    "BaseAccumulator",
+    "ConfusionMatrixAccumulator",
+    "RegressionAccumulator",
+    "TopKAccuracyAccumulator",
+]
+
+from analora.metric.accumulator.accuracy import AccuracyAccumulator
+from analora.metric.accumulator.base import BaseAccumulator
+from analora.metric.accumulator.confmat import ConfusionMatrixAccumulator
+from analora.metric.accumulator.regression import RegressionAccumulator
+from analora.metric.accumulator.topk import TopKAccuracyAccumulator
@@ -0,0 +1,133 @@
+r"""Implement an accumulator to compute the accuracy metrics on
+batches of data."""
+
+from __future__ import annotations
+
+__all__ = ["AccuracyAccumulator"]
+
+from typing import Any
+
+import numpy as np
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+from analora.metric.accumulator.base import (
+    BaseAccumulator,
+    check_same_accumulator,
+    check_same_config,
+)
+from analora.metric.utils import check_nan_policy, contains_nan, preprocess_pred
+
+
+class AccuracyAccumulator(BaseAccumulator):
+    r"""Implement an accumulator to compute the accuracy metrics on
+    batches of data.
+
+    The accumulator only keeps the number of samples and the number of
+    correct predictions. The output of ``compute`` has the same keys
+    as ``analora.metric.accuracy``.
+
+    Args:
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.accumulator import AccuracyAccumulator
+    >>> accumulator = AccuracyAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    >>> accumulator.update(y_true=np.array([1, 1]), y_pred=np.array([1, 1]))
+    >>> accumulator
+    AccuracyAccumulator(count=5, count_correct=4, nan_policy='propagate')
+    >>> accumulator.compute()
+    {'accuracy': 0.8, 'count_correct': 4, 'count_incorrect': 1, 'count': 5, 'error': 0.19999999999999996}
+
+    ```
+    """
+
+    def __init__(self, nan_policy: str = "propagate") -> None:
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+        self.reset()
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "count": self._count,
+                "count_correct": self._correct,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    def compute(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
+        count = self._count
+        acc, correct = float("nan"), float("nan")
+        if not self._nan:
+            correct = self._correct
+            if count > 0:
+                acc = float(correct / count)
+        return {
+            f"{prefix}accuracy{suffix}": acc,
+            f"{prefix}count_correct{suffix}": correct,
+            f"{prefix}count_incorrect{suffix}": count - correct,
+            f"{prefix}count{suffix}": count,
+            f"{prefix}error{suffix}": 1.0 - acc,
+        }
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return objects_are_equal(self._get_stats(), other._get_stats(), equal_nan=equal_nan)
+
+    def merge(self, other: AccuracyAccumulator) -> None:
+        check_same_accumulator(self, other)
+        check_same_config(self._get_config(), other._get_config())
+        self._count += other._count
+        self._correct += other._correct
+        self._nan = self._nan or other._nan
+
+    def reset(self) -> None:
+        self._count = 0
+        self._correct = 0
+        self._nan = False
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        y_true, y_pred = preprocess_pred(
+            y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=self._nan_policy == "omit"
+        )
+        y_true_nan = contains_nan(arr=y_true, nan_policy=self._nan_policy, name="'y_true'")
+        y_pred_nan = contains_nan(arr=y_pred, nan_policy=self._nan_policy, name="'y_pred'")
+        self._count += y_true.size
+        if y_true_nan or y_pred_nan:
+            self._nan = True
+            return
+        self._correct += int(np.count_nonzero(y_true == y_pred))
+
+    def _get_config(self) -> dict[str, Any]:
+        r"""Return the configuration of the accumulator.
+
+        Returns:
+            The configuration.
+        """
+        return {"nan_policy": self._nan_policy}
+
+    def _get_stats(self) -> dict[str, Any]:
+        r"""Return the accumulated statistics and the configuration.
+
+        Returns:
+            The accumulated statistics and the configuration.
+        """
+        return {
+            "count": self._count,
+            "correct": self._correct,
+            "nan": self._nan,
+        } | self._get_config()
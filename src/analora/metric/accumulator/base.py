@@ -0,0 +1,217 @@
+r"""Contain the base class to implement a metric accumulator."""
+
+from __future__ import annotations
+
+__all__ = ["BaseAccumulator", "check_same_accumulator", "check_same_config"]
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from coola import objects_are_equal
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class BaseAccumulator(ABC):
+    r"""Define the base class to implement a metric accumulator.
+
+    An accumulator computes metrics on data that arrive in batches.
+    It only keeps constant-size sufficient statistics, so the full
+    arrays never need to be in memory. The partial states computed in
+    different processes can be merged before computing the metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.accumulator import AccuracyAccumulator
+    >>> accumulator = AccuracyAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    >>> accumulator.update(y_true=np.array([1, 1]), y_pred=np.array([1, 1]))
+    >>> accumulator.compute()
+    {'accuracy': 0.8, 'count_correct': 4, 'count_incorrect': 1, 'count': 5, 'error': 0.19999999999999996}
+
+    ```
+    """
+
+    @abstractmethod
+    def compute(self, prefix: str = "", suffix: str = "") -> dict:
+        r"""Compute the metrics from the accumulated statistics.
+
+        Args:
+            prefix: The key prefix in the returned dictionary.
+            suffix: The key suffix in the returned dictionary.
+
+        Returns:
+            The metrics.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.accumulator import AccuracyAccumulator
+        >>> accumulator = AccuracyAccumulator()
+        >>> accumulator.update(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+        >>> accumulator.compute()
+        {'accuracy': 1.0, 'count_correct': 5, 'count_incorrect': 0, 'count': 5, 'error': 0.0}
+
+        ```
+        """
+
+    @abstractmethod
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        r"""Indicate if two accumulators are equal or not.
+
+        Args:
+            other: The other accumulator to compare.
+            equal_nan: Whether to compare NaN's as equal. If ``True``,
+                NaN's in both objects will be considered equal.
+
+        Returns:
+            ``True`` if the two accumulators are equal, otherwise
+                ``False``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.accumulator import AccuracyAccumulator
+        >>> accumulator1 = AccuracyAccumulator()
+        >>> accumulator1.update(y_true=np.array([1, 0]), y_pred=np.array([1, 0]))
+        >>> accumulator2 = AccuracyAccumulator()
+        >>> accumulator2.update(y_true=np.array([1, 0]), y_pred=np.array([1, 0]))
+        >>> accumulator1.equal(accumulator2)
+        True
+        >>> accumulator1.equal(AccuracyAccumulator())
+        False
+
+        ```
+        """
+
+    @abstractmethod
+    def merge(self, other: Any) -> None:
+        r"""Merge the statistics of another accumulator into the
+        current accumulator.
+
+        Args:
+            other: The other accumulator to merge. It must be of the
+                same type and have the same configuration.
+
+        Raises:
+            TypeError: if the other accumulator has a different type.
+            ValueError: if the other accumulator has a different
+                configuration.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.accumulator import AccuracyAccumulator
+        >>> accumulator1 = AccuracyAccumulator()
+        >>> accumulator1.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+        >>> accumulator2 = AccuracyAccumulator()
+        >>> accumulator2.update(y_true=np.array([1, 1]), y_pred=np.array([1, 1]))
+        >>> accumulator1.merge(accumulator2)
+        >>> accumulator1.compute()
+        {'accuracy': 0.8, 'count_correct': 4, 'count_incorrect': 1, 'count': 5, 'error': 0.19999999999999996}
+
+        ```
+        """
+
+    @abstractmethod
+    def reset(self) -> None:
+        r"""Reset the accumulated statistics.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.accumulator import AccuracyAccumulator
+        >>> accumulator = AccuracyAccumulator()
+        >>> accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+        >>> accumulator.reset()
+        >>> accumulator.compute()
+        {'accuracy': nan, 'count_correct': 0, 'count_incorrect': 0, 'count': 0, 'error': nan}
+
+        ```
+        """
+
+    @abstractmethod
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        r"""Update the statistics with a new batch of data.
+
+        Args:
+            y_true: The ground truth target labels or values.
+            y_pred: The predicted labels, values or scores.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.accumulator import AccuracyAccumulator
+        >>> accumulator = AccuracyAccumulator()
+        >>> accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+        >>> accumulator
+        AccuracyAccumulator(count=3, count_correct=2, nan_policy='propagate')
+
+        ```
+        """
+
+
+def check_same_accumulator(accumulator: BaseAccumulator, other: Any) -> None:
+    r"""Check the other object is an accumulator of the same type.
+
+    Args:
+        accumulator: The reference accumulator.
+        other: The object to check.
+
+    Raises:
+        TypeError: if the other object has a different type.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from analora.metric.accumulator import AccuracyAccumulator
+    >>> from analora.metric.accumulator.base import check_same_accumulator
+    >>> check_same_accumulator(AccuracyAccumulator(), AccuracyAccumulator())
+
+    ```
+    """
+    if not isinstance(other, accumulator.__class__):
+        msg = (
+            f"Incorrect accumulator type: {type(other).__qualname__} "
+            f"(expected: {accumulator.__class__.__qualname__})"
+        )
+        raise TypeError(msg)
+
+
+def check_same_config(config: dict[str, Any], other: dict[str, Any]) -> None:
+    r"""Check two accumulator configurations are equal.
+
+    Args:
+        config: The reference configuration.
+        other: The configuration to check.
+
+    Raises:
+        ValueError: if the configurations are different.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from analora.metric.accumulator.base import check_same_config
+    >>> check_same_config({"nan_policy": "omit"}, {"nan_policy": "omit"})
+
+    ```
+    """
+    if not objects_are_equal(config, other):
+        msg = f"Cannot merge accumulators with different configurations: {config} vs {other}"
+        raise ValueError(msg)
@@ -0,0 +1,225 @@
+r"""Implement an accumulator to compute the confusion matrix derived
+metrics on batches of data."""
+
+from __future__ import annotations
+
+__all__ = ["ConfusionMatrixAccumulator"]
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+from analora.metric.accumulator.base import (
+    BaseAccumulator,
+    check_same_accumulator,
+    check_same_config,
+)
+from analora.metric.classification.stats import (
+    multiclass_confmat,
+    multiclass_fbeta_from_confmat,
+    multiclass_jaccard_from_confmat,
+    multiclass_precision_from_confmat,
+    multiclass_recall_from_confmat,
+)
+from analora.metric.utils import check_nan_policy, contains_nan, preprocess_pred
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class ConfusionMatrixAccumulator(BaseAccumulator):
+    r"""Implement an accumulator to compute the confusion matrix derived
+    metrics on batches of data.
+
+    The accumulator only keeps the multiclass confusion matrix and the
+    labels of its rows and columns. The output of ``compute`` has the
+    same keys as ``analora.metric.classification_report``.
+
+    Args:
+        betas: The betas used to compute the F-beta scores.
+        num_classes: The number of classes, if known. If set, the
+            labels must be integers in ``{0, ..., num_classes-1}``
+            and the confusion matrix has a fixed size. Otherwise, the
+            labels are discovered and the confusion matrix grows when
+            a new label is found.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.accumulator import ConfusionMatrixAccumulator
+    >>> accumulator = ConfusionMatrixAccumulator()
+    >>> accumulator.update(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 0, 1]))
+    >>> accumulator.update(y_true=np.array([1, 2, 2]), y_pred=np.array([1, 1, 1]))
+    >>> accumulator
+    ConfusionMatrixAccumulator(count=6, num_classes=3, betas=(1,), nan_policy='propagate')
+    >>> accumulator.confmat
+    array([[2, 0, 0],
+           [0, 2, 0],
+           [0, 2, 0]])
+    >>> accumulator.compute()
+    {'count': 6,
+     'macro_precision': 0.5,
+     'micro_precision': 0.666...,
+     'precision': array([1. , 0.5, 0. ]),
+     'weighted_precision': 0.5,
+     'macro_recall': 0.666...,
+     'micro_recall': 0.666...,
+     'recall': array([1., 1., 0.]),
+     'weighted_recall': 0.666...,
+     'f1': array([1.        , 0.66666667, 0.        ]),
+     'macro_f1': 0.555...,
+     'micro_f1': 0.666...,
+     'weighted_f1': 0.555...,
+     'jaccard': array([1. , 0.5, 0. ]),
+     'macro_jaccard': 0.5,
+     'micro_jaccard': 0.5,
+     'weighted_jaccard': 0.5}
+
+    ```
+    """
+
+    def __init__(
+        self,
+        betas: Sequence[float] = (1,),
+        num_classes: int | None = None,
+        nan_policy: str = "propagate",
+    ) -> None:
+        check_nan_policy(nan_policy)
+        self._betas = tuple(betas)
+        self._num_classes = num_classes
+        self._nan_policy = nan_policy
+        self.reset()
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "count": self._count,
+                "num_classes": self._labels.size,
+                "betas": self._betas,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def confmat(self) -> np.ndarray:
+        r"""The accumulated confusion matrix of shape
+        ``(num_classes, num_classes)``."""
+        return self._confmat
+
+    @property
+    def labels(self) -> np.ndarray:
+        r"""The labels associated to the rows and columns of the
+        confusion matrix."""
+        return self._labels
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    def compute(self, prefix: str = "", suffix: str = "") -> dict[str, float | np.ndarray]:
+        confmat = self._confmat
+        if self._count == 0 or self._nan:
+            confmat = np.zeros((0, 0), dtype=np.int64)
+        return (
+            {f"{prefix}count{suffix}": self._count}
+            | multiclass_precision_from_confmat(confmat, prefix=prefix, suffix=suffix)
+            | multiclass_recall_from_confmat(confmat, prefix=prefix, suffix=suffix)
+            | multiclass_fbeta_from_confmat(
+                confmat, betas=self._betas, prefix=prefix, suffix=suffix
+            )
+            | multiclass_jaccard_from_confmat(confmat, prefix=prefix, suffix=suffix)
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return objects_are_equal(self._get_stats(), other._get_stats(), equal_nan=equal_nan)
+
+    def merge(self, other: ConfusionMatrixAccumulator) -> None:
+        check_same_accumulator(self, other)
+        check_same_config(self._get_config(), other._get_config())
+        self._count += other._count
+        self._nan = self._nan or other._nan
+        self._add_confmat(labels=other._labels, confmat=other._confmat)
+
+    def reset(self) -> None:
+        self._count = 0
+        self._nan = False
+        num_classes = self._num_classes or 0
+        self._labels = np.arange(num_classes)
+        self._confmat = np.zeros((num_classes, num_classes), dtype=np.int64)
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        y_true, y_pred = preprocess_pred(
+            y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=self._nan_policy == "omit"
+        )
+        y_true_nan = contains_nan(arr=y_true, nan_policy=self._nan_policy, name="'y_true'")
+        y_pred_nan = contains_nan(arr=y_pred, nan_policy=self._nan_policy, name="'y_pred'")
+        self._count += y_true.size
+        if y_true_nan or y_pred_nan or y_true.size == 0:
+            self._nan = self._nan or y_true_nan or y_pred_nan
+            return
+        if self._num_classes is not None:
+            self._confmat += multiclass_confmat(
+                y_true=y_true, y_pred=y_pred, num_classes=self._num_classes
+            )
+            return
+        labels, inverse = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+        n = labels.size
+        indices = inverse[: y_true.size] * n + inverse[y_true.size :]
+        confmat = np.bincount(indices, minlength=n * n).astype(np.int64).reshape(n, n)
+        self._add_confmat(labels=labels, confmat=confmat)
+
+    def _add_confmat(self, labels: np.ndarray, confmat: np.ndarray) -> None:
+        r"""Add a confusion matrix to the accumulated confusion matrix.
+
+        The accumulated confusion matrix is extended if ``labels``
+        contains new labels.
+
+        Args:
+            labels: The labels associated to the rows and columns of
+                the confusion matrix to add.
+            confmat: The confusion matrix to add.
+        """
+        if np.array_equal(labels, self._labels):
+            self._confmat += confmat
+            return
+        all_labels = np.union1d(self._labels, labels) if self._labels.size else labels
+        out = np.zeros((all_labels.size, all_labels.size), dtype=np.int64)
+        for lbls, cm in [(self._labels, self._confmat), (labels, confmat)]:
+            indices = np.searchsorted(all_labels, lbls)
+            out[np.ix_(indices, indices)] += cm
+        self._labels, self._confmat = all_labels, out
+
+    def _get_config(self) -> dict[str, Any]:
+        r"""Return the configuration of the accumulator.
+
+        Returns:
+            The configuration.
+        """
+        return {
+            "betas": self._betas,
+            "num_classes": self._num_classes,
+            "nan_policy": self._nan_policy,
+        }
+
+    def _get_stats(self) -> dict[str, Any]:
+        r"""Return the accumulated statistics and the configuration.
+
+        Returns:
+            The accumulated statistics and the configuration.
+        """
+        return {
+            "count": self._count,
+            "confmat": self._confmat,
+            "labels": self._labels,
+            "nan": self._nan,
+        } | self._get_config()
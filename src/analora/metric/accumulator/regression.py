@@ -0,0 +1,191 @@
+r"""Implement an accumulator to compute the regression error metrics on
+batches of data."""
+
+from __future__ import annotations
+
+__all__ = ["RegressionAccumulator"]
+
+import math
+from typing import Any
+
+import numpy as np
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+from analora.metric.accumulator.base import (
+    BaseAccumulator,
+    check_same_accumulator,
+    check_same_config,
+)
+from analora.metric.regression.r2 import r2_score_from_sums
+from analora.metric.utils import check_nan_policy, contains_nan, preprocess_pred
+
+
+class RegressionAccumulator(BaseAccumulator):
+    r"""Implement an accumulator to compute the regression error metrics
+    on batches of data.
+
+    The accumulator keeps the sums of absolute and squared errors, and
+    the mean and the sum of squared deviations of the targets. The
+    latter are merged with the parallel algorithm of Chan et al., which
+    is numerically stable. The output of ``compute`` has the same keys
+    as ``analora.metric.mean_absolute_error``,
+    ``analora.metric.mean_squared_error``,
+    ``analora.metric.root_mean_squared_error``, and
+    ``analora.metric.r2_score``.
+
+    Args:
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.accumulator import RegressionAccumulator
+    >>> accumulator = RegressionAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 4]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([3, 5]))
+    >>> accumulator
+    RegressionAccumulator(count=5, nan_policy='propagate')
+    >>> accumulator.compute()
+    {'count': 5,
+     'mean_absolute_error': 0.4,
+     'mean_squared_error': 0.4,
+     'root_mean_squared_error': 0.632...,
+     'r2_score': 0.8}
+
+    ```
+    """
+
+    def __init__(self, nan_policy: str = "propagate") -> None:
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+        self.reset()
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line({"count": self._count, "nan_policy": self._nan_policy})
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    def compute(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
+        count = self._count
+        mae, mse, rmse, r2 = float("nan"), float("nan"), float("nan"), float("nan")
+        if count > 0 and not self._nan:
+            mae = self._sum_abs_error / count
+            mse = self._sum_sq_error / count
+            rmse = math.sqrt(mse)
+            if count > 1:
+                r2 = r2_score_from_sums(
+                    sum_sq_error=self._sum_sq_error, sum_sq_dev=self._sum_sq_dev
+                )
+        return {
+            f"{prefix}count{suffix}": count,
+            f"{prefix}mean_absolute_error{suffix}": mae,
+            f"{prefix}mean_squared_error{suffix}": mse,
+            f"{prefix}root_mean_squared_error{suffix}": rmse,
+            f"{prefix}r2_score{suffix}": r2,
+        }
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return objects_are_equal(self._get_stats(), other._get_stats(), equal_nan=equal_nan)
+
+    def merge(self, other: RegressionAccumulator) -> None:
+        check_same_accumulator(self, other)
+        check_same_config(self._get_config(), other._get_config())
+        self._nan = self._nan or other._nan
+        self._add_stats(
+            count=other._count,
+            sum_abs_error=other._sum_abs_error,
+            sum_sq_error=other._sum_sq_error,
+            mean=other._mean,
+            sum_sq_dev=other._sum_sq_dev,
+        )
+
+    def reset(self) -> None:
+        self._count = 0
+        self._sum_abs_error = 0.0
+        self._sum_sq_error = 0.0
+        self._mean = 0.0
+        self._sum_sq_dev = 0.0
+        self._nan = False
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        y_true, y_pred = preprocess_pred(
+            y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=self._nan_policy == "omit"
+        )
+        y_true_nan = contains_nan(arr=y_true, nan_policy=self._nan_policy, name="'y_true'")
+        y_pred_nan = contains_nan(arr=y_pred, nan_policy=self._nan_policy, name="'y_pred'")
+        if y_true_nan or y_pred_nan or y_true.size == 0:
+            self._count += y_true.size
+            self._nan = self._nan or y_true_nan or y_pred_nan
+            return
+        y_true = y_true.astype(np.float64, copy=False)
+        error = y_true - y_pred
+        mean = float(y_true.mean())
+        self._add_stats(
+            count=y_true.size,
+            sum_abs_error=float(np.abs(error).sum()),
+            sum_sq_error=float(np.dot(error, error)),
+            mean=mean,
+            sum_sq_dev=float(np.square(y_true - mean).sum()),
+        )
+
+    def _add_stats(
+        self,
+        *,
+        count: int,
+        sum_abs_error: float,
+        sum_sq_error: float,
+        mean: float,
+        sum_sq_dev: float,
+    ) -> None:
+        r"""Add the statistics of a batch to the accumulated statistics.
+
+        Args:
+            count: The number of samples in the batch.
+            sum_abs_error: The sum of absolute errors in the batch.
+            sum_sq_error: The sum of squared errors in the batch.
+            mean: The mean of the targets in the batch.
+            sum_sq_dev: The sum of squared deviations from the mean of
+                the targets in the batch.
+        """
+        if count == 0:
+            return
+        total = self._count + count
+        delta = mean - self._mean
+        self._sum_sq_dev += sum_sq_dev + delta * delta * self._count * count / total
+        self._mean += delta * count / total
+        self._sum_abs_error += sum_abs_error
+        self._sum_sq_error += sum_sq_error
+        self._count = total
+
+    def _get_config(self) -> dict[str, Any]:
+        r"""Return the configuration of the accumulator.
+
+        Returns:
+            The configuration.
+        """
+        return {"nan_policy": self._nan_policy}
+
+    def _get_stats(self) -> dict[str, Any]:
+        r"""Return the accumulated statistics and the configuration.
+
+        Returns:
+            The accumulated statistics and the configuration.
+        """
+        return {
+            "count": self._count,
+            "sum_abs_error": self._sum_abs_error,
+            "sum_sq_error": self._sum_sq_error,
+            "mean": self._mean,
+            "sum_sq_dev": self._sum_sq_dev,
+            "nan": self._nan,
+        } | self._get_config()
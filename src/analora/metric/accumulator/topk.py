@@ -0,0 +1,217 @@
+r"""Implement an accumulator to compute the top-k accuracy metrics on
+batches of data."""
+
+from __future__ import annotations
+
+__all__ = ["TopKAccuracyAccumulator"]
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+from analora.metric.accumulator.base import (
+    BaseAccumulator,
+    check_same_accumulator,
+    check_same_config,
+)
+from analora.metric.classification.topk_accuracy import top_k_correct
+from analora.metric.utils import (
+    check_nan_policy,
+    contains_nan,
+    preprocess_score_binary,
+    preprocess_score_multiclass,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class TopKAccuracyAccumulator(BaseAccumulator):
+    r"""Implement an accumulator to compute the top-k accuracy metrics on
+    batches of data.
+
+    The accumulator keeps the number of correct predictions for each
+    ``k``. For binary labels (1d scores), it also keeps the number of
+    correct predictions for the thresholds ``0.5`` and ``0``, and the
+    range of the scores, because the threshold used by
+    ``sklearn.metrics.top_k_accuracy_score`` depends on the range of
+    all the scores. The output of ``compute`` has the same keys as
+    ``analora.metric.top_k_accuracy``.
+
+    For multiclass labels, ``y_true`` must contain the class indices
+    in ``{0, ..., n_classes-1}`` that match the columns of the
+    scores passed as ``y_pred`` to ``update``. The ties are broken like in
+    ``sklearn.metrics.top_k_accuracy_score``.
+
+    Args:
+        k: The numbers of most likely outcomes considered to find the
+            correct label.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.accumulator import TopKAccuracyAccumulator
+    >>> accumulator = TopKAccuracyAccumulator(k=[1, 2])
+    >>> accumulator.update(
+    ...     y_true=np.array([0, 1, 2]),
+    ...     y_pred=np.array([[0.7, 0.2, 0.1], [0.4, 0.3, 0.3], [0.1, 0.8, 0.1]]),
+    ... )
+    >>> accumulator.update(
+    ...     y_true=np.array([2, 0]),
+    ...     y_pred=np.array([[0.2, 0.3, 0.5], [0.4, 0.4, 0.2]]),
+    ... )
+    >>> accumulator
+    TopKAccuracyAccumulator(count=5, k=(1, 2), nan_policy='propagate')
+    >>> accumulator.compute()
+    {'count': 5, 'top_1_accuracy': 0.4, 'top_2_accuracy': 0.8}
+
+    ```
+    """
+
+    def __init__(self, k: Sequence[int] = (2,), nan_policy: str = "propagate") -> None:
+        check_nan_policy(nan_policy)
+        self._k = tuple(k)
+        self._nan_policy = nan_policy
+        self.reset()
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {"count": self._count, "k": self._k, "nan_policy": self._nan_policy}
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    def compute(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
+        count = self._count
+        correct = np.full(len(self._k), np.nan)
+        if count > 0 and not self._nan:
+            correct = self._correct
+            if self._binary:
+                # Same threshold as sklearn.metrics.top_k_accuracy_score
+                in_unit_range = self._min_score >= 0 and self._max_score <= 1
+                binary_correct = self._binary_correct[0 if in_unit_range else 1]
+                correct = np.array([binary_correct if k == 1 else count for k in self._k])
+        out = {
+            f"{prefix}top_{k}_accuracy{suffix}": float(num / count) if count > 0 else float("nan")
+            for k, num in zip(self._k, correct)
+        }
+        return {f"{prefix}count{suffix}": count} | out
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return objects_are_equal(self._get_stats(), other._get_stats(), equal_nan=equal_nan)
+
+    def merge(self, other: TopKAccuracyAccumulator) -> None:
+        check_same_accumulator(self, other)
+        check_same_config(self._get_config(), other._get_config())
+        self._check_label_type(other._binary)
+        if self._binary is None:
+            self._binary = other._binary
+        self._count += other._count
+        self._nan = self._nan or other._nan
+        self._correct += other._correct
+        self._binary_correct += other._binary_correct
+        self._min_score = min(self._min_score, other._min_score)
+        self._max_score = max(self._max_score, other._max_score)
+
+    def reset(self) -> None:
+        self._count = 0
+        self._nan = False
+        self._binary = None
+        self._correct = np.zeros(len(self._k), dtype=np.int64)
+        self._binary_correct = np.zeros(2, dtype=np.int64)
+        self._min_score = float("inf")
+        self._max_score = float("-inf")
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        binary = y_pred.ndim == 1
+        self._check_label_type(binary)
+        preprocess = preprocess_score_binary if binary else preprocess_score_multiclass
+        y_true, y_pred = preprocess(y_true, y_pred, drop_nan=self._nan_policy == "omit")
+        y_true_nan = contains_nan(arr=y_true, nan_policy=self._nan_policy, name="'y_true'")
+        y_pred_nan = contains_nan(arr=y_pred, nan_policy=self._nan_policy, name="'y_pred'")
+        self._binary = binary
+        self._count += y_true.size
+        if y_true_nan or y_pred_nan or y_true.size == 0:
+            self._nan = self._nan or y_true_nan or y_pred_nan
+            return
+        if binary:
+            self._update_binary(y_true=y_true, y_score=y_pred)
+        else:
+            self._update_multiclass(y_true=y_true, y_score=y_pred)
+
+    def _check_label_type(self, binary: bool | None) -> None:
+        r"""Check the label type is consistent with the previous
+        batches.
+
+        Args:
+            binary: ``True`` for binary labels, ``False`` for
+                multiclass labels, and ``None`` if unknown.
+
+        Raises:
+            ValueError: if the label type is inconsistent.
+        """
+        if self._binary is None or binary is None:
+            return
+        if self._binary != binary:
+            msg = (
+                "Cannot mix binary (1d scores) and multiclass (2d scores) labels "
+                "in the same accumulator"
+            )
+            raise ValueError(msg)
+
+    def _update_binary(self, y_true: np.ndarray, y_score: np.ndarray) -> None:
+        r"""Update the statistics with a batch of binary labels.
+
+        Args:
+            y_true: The ground truth target labels.
+            y_score: The target scores.
+        """
+        for i, threshold in enumerate((0.5, 0)):
+            self._binary_correct[i] += np.count_nonzero((y_score > threshold) == (y_true == 1))
+        self._min_score = min(self._min_score, float(y_score.min()))
+        self._max_score = max(self._max_score, float(y_score.max()))
+
+    def _update_multiclass(self, y_true: np.ndarray, y_score: np.ndarray) -> None:
+        r"""Update the statistics with a batch of multiclass labels.
+
+        Args:
+            y_true: The ground truth target labels.
+            y_score: The target scores.
+        """
+        self._correct += top_k_correct(y_true=y_true, y_score=y_score, k=self._k)
+
+    def _get_config(self) -> dict[str, Any]:
+        r"""Return the configuration of the accumulator.
+
+        Returns:
+            The configuration.
+        """
+        return {"k": self._k, "nan_policy": self._nan_policy}
+
+    def _get_stats(self) -> dict[str, Any]:
+        r"""Return the accumulated statistics and the configuration.
+
+        Returns:
+            The accumulated statistics and the configuration.
+        """
+        return {
+            "count": self._count,
+            "nan": self._nan,
+            "binary": self._binary,
+            "correct": self._correct,
+            "binary_correct": self._binary_correct,
+            "min_score": self._min_score,
+            "max_score": self._max_score,
+        } | self._get_config()
@@ -2,7 +2,7 @@ r"""Implement the classification accuracy metrics."""
 
 from __future__ import annotations
 
-__all__ = ["accuracy"]
+__all__ = ["accuracy", "accuracy_from_counts"]
 
 
 from typing import TYPE_CHECKING
@@ -58,10 +58,41 @@ def accuracy(
     y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
 
     count = y_true.size
-    acc, correct = float("nan"), float("nan")
+    correct = float("nan")
     if count > 0 and not y_true_nan and not y_pred_nan:
         correct = int(metrics.accuracy_score(y_true=y_true, y_pred=y_pred, normalize=False))
-        acc = float(correct / count)
+    return accuracy_from_counts(count=count, correct=correct, prefix=prefix, suffix=suffix)
+
+
+def accuracy_from_counts(
+    count: int, correct: float, *, prefix: str = "", suffix: str = ""
+) -> dict[str, float]:
+    r"""Return the accuracy metrics from the number of samples and the
+    number of correct predictions.
+
+    Args:
+        count: The number of samples.
+        correct: The number of correct predictions, or NaN if it
+            cannot be computed.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+
+    Returns:
+        The computed metrics, with the same keys as ``accuracy``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from analora.metric.classification.accuracy import accuracy_from_counts
+    >>> accuracy_from_counts(count=5, correct=4)
+    {'accuracy': 0.8, 'count_correct': 4, 'count_incorrect': 1, 'count': 5, 'error': 0.19999999999999996}
+    >>> accuracy_from_counts(count=0, correct=float("nan"))
+    {'accuracy': nan, 'count_correct': nan, 'count_incorrect': nan, 'count': 0, 'error': nan}
+
+    ```
+    """
+    acc = float(correct / count) if count > 0 else float("nan")
     return {
         f"{prefix}accuracy{suffix}": acc,
         f"{prefix}count_correct{suffix}": correct,
@@ -13,6 +13,7 @@ __all__ = [
 
 import numpy as np
 
+from analora.metric.classification.ranking import RankedScores
 from analora.metric.utils import (
     check_label_type,
     contains_nan,
@@ -171,7 +172,6 @@ def binary_average_precision(
 
     ```
     """
-    check_sklearn()
     y_true, y_score = preprocess_score_binary(
         y_true=y_true, y_score=y_score, drop_nan=nan_policy == "omit"
     )
@@ -181,7 +181,7 @@ def binary_average_precision(
     count = y_true.size
     ap = float("nan")
     if count > 0 and not y_true_nan and not y_score_nan:
-        ap = float(metrics.average_precision_score(y_true=y_true, y_score=y_score))
+        ap = RankedScores(y_true=y_true, y_score=y_score).average_precision()
     return {f"{prefix}average_precision{suffix}": ap, f"{prefix}count{suffix}": count}
 
 
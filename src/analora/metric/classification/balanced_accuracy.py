@@ -2,34 +2,44 @@ r"""Implement the classification accuracy metrics."""
 
 from __future__ import annotations
 
-__all__ = ["balanced_accuracy"]
+__all__ = ["balanced_accuracy", "per_class_counts"]
 
 
-from typing import TYPE_CHECKING
+import numpy as np
 
-from analora.metric.utils import contains_nan, preprocess_pred
-from analora.utils.imports import check_sklearn, is_sklearn_available
-
-if is_sklearn_available():  # pragma: no cover
-    from sklearn import metrics
-
-if TYPE_CHECKING:
-    import numpy as np
+from analora.metric.utils import (
+    contains_nan,
+    preprocess_pred,
+    preprocess_same_shape_arrays,
+)
 
 
 def balanced_accuracy(
     y_true: np.ndarray,
     y_pred: np.ndarray,
     *,
+    num_classes: int | None = None,
+    sample_weight: np.ndarray | None = None,
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
 ) -> dict[str, float]:
     r"""Return the accuracy metrics.
 
+    The balanced accuracy is the average of the recall of each class
+    in ``y_true``. The per-class counts are computed with
+    ``np.bincount`` (see ``per_class_counts``), and the values are
+    the same as ``sklearn.metrics.balanced_accuracy_score``.
+
     Args:
         y_true: The ground truth target labels.
         y_pred: The predicted labels.
+        num_classes: The optional number of classes. If given, the
+            labels in ``y_true`` must be integers in
+            ``{0, ..., num_classes-1}``, and the labels are not
+            searched in the arrays.
+        sample_weight: The optional sample weights, with the same
+            shape as ``y_true``.
         prefix: The key prefix in the returned dictionary.
         suffix: The key suffix in the returned dictionary.
         nan_policy: The policy on how to handle NaN values in the input
@@ -39,6 +49,10 @@ def balanced_accuracy(
     Returns:
         The computed metrics.
 
+    Raises:
+        ValueError: if ``num_classes`` is given and ``y_true`` has a
+            label outside ``{0, ..., num_classes-1}``.
+
     Example usage:
 
     ```pycon
@@ -47,18 +61,141 @@ def balanced_accuracy(
     >>> from analora.metric import balanced_accuracy
     >>> balanced_accuracy(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
     {'balanced_accuracy': 1.0, 'count': 5}
+    >>> balanced_accuracy(
+    ...     y_true=np.array([1, 0, 0, 1, 1]),
+    ...     y_pred=np.array([1, 0, 1, 1, 0]),
+    ...     num_classes=2,
+    ...     sample_weight=np.array([1.0, 1.0, 3.0, 1.0, 1.0]),
+    ... )
+    {'balanced_accuracy': 0.458..., 'count': 5}
 
     ```
     """
-    check_sklearn()
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
+    drop_nan = nan_policy == "omit"
+    y_true, y_pred = y_true.ravel(), y_pred.ravel()
+    if sample_weight is None:
+        y_true, y_pred = preprocess_pred(y_true=y_true, y_pred=y_pred, drop_nan=drop_nan)
+        weight_nan = False
+    else:
+        y_true, y_pred, sample_weight = preprocess_same_shape_arrays(
+            arrays=[y_true, y_pred, sample_weight.ravel()], drop_nan=drop_nan
+        )
+        weight_nan = contains_nan(arr=sample_weight, nan_policy=nan_policy, name="'sample_weight'")
     y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
     y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
 
     count = y_true.size
     acc = float("nan")
-    if count > 0 and not y_true_nan and not y_pred_nan:
-        acc = float(metrics.balanced_accuracy_score(y_true=y_true, y_pred=y_pred))
+    if count > 0 and not y_true_nan and not y_pred_nan and not weight_nan:
+        support, correct = per_class_counts(
+            y_true=y_true, y_pred=y_pred, num_classes=num_classes, sample_weight=sample_weight
+        )
+        present = support > 0
+        if present.any():
+            acc = float(np.mean(correct[present] / support[present]))
     return {f"{prefix}balanced_accuracy{suffix}": acc, f"{prefix}count{suffix}": count}
+
+
+def per_class_counts(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    num_classes: int | None = None,
+    sample_weight: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Return the number of samples and correct predictions of each
+    class.
+
+    The counts are computed with ``np.bincount`` on the labels of
+    ``y_true``, so no confusion matrix is built. The accuracy and the
+    balanced accuracy can both be computed from these counts. The
+    arrays must not contain NaN values.
+
+    Args:
+        y_true: The ground truth target labels.
+        y_pred: The predicted labels.
+        num_classes: The optional number of classes. If given, the
+            classes are ``{0, ..., num_classes-1}`` and the labels in
+            ``y_true`` must be integers in this set. Otherwise, the
+            classes are the sorted unique labels in ``y_true``.
+        sample_weight: The optional sample weights, with the same
+            shape as ``y_true``. If ``None``, each sample has a weight
+            of 1 and the counts are integers.
+
+    Returns:
+        A tuple with the (weighted) number of samples and the
+            (weighted) number of correct predictions of each class.
+
+    Raises:
+        ValueError: if ``num_classes`` is given and ``y_true`` has a
+            label outside ``{0, ..., num_classes-1}``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import per_class_counts
+    >>> per_class_counts(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 1, 0]))
+    (array([2, 3]), array([1, 2]))
+    >>> per_class_counts(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 1, 0]), num_classes=3
+    ... )
+    (array([2, 3, 0]), array([1, 2, 0]))
+
+    ```
+    """
+    y_true, y_pred = y_true.ravel(), y_pred.ravel()
+    if sample_weight is not None:
+        sample_weight = sample_weight.ravel()
+    labels = _as_class_indices(y_true)
+    if num_classes is not None:
+        if labels is None or (
+            labels.size > 0 and (labels.min() < 0 or labels.max() >= num_classes)
+        ):
+            msg = (
+                f"Incorrect num_classes: {num_classes}. "
+                f"The labels in y_true must be integers in [0, {num_classes - 1}]"
+            )
+            raise ValueError(msg)
+        drop_missing = False
+    elif (
+        labels is not None and labels.size > 0 and labels.min() >= 0 and labels.max() < labels.size
+    ):
+        # The small non-negative integer labels are counted directly, and
+        # the classes that do not appear in y_true are removed.
+        num_classes, drop_missing = labels.max().item() + 1, True
+    else:
+        classes, labels = np.unique(y_true, return_inverse=True)
+        num_classes, drop_missing = classes.size, False
+
+    is_correct = y_true == y_pred
+    support = np.bincount(labels, weights=sample_weight, minlength=num_classes)
+    correct = np.bincount(
+        labels[is_correct],
+        weights=None if sample_weight is None else sample_weight[is_correct],
+        minlength=num_classes,
+    )
+    if drop_missing:
+        present = support > 0 if sample_weight is None else np.bincount(labels) > 0
+        support, correct = support[present], correct[present]
+    return support, correct
+
+
+def _as_class_indices(labels: np.ndarray) -> np.ndarray | None:
+    r"""Convert integer labels to class indices.
+
+    Args:
+        labels: The labels.
+
+    Returns:
+        The labels as an array of ``np.intp``, or ``None`` if the
+            labels are not integers.
+    """
+    if labels.dtype.kind in "biu":
+        return labels.astype(np.intp, copy=False)
+    if labels.dtype.kind == "f":
+        indices = labels.astype(np.intp)
+        if np.array_equal(indices, labels):
+            return indices
+    return None
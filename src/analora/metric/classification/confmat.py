@@ -13,16 +13,17 @@ __all__ = [
 import numpy as np
 
 from analora.metric.classification.precision import find_label_type
+from analora.metric.classification.stats import (
+    binary_confmat,
+    compute_multiclass_confmat,
+    multilabel_confmat,
+)
 from analora.metric.utils import (
     check_label_type,
     contains_nan,
     preprocess_pred,
     preprocess_pred_multilabel,
 )
-from analora.utils.imports import check_sklearn, is_sklearn_available
-
-if is_sklearn_available():  # pragma: no cover
-    from sklearn import metrics
 
 
 def confusion_matrix(
@@ -33,6 +34,7 @@ def confusion_matrix(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    num_classes: int | None = None,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the confusion matrix metrics.
 
@@ -48,6 +50,10 @@ def confusion_matrix(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        num_classes: The number of classes, if known. It is only used
+            for multiclass labels. If set, the labels must be integers
+            in ``{0, ..., num_classes-1}`` and the label discovery is
+            skipped.
 
     Returns:
         The computed metrics.
@@ -106,7 +112,12 @@ def confusion_matrix(
             y_true=y_true, y_pred=y_pred, prefix=prefix, suffix=suffix, nan_policy=nan_policy
         )
     return multiclass_confusion_matrix(
-        y_true=y_true, y_pred=y_pred, prefix=prefix, suffix=suffix, nan_policy=nan_policy
+        y_true=y_true,
+        y_pred=y_pred,
+        prefix=prefix,
+        suffix=suffix,
+        nan_policy=nan_policy,
+        num_classes=num_classes,
     )
 
 
@@ -154,7 +165,6 @@ def binary_confusion_matrix(
 
     ```
     """
-    check_sklearn()
     y_true, y_pred = preprocess_pred(
         y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
     )
@@ -164,10 +174,8 @@ def binary_confusion_matrix(
     count = y_true.size
     if y_true_nan or y_pred_nan:
         confmat = np.array([[np.nan, np.nan], [np.nan, np.nan]])
-    elif count > 0:
-        confmat = metrics.confusion_matrix(y_true=y_true, y_pred=y_pred)
     else:
-        confmat = np.zeros((2, 2), dtype=np.int64)
+        confmat = binary_confmat(y_true=y_true, y_pred=y_pred)
     tn, fp, fn, tp = confmat.ravel().tolist()
     neg = tn + fp
     pos = tp + fn
@@ -192,6 +200,7 @@ def multiclass_confusion_matrix(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    num_classes: int | None = None,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the confusion matrix metrics for multiclass labels.
 
@@ -203,6 +212,10 @@ def multiclass_confusion_matrix(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        num_classes: The number of classes, if known. If set, the
+            labels must be integers in ``{0, ..., num_classes-1}``,
+            the label discovery is skipped, and the confusion matrix
+            has a row and a column for each class.
 
     Returns:
         The computed metrics.
@@ -217,23 +230,20 @@ def multiclass_confusion_matrix(
     ...     y_true=np.array([0, 1, 1, 2, 2, 2]), y_pred=np.array([0, 1, 1, 2, 2, 2])
     ... )
     {'confusion_matrix': array([[1, 0, 0], [0, 2, 0], [0, 0, 3]]), 'count': 6}
+    >>> multiclass_confusion_matrix(
+    ...     y_true=np.array([0, 1, 1, 2, 2, 2]),
+    ...     y_pred=np.array([0, 1, 1, 2, 2, 2]),
+    ...     num_classes=4,
+    ... )
+    {'confusion_matrix': array([[1, 0, 0, 0], [0, 2, 0, 0], [0, 0, 3, 0], [0, 0, 0, 0]]),
+     'count': 6}
 
     ```
     """
-    check_sklearn()
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
+    count, confmat = compute_multiclass_confmat(
+        y_true=y_true, y_pred=y_pred, nan_policy=nan_policy, num_classes=num_classes
     )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-    if y_true_nan or y_pred_nan:
-        confmat = np.zeros((0, 0), dtype=np.int64)
-    else:
-        confmat = metrics.confusion_matrix(y_true=y_true, y_pred=y_pred)
-    return {
-        f"{prefix}confusion_matrix{suffix}": confmat,
-        f"{prefix}count{suffix}": y_true.size,
-    }
+    return {f"{prefix}confusion_matrix{suffix}": confmat, f"{prefix}count{suffix}": count}
 
 
 def multilabel_confusion_matrix(
@@ -275,17 +285,13 @@ def multilabel_confusion_matrix(
 
     ```
     """
-    check_sklearn()
     y_true, y_pred = preprocess_pred_multilabel(y_true, y_pred, drop_nan=nan_policy == "omit")
     y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
     y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
 
     count = y_true.shape[0]
     if count > 0 and not y_true_nan and not y_pred_nan:
-        if y_true.shape[1] > 1:
-            confmat = metrics.multilabel_confusion_matrix(y_true=y_true, y_pred=y_pred)
-        else:
-            confmat = metrics.confusion_matrix(y_true=y_true, y_pred=y_pred).reshape(1, 2, 2)
+        confmat = multilabel_confmat(y_true=y_true, y_pred=y_pred)
     else:
         confmat = np.zeros((0, 0, 0), dtype=np.int64)
     return {f"{prefix}confusion_matrix{suffix}": confmat, f"{prefix}count{suffix}": count}
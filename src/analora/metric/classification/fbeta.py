@@ -14,6 +14,10 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from analora.metric.classification.precision import find_label_type
+from analora.metric.classification.stats import (
+    compute_multiclass_confmat,
+    multiclass_fbeta_from_confmat,
+)
 from analora.metric.utils import (
     check_label_type,
     contains_nan,
@@ -234,40 +238,10 @@ def multiclass_fbeta_score(
 
     ```
     """
-    check_sklearn()
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
+    count, confmat = compute_multiclass_confmat(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+    return {f"{prefix}count{suffix}": count} | multiclass_fbeta_from_confmat(
+        confmat, betas=betas, prefix=prefix, suffix=suffix
     )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    n_samples = y_true.shape[0]
-    out = {f"{prefix}count{suffix}": n_samples}
-    for beta in betas:
-        fbeta = np.array([])
-        macro, micro, weighted = float("nan"), float("nan"), float("nan")
-        if n_samples > 0 and not y_true_nan and not y_pred_nan:
-            macro = metrics.fbeta_score(
-                y_true=y_true, y_pred=y_pred, beta=beta, average="macro", zero_division=0.0
-            )
-            micro = metrics.fbeta_score(
-                y_true=y_true, y_pred=y_pred, beta=beta, average="micro", zero_division=0.0
-            )
-            weighted = metrics.fbeta_score(
-                y_true=y_true, y_pred=y_pred, beta=beta, average="weighted", zero_division=0.0
-            )
-            fbeta = np.asarray(
-                metrics.fbeta_score(
-                    y_true=y_true, y_pred=y_pred, beta=beta, average=None, zero_division=0.0
-                )
-            ).ravel()
-        out |= {
-            f"{prefix}f{beta}{suffix}": fbeta,
-            f"{prefix}macro_f{beta}{suffix}": float(macro),
-            f"{prefix}micro_f{beta}{suffix}": float(micro),
-            f"{prefix}weighted_f{beta}{suffix}": float(weighted),
-        }
-    return out
 
 
 def multilabel_fbeta_score(
@@ -6,38 +6,47 @@ from __future__ import annotations
 __all__ = ["ndcg"]
 
 
-from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
 
 from analora.metric.utils import (
     check_array_ndim,
+    check_same_shape_score,
     contains_nan,
     preprocess_score_multilabel,
 )
-from analora.utils.imports import check_sklearn, is_sklearn_available
-
-if is_sklearn_available():  # pragma: no cover
-    from sklearn.metrics import ndcg_score
+from analora.utils.imports import is_scipy_available
 
-if TYPE_CHECKING:
-    import numpy as np
+if is_scipy_available():  # pragma: no cover
+    from scipy import sparse
 
 
 def ndcg(
-    y_true: np.ndarray,
+    y_true: np.ndarray | Any,
     y_score: np.ndarray,
     *,
     k: int | None = None,
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    chunk_size: int | None = 1024,
 ) -> dict[str, float]:
     r"""Return the Normalized Discounted Cumulative Gain (NDCG) metrics.
 
+    The values are the same as ``sklearn.metrics.ndcg_score``, where
+    the gains of tied scores are averaged. The rows are processed in
+    blocks, and only the ``k`` highest scores of each row are sorted.
+    ``y_true`` can be a ``scipy.sparse`` matrix or array, in which
+    case the gains are only read for the ranked candidates and the
+    stored relevance values, and ``y_true`` is never converted to a
+    dense array.
+
     Args:
         y_true: The ground truth target targets of multilabel
             classification, or true scores of entities to be ranked.
-            Negative values in y_true may result in an output that is
-            not between 0 and 1. This input must be an array of shape
+            This input must be a non-negative array or
+            ``scipy.sparse`` matrix of shape
             ``(n_samples, n_labels)``.
         y_score: The predicted scores, can either be probability
             estimates, confidence values, or non-thresholded measure
@@ -50,10 +59,18 @@ def ndcg(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        chunk_size: The number of samples (rows) processed at the same
+            time. It bounds the size of the temporary arrays. If
+            ``None``, all the samples are processed at the same time.
 
     Returns:
         The computed metrics.
 
+    Raises:
+        ValueError: if ``k`` is lower than 1.
+        ValueError: if ``y_true`` contains negative values.
+        ValueError: if there is only one label.
+
     Example usage:
 
     ```pycon
@@ -67,19 +84,274 @@ def ndcg(
     ...     ),
     ... )
     {'count': 4, 'ndcg': 1.0}
+    >>> from scipy import sparse
+    >>> ndcg(
+    ...     y_true=sparse.csr_array(np.array([[1, 0, 0], [0, 2, 0], [0, 0, 3], [0, 0, 1]])),
+    ...     y_score=np.array(
+    ...         [[2.0, 1.0, 0.0], [0.0, 1.0, -1.0], [0.0, 0.0, 1.0], [1.0, 2.0, 3.0]]
+    ...     ),
+    ...     k=2,
+    ... )
+    {'count': 4, 'ndcg': 1.0}
 
     ```
     """
-    check_sklearn()
+    if k is not None and k < 1:
+        msg = f"Incorrect k: {k}. k must be greater than or equal to 1"
+        raise ValueError(msg)
     check_array_ndim(y_true, ndim=2)
-    y_true, y_score = preprocess_score_multilabel(
-        y_true=y_true, y_score=y_score, drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
+    if _is_sparse(y_true):
+        y_true, y_score = _preprocess_sparse(
+            y_true=y_true, y_score=y_score, drop_nan=nan_policy == "omit"
+        )
+        y_true_nan = contains_nan(arr=y_true.data, nan_policy=nan_policy, name="'y_true'")
+    else:
+        y_true, y_score = preprocess_score_multilabel(
+            y_true=y_true, y_score=y_score, drop_nan=nan_policy == "omit"
+        )
+        y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
     y_score_nan = contains_nan(arr=y_score, nan_policy=nan_policy, name="'y_score'")
 
     n_samples = y_true.shape[0]
     score = float("nan")
     if n_samples > 0 and not y_true_nan and not y_score_nan:
-        score = float(ndcg_score(y_true=y_true, y_score=y_score, k=k))
+        score = _mean_ndcg(y_true=y_true, y_score=y_score, k=k, chunk_size=chunk_size)
     return {f"{prefix}count{suffix}": n_samples, f"{prefix}ndcg{suffix}": score}
+
+
+def _is_sparse(arr: Any) -> bool:
+    r"""Indicate if the input is a ``scipy.sparse`` matrix or array.
+
+    Args:
+        arr: The input to check.
+
+    Returns:
+        ``True`` if the input is a ``scipy.sparse`` matrix or array,
+            otherwise ``False``.
+    """
+    return is_scipy_available() and sparse.issparse(arr)
+
+
+def _preprocess_sparse(
+    y_true: Any, y_score: np.ndarray, drop_nan: bool = False
+) -> tuple[Any, np.ndarray]:
+    r"""Preprocess a ``scipy.sparse`` ``y_true`` and a dense
+    ``y_score``.
+
+    Args:
+        y_true: The ground truth relevance of shape
+            ``(n_samples, n_labels)``.
+        y_score: The predicted scores of shape
+            ``(n_samples, n_labels)``.
+        drop_nan: If ``True``, the rows with NaN values are removed,
+            otherwise they are kept.
+
+    Returns:
+        A tuple with ``y_true`` in canonical CSR format, and
+            ``y_score``.
+    """
+    check_same_shape_score(y_true, y_score)
+    y_true = sparse.csr_array(y_true, copy=True)
+    y_true.sum_duplicates()
+    if not drop_nan:
+        return y_true, y_score
+    rows = np.repeat(np.arange(y_true.shape[0]), np.diff(y_true.indptr))
+    nan_rows = np.bincount(rows[np.isnan(y_true.data)], minlength=y_true.shape[0]) > 0
+    mask = np.logical_not(np.logical_or(nan_rows, np.isnan(y_score).any(axis=1)))
+    return y_true[mask], y_score[mask]
+
+
+def _mean_ndcg(y_true: Any, y_score: np.ndarray, k: int | None, chunk_size: int | None) -> float:
+    r"""Compute the mean NDCG over the rows.
+
+    Args:
+        y_true: The ground truth relevance without NaN values. This
+            input must be an array or a canonical CSR array of shape
+            ``(n_samples, n_labels)``.
+        y_score: The predicted scores without NaN values. This input
+            must be an array of shape ``(n_samples, n_labels)``.
+        k: Only consider the highest ``k`` scores in the ranking.
+            If ``None``, use all outputs.
+        chunk_size: The number of rows processed at the same time.
+
+    Returns:
+        The mean NDCG.
+
+    Raises:
+        ValueError: if ``y_true`` contains negative values.
+        ValueError: if there is only one label.
+    """
+    is_sparse = _is_sparse(y_true)
+    n_samples, n_labels = y_true.shape
+    values = y_true.data if is_sparse else y_true
+    if values.size and values.min() < 0:
+        msg = "ndcg_score should not be used on negative y_true values."
+        raise ValueError(msg)
+    if n_labels <= 1:
+        msg = (
+            "Computing NDCG is only meaningful when there is more than 1 document. "
+            f"Got {n_labels} instead."
+        )
+        raise ValueError(msg)
+
+    num_ranks = n_labels if k is None else min(k, n_labels)
+    discount = 1.0 / np.log2(np.arange(num_ranks) + 2)
+    chunk_size = chunk_size or n_samples
+    total = 0.0
+    for start in range(0, n_samples, chunk_size):
+        true = y_true[start : start + chunk_size]
+        score = y_score[start : start + chunk_size]
+        candidates = _top_candidates(score, num_ranks)
+        sorted_score = np.take_along_axis(score, candidates, axis=1)
+        # Minimum score in the top-k. All the labels with this score
+        # share the same average gain, even the ones after the top-k.
+        tied = score == sorted_score[:, -1:]
+        if is_sparse:
+            gains, tied_gain = _sparse_gains(true, candidates=candidates, tied=tied)
+            ideal = _sparse_ideal_dcg(true, discount=discount)
+        else:
+            gains = np.take_along_axis(true, candidates, axis=1)
+            tied_gain = np.where(tied, true, 0).sum(axis=1)
+            ideal = -np.sort(-_top_values(true, num_ranks), axis=1) @ discount
+        dcg = _tie_averaged_dcg(
+            sorted_score=sorted_score,
+            gains=gains,
+            tied_gain=tied_gain,
+            tied_count=np.count_nonzero(tied, axis=1),
+            discount=discount,
+        )
+        np.divide(dcg, ideal, out=dcg, where=ideal != 0)
+        total += float(dcg[ideal != 0].sum())
+    return total / n_samples
+
+
+def _top_candidates(score: np.ndarray, num_ranks: int) -> np.ndarray:
+    r"""Return the indices of the ``num_ranks`` highest scores of each
+    row, sorted by decreasing score.
+
+    Args:
+        score: The scores of shape ``(n_rows, n_labels)``.
+        num_ranks: The number of highest scores to keep.
+
+    Returns:
+        The indices of shape ``(n_rows, num_ranks)``.
+    """
+    negative = np.negative(score)
+    if num_ranks < score.shape[1]:
+        indices = np.argpartition(negative, num_ranks - 1, axis=1)[:, :num_ranks]
+    else:
+        indices = np.broadcast_to(np.arange(score.shape[1]), score.shape)
+    order = np.argsort(np.take_along_axis(negative, indices, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(indices, order, axis=1)
+
+
+def _top_values(values: np.ndarray, num_ranks: int) -> np.ndarray:
+    r"""Return the ``num_ranks`` highest values of each row, in an
+    arbitrary order.
+
+    Args:
+        values: The values of shape ``(n_rows, n_labels)``.
+        num_ranks: The number of highest values to keep.
+
+    Returns:
+        The highest values of shape ``(n_rows, num_ranks)``.
+    """
+    if num_ranks < values.shape[1]:
+        return -np.partition(-values, num_ranks - 1, axis=1)[:, :num_ranks]
+    return values
+
+
+def _tie_averaged_dcg(
+    *,
+    sorted_score: np.ndarray,
+    gains: np.ndarray,
+    tied_gain: np.ndarray,
+    tied_count: np.ndarray,
+    discount: np.ndarray,
+) -> np.ndarray:
+    r"""Compute the DCG of each row where the gains of tied scores are
+    averaged.
+
+    The last group of tied scores of each row can have labels after
+    the top-k, so its total gain and size are given for the full row.
+
+    Args:
+        sorted_score: The top-k scores of shape ``(n_rows, k)``
+            sorted by decreasing score.
+        gains: The gains associated to the top-k scores.
+        tied_gain: The total gain of the labels with the minimum top-k
+            score in each row.
+        tied_count: The number of labels with the minimum top-k score
+            in each row.
+        discount: The discount of each rank.
+
+    Returns:
+        The DCG of each row.
+    """
+    n_rows, num_ranks = sorted_score.shape
+    new_group = np.ones((n_rows, num_ranks), dtype=bool)
+    np.not_equal(sorted_score[:, 1:], sorted_score[:, :-1], out=new_group[:, 1:])
+    # The first rank of each row always starts a new group, so the
+    # group ids are unique across rows.
+    group = np.cumsum(new_group.ravel()) - 1
+    group_gain = np.bincount(group, weights=gains.ravel())
+    group_count = np.bincount(group).astype(np.float64)
+    last_group = group[num_ranks - 1 :: num_ranks]
+    group_gain[last_group] = tied_gain
+    group_count[last_group] = tied_count
+    return (group_gain / group_count)[group].reshape(n_rows, num_ranks) @ discount
+
+
+def _sparse_gains(
+    y_true: Any, candidates: np.ndarray, tied: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Return the gains of the candidates and the total gain of the
+    tied labels from a canonical CSR array.
+
+    Args:
+        y_true: The ground truth relevance as a canonical CSR array
+            of shape ``(n_rows, n_labels)``.
+        candidates: The indices of the candidates of shape
+            ``(n_rows, k)``.
+        tied: A boolean array of shape ``(n_rows, n_labels)`` which
+            indicates the labels with the minimum top-k score.
+
+    Returns:
+        The gains of the candidates of shape ``(n_rows, k)`` and the
+            total gain of the tied labels of shape ``(n_rows,)``.
+    """
+    n_rows, n_labels = y_true.shape
+    rows = np.repeat(np.arange(n_rows), np.diff(y_true.indptr))
+    if y_true.nnz == 0:
+        return np.zeros(candidates.shape), np.zeros(n_rows)
+    # The keys of the stored values are sorted in a canonical CSR array.
+    keys = rows * n_labels + y_true.indices
+    queries = np.arange(n_rows)[:, None] * n_labels + candidates
+    positions = np.minimum(np.searchsorted(keys, queries), keys.size - 1)
+    gains = np.where(keys[positions] == queries, y_true.data[positions], 0)
+    tied_gain = np.bincount(
+        rows, weights=y_true.data * tied[rows, y_true.indices], minlength=n_rows
+    )
+    return gains, tied_gain
+
+
+def _sparse_ideal_dcg(y_true: Any, discount: np.ndarray) -> np.ndarray:
+    r"""Return the ideal DCG of each row from a canonical CSR array
+    with non-negative values.
+
+    Args:
+        y_true: The ground truth relevance as a canonical CSR array
+            of shape ``(n_rows, n_labels)``.
+        discount: The discount of each rank.
+
+    Returns:
+        The ideal DCG of each row.
+    """
+    n_rows = y_true.shape[0]
+    rows = np.repeat(np.arange(n_rows), np.diff(y_true.indptr))
+    order = np.lexsort((-y_true.data, rows))
+    ranks = np.arange(rows.size) - y_true.indptr[rows]
+    keep = ranks < discount.size
+    return np.bincount(
+        rows[keep], weights=y_true.data[order][keep] * discount[ranks[keep]], minlength=n_rows
+    )
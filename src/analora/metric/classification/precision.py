@@ -14,6 +14,10 @@ import math
 
 import numpy as np
 
+from analora.metric.classification.stats import (
+    compute_multiclass_confmat,
+    multiclass_precision_from_confmat,
+)
 from analora.metric.utils import (
     check_label_type,
     contains_nan,
@@ -202,36 +206,10 @@ def multiclass_precision(
 
     ```
     """
-    check_sklearn()
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
+    count, confmat = compute_multiclass_confmat(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+    return {f"{prefix}count{suffix}": count} | multiclass_precision_from_confmat(
+        confmat, prefix=prefix, suffix=suffix
     )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    per_class = np.array([])
-    macro, micro, weighted = float("nan"), float("nan"), float("nan")
-    n_samples = y_true.shape[0]
-    if n_samples > 0 and not y_true_nan and not y_pred_nan:
-        macro = metrics.precision_score(
-            y_true=y_true, y_pred=y_pred, average="macro", zero_division=0.0
-        )
-        micro = metrics.precision_score(
-            y_true=y_true, y_pred=y_pred, average="micro", zero_division=0.0
-        )
-        weighted = metrics.precision_score(
-            y_true=y_true, y_pred=y_pred, average="weighted", zero_division=0.0
-        )
-        per_class = np.asarray(
-            metrics.precision_score(y_true=y_true, y_pred=y_pred, average=None, zero_division=0.0)
-        ).ravel()
-    return {
-        f"{prefix}count{suffix}": n_samples,
-        f"{prefix}macro_precision{suffix}": float(macro),
-        f"{prefix}micro_precision{suffix}": float(micro),
-        f"{prefix}precision{suffix}": per_class,
-        f"{prefix}weighted_precision{suffix}": float(weighted),
-    }
 
 
 def multilabel_precision(
@@ -0,0 +1,301 @@
+r"""Implement a structure to rank binary classification scores once and
+derive the ranking metrics and curves from it."""
+
+from __future__ import annotations
+
+__all__ = ["RankedScores"]
+
+import numpy as np
+from coola.utils.format import repr_mapping_line
+
+from analora.metric.utils import check_same_shape_score
+
+
+class RankedScores:
+    r"""Implement a structure that ranks binary classification scores.
+
+    The scores are sorted only once, then the cumulative numbers of
+    true positives and false positives are computed at each distinct
+    threshold. The ROC curve, the precision-recall curve, the ROC AUC,
+    and the average precision are derived from these cumulative
+    counts without sorting the scores again, so the same object can
+    be shared by several metrics, figures or evaluators.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, *)`` with ``0`` and
+            ``1`` values. The input arrays must not contain NaN values.
+        y_score: The target scores, can either be probability
+            estimates of the positive class, confidence values,
+            or non-thresholded measure of decisions. This input must
+            be an array of shape ``(n_samples, *)``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import RankedScores
+    >>> ranked = RankedScores(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+    ... )
+    >>> ranked
+    RankedScores(count=5, num_positives=3, num_negatives=2, num_thresholds=5)
+    >>> ranked.thresholds
+    array([ 3,  2,  1,  0, -1])
+    >>> ranked.true_positives
+    array([1, 2, 3, 3, 3])
+    >>> ranked.false_positives
+    array([0, 0, 0, 1, 2])
+    >>> ranked.roc_auc()
+    1.0
+    >>> ranked.average_precision()
+    1.0
+
+    ```
+    """
+
+    def __init__(self, y_true: np.ndarray, y_score: np.ndarray) -> None:
+        y_true, y_score = y_true.ravel(), y_score.ravel()
+        check_same_shape_score(y_true, y_score)
+        self._count = y_true.size
+
+        # Reverse a stable ascending sort to get the scores in descending
+        # order. The order of the tied scores does not matter because
+        # the counts are only read at the last position of each group
+        # of tied scores.
+        order = np.argsort(y_score, kind="stable")[::-1]
+        y_score = y_score[order]
+        indices = np.flatnonzero(np.diff(y_score))
+        indices = np.append(indices, self._count - 1) if self._count > 0 else indices
+
+        self._thresholds = y_score[indices]
+        self._tps = np.cumsum(y_true[order] == 1, dtype=np.int64)[indices]
+        self._fps = indices + 1 - self._tps
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "count": self._count,
+                "num_positives": self.num_positives,
+                "num_negatives": self.num_negatives,
+                "num_thresholds": self._thresholds.size,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of ranked samples."""
+        return self._count
+
+    @property
+    def num_positives(self) -> int:
+        r"""The number of positive samples."""
+        return int(self._tps[-1]) if self._tps.size else 0
+
+    @property
+    def num_negatives(self) -> int:
+        r"""The number of negative samples."""
+        return int(self._fps[-1]) if self._fps.size else 0
+
+    @property
+    def thresholds(self) -> np.ndarray:
+        r"""The distinct scores sorted in decreasing order."""
+        return self._thresholds
+
+    @property
+    def true_positives(self) -> np.ndarray:
+        r"""The number of true positives when predicting positive all
+        the samples with a score greater than or equal to each
+        threshold."""
+        return self._tps
+
+    @property
+    def false_positives(self) -> np.ndarray:
+        r"""The number of false positives when predicting positive all
+        the samples with a score greater than or equal to each
+        threshold."""
+        return self._fps
+
+    def roc_curve(
+        self, drop_intermediate: bool = True
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""Return the Receiver Operating Characteristic Curve (ROC).
+
+        The output follows the ``sklearn.metrics.roc_curve``
+        convention: an extra threshold ``inf`` is added so the curve
+        starts at ``(0, 0)``.
+
+        Args:
+            drop_intermediate: If ``True``, the thresholds of the points
+                that are collinear with their neighbors are dropped.
+                These points do not change the shape of the curve.
+
+        Returns:
+            A tuple with the false positive rates, the true positive
+                rates and the decreasing thresholds.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric import RankedScores
+        >>> ranked = RankedScores(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ... )
+        >>> fpr, tpr, thresholds = ranked.roc_curve()
+        >>> fpr
+        array([0., 0., 0., 1.])
+        >>> tpr
+        array([0.        , 0.33333333, 1.        , 1.        ])
+        >>> thresholds
+        array([inf,  3.,  1., -1.])
+
+        ```
+        """
+        tps, fps, thresholds = self._tps, self._fps, self._thresholds
+        if drop_intermediate and tps.size > 2:
+            keep = np.flatnonzero(
+                np.concatenate([[True], np.logical_or(np.diff(fps, 2), np.diff(tps, 2)), [True]])
+            )
+            tps, fps, thresholds = tps[keep], fps[keep], thresholds[keep]
+        tpr = _normalize(np.concatenate([[0], tps]))
+        fpr = _normalize(np.concatenate([[0], fps]))
+        return fpr, tpr, np.concatenate([[np.inf], thresholds])
+
+    def precision_recall_curve(
+        self, drop_intermediate: bool = False
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""Return the precision-recall curve.
+
+        The output follows the ``sklearn.metrics.precision_recall_curve``
+        convention: the recall is decreasing and the last point of the
+        curve is ``(recall=0, precision=1)``. If there is no positive
+        sample, the recall is set to one for all the thresholds.
+
+        Args:
+            drop_intermediate: If ``True``, the thresholds of the points
+                with the same number of true positives as their
+                neighbors are dropped.
+
+        Returns:
+            A tuple with the precision values, the recall values and
+                the increasing thresholds.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric import RankedScores
+        >>> ranked = RankedScores(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ... )
+        >>> precision, recall, thresholds = ranked.precision_recall_curve()
+        >>> precision
+        array([0.6 , 0.75, 1.  , 1.  , 1.  , 1.  ])
+        >>> recall
+        array([1.        , 1.        , 1.        , 0.66666667, 0.33333333, 0.        ])
+        >>> thresholds
+        array([-1,  0,  1,  2,  3])
+
+        ```
+        """
+        tps, fps, thresholds = self._tps, self._fps, self._thresholds
+        if drop_intermediate and tps.size > 2:
+            keep = np.flatnonzero(
+                np.concatenate([[True], np.logical_or(np.diff(tps[:-1]), np.diff(tps[1:])), [True]])
+            )
+            tps, fps, thresholds = tps[keep], fps[keep], thresholds[keep]
+        # Each threshold selects at least one sample, so the number of
+        # predicted positives is always strictly positive.
+        precision = tps / (tps + fps)
+        if self.num_positives > 0:
+            recall = tps / self.num_positives
+        else:
+            recall = np.ones(tps.shape, dtype=float)
+        return (
+            np.concatenate([precision[::-1], [1.0]]),
+            np.concatenate([recall[::-1], [0.0]]),
+            thresholds[::-1],
+        )
+
+    def roc_auc(self) -> float:
+        r"""Return the Area Under the Receiver Operating Characteristic
+        Curve (ROC AUC).
+
+        Returns:
+            The ROC AUC, or NaN if there is no sample or only one
+                class.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric import RankedScores
+        >>> ranked = RankedScores(
+        ...     y_true=np.array([1, 0, 0, 1]), y_score=np.array([-1, 1, 0, -2])
+        ... )
+        >>> ranked.roc_auc()
+        0.0
+
+        ```
+        """
+        num_positives, num_negatives = self.num_positives, self.num_negatives
+        if num_positives == 0 or num_negatives == 0:
+            return float("nan")
+        tps = np.concatenate([[0], self._tps])
+        fps = np.concatenate([[0], self._fps])
+        # Trapezoidal rule on the un-normalized curve, then normalize once.
+        area = np.dot(np.diff(fps), tps[1:] + tps[:-1]) / 2
+        return float(area / (num_positives * num_negatives))
+
+    def average_precision(self) -> float:
+        r"""Return the average precision.
+
+        The average precision is the weighted mean of the precision at
+        each threshold, where the weight is the increase in recall
+        from the previous threshold.
+
+        Returns:
+            The average precision, or NaN if there is no sample.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric import RankedScores
+        >>> ranked = RankedScores(
+        ...     y_true=np.array([1, 0, 0, 1]), y_score=np.array([-1, 1, 0, -2])
+        ... )
+        >>> ranked.average_precision()
+        0.416...
+
+        ```
+        """
+        if self._count == 0:
+            return float("nan")
+        if self.num_positives == 0:
+            return 0.0
+        precision = self._tps / (self._tps + self._fps)
+        gains = np.diff(self._tps, prepend=0)
+        return float(np.dot(gains, precision) / self.num_positives)
+
+
+def _normalize(counts: np.ndarray) -> np.ndarray:
+    r"""Normalize cumulative counts by their last value.
+
+    Args:
+        counts: The cumulative counts.
+
+    Returns:
+        The normalized counts, or an array of NaN if the last value
+            is zero.
+    """
+    if counts[-1] <= 0:
+        return np.full(counts.shape, np.nan)
+    return counts / counts[-1]
@@ -0,0 +1,99 @@
+r"""Implement a classification report that computes several
+classification metrics at once."""
+
+from __future__ import annotations
+
+__all__ = ["classification_report"]
+
+from typing import TYPE_CHECKING
+
+from analora.metric.classification.stats import (
+    compute_multiclass_confmat,
+    multiclass_fbeta_from_confmat,
+    multiclass_jaccard_from_confmat,
+    multiclass_precision_from_confmat,
+    multiclass_recall_from_confmat,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+
+
+def classification_report(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    betas: Sequence[float] = (1,),
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+    num_classes: int | None = None,
+) -> dict[str, float | np.ndarray]:
+    r"""Return the precision, recall, F-beta and Jaccard metrics for
+    multiclass labels.
+
+    The confusion matrix is computed only once, then all the metrics
+    are derived from it. The output is the union of the outputs of
+    ``multiclass_precision``, ``multiclass_recall``,
+    ``multiclass_fbeta_score``, and ``multiclass_jaccard``.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)``.
+        y_pred: The predicted labels. This input must
+            be an array of shape ``(n_samples,)``.
+        betas: The betas used to compute the F-beta scores.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        num_classes: The number of classes, if known. If set, the
+            labels must be integers in ``{0, ..., num_classes-1}``,
+            the label discovery is skipped, and the per-class metrics
+            have a value for each class.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import classification_report
+    >>> classification_report(
+    ...     y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 2, 2])
+    ... )
+    {'count': 6,
+     'macro_precision': 1.0,
+     'micro_precision': 1.0,
+     'precision': array([1., 1., 1.]),
+     'weighted_precision': 1.0,
+     'macro_recall': 1.0,
+     'micro_recall': 1.0,
+     'recall': array([1., 1., 1.]),
+     'weighted_recall': 1.0,
+     'f1': array([1., 1., 1.]),
+     'macro_f1': 1.0,
+     'micro_f1': 1.0,
+     'weighted_f1': 1.0,
+     'jaccard': array([1., 1., 1.]),
+     'macro_jaccard': 1.0,
+     'micro_jaccard': 1.0,
+     'weighted_jaccard': 1.0}
+
+    ```
+    """
+    count, confmat = compute_multiclass_confmat(
+        y_true=y_true, y_pred=y_pred, nan_policy=nan_policy, num_classes=num_classes
+    )
+    return (
+        {f"{prefix}count{suffix}": count}
+        | multiclass_precision_from_confmat(confmat, prefix=prefix, suffix=suffix)
+        | multiclass_recall_from_confmat(confmat, prefix=prefix, suffix=suffix)
+        | multiclass_fbeta_from_confmat(confmat, betas=betas, prefix=prefix, suffix=suffix)
+        | multiclass_jaccard_from_confmat(confmat, prefix=prefix, suffix=suffix)
+    )
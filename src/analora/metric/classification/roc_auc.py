@@ -15,6 +15,7 @@ from typing import Any
 import numpy as np
 
 from analora.metric.classification.ap import find_label_type
+from analora.metric.classification.ranking import RankedScores
 from analora.metric.utils import (
     check_label_type,
     contains_nan,
@@ -170,8 +171,21 @@ def binary_roc_auc(
 
     Returns:
         The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import binary_roc_auc
+    >>> metrics = binary_roc_auc(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+    ... )
+    >>> metrics
+    {'count': 5, 'roc_auc': 1.0}
+
+    ```
     """
-    check_sklearn()
     y_true, y_score = preprocess_score_binary(
         y_true=y_true, y_score=y_score, drop_nan=nan_policy == "omit"
     )
@@ -181,7 +195,7 @@ def binary_roc_auc(
     count = y_true.size
     roc_auc = float("nan")
     if count > 0 and not y_true_nan and not y_score_nan:
-        roc_auc = float(metrics.roc_auc_score(y_true=y_true, y_score=y_score))
+        roc_auc = RankedScores(y_true=y_true, y_score=y_score).roc_auc()
     return {f"{prefix}count{suffix}": count, f"{prefix}roc_auc{suffix}": roc_auc}
 
 
@@ -0,0 +1,574 @@
+r"""Implement functions to compute classification metrics from a
+confusion matrix.
+
+The confusion matrix is computed once, and all the per-class and
+averaged (macro, micro, weighted) metrics are derived from it without
+going through the raw labels again.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "MAX_DENSE_CONFMAT_SIZE",
+    "binary_confmat",
+    "compute_multiclass_confmat",
+    "multiclass_confmat",
+    "multiclass_fbeta_from_confmat",
+    "multiclass_jaccard_from_confmat",
+    "multiclass_precision_from_confmat",
+    "multiclass_recall_from_confmat",
+    "multilabel_confmat",
+]
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from analora.metric.utils import contains_nan, preprocess_pred
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Maximum number of entries of the dense confusion matrix used to count
+# integer labels without label discovery.
+MAX_DENSE_CONFMAT_SIZE = 2**22
+
+
+def binary_confmat(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    r"""Compute the confusion matrix for binary labels.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)`` with values in
+            ``{0, 1}``.
+        y_pred: The predicted labels. This input must be an array
+            of shape ``(n_samples,)`` with values in ``{0, 1}``.
+
+    Returns:
+        The confusion matrix of shape ``(2, 2)`` in the format
+            ``[[tn, fp], [fn, tp]]``.
+
+    Raises:
+        ValueError: if the labels are not ``0`` or ``1``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.classification.stats import binary_confmat
+    >>> binary_confmat(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 1, 0]))
+    array([[1, 1],
+           [1, 2]])
+
+    ```
+    """
+    return multiclass_confmat(y_true=y_true, y_pred=y_pred, num_classes=2)
+
+
+def multiclass_confmat(
+    y_true: np.ndarray, y_pred: np.ndarray, num_classes: int | None = None
+) -> np.ndarray:
+    r"""Compute the confusion matrix for multiclass labels.
+
+    If ``num_classes`` is not given, the classes are the sorted union
+    of the values in ``y_true`` and ``y_pred``. The entry ``(i, j)``
+    of the confusion matrix is the number of samples with true label
+    ``i`` and predicted label ``j``.
+
+    Integer labels (or float labels with integer values) are counted
+    with a single ``np.bincount`` over ``y_true * n_classes + y_pred``.
+    The other labels are first mapped to class indices with
+    ``np.unique``.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)``.
+        y_pred: The predicted labels. This input must be an array
+            of shape ``(n_samples,)``.
+        num_classes: The number of classes, if known. If set, the
+            labels must be integers in ``{0, ..., num_classes-1}``,
+            the label discovery is skipped, and the confusion matrix
+            has a row and a column for each class, even the classes
+            without sample.
+
+    Returns:
+        The confusion matrix of shape ``(n_classes, n_classes)``.
+
+    Raises:
+        ValueError: if ``num_classes`` is set and the labels are not
+            integers in ``{0, ..., num_classes-1}``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.classification.stats import multiclass_confmat
+    >>> multiclass_confmat(
+    ...     y_true=np.array([0, 1, 1, 2, 2, 2]), y_pred=np.array([0, 1, 2, 2, 2, 1])
+    ... )
+    array([[1, 0, 0],
+           [0, 1, 1],
+           [0, 1, 2]])
+    >>> multiclass_confmat(
+    ...     y_true=np.array([0, 1, 1, 2, 2, 2]),
+    ...     y_pred=np.array([0, 1, 2, 2, 2, 1]),
+    ...     num_classes=4,
+    ... )
+    array([[1, 0, 0, 0],
+           [0, 1, 1, 0],
+           [0, 1, 2, 0],
+           [0, 0, 0, 0]])
+
+    ```
+    """
+    if num_classes is not None:
+        return _bincount_confmat(
+            y_true=_to_class_indices(y_true, num_classes=num_classes, name="y_true"),
+            y_pred=_to_class_indices(y_pred, num_classes=num_classes, name="y_pred"),
+            num_classes=num_classes,
+        )
+
+    y_true_int, y_pred_int = _as_integer(y_true), _as_integer(y_pred)
+    if y_true_int is not None and y_pred_int is not None and y_true_int.size > 0:
+        low = min(y_true_int.min(), y_pred_int.min())
+        span = int(max(y_true_int.max(), y_pred_int.max())) - int(low) + 1
+        if span**2 <= MAX_DENSE_CONFMAT_SIZE:
+            if low != 0:
+                y_true_int, y_pred_int = y_true_int - low, y_pred_int - low
+            confmat = _bincount_confmat(y_true=y_true_int, y_pred=y_pred_int, num_classes=span)
+            # only keep the labels that appear in y_true or y_pred
+            present = np.logical_or(confmat.any(axis=0), confmat.any(axis=1))
+            if not present.all():
+                confmat = confmat[np.ix_(present, present)]
+            return confmat
+
+    n_samples = y_true.shape[0]
+    labels, inverse = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    return _bincount_confmat(
+        y_true=inverse[:n_samples], y_pred=inverse[n_samples:], num_classes=labels.shape[0]
+    )
+
+
+def multilabel_confmat(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    r"""Compute the confusion matrix of each class for multilabel
+    labels.
+
+    The labels are packed into bits along the sample dimension, so the
+    counts are computed with bitwise operations on 8 samples at a
+    time.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, n_classes)`` with
+            values in ``{0, 1}``.
+        y_pred: The predicted labels. This input must be an array
+            of shape ``(n_samples, n_classes)`` with values in
+            ``{0, 1}``.
+
+    Returns:
+        The confusion matrices of shape ``(n_classes, 2, 2)``. Each
+            confusion matrix is in the format ``[[tn, fp], [fn, tp]]``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.classification.stats import multilabel_confmat
+    >>> multilabel_confmat(
+    ...     y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+    ...     y_pred=np.array([[1, 0, 0], [0, 1, 1], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+    ... )
+    array([[[2, 0], [0, 3]],
+           [[3, 0], [0, 2]],
+           [[1, 1], [1, 2]]])
+
+    ```
+    """
+    n_samples = y_true.shape[0]
+    packed_true = np.packbits(y_true.astype(bool, copy=False), axis=0)
+    packed_pred = np.packbits(y_pred.astype(bool, copy=False), axis=0)
+    tp = _popcount(np.bitwise_and(packed_true, packed_pred))
+    fn = _popcount(packed_true) - tp
+    fp = _popcount(packed_pred) - tp
+    tn = n_samples - tp - fn - fp
+    return np.stack([tn, fp, fn, tp], axis=1).reshape(-1, 2, 2)
+
+
+def compute_multiclass_confmat(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    nan_policy: str = "propagate",
+    num_classes: int | None = None,
+) -> tuple[int, np.ndarray]:
+    r"""Preprocess the multiclass labels and compute the confusion
+    matrix.
+
+    Args:
+        y_true: The ground truth target labels.
+        y_pred: The predicted labels.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        num_classes: The number of classes, if known. If set, the
+            labels must be integers in ``{0, ..., num_classes-1}``.
+
+    Returns:
+        A tuple with the number of samples and the confusion matrix.
+            The confusion matrix is an empty array of shape
+            ``(0, 0)`` if there is no sample or if one of the arrays
+            contains a NaN value.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.classification.stats import compute_multiclass_confmat
+    >>> compute_multiclass_confmat(
+    ...     y_true=np.array([0, 1, 1, 2, 2, 2]), y_pred=np.array([0, 1, 2, 2, 2, 1])
+    ... )
+    (6, array([[1, 0, 0],
+               [0, 1, 1],
+               [0, 1, 2]]))
+
+    ```
+    """
+    y_true, y_pred = preprocess_pred(
+        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
+    )
+    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
+    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
+
+    count = y_true.size
+    if count == 0 or y_true_nan or y_pred_nan:
+        return count, np.zeros((0, 0), dtype=np.int64)
+    return count, multiclass_confmat(y_true=y_true, y_pred=y_pred, num_classes=num_classes)
+
+
+def multiclass_precision_from_confmat(
+    confmat: np.ndarray, *, prefix: str = "", suffix: str = ""
+) -> dict[str, float | np.ndarray]:
+    r"""Return the precision metrics for multiclass labels from a
+    confusion matrix.
+
+    Args:
+        confmat: The confusion matrix of shape
+            ``(n_classes, n_classes)``. The metrics are NaN if the
+            confusion matrix is empty.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.classification.stats import multiclass_precision_from_confmat
+    >>> multiclass_precision_from_confmat(np.array([[2, 0, 0], [0, 2, 0], [0, 2, 0]]))
+    {'macro_precision': 0.5,
+     'micro_precision': 0.6666666666666666,
+     'precision': array([1. , 0.5, 0. ]),
+     'weighted_precision': 0.5}
+
+    ```
+    """
+    tp, pred_count, support = _get_counts(confmat)
+    return _format_scores(
+        name="precision",
+        per_class=_safe_divide(tp, pred_count),
+        micro=_safe_divide(tp.sum(), pred_count.sum()),
+        support=support,
+        prefix=prefix,
+        suffix=suffix,
+    )
+
+
+def multiclass_recall_from_confmat(
+    confmat: np.ndarray, *, prefix: str = "", suffix: str = ""
+) -> dict[str, float | np.ndarray]:
+    r"""Return the recall metrics for multiclass labels from a confusion
+    matrix.
+
+    Args:
+        confmat: The confusion matrix of shape
+            ``(n_classes, n_classes)``. The metrics are NaN if the
+            confusion matrix is empty.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.classification.stats import multiclass_recall_from_confmat
+    >>> multiclass_recall_from_confmat(np.array([[2, 0, 0], [0, 2, 0], [0, 2, 0]]))
+    {'macro_recall': 0.6666666666666666,
+     'micro_recall': 0.6666666666666666,
+     'recall': array([1., 1., 0.]),
+     'weighted_recall': 0.6666666666666666}
+
+    ```
+    """
+    tp, _, support = _get_counts(confmat)
+    return _format_scores(
+        name="recall",
+        per_class=_safe_divide(tp, support),
+        micro=_safe_divide(tp.sum(), support.sum()),
+        support=support,
+        prefix=prefix,
+        suffix=suffix,
+    )
+
+
+def multiclass_fbeta_from_confmat(
+    confmat: np.ndarray,
+    *,
+    betas: Sequence[float] = (1,),
+    prefix: str = "",
+    suffix: str = "",
+) -> dict[str, float | np.ndarray]:
+    r"""Return the F-beta metrics for multiclass labels from a confusion
+    matrix.
+
+    Args:
+        confmat: The confusion matrix of shape
+            ``(n_classes, n_classes)``. The metrics are NaN if the
+            confusion matrix is empty.
+        betas: The betas used to compute the F-beta scores.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.classification.stats import multiclass_fbeta_from_confmat
+    >>> multiclass_fbeta_from_confmat(np.array([[2, 0, 0], [0, 2, 0], [0, 2, 0]]))
+    {'f1': array([1.        , 0.66666667, 0.        ]),
+     'macro_f1': 0.5555555555555555,
+     'micro_f1': 0.6666666666666666,
+     'weighted_f1': 0.5555555555555555}
+
+    ```
+    """
+    tp, pred_count, support = _get_counts(confmat)
+    out = {}
+    for beta in betas:
+        beta2 = beta**2
+        out |= _format_scores(
+            name=f"f{beta}",
+            per_class=_safe_divide((1 + beta2) * tp, beta2 * support + pred_count),
+            micro=_safe_divide((1 + beta2) * tp.sum(), beta2 * support.sum() + pred_count.sum()),
+            support=support,
+            prefix=prefix,
+            suffix=suffix,
+        )
+    return out
+
+
+def multiclass_jaccard_from_confmat(
+    confmat: np.ndarray, *, prefix: str = "", suffix: str = ""
+) -> dict[str, float | np.ndarray]:
+    r"""Return the Jaccard metrics for multiclass labels from a
+    confusion matrix.
+
+    Args:
+        confmat: The confusion matrix of shape
+            ``(n_classes, n_classes)``. The metrics are NaN if the
+            confusion matrix is empty.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.classification.stats import multiclass_jaccard_from_confmat
+    >>> multiclass_jaccard_from_confmat(np.array([[2, 0, 0], [0, 2, 0], [0, 2, 0]]))
+    {'jaccard': array([1. , 0.5, 0. ]),
+     'macro_jaccard': 0.5,
+     'micro_jaccard': 0.5,
+     'weighted_jaccard': 0.5}
+
+    ```
+    """
+    tp, pred_count, support = _get_counts(confmat)
+    return _format_scores(
+        name="jaccard",
+        per_class=_safe_divide(tp, support + pred_count - tp),
+        micro=_safe_divide(tp.sum(), support.sum() + pred_count.sum() - tp.sum()),
+        support=support,
+        prefix=prefix,
+        suffix=suffix,
+    )
+
+
+def _get_counts(confmat: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    r"""Return the per-class counts of a multiclass confusion matrix.
+
+    Args:
+        confmat: The confusion matrix of shape
+            ``(n_classes, n_classes)``.
+
+    Returns:
+        A tuple with the number of true positives, the number of
+            predicted samples, and the number of true samples
+            (a.k.a. support) for each class.
+    """
+    return np.diag(confmat), confmat.sum(axis=0), confmat.sum(axis=1)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    r"""Divide two arrays element-wise and return ``0`` where the
+    denominator is ``0``.
+
+    Args:
+        numerator: The numerator values.
+        denominator: The denominator values.
+
+    Returns:
+        The result of the division.
+    """
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator != 0)
+
+
+def _format_scores(
+    *,
+    name: str,
+    per_class: np.ndarray,
+    micro: np.ndarray,
+    support: np.ndarray,
+    prefix: str,
+    suffix: str,
+) -> dict[str, float | np.ndarray]:
+    r"""Compute the macro and weighted averages and format the scores.
+
+    Args:
+        name: The metric name.
+        per_class: The per-class scores.
+        micro: The micro-averaged score.
+        support: The number of true samples for each class.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+
+    Returns:
+        The formatted scores. The averaged scores are NaN if there
+            is no class.
+    """
+    macro, weighted = float("nan"), float("nan")
+    if per_class.size > 0:
+        macro = float(per_class.mean())
+        micro = float(micro)
+        if support.sum() > 0:
+            weighted = float(np.average(per_class, weights=support))
+    else:
+        micro = float("nan")
+    scores = {
+        name: per_class,
+        f"macro_{name}": macro,
+        f"micro_{name}": micro,
+        f"weighted_{name}": weighted,
+    }
+    return {f"{prefix}{key}{suffix}": scores[key] for key in sorted(scores)}
+
+
+def _as_integer(arr: np.ndarray) -> np.ndarray | None:
+    r"""Return the labels as an integer array if possible.
+
+    Args:
+        arr: The labels.
+
+    Returns:
+        The labels as an integer array, or ``None`` if the labels are
+            not integer values.
+    """
+    if arr.dtype == bool:
+        return arr.view(np.uint8)
+    if np.issubdtype(arr.dtype, np.integer):
+        return arr
+    if np.issubdtype(arr.dtype, np.floating):
+        arr_int = arr.astype(np.int64)
+        if np.array_equal(arr_int, arr):
+            return arr_int
+    return None
+
+
+def _to_class_indices(arr: np.ndarray, num_classes: int, name: str) -> np.ndarray:
+    r"""Check the labels are valid class indices and return them as an
+    integer array.
+
+    Args:
+        arr: The labels.
+        num_classes: The number of classes.
+        name: The name of the array, used in the error message.
+
+    Returns:
+        The class indices.
+
+    Raises:
+        ValueError: if the labels are not integers in
+            ``{0, ..., num_classes-1}``.
+    """
+    arr_int = _as_integer(arr)
+    if arr_int is None or (
+        arr_int.size > 0 and (arr_int.min() < 0 or arr_int.max() >= num_classes)
+    ):
+        msg = f"{name!r} must contain integer labels in [0, {num_classes - 1}]"
+        raise ValueError(msg)
+    return arr_int
+
+
+def _bincount_confmat(y_true: np.ndarray, y_pred: np.ndarray, num_classes: int) -> np.ndarray:
+    r"""Compute the confusion matrix from class indices.
+
+    Args:
+        y_true: The ground truth class indices in
+            ``{0, ..., num_classes-1}``.
+        y_pred: The predicted class indices in
+            ``{0, ..., num_classes-1}``.
+        num_classes: The number of classes.
+
+    Returns:
+        The confusion matrix of shape ``(num_classes, num_classes)``.
+    """
+    indices = y_true.astype(np.intp) * num_classes
+    indices += y_pred.astype(np.intp, copy=False)
+    return (
+        np.bincount(indices, minlength=num_classes * num_classes)
+        .astype(np.int64, copy=False)
+        .reshape(num_classes, num_classes)
+    )
+
+
+def _popcount(packed: np.ndarray) -> np.ndarray:
+    r"""Count the number of bits set to one in each column of a packed
+    array.
+
+    Args:
+        packed: The array of packed bits of shape
+            ``(n_bytes, n_classes)``.
+
+    Returns:
+        The number of ones for each column.
+    """
+    return np.bitwise_count(packed).sum(axis=0, dtype=np.int64)
@@ -3,25 +3,26 @@ metrics."""
 
 from __future__ import annotations
 
-__all__ = ["binary_top_k_accuracy", "multiclass_top_k_accuracy", "top_k_accuracy"]
+__all__ = [
+    "binary_top_k_accuracy",
+    "multiclass_top_k_accuracy",
+    "top_k_accuracy",
+    "top_k_correct",
+]
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from analora.metric.utils import (
     contains_nan,
     preprocess_score_binary,
     preprocess_score_multiclass,
 )
-from analora.utils.imports import check_sklearn, is_sklearn_available
-
-if is_sklearn_available():  # pragma: no cover
-    from sklearn import metrics
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    import numpy as np
-
 
 def top_k_accuracy(
     y_true: np.ndarray,
@@ -31,9 +32,15 @@ def top_k_accuracy(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    chunk_size: int | None = 1024,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the Area Under the Top-k Accuracy classification metrics.
 
+    The values are the same as ``sklearn.metrics.top_k_accuracy_score``,
+    but all the ``k`` values are computed together: the rank of the
+    true label is computed once for each sample, without sorting the
+    scores.
+
     Args:
         y_true: The ground truth target labels. This input must
             be an array of shape ``(n_samples,)``.
@@ -50,10 +57,19 @@ def top_k_accuracy(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        chunk_size: The number of samples (rows of ``y_score``)
+            processed at the same time in the multiclass case. It
+            bounds the size of the temporary arrays. If ``None``, all
+            the samples are processed at the same time.
 
     Returns:
         The computed metrics.
 
+    Raises:
+        ValueError: if a ``k`` value is lower than 1.
+        ValueError: if the number of classes in ``y_true`` is not the
+            number of classes in ``y_score``.
+
     Example usage:
 
     ```pycon
@@ -95,6 +111,7 @@ def top_k_accuracy(
         prefix=prefix,
         suffix=suffix,
         nan_policy=nan_policy,
+        chunk_size=chunk_size,
     )
 
 
@@ -127,18 +144,27 @@ def binary_top_k_accuracy(
 
     Returns:
         The computed metrics.
+
+    Raises:
+        ValueError: if a ``k`` value is lower than 1.
+        ValueError: if ``y_true`` does not have two classes.
     """
+    _check_k(k)
     y_true, y_score = preprocess_score_binary(
         y_true=y_true, y_score=y_score, drop_nan=nan_policy == "omit"
     )
-    return _top_k_accuracy(
-        y_true=y_true,
-        y_score=y_score,
-        k=k,
-        prefix=prefix,
-        suffix=suffix,
-        nan_policy=nan_policy,
-    )
+    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
+    y_score_nan = contains_nan(arr=y_score, nan_policy=nan_policy, name="'y_score'")
+
+    count = y_true.size
+    correct = None
+    if count > 0 and not y_true_nan and not y_score_nan:
+        y_true = _encode_labels(y_true, num_classes=2)
+        # Same threshold as sklearn.metrics.top_k_accuracy_score
+        threshold = 0.5 if y_score.min() >= 0 and y_score.max() <= 1 else 0
+        binary_correct = np.count_nonzero((y_score > threshold) == y_true)
+        correct = np.array([binary_correct if _k == 1 else count for _k in k])
+    return _format_top_k_accuracy(correct=correct, count=count, k=k, prefix=prefix, suffix=suffix)
 
 
 def multiclass_top_k_accuracy(
@@ -149,6 +175,7 @@ def multiclass_top_k_accuracy(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    chunk_size: int | None = 1024,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the Area Under the Top-k Accuracy classification metrics
     for multiclass labels.
@@ -167,62 +194,168 @@ def multiclass_top_k_accuracy(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        chunk_size: The number of samples (rows of ``y_score``)
+            processed at the same time. It bounds the size of the
+            temporary arrays. If ``None``, all the samples are
+            processed at the same time.
 
     Returns:
         The computed metrics.
+
+    Raises:
+        ValueError: if a ``k`` value is lower than 1.
+        ValueError: if the number of classes in ``y_true`` is not the
+            number of classes in ``y_score``.
     """
+    _check_k(k)
     y_true, y_score = preprocess_score_multiclass(y_true, y_score, drop_nan=nan_policy == "omit")
-    return _top_k_accuracy(
-        y_true=y_true,
-        y_score=y_score,
-        k=k,
-        prefix=prefix,
-        suffix=suffix,
-        nan_policy=nan_policy,
-    )
+    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
+    y_score_nan = contains_nan(arr=y_score, nan_policy=nan_policy, name="'y_score'")
+
+    count = y_true.size
+    correct = None
+    if count > 0 and not y_true_nan and not y_score_nan:
+        y_true = _encode_labels(y_true, num_classes=y_score.shape[1])
+        correct = top_k_correct(y_true=y_true, y_score=y_score, k=k, chunk_size=chunk_size)
+    return _format_top_k_accuracy(correct=correct, count=count, k=k, prefix=prefix, suffix=suffix)
 
 
-def _top_k_accuracy(
+def top_k_correct(
     y_true: np.ndarray,
     y_score: np.ndarray,
-    *,
-    k: Sequence[int] = (2,),
+    k: Sequence[int],
+    chunk_size: int | None = None,
+) -> np.ndarray:
+    r"""Return the number of correct top-k predictions for each ``k``.
+
+    The rank of the true label is the number of classes with a greater
+    score, plus the number of tied classes with a greater index, which
+    are ranked first by ``sklearn.metrics.top_k_accuracy_score``. A
+    prediction is correct if the rank is lower than ``k``, so all the
+    ``k`` values are computed from the ranks without sorting the
+    scores.
+
+    Args:
+        y_true: The ground truth class indices in
+            ``{0, ..., n_classes-1}``. This input must be an array of
+            shape ``(n_samples,)``.
+        y_score: The target scores. This input must be an array of
+            shape ``(n_samples, n_classes)`` without NaN values.
+        k: The numbers of most likely outcomes considered to find the
+            correct label.
+        chunk_size: The number of samples (rows of ``y_score``)
+            processed at the same time. It bounds the size of the
+            temporary arrays. If ``None``, all the samples are
+            processed at the same time.
+
+    Returns:
+        The number of correct predictions for each ``k``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.classification.topk_accuracy import top_k_correct
+    >>> top_k_correct(
+    ...     y_true=np.array([0, 1, 2, 2]),
+    ...     y_score=np.array(
+    ...         [[0.5, 0.2, 0.2], [0.3, 0.4, 0.2], [0.2, 0.4, 0.3], [0.7, 0.2, 0.1]]
+    ...     ),
+    ...     k=[1, 2, 3],
+    ... )
+    array([2, 3, 4])
+
+    ```
+    """
+    k = np.asarray(k, dtype=np.int64)
+    y_true = y_true.astype(np.intp, copy=False)
+    num_samples, num_classes = y_score.shape
+    max_rank = max(min(int(k.max(initial=0)), num_classes), 1)
+    chunk_size = chunk_size or max(num_samples, 1)
+    columns = np.arange(num_classes)
+    rank_counts = np.zeros(max_rank + 1, dtype=np.int64)
+    for start in range(0, num_samples, chunk_size):
+        score = y_score[start : start + chunk_size]
+        label = y_true[start : start + chunk_size]
+        true_score = score[np.arange(label.size), label][:, None]
+        rank = np.count_nonzero(score > true_score, axis=1)
+        rank += np.count_nonzero((score == true_score) & (columns > label[:, None]), axis=1)
+        rank_counts += np.bincount(np.minimum(rank, max_rank), minlength=max_rank + 1)
+    correct = np.cumsum(rank_counts)
+    return np.where(k >= num_classes, num_samples, correct[np.clip(k - 1, 0, max_rank)])
+
+
+def _check_k(k: Sequence[int]) -> None:
+    r"""Check the ``k`` values are valid.
+
+    Args:
+        k: The numbers of most likely outcomes considered to find the
+            correct label.
+
+    Raises:
+        ValueError: if a ``k`` value is lower than 1.
+    """
+    for _k in k:
+        if _k < 1:
+            msg = f"Incorrect k: {_k}. k must be greater than or equal to 1"
+            raise ValueError(msg)
+
+
+def _encode_labels(y_true: np.ndarray, num_classes: int) -> np.ndarray:
+    r"""Encode the labels to class indices in
+    ``{0, ..., num_classes-1}``.
+
+    Like ``sklearn.metrics.top_k_accuracy_score``, the classes are the
+    sorted unique labels, and all the classes must be in ``y_true``.
+
+    Args:
+        y_true: The ground truth target labels.
+        num_classes: The number of classes in the scores.
+
+    Returns:
+        The class indices.
+
+    Raises:
+        ValueError: if the number of classes in ``y_true`` is not
+            ``num_classes``.
+    """
+    classes = np.unique(y_true)
+    if classes.size != num_classes:
+        msg = (
+            f"Number of classes in 'y_true' ({classes.size}) not equal to the number "
+            f"of classes in 'y_score' ({num_classes})"
+        )
+        raise ValueError(msg)
+    return np.searchsorted(classes, y_true)
+
+
+def _format_top_k_accuracy(
+    correct: np.ndarray | None,
+    count: int,
+    k: Sequence[int],
     prefix: str = "",
     suffix: str = "",
-    nan_policy: str = "propagate",
-) -> dict[str, float | np.ndarray]:
-    r"""Return the Area Under the Top-k Accuracy classification metrics
-    for multiclass labels.
+) -> dict[str, float]:
+    r"""Return the top-k accuracy metrics from the number of correct
+    predictions.
 
     Args:
-        y_true: The ground truth target labels. This input must
-            be an array of shape ``(n_samples,)``.
-        y_score: The target scores, can either be probability
-            estimates of the positive class, confidence values,
-            or non-thresholded measure of decisions. This input must
-            be an array of shape ``(n_samples, n_classes)``.
+        correct: The number of correct predictions for each ``k``, or
+            ``None`` if the metrics cannot be computed.
+        count: The number of samples.
         k: The numbers of most likely outcomes considered to find the
             correct label.
         prefix: The key prefix in the returned dictionary.
         suffix: The key suffix in the returned dictionary.
-        nan_policy: The policy on how to handle NaN values in the input
-            arrays. The following options are available: ``'omit'``,
-            ``'propagate'``, and ``'raise'``.
 
     Returns:
         The computed metrics.
     """
-    check_sklearn()
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_score_nan = contains_nan(arr=y_score, nan_policy=nan_policy, name="'y_score'")
-
-    count = y_true.size
-    out = {}
-    for _k in k:
-        top_k_accuracy = float("nan")
-        if count > 0 and not y_true_nan and not y_score_nan:
-            top_k_accuracy = float(
-                metrics.top_k_accuracy_score(y_true=y_true, y_score=y_score, k=_k)
-            )
-        out[f"{prefix}top_{_k}_accuracy{suffix}"] = top_k_accuracy
+    if correct is None:
+        correct = np.full(len(k), np.nan)
+    out = {
+        f"{prefix}top_{_k}_accuracy{suffix}": float(num / count) if count > 0 else float("nan")
+        for _k, num in zip(k, correct)
+    }
     return {f"{prefix}count{suffix}": count} | out
@@ -0,0 +1,344 @@
+r"""Implement the Pearson and Spearman correlation matrices between the
+columns of 2d arrays."""
+
+from __future__ import annotations
+
+__all__ = ["pearsonr_matrix", "spearmanr_matrix"]
+
+
+import numpy as np
+
+from analora.array import isnan
+from analora.metric.correlation.utils import correlation_pvalues, pearson_coefficients
+from analora.metric.utils import check_nan_policy, contains_nan, rankdata
+from analora.utils.imports import check_scipy, is_polars_available, is_scipy_available
+
+if is_polars_available():
+    import polars as pl
+
+if is_scipy_available():
+    from scipy import stats
+
+
+def pearsonr_matrix(
+    x: np.ndarray | pl.DataFrame,
+    y: np.ndarray | pl.DataFrame | None = None,
+    *,
+    alternative: str = "two-sided",
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, np.ndarray]:
+    r"""Return the Pearson correlation coefficients and p-values between
+    the columns of two arrays.
+
+    Each column is standardized once, and all the correlation
+    coefficients are computed with a single matrix product. The
+    p-values are computed in bulk with the same test as
+    ``scipy.stats.pearsonr``.
+
+    Args:
+        x: The first input array of shape ``(n_samples, n_features_x)``
+            or a ``polars.DataFrame``. A 1d array is considered as a
+            single column.
+        y: The second input array of shape
+            ``(n_samples, n_features_y)`` or a ``polars.DataFrame``.
+            If ``None``, the correlations between the columns of ``x``
+            are computed.
+        alternative: The alternative hypothesis. Default is 'two-sided'.
+            The following options are available:
+            - 'two-sided': the correlation is nonzero
+            - 'less': the correlation is negative (less than zero)
+            - 'greater': the correlation is positive (greater than zero)
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``. With ``'omit'``, each
+            pair of columns uses the rows where both values are not
+            NaN.
+
+    Returns:
+        The computed metrics. Each value is an array of shape
+            ``(n_features_x, n_features_y)``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import pearsonr_matrix
+    >>> pearsonr_matrix(
+    ...     x=np.array([[1, 5, 2], [2, 4, 1], [3, 3, 5], [4, 2, 3], [5, 1, 4]]),
+    ... )
+    {'count': array([[5, 5, 5],
+                     [5, 5, 5],
+                     [5, 5, 5]]),
+     'pearson_coeff': array([[ 1. , -1. ,  0.6],
+                             [-1. ,  1. , -0.6],
+                             [ 0.6, -0.6,  1. ]]),
+     'pearson_pvalue': array([[0.        , 0.        , 0.284756...],
+                              [0.        , 0.        , 0.284756...],
+                              [0.284756..., 0.284756..., 0.        ]])}
+
+    ```
+    """
+    check_scipy()
+    x, y = _preprocess_matrices(x, y, nan_policy=nan_policy)
+    if nan_policy == "omit" and (contains_nan(x) or contains_nan(y)):
+        count, coeff = _pairwise_pearson(x, y)
+    else:
+        count = np.full((x.shape[1], y.shape[1]), x.shape[0], dtype=np.int64)
+        coeff = pearson_coefficients(x, y)
+    coeff[count < 2] = np.nan
+    pvalue = correlation_pvalues(coeff, count=count, alternative=alternative)
+    # Like scipy.stats.pearsonr, the p-value is 1 for two samples.
+    pvalue[np.logical_and(count == 2, ~np.isnan(coeff))] = 1.0
+    return {
+        f"{prefix}count{suffix}": count,
+        f"{prefix}pearson_coeff{suffix}": coeff,
+        f"{prefix}pearson_pvalue{suffix}": pvalue,
+    }
+
+
+def spearmanr_matrix(
+    x: np.ndarray | pl.DataFrame,
+    y: np.ndarray | pl.DataFrame | None = None,
+    *,
+    alternative: str = "two-sided",
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, np.ndarray]:
+    r"""Return the Spearman correlation coefficients and p-values
+    between the columns of two arrays.
+
+    Each column is ranked once, and all the correlation coefficients
+    are computed with a single matrix product of the standardized
+    ranks. The ranks are computed with
+    ``analora.metric.utils.rankdata``, so they are reused across calls
+    while a ``analora.metric.utils.RankCache`` is active. The p-values
+    are computed in bulk with the same test as
+    ``scipy.stats.spearmanr``. With ``nan_policy='omit'``, the ranks
+    depend on the rows kept for each pair of columns, so the columns
+    with NaN values are re-ranked for each NaN pattern of the other
+    array.
+
+    Args:
+        x: The first input array of shape ``(n_samples, n_features_x)``
+            or a ``polars.DataFrame``. A 1d array is considered as a
+            single column.
+        y: The second input array of shape
+            ``(n_samples, n_features_y)`` or a ``polars.DataFrame``.
+            If ``None``, the correlations between the columns of ``x``
+            are computed.
+        alternative: The alternative hypothesis. Default is 'two-sided'.
+            The following options are available:
+            - 'two-sided': the correlation is nonzero
+            - 'less': the correlation is negative (less than zero)
+            - 'greater': the correlation is positive (greater than zero)
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``. With ``'omit'``, each
+            pair of columns uses the rows where both values are not
+            NaN.
+
+    Returns:
+        The computed metrics. Each value is an array of shape
+            ``(n_features_x, n_features_y)``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import spearmanr_matrix
+    >>> spearmanr_matrix(
+    ...     x=np.array([[1, 5, 2], [2, 4, 1], [3, 3, 5], [4, 2, 3], [5, 1, 4]]),
+    ...     y=np.array([[1], [4], [9], [16], [25]]),
+    ... )
+    {'count': array([[5],
+                     [5],
+                     [5]]),
+     'spearman_coeff': array([[ 1. ],
+                              [-1. ],
+                              [ 0.6]]),
+     'spearman_pvalue': array([[0.        ],
+                               [0.        ],
+                               [0.284756...]])}
+
+    ```
+    """
+    check_scipy()
+    symmetric = y is None
+    x, y = _preprocess_matrices(x, y, nan_policy=nan_policy)
+    if nan_policy == "omit" and (contains_nan(x) or contains_nan(y)):
+        count, coeff = _pairwise_spearman(x, y)
+    else:
+        count = np.full((x.shape[1], y.shape[1]), x.shape[0], dtype=np.int64)
+        x_rank = rankdata(x)
+        coeff = pearson_coefficients(x_rank, x_rank if symmetric else rankdata(y))
+    coeff[count < 2] = np.nan
+    return {
+        f"{prefix}count{suffix}": count,
+        f"{prefix}spearman_coeff{suffix}": coeff,
+        f"{prefix}spearman_pvalue{suffix}": correlation_pvalues(
+            coeff, count=count, alternative=alternative
+        ),
+    }
+
+
+def _preprocess_matrices(
+    x: np.ndarray | pl.DataFrame, y: np.ndarray | pl.DataFrame | None, nan_policy: str
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Convert and check the input arrays of the correlation matrices.
+
+    Args:
+        x: The first input array or ``polars.DataFrame``.
+        y: The second input array or ``polars.DataFrame``. If
+            ``None``, ``x`` is used.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays.
+
+    Returns:
+        The two input arrays as 2d floating-point arrays.
+
+    Raises:
+        RuntimeError: if an array is not a 1d or 2d array, or if the
+            arrays have a different number of rows.
+        ValueError: if an array contains a NaN value and
+            ``nan_policy`` is ``'raise'``.
+    """
+    check_nan_policy(nan_policy)
+    x = _to_matrix(x, name="x")
+    y = x if y is None else _to_matrix(y, name="y")
+    if x.shape[0] != y.shape[0]:
+        msg = f"'x' and 'y' have different numbers of rows: {x.shape[0]} vs {y.shape[0]}"
+        raise RuntimeError(msg)
+    contains_nan(arr=x, nan_policy=nan_policy, name="'x'")
+    contains_nan(arr=y, nan_policy=nan_policy, name="'y'")
+    return x, y
+
+
+def _to_matrix(data: np.ndarray | pl.DataFrame, name: str) -> np.ndarray:
+    r"""Convert the input data to a 2d floating-point array.
+
+    Args:
+        data: The input array or ``polars.DataFrame``. The null
+            values of a ``polars.DataFrame`` are converted to NaN.
+        name: The name of the input data.
+
+    Returns:
+        The 2d floating-point array.
+
+    Raises:
+        RuntimeError: if the array is not a 1d or 2d array.
+    """
+    if is_polars_available() and isinstance(data, pl.DataFrame):
+        data = data.cast(pl.Float64).to_numpy()
+    arr = np.asarray(data, dtype=float)
+    if arr.ndim == 1:
+        arr = arr.reshape(-1, 1)
+    if arr.ndim != 2:
+        msg = f"'{name}' must be a 1d or 2d array but received an array of shape: {arr.shape}"
+        raise RuntimeError(msg)
+    return arr
+
+
+def _rank(arr: np.ndarray) -> np.ndarray:
+    r"""Rank the values of each column.
+
+    Ties get the average rank, and the columns with at least one NaN
+    value are filled with NaN.
+
+    Args:
+        arr: The 2d array to rank.
+
+    Returns:
+        The ranks of the values in each column.
+    """
+    if arr.shape[0] == 0:
+        return arr.copy()
+    return stats.rankdata(arr, axis=0)
+
+
+def _pairwise_pearson(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    r"""Compute the Pearson correlation coefficients between the columns
+    of two arrays, ignoring the NaN values pair by pair.
+
+    The sums over the rows kept by each pair are computed with matrix
+    products between the masked values and the masks.
+
+    Args:
+        x: The first 2d array.
+        y: The second 2d array.
+
+    Returns:
+        A tuple with the number of rows kept by each pair of columns
+            and the correlation coefficients.
+    """
+    x_raw, y_raw = x, y
+    x_valid = np.logical_not(isnan(x)).astype(float)
+    y_valid = np.logical_not(isnan(y)).astype(float)
+    # The columns are shifted by their mean to limit cancellation errors.
+    with np.errstate(invalid="ignore"):
+        x = np.nan_to_num(x - np.nanmean(x, axis=0, keepdims=True), nan=0.0)
+        y = np.nan_to_num(y - np.nanmean(y, axis=0, keepdims=True), nan=0.0)
+    count = x_valid.T @ y_valid
+    sum_x, sum_y = x.T @ y_valid, x_valid.T @ y
+    sum_sq_x, sum_sq_y = np.square(x).T @ y_valid, x_valid.T @ np.square(y)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = x.T @ y - sum_x * sum_y / count
+        var_x = sum_sq_x - np.square(sum_x) / count
+        var_y = sum_sq_y - np.square(sum_y) / count
+        coeff = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+    # The columns which are constant on the kept rows have a variance
+    # equal to zero up to the rounding errors.
+    tol = np.finfo(float).eps * count
+    coeff[np.logical_or(var_x <= tol * sum_sq_x, var_y <= tol * sum_sq_y)] = np.nan
+    # The pairs of columns without NaN values use the more accurate
+    # centered computation.
+    x_complete, y_complete = x_valid.all(axis=0), y_valid.all(axis=0)
+    coeff[np.ix_(x_complete, y_complete)] = pearson_coefficients(
+        x_raw[:, x_complete], y_raw[:, y_complete]
+    )
+    return count.round().astype(np.int64), coeff
+
+
+def _pairwise_spearman(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    r"""Compute the Spearman correlation coefficients between the columns
+    of two arrays, ignoring the NaN values pair by pair.
+
+    The columns of ``x`` are grouped by NaN pattern. For each group,
+    the rows are filtered once and the columns of ``y`` without NaN
+    values on these rows are ranked together. The other columns of
+    ``y`` are handled one by one.
+
+    Args:
+        x: The first 2d array.
+        y: The second 2d array.
+
+    Returns:
+        A tuple with the number of rows kept by each pair of columns
+            and the correlation coefficients.
+    """
+    x_nan, y_nan = isnan(x), isnan(y)
+    count = (~x_nan).T.astype(np.int64) @ (~y_nan).astype(np.int64)
+    coeff = np.full(count.shape, np.nan)
+    patterns, group = np.unique(x_nan, axis=1, return_inverse=True)
+    for i in range(patterns.shape[1]):
+        rows = ~patterns[:, i]
+        cols = np.flatnonzero(group.ravel() == i)
+        x_group, y_group = x[rows][:, cols], y[rows]
+        y_complete = ~y_nan[rows].any(axis=0)
+        coeff[np.ix_(cols, y_complete)] = pearson_coefficients(
+            _rank(x_group), _rank(y_group[:, y_complete])
+        )
+        for j in np.flatnonzero(~y_complete):
+            valid = ~y_nan[rows, j]
+            coeff[cols, j] = pearson_coefficients(
+                _rank(x_group[valid]), _rank(y_group[valid, j : j + 1])
+            ).ravel()
+    return count, coeff
@@ -5,16 +5,11 @@ from __future__ import annotations
 __all__ = ["spearmanr"]
 
 
-from typing import TYPE_CHECKING
+import numpy as np
 
-from analora.metric.utils import contains_nan, preprocess_same_shape_arrays
-from analora.utils.imports import check_scipy, is_scipy_available
-
-if is_scipy_available():
-    from scipy import stats
-
-if TYPE_CHECKING:
-    import numpy as np
+from analora.metric.correlation.utils import correlation_pvalues, pearson_coefficients
+from analora.metric.utils import contains_nan, preprocess_same_shape_arrays, rankdata
+from analora.utils.imports import check_scipy
 
 
 def spearmanr(
@@ -29,6 +24,10 @@ def spearmanr(
     r"""Return the Spearman correlation coefficient and p-value for
     testing non-correlation.
 
+    The ranks are computed with ``analora.metric.utils.rankdata``, so
+    they are reused across calls while a
+    ``analora.metric.utils.RankCache`` is active.
+
     Args:
         x: The first input array.
         y: The second input array.
@@ -70,8 +69,9 @@ def spearmanr(
     count = x.size
     coeff, pvalue = float("nan"), float("nan")
     if count > 1 and not x_nan and not y_nan:
-        result = stats.spearmanr(x, y, alternative=alternative)
-        coeff, pvalue = float(result.statistic), float(result.pvalue)
+        coeff = pearson_coefficients(rankdata(x).reshape(-1, 1), rankdata(y).reshape(-1, 1))
+        pvalue = correlation_pvalues(coeff, count=np.array([[count]]), alternative=alternative)
+        coeff, pvalue = float(coeff[0, 0]), float(pvalue[0, 0])
     return {
         f"{prefix}count{suffix}": count,
         f"{prefix}spearman_coeff{suffix}": coeff,
@@ -0,0 +1,121 @@
+r"""Contain utility functions shared by the correlation metrics."""
+
+from __future__ import annotations
+
+__all__ = ["correlation_pvalues", "pearson_coefficients"]
+
+
+import numpy as np
+
+from analora.utils.imports import is_scipy_available
+
+if is_scipy_available():
+    from scipy import stats
+
+
+def correlation_pvalues(coeff: np.ndarray, count: np.ndarray, alternative: str) -> np.ndarray:
+    r"""Compute the p-values of the correlation coefficients.
+
+    The p-values are computed with a t-test with ``count - 2`` degrees
+    of freedom, which is equivalent to the exact test of
+    ``scipy.stats.pearsonr`` and is the test of
+    ``scipy.stats.spearmanr``.
+
+    Args:
+        coeff: The correlation coefficients.
+        count: The number of samples used to compute each
+            coefficient.
+        alternative: The alternative hypothesis. The following options
+            are available: ``'two-sided'``, ``'less'``, and
+            ``'greater'``.
+
+    Returns:
+        The p-values.
+
+    Raises:
+        ValueError: if the alternative hypothesis is invalid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.correlation.utils import correlation_pvalues
+    >>> correlation_pvalues(np.array([[0.5]]), count=np.array([[10]]), alternative="two-sided")
+    array([[0.141...]])
+
+    ```
+    """
+    dof = count - 2.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tstat = coeff * np.sqrt(np.clip(dof / ((1.0 + coeff) * (1.0 - coeff)), 0, None))
+    tstat[dof <= 0] = np.nan
+    if alternative == "two-sided":
+        return np.minimum(2.0 * stats.t.sf(np.abs(tstat), dof), 1.0)
+    if alternative == "less":
+        return stats.t.cdf(tstat, dof)
+    if alternative == "greater":
+        return stats.t.sf(tstat, dof)
+    msg = (
+        f"Incorrect alternative: {alternative}. The valid values are "
+        "'two-sided', 'less', and 'greater'"
+    )
+    raise ValueError(msg)
+
+
+def pearson_coefficients(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    r"""Compute the Pearson correlation coefficients between the columns
+    of two arrays with the same number of rows.
+
+    The columns with at least one NaN value have NaN coefficients, and
+    the constant columns have NaN coefficients because the correlation
+    is not defined for them.
+
+    Args:
+        x: The first 2d array.
+        y: The second 2d array.
+
+    Returns:
+        The correlation coefficients of shape
+            ``(n_features_x, n_features_y)``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.correlation.utils import pearson_coefficients
+    >>> x = np.array([[1.0, 5.0], [2.0, 4.0], [3.0, 3.0], [4.0, 2.0]])
+    >>> pearson_coefficients(x, x)
+    array([[ 1., -1.],
+           [-1.,  1.]])
+
+    ```
+    """
+    x = _center(x)
+    y = x if y is x else _center(y)
+    sum_sq_x = np.einsum("ij,ij->j", x, x)
+    sum_sq_y = sum_sq_x if y is x else np.einsum("ij,ij->j", y, y)
+    # The square root of the product is exact for perfectly correlated
+    # columns, unlike the product of the square roots.
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.clip((x.T @ y) / np.sqrt(np.outer(sum_sq_x, sum_sq_y)), -1.0, 1.0)
+
+
+def _center(arr: np.ndarray) -> np.ndarray:
+    r"""Center each column of an array.
+
+    The constant columns are filled with NaN because the correlation
+    is not defined for them.
+
+    Args:
+        arr: The 2d array to center.
+
+    Returns:
+        The centered array.
+    """
+    if arr.shape[0] == 0:
+        return arr.copy()
+    out = arr - arr.mean(axis=0)
+    out[:, (arr == arr[0]).all(axis=0)] = np.nan
+    return out
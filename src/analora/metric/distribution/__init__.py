@@ -1 +1,8 @@
 r"""Contain functions to compute metrics on distributions."""
+
+from __future__ import annotations
+
+__all__ = ["ReferenceDistribution", "cdf_distance", "histogram_sketch", "quantile_sketch"]
+
+from analora.metric.distribution.cdf import cdf_distance, histogram_sketch, quantile_sketch
+from analora.metric.distribution.reference import ReferenceDistribution
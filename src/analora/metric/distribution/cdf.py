@@ -0,0 +1,264 @@
+r"""Contain functions to compute distances between the cumulative
+distribution functions (CDFs) of 1D distributions, and to summarize a
+distribution with a small sketch."""
+
+from __future__ import annotations
+
+__all__ = ["cdf_distance", "compute_cdf_distance", "histogram_sketch", "quantile_sketch"]
+
+
+import numpy as np
+
+from analora.array import has_nan, isnan
+from analora.metric.utils import contains_nan, preprocess_same_shape_arrays
+
+
+def cdf_distance(
+    u_values: np.ndarray,
+    v_values: np.ndarray,
+    *,
+    p: float = 1.0,
+    u_weights: np.ndarray | None = None,
+    v_weights: np.ndarray | None = None,
+) -> float:
+    r"""Compute the statistical distance between the CDFs of two 1D
+    distributions.
+
+    The distance is ``(int |U - V|^p dx)^(1/p)``, where ``U`` and ``V``
+    are the CDFs of the two distributions. The two samples are sorted
+    together, so the CDFs are evaluated on the merged values with
+    cumulative sums, and the samples can have different sizes.
+
+    Args:
+        u_values: The values observed in the first distribution.
+            The values must not contain NaN.
+        v_values: The values observed in the second distribution.
+            The values must not contain NaN.
+        p: The order of the distance. ``p=1`` gives the Wasserstein
+            distance, and ``p=2`` gives the energy distance divided by
+            ``sqrt(2)``.
+        u_weights: The optional weights of the values in the first
+            distribution. If ``None``, all the values have the same
+            weight.
+        v_weights: The optional weights of the values in the second
+            distribution. If ``None``, all the values have the same
+            weight.
+
+    Returns:
+        The distance, or NaN if a distribution is empty or has a total
+            weight of zero.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.distribution import cdf_distance
+    >>> cdf_distance(np.array([0.0, 1.0, 3.0]), np.array([5.0, 6.0, 8.0]))
+    5.0
+    >>> cdf_distance(np.array([0.0, 1.0]), np.array([0.0, 1.0, 2.0, 3.0]), p=2)
+    0.612...
+    >>> cdf_distance(
+    ...     np.array([0.0, 1.0]),
+    ...     np.array([0.0, 1.0]),
+    ...     u_weights=np.array([3.0, 1.0]),
+    ...     v_weights=np.array([1.0, 3.0]),
+    ... )
+    0.5
+
+    ```
+    """
+    u_values, v_values = np.ravel(u_values), np.ravel(v_values)
+    u_weights = np.ones(u_values.size) if u_weights is None else np.ravel(u_weights)
+    v_weights = np.ones(v_values.size) if v_weights is None else np.ravel(v_weights)
+    u_total, v_total = u_weights.sum(), v_weights.sum()
+    if u_values.size == 0 or v_values.size == 0 or u_total == 0 or v_total == 0:
+        return float("nan")
+
+    values = np.concatenate([u_values, v_values])
+    # The stable sort merges already sorted samples (e.g. sketches) in
+    # linear time.
+    order = np.argsort(values, kind="stable")
+    deltas = np.diff(values[order])
+    # Only the last position of a group of equal values has a non-zero
+    # delta, and all the group is counted in the CDFs at this position.
+    is_u = order[:-1] < u_values.size
+    weights = np.concatenate([u_weights, v_weights])[order[:-1]]
+    u_cdf = np.cumsum(np.where(is_u, weights, 0.0)) / u_total
+    v_cdf = np.cumsum(np.where(is_u, 0.0, weights)) / v_total
+    diff = np.abs(u_cdf - v_cdf)
+    if p == 1:
+        return float(np.dot(diff, deltas))
+    if p == 2:
+        return float(np.sqrt(np.dot(np.square(diff), deltas)))
+    return float(np.power(np.dot(np.power(diff, p), deltas), 1.0 / p))
+
+
+def histogram_sketch(
+    values: np.ndarray, bins: int | np.ndarray = 100, weights: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Summarize a distribution with a histogram.
+
+    The sketch is the centers of the non-empty bins and their counts.
+    It can be used as values and weights in the distribution metrics
+    (e.g. ``wasserstein_distance``), so a large reference sample is
+    summarized once. For the Wasserstein distance, the approximation
+    error of each sketch is at most half the bin width. The NaN values
+    are ignored.
+
+    Args:
+        values: The values observed in the distribution.
+        bins: The number of equal-width bins in the range of the
+            values, or the bin edges.
+        weights: The optional weights of the values.
+
+    Returns:
+        A tuple with the bin centers and the bin counts.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.distribution import histogram_sketch
+    >>> histogram_sketch(np.array([0.0, 1.0, 1.5, 4.0, float("nan")]), bins=4)
+    (array([0.5, 1.5, 3.5]), array([1., 2., 1.]))
+
+    ```
+    """
+    values = np.ravel(values)
+    if weights is not None:
+        weights = np.ravel(weights)
+    if has_nan(values):
+        mask = ~isnan(values)
+        values = values[mask]
+        if weights is not None:
+            weights = weights[mask]
+    counts, edges = np.histogram(values, bins=bins, weights=weights)
+    centers = (edges[:-1] + edges[1:]) / 2
+    nonzero = counts > 0
+    return centers[nonzero], counts[nonzero].astype(float)
+
+
+def quantile_sketch(values: np.ndarray, num_quantiles: int = 100) -> np.ndarray:
+    r"""Summarize a distribution with evenly spaced quantiles.
+
+    The sketch contains the quantiles at the probabilities
+    ``(i + 0.5) / num_quantiles``, so each quantile represents the
+    same probability mass. It can be used as values in the distribution
+    metrics (e.g. ``wasserstein_distance``), so a large reference
+    sample is summarized once. The NaN values are ignored.
+
+    Args:
+        values: The values observed in the distribution.
+        num_quantiles: The number of quantiles.
+
+    Returns:
+        The quantiles, or an empty array if there is no value.
+
+    Raises:
+        ValueError: if ``num_quantiles`` is lower than 1.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.distribution import quantile_sketch
+    >>> quantile_sketch(np.arange(101), num_quantiles=4)
+    array([12.5, 37.5, 62.5, 87.5])
+
+    ```
+    """
+    if num_quantiles < 1:
+        msg = (
+            f"Incorrect num_quantiles: {num_quantiles}. "
+            "num_quantiles must be greater than or equal to 1"
+        )
+        raise ValueError(msg)
+    values = np.ravel(values)
+    if has_nan(values):
+        values = values[~isnan(values)]
+    if values.size == 0:
+        return np.array([], dtype=float)
+    return np.quantile(values, (np.arange(num_quantiles) + 0.5) / num_quantiles)
+
+
+def compute_cdf_distance(
+    u_values: np.ndarray,
+    v_values: np.ndarray,
+    *,
+    p: float,
+    u_weights: np.ndarray | None,
+    v_weights: np.ndarray | None,
+    nan_policy: str,
+) -> tuple[int, float]:
+    r"""Preprocess the samples and compute the distance between their
+    CDFs.
+
+    The two samples are independent, so the NaN values are removed
+    independently in each sample. A value is also removed if its
+    weight is NaN.
+
+    Args:
+        u_values: The values observed in the first distribution.
+        v_values: The values observed in the second distribution.
+        p: The order of the distance.
+        u_weights: The optional weights of the values in the first
+            distribution.
+        v_weights: The optional weights of the values in the second
+            distribution.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays.
+
+    Returns:
+        A tuple with the number of values in the first distribution
+            and the distance.
+
+    Raises:
+        RuntimeError: if the weights and the values have different
+            shapes.
+        ValueError: if the weights contain negative values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.distribution.cdf import compute_cdf_distance
+    >>> compute_cdf_distance(
+    ...     np.array([0.0, 1.0, float("nan")]),
+    ...     np.array([1.0, 2.0]),
+    ...     p=1.0,
+    ...     u_weights=None,
+    ...     v_weights=None,
+    ...     nan_policy="omit",
+    ... )
+    (2, 1.0)
+
+    ```
+    """
+    u_values, v_values = np.ravel(u_values), np.ravel(v_values)
+    u_weights = np.ones(u_values.size) if u_weights is None else np.ravel(u_weights)
+    v_weights = np.ones(v_values.size) if v_weights is None else np.ravel(v_weights)
+    drop_nan = nan_policy == "omit"
+    u_values, u_weights = preprocess_same_shape_arrays(
+        arrays=[u_values, u_weights], drop_nan=drop_nan
+    )
+    v_values, v_weights = preprocess_same_shape_arrays(
+        arrays=[v_values, v_weights], drop_nan=drop_nan
+    )
+    found = contains_nan(arr=u_values, nan_policy=nan_policy, name="'u_values'")
+    found |= contains_nan(arr=v_values, nan_policy=nan_policy, name="'v_values'")
+    found |= contains_nan(arr=u_weights, nan_policy=nan_policy, name="'u_weights'")
+    found |= contains_nan(arr=v_weights, nan_policy=nan_policy, name="'v_weights'")
+    for name, weights in [("u_weights", u_weights), ("v_weights", v_weights)]:
+        if np.any(weights < 0):
+            msg = f"Incorrect {name}: the weights must be non-negative"
+            raise ValueError(msg)
+
+    count = u_values.size
+    dist = float("nan")
+    if count > 0 and not found:
+        dist = cdf_distance(u_values, v_values, p=p, u_weights=u_weights, v_weights=v_weights)
+    return count, dist
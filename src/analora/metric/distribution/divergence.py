@@ -0,0 +1,143 @@
+r"""Implement the Kullback-Leibler (KL) and Jensen-Shannon (JS)
+divergences between many pairs of distributions at once."""
+
+from __future__ import annotations
+
+__all__ = ["batched_divergences"]
+
+
+import numpy as np
+
+
+def batched_divergences(
+    p: np.ndarray,
+    q: np.ndarray,
+    *,
+    prefix: str = "",
+    suffix: str = "",
+) -> dict[str, int | np.ndarray]:
+    r"""Return the KL and JS divergences between many pairs of
+    distributions.
+
+    Each row of ``p`` and ``q`` is a discrete distribution, and the
+    divergences are computed for each pair of rows in a single
+    vectorized pass. The logarithms of ``p``, ``q``, and their mixture
+    are computed once and shared by ``KL(p||q)``, ``KL(q||p)``, and the
+    JS divergence. The values are the same as the ones computed by
+    ``kl_div`` and ``jensen_shannon_divergence`` for each pair.
+
+    Args:
+        p: The true probability distributions, as an array of shape
+            ``(n_pairs, n_bins)``. A 1d array is a single distribution
+            compared to all the distributions in ``q``.
+        q: The model probability distributions, as an array of shape
+            ``(n_pairs, n_bins)``. A 1d array is a single distribution
+            compared to all the distributions in ``p``.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+
+    Returns:
+        The computed metrics. ``'size'`` is the number of bins, and
+            the divergences are arrays of shape ``(n_pairs,)``.
+
+    Raises:
+        RuntimeError: if the arrays are not 1d or 2d arrays, or if
+            their shapes are not compatible.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import batched_divergences
+    >>> batched_divergences(
+    ...     p=np.array([[0.1, 0.6, 0.1, 0.2], [0.25, 0.25, 0.25, 0.25]]),
+    ...     q=np.array([0.2, 0.5, 0.2, 0.1]),
+    ... )
+    {'size': 4,
+     'kl_pq': array([0.10939293, 0.16735766]),
+     'kl_qp': array([0.11678338, 0.1656871 ]),
+     'jensen_shannon_divergence': array([0.02776072, 0.04062448])}
+
+    ```
+    """
+    p, q = _preprocess_distributions(p, q)
+    size = p.shape[1]
+    if size == 0:
+        nan = np.full(p.shape[0], np.nan)
+        kl_pq, kl_qp, js = nan, nan.copy(), nan.copy()
+    else:
+        kl_pq, kl_qp, js = _divergences(p, q)
+    return {
+        f"{prefix}size{suffix}": size,
+        f"{prefix}kl_pq{suffix}": kl_pq,
+        f"{prefix}kl_qp{suffix}": kl_qp,
+        f"{prefix}jensen_shannon_divergence{suffix}": js,
+    }
+
+
+def _preprocess_distributions(p: np.ndarray, q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    r"""Convert the distributions to 2d floating-point arrays with the
+    same shape.
+
+    Args:
+        p: The first distributions.
+        q: The second distributions.
+
+    Returns:
+        The two arrays of shape ``(n_pairs, n_bins)``.
+
+    Raises:
+        RuntimeError: if the arrays are not 1d or 2d arrays, or if
+            their shapes are not compatible.
+    """
+    p, q = np.asarray(p, dtype=float), np.asarray(q, dtype=float)
+    for name, arr in [("p", p), ("q", q)]:
+        if arr.ndim not in {1, 2}:
+            msg = f"'{name}' must be a 1d or 2d array but received an array of shape: {arr.shape}"
+            raise RuntimeError(msg)
+    try:
+        return np.broadcast_arrays(np.atleast_2d(p), np.atleast_2d(q))
+    except ValueError as exc:
+        msg = f"'p' and 'q' have incompatible shapes: {p.shape} vs {q.shape}"
+        raise RuntimeError(msg) from exc
+
+
+def _divergences(p: np.ndarray, q: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    r"""Compute the KL and JS divergences for each pair of rows.
+
+    The terms follow the conventions of ``scipy.special.rel_entr``:
+    a zero probability contributes ``0``, a positive probability
+    compared to a zero probability contributes ``inf``, the NaN values
+    are propagated, and the divergences of the rows with negative
+    values are ``inf``.
+
+    Args:
+        p: The first distributions of shape ``(n_pairs, n_bins)``.
+        q: The second distributions of shape ``(n_pairs, n_bins)``.
+
+    Returns:
+        A tuple with ``KL(p||q)``, ``KL(q||p)``, and the JS divergence
+            of each pair.
+    """
+    nan_p, nan_q = np.isnan(p), np.isnan(q)
+    # A zero probability contributes 0 only if the other probability is
+    # not NaN, like rel_entr(0, nan) which is NaN.
+    zero_p = np.logical_and(p == 0, ~nan_q)
+    zero_q = np.logical_and(q == 0, ~nan_p)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_p, log_q = np.log(p), np.log(q)
+        log_m = np.log(0.5 * (p + q))
+        log_ratio = log_p - log_q
+        kl_pq = np.where(zero_p, 0.0, p * log_ratio).sum(axis=1)
+        kl_qp = np.where(zero_q, 0.0, -q * log_ratio).sum(axis=1)
+        js = 0.5 * (
+            np.where(zero_p, 0.0, p * (log_p - log_m)) + np.where(zero_q, 0.0, q * (log_q - log_m))
+        ).sum(axis=1)
+    # The rows with negative values are inf, unless they contain NaN
+    # values, which are propagated.
+    negative = np.logical_or(p < 0, q < 0).any(axis=1)
+    negative &= ~np.logical_or(nan_p, nan_q).any(axis=1)
+    if negative.any():
+        kl_pq[negative] = kl_qp[negative] = js[negative] = np.inf
+    return kl_pq, kl_qp, js
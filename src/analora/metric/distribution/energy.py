@@ -4,14 +4,10 @@ from __future__ import annotations
 
 __all__ = ["energy_distance"]
 
-
+import math
 from typing import TYPE_CHECKING
 
-from analora.metric.utils import contains_nan, preprocess_same_shape_arrays
-from analora.utils.imports import check_scipy, is_scipy_available
-
-if is_scipy_available():
-    from scipy import stats
+from analora.metric.distribution.cdf import compute_cdf_distance
 
 if TYPE_CHECKING:
     import numpy as np
@@ -21,15 +17,30 @@ def energy_distance(
     u_values: np.ndarray,
     v_values: np.ndarray,
     *,
+    u_weights: np.ndarray | None = None,
+    v_weights: np.ndarray | None = None,
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
 ) -> dict[str, float]:
     r"""Return the energy distance between two 1D distributions.
 
+    The distance is computed from the merged CDFs of the two samples
+    (see ``cdf_distance``), so the samples can have different sizes.
+    The NaN values are removed independently in each sample.
+    A large reference sample can be summarized once with
+    ``histogram_sketch`` or ``quantile_sketch``, and the sketch used as
+    values and weights to compute an approximate distance.
+
     Args:
         u_values: The values observed in the (empirical) distribution.
         v_values: The values observed in the (empirical) distribution.
+        u_weights: The optional weights of the values in
+            ``u_values``. If ``None``, all the values have the same
+            weight.
+        v_weights: The optional weights of the values in
+            ``v_values``. If ``None``, all the values have the same
+            weight.
         prefix: The key prefix in the returned dictionary.
         suffix: The key suffix in the returned dictionary.
         nan_policy: The policy on how to handle NaN values in the input
@@ -37,7 +48,13 @@ def energy_distance(
             ``'propagate'``, and ``'raise'``.
 
     Returns:
-        The computed metrics.
+        The computed metrics. ``'count'`` is the number of values in
+            ``u_values`` after the NaN values are removed.
+
+    Raises:
+        RuntimeError: if the weights and the values have different
+            shapes.
+        ValueError: if the weights contain negative values.
 
     Example usage:
 
@@ -47,20 +64,20 @@ def energy_distance(
     >>> from analora.metric import energy_distance
     >>> energy_distance(u_values=np.array([1, 2, 3, 4, 5]), v_values=np.array([1, 2, 3, 4, 5]))
     {'count': 5, 'energy_distance': 0.0}
+    >>> energy_distance(u_values=np.array([0, 0, 0]), v_values=np.array([1, 1, 1, 1]))
+    {'count': 3, 'energy_distance': 1.414...}
 
     ```
     """
-    check_scipy()
-    u_values, v_values = preprocess_same_shape_arrays(
-        arrays=[u_values.ravel(), v_values.ravel()], drop_nan=nan_policy == "omit"
+    count, dist = compute_cdf_distance(
+        u_values,
+        v_values,
+        p=2.0,
+        u_weights=u_weights,
+        v_weights=v_weights,
+        nan_policy=nan_policy,
     )
-    u_nan = contains_nan(arr=u_values, nan_policy=nan_policy, name="'u_values'")
-    v_nan = contains_nan(arr=v_values, nan_policy=nan_policy, name="'v_values'")
-
-    count = u_values.size
-    dist = float("nan")
-    if count > 0 and not u_nan and not v_nan:
-        dist = float(stats.energy_distance(u_values, v_values))
+    dist *= math.sqrt(2)
     return {
         f"{prefix}count{suffix}": count,
         f"{prefix}energy_distance{suffix}": dist,
@@ -0,0 +1,628 @@
+r"""Implement a reference distribution that is processed once and then
+compared to many samples."""
+
+from __future__ import annotations
+
+__all__ = ["ReferenceDistribution"]
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+from coola.utils.format import repr_mapping_line
+
+from analora.metric.distribution.cdf import cdf_distance
+from analora.metric.distribution.divergence import batched_divergences
+from analora.metric.utils import contains_nan, preprocess_same_shape_arrays
+from analora.utils.path import sanitize_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class ReferenceDistribution:
+    r"""Implement a reference distribution that is processed once and
+    then compared to many samples.
+
+    The sorted distinct values of the reference sample, its CDF, the
+    integrals of its CDF, a histogram and a quantile sketch are
+    computed once. Then, the distances and divergences between the
+    reference and a new sample only need to sort or bin the new sample,
+    and to search its values in the precomputed reference, so the cost
+    of a comparison is proportional to the size of the new sample. The
+    reference can be saved to disk with ``save``, and loaded with
+    ``ReferenceDistribution.load``.
+
+    Args:
+        values: The values observed in the reference distribution.
+            The NaN values are ignored.
+        weights: The optional weights of the values. If ``None``, all
+            the values have the same weight.
+        bins: The number of equal-width bins of the histogram in the
+            range of the values, or the bin edges. The histogram is used
+            by the divergences.
+        num_quantiles: The number of quantiles of the quantile sketch.
+            The quantile sketch is used by the approximate distances.
+
+    Raises:
+        ValueError: if there is no non-NaN value with a positive
+            weight, if the weights contain negative values, or if
+            ``num_quantiles`` is lower than 1.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.distribution import ReferenceDistribution
+    >>> ref = ReferenceDistribution(np.array([1, 2, 2, 3, 5]), bins=4, num_quantiles=2)
+    >>> ref
+    ReferenceDistribution(count=5, num_values=4, num_bins=4, num_quantiles=2)
+    >>> ref.values
+    array([1., 2., 3., 5.])
+    >>> ref.cdf
+    array([0.2, 0.6, 0.8, 1. ])
+    >>> ref.wasserstein_distance(np.array([1, 2, 3, 5, 5]))
+    {'count': 5, 'wasserstein_distance': 0.6...}
+    >>> ref.energy_distance(np.array([1, 2, 3, 5, 5]))
+    {'count': 5, 'energy_distance': 0.489...}
+    >>> ref.kl_div(np.array([1, 2, 3, 5, 5]))
+    {'size': 4, 'kl_pq': 0.138..., 'kl_qp': 0.138...}
+
+    ```
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        *,
+        weights: np.ndarray | None = None,
+        bins: int | np.ndarray = 100,
+        num_quantiles: int = 100,
+    ) -> None:
+        if num_quantiles < 1:
+            msg = (
+                f"Incorrect num_quantiles: {num_quantiles}. "
+                "num_quantiles must be greater than or equal to 1"
+            )
+            raise ValueError(msg)
+        values = np.ravel(values).astype(float)
+        weights = np.ones(values.size) if weights is None else np.ravel(weights).astype(float)
+        values, weights = preprocess_same_shape_arrays(arrays=[values, weights], drop_nan=True)
+        _check_weights(weights)
+        if values.size == 0 or weights.sum() <= 0:
+            msg = "The reference distribution must have at least one non-NaN value"
+            raise ValueError(msg)
+
+        support, inverse = np.unique(values, return_inverse=True)
+        cdf = np.cumsum(np.bincount(inverse, weights=weights))
+        bin_counts, bin_edges = np.histogram(values, bins=bins, weights=weights)
+        quantiles = np.quantile(
+            values, _probabilities(num_quantiles), weights=weights, method="inverted_cdf"
+        )
+        self._set_state(
+            count=values.size,
+            values=support,
+            cdf=cdf / cdf[-1],
+            bin_edges=bin_edges,
+            bin_counts=bin_counts.astype(float),
+            quantiles=quantiles,
+        )
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "count": self._count,
+                "num_values": self._values.size,
+                "num_bins": self._bin_counts.size,
+                "num_quantiles": self._quantiles.size,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of values in the reference sample."""
+        return self._count
+
+    @property
+    def values(self) -> np.ndarray:
+        r"""The distinct values of the reference sample sorted in
+        increasing order."""
+        return self._values
+
+    @property
+    def cdf(self) -> np.ndarray:
+        r"""The CDF of the reference distribution at each distinct
+        value."""
+        return self._cdf
+
+    @property
+    def bin_edges(self) -> np.ndarray:
+        r"""The bin edges of the histogram."""
+        return self._bin_edges
+
+    @property
+    def bin_counts(self) -> np.ndarray:
+        r"""The (weighted) number of values in each bin of the
+        histogram."""
+        return self._bin_counts
+
+    @property
+    def quantiles(self) -> np.ndarray:
+        r"""The quantile sketch, i.e. the quantiles at the probabilities
+        ``(i + 0.5) / num_quantiles``."""
+        return self._quantiles
+
+    def wasserstein_distance(
+        self,
+        values: np.ndarray,
+        *,
+        weights: np.ndarray | None = None,
+        approximate: bool = False,
+        prefix: str = "",
+        suffix: str = "",
+        nan_policy: str = "propagate",
+    ) -> dict[str, float]:
+        r"""Return the Wasserstein distance between a sample and the
+        reference distribution.
+
+        Args:
+            values: The values observed in the sample.
+            weights: The optional weights of the values.
+            approximate: If ``True``, the distance is computed between
+                the quantile sketches of the sample and the reference,
+                so the sample is not sorted.
+            prefix: The key prefix in the returned dictionary.
+            suffix: The key suffix in the returned dictionary.
+            nan_policy: The policy on how to handle NaN values in the
+                input arrays. The following options are available:
+                ``'omit'``, ``'propagate'``, and ``'raise'``.
+
+        Returns:
+            The computed metrics. ``'count'`` is the number of values
+                in the sample.
+
+        Raises:
+            ValueError: if the weights contain negative values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.distribution import ReferenceDistribution
+        >>> ref = ReferenceDistribution(np.array([0, 1, 3]))
+        >>> ref.wasserstein_distance(np.array([5, 6, 8]))
+        {'count': 3, 'wasserstein_distance': 5.0}
+
+        ```
+        """
+        count, dist = self._distance(
+            values, weights=weights, p=1, approximate=approximate, nan_policy=nan_policy
+        )
+        return {
+            f"{prefix}count{suffix}": count,
+            f"{prefix}wasserstein_distance{suffix}": dist,
+        }
+
+    def energy_distance(
+        self,
+        values: np.ndarray,
+        *,
+        weights: np.ndarray | None = None,
+        approximate: bool = False,
+        prefix: str = "",
+        suffix: str = "",
+        nan_policy: str = "propagate",
+    ) -> dict[str, float]:
+        r"""Return the energy distance between a sample and the
+        reference distribution.
+
+        Args:
+            values: The values observed in the sample.
+            weights: The optional weights of the values.
+            approximate: If ``True``, the distance is computed between
+                the quantile sketches of the sample and the reference,
+                so the sample is not sorted.
+            prefix: The key prefix in the returned dictionary.
+            suffix: The key suffix in the returned dictionary.
+            nan_policy: The policy on how to handle NaN values in the
+                input arrays. The following options are available:
+                ``'omit'``, ``'propagate'``, and ``'raise'``.
+
+        Returns:
+            The computed metrics. ``'count'`` is the number of values
+                in the sample.
+
+        Raises:
+            ValueError: if the weights contain negative values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.distribution import ReferenceDistribution
+        >>> ref = ReferenceDistribution(np.array([0, 0, 0]))
+        >>> ref.energy_distance(np.array([2, 2, 2, 2]))
+        {'count': 4, 'energy_distance': 2.0...}
+
+        ```
+        """
+        count, dist = self._distance(
+            values, weights=weights, p=2, approximate=approximate, nan_policy=nan_policy
+        )
+        return {
+            f"{prefix}count{suffix}": count,
+            f"{prefix}energy_distance{suffix}": dist * math.sqrt(2),
+        }
+
+    def kl_div(
+        self,
+        values: np.ndarray,
+        *,
+        weights: np.ndarray | None = None,
+        prefix: str = "",
+        suffix: str = "",
+        nan_policy: str = "propagate",
+    ) -> dict[str, float]:
+        r"""Return the Kullback-Leibler (KL) divergence between the
+        reference distribution and a sample.
+
+        The sample is binned with the bin edges of the reference
+        histogram, and the values outside the reference range are
+        counted in the first or last bin. ``p`` is the reference
+        distribution, and ``q`` is the sample distribution.
+
+        Args:
+            values: The values observed in the sample.
+            weights: The optional weights of the values.
+            prefix: The key prefix in the returned dictionary.
+            suffix: The key suffix in the returned dictionary.
+            nan_policy: The policy on how to handle NaN values in the
+                input arrays. The following options are available:
+                ``'omit'``, ``'propagate'``, and ``'raise'``.
+
+        Returns:
+            The computed metrics. ``'size'`` is the number of bins.
+
+        Raises:
+            ValueError: if the weights contain negative values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.distribution import ReferenceDistribution
+        >>> ref = ReferenceDistribution(np.array([0, 1, 2, 3]), bins=2)
+        >>> ref.kl_div(np.array([0, 1, 2, 3]))
+        {'size': 2, 'kl_pq': 0.0, 'kl_qp': 0.0}
+
+        ```
+        """
+        out = self._divergences(values, weights=weights, nan_policy=nan_policy)
+        return {
+            f"{prefix}size{suffix}": self._bin_counts.size,
+            f"{prefix}kl_pq{suffix}": out["kl_pq"],
+            f"{prefix}kl_qp{suffix}": out["kl_qp"],
+        }
+
+    def jensen_shannon_divergence(
+        self,
+        values: np.ndarray,
+        *,
+        weights: np.ndarray | None = None,
+        prefix: str = "",
+        suffix: str = "",
+        nan_policy: str = "propagate",
+    ) -> dict[str, float]:
+        r"""Return the Jensen-Shannon (JS) divergence between the
+        reference distribution and a sample.
+
+        The sample is binned with the bin edges of the reference
+        histogram, and the values outside the reference range are
+        counted in the first or last bin.
+
+        Args:
+            values: The values observed in the sample.
+            weights: The optional weights of the values.
+            prefix: The key prefix in the returned dictionary.
+            suffix: The key suffix in the returned dictionary.
+            nan_policy: The policy on how to handle NaN values in the
+                input arrays. The following options are available:
+                ``'omit'``, ``'propagate'``, and ``'raise'``.
+
+        Returns:
+            The computed metrics. ``'size'`` is the number of bins.
+
+        Raises:
+            ValueError: if the weights contain negative values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.distribution import ReferenceDistribution
+        >>> ref = ReferenceDistribution(np.array([0, 1, 2, 3]), bins=2)
+        >>> ref.jensen_shannon_divergence(np.array([0, 1, 2, 3]))
+        {'size': 2, 'jensen_shannon_divergence': 0.0}
+
+        ```
+        """
+        out = self._divergences(values, weights=weights, nan_policy=nan_policy)
+        return {
+            f"{prefix}size{suffix}": self._bin_counts.size,
+            f"{prefix}jensen_shannon_divergence{suffix}": out["jensen_shannon_divergence"],
+        }
+
+    def save(self, path: Path | str) -> None:
+        r"""Save the reference distribution to a ``.npz`` file.
+
+        Args:
+            path: The path to the file. The parent directories are
+                created if they do not exist.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> import numpy as np
+        >>> from analora.metric.distribution import ReferenceDistribution
+        >>> ref = ReferenceDistribution(np.array([1, 2, 2, 3, 5]))
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("ref.npz")
+        ...     ref.save(path)
+        ...     ReferenceDistribution.load(path)
+        ...
+        ReferenceDistribution(count=5, num_values=4, num_bins=100, num_quantiles=100)
+
+        ```
+        """
+        path = sanitize_path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open(mode="wb") as file:
+            np.savez(
+                file,
+                count=self._count,
+                values=self._values,
+                cdf=self._cdf,
+                bin_edges=self._bin_edges,
+                bin_counts=self._bin_counts,
+                quantiles=self._quantiles,
+            )
+
+    @classmethod
+    def load(cls, path: Path | str) -> ReferenceDistribution:
+        r"""Load a reference distribution saved with ``save``.
+
+        Args:
+            path: The path to the file.
+
+        Returns:
+            The reference distribution.
+        """
+        with np.load(sanitize_path(path), allow_pickle=False) as data:
+            ref = cls.__new__(cls)
+            ref._set_state(
+                count=int(data["count"]),
+                values=data["values"],
+                cdf=data["cdf"],
+                bin_edges=data["bin_edges"],
+                bin_counts=data["bin_counts"],
+                quantiles=data["quantiles"],
+            )
+        return ref
+
+    def _set_state(
+        self,
+        *,
+        count: int,
+        values: np.ndarray,
+        cdf: np.ndarray,
+        bin_edges: np.ndarray,
+        bin_counts: np.ndarray,
+        quantiles: np.ndarray,
+    ) -> None:
+        r"""Set the state of the reference distribution, and compute the
+        integrals of the CDF.
+
+        Args:
+            count: The number of values in the reference sample.
+            values: The sorted distinct values.
+            cdf: The CDF at each distinct value.
+            bin_edges: The bin edges of the histogram.
+            bin_counts: The counts of the histogram.
+            quantiles: The quantile sketch.
+        """
+        self._count = count
+        self._values = values
+        self._cdf = cdf
+        self._bin_edges = bin_edges
+        self._bin_counts = bin_counts
+        self._quantiles = quantiles
+        # The integrals of the CDF and of its square from the smallest
+        # value to each distinct value. The CDF is constant between two
+        # distinct values, so the integrals are piecewise linear.
+        deltas = np.diff(values)
+        self._cdf_integral = np.concatenate([[0.0], np.cumsum(cdf[:-1] * deltas)])
+        self._cdf2_integral = np.concatenate([[0.0], np.cumsum(np.square(cdf[:-1]) * deltas)])
+
+    def _distance(
+        self,
+        values: np.ndarray,
+        weights: np.ndarray | None,
+        p: int,
+        approximate: bool,
+        nan_policy: str,
+    ) -> tuple[int, float]:
+        r"""Compute the distance between the CDFs of a sample and the
+        reference distribution.
+
+        Args:
+            values: The values observed in the sample.
+            weights: The optional weights of the values.
+            p: The order of the distance. Only ``1`` and ``2`` are
+                supported.
+            approximate: If ``True``, the distance is computed between
+                the quantile sketches.
+            nan_policy: The policy on how to handle NaN values.
+
+        Returns:
+            A tuple with the number of values in the sample and the
+                distance.
+        """
+        values, weights, found = _preprocess_sample(values, weights, nan_policy=nan_policy)
+        count = values.size
+        if count == 0 or found or weights.sum() <= 0:
+            return count, float("nan")
+        if approximate:
+            quantiles = np.quantile(
+                values,
+                _probabilities(self._quantiles.size),
+                weights=weights,
+                method="inverted_cdf",
+            )
+            return count, cdf_distance(self._quantiles, quantiles, p=p)
+
+        order = np.argsort(values)
+        values = values[order]
+        cdf = np.cumsum(weights[order])
+        cdf /= cdf[-1]
+        # The CDF of the sample is constant on each segment between two
+        # consecutive values, and the segments before the first value
+        # and after the last value have a CDF of 0 and 1.
+        lower = min(values[0], self._values[0])
+        upper = max(values[-1], self._values[-1])
+        starts = np.concatenate([[lower], values])
+        ends = np.concatenate([values, [upper]])
+        levels = np.concatenate([[0.0], cdf])
+        start_integral = self._integral(starts)
+        end_integral = self._integral(ends)
+        if p == 1:
+            # The reference CDF is lower than the level before the
+            # crossing point, and greater than or equal after.
+            index = np.minimum(np.searchsorted(self._cdf, levels), self._cdf.size - 1)
+            cross = np.clip(self._values[index], starts, ends)
+            cross_integral = self._integral(cross)
+            dist = (
+                levels * (cross - starts)
+                - (cross_integral - start_integral)
+                + (end_integral - cross_integral)
+                - levels * (ends - cross)
+            ).sum()
+            return count, float(max(dist, 0.0))
+        dist = (
+            self._integral(ends, squared=True)
+            - self._integral(starts, squared=True)
+            - 2 * levels * (end_integral - start_integral)
+            + np.square(levels) * (ends - starts)
+        ).sum()
+        return count, float(np.sqrt(max(dist, 0.0)))
+
+    def _integral(self, points: np.ndarray, squared: bool = False) -> np.ndarray:
+        r"""Evaluate the integral of the reference CDF from the smallest
+        reference value to some points.
+
+        Args:
+            points: The points where to evaluate the integral.
+            squared: If ``True``, the integral of the squared CDF is
+                evaluated.
+
+        Returns:
+            The integral at each point.
+        """
+        index = np.searchsorted(self._values, points, side="right") - 1
+        valid = np.maximum(index, 0)
+        integral, slope = self._cdf_integral[valid], self._cdf[valid]
+        if squared:
+            integral, slope = self._cdf2_integral[valid], np.square(slope)
+        return np.where(index < 0, 0.0, integral + slope * (points - self._values[valid]))
+
+    def _divergences(
+        self, values: np.ndarray, weights: np.ndarray | None, nan_policy: str
+    ) -> dict[str, float]:
+        r"""Compute the divergences between the reference histogram and
+        the histogram of a sample.
+
+        Args:
+            values: The values observed in the sample.
+            weights: The optional weights of the values.
+            nan_policy: The policy on how to handle NaN values.
+
+        Returns:
+            The KL and JS divergences.
+        """
+        values, weights, found = _preprocess_sample(values, weights, nan_policy=nan_policy)
+        if values.size == 0 or found or weights.sum() <= 0:
+            nan = float("nan")
+            return {"kl_pq": nan, "kl_qp": nan, "jensen_shannon_divergence": nan}
+        counts, _ = np.histogram(
+            np.clip(values, self._bin_edges[0], self._bin_edges[-1]),
+            bins=self._bin_edges,
+            weights=weights,
+        )
+        out = batched_divergences(
+            p=self._bin_counts / self._bin_counts.sum(), q=counts / counts.sum()
+        )
+        return {key: float(out[key][0]) for key in ["kl_pq", "kl_qp", "jensen_shannon_divergence"]}
+
+
+def _preprocess_sample(
+    values: np.ndarray, weights: np.ndarray | None, nan_policy: str
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    r"""Preprocess the values and weights of a sample.
+
+    Args:
+        values: The values observed in the sample.
+        weights: The optional weights of the values.
+        nan_policy: The policy on how to handle NaN values.
+
+    Returns:
+        A tuple with the flat values, the flat weights, and a boolean
+            indicating if the values or weights contain a NaN value.
+
+    Raises:
+        RuntimeError: if the weights and the values have different
+            shapes.
+        ValueError: if the weights contain negative values.
+    """
+    values = np.ravel(values).astype(float)
+    weights = np.ones(values.size) if weights is None else np.ravel(weights).astype(float)
+    values, weights = preprocess_same_shape_arrays(
+        arrays=[values, weights], drop_nan=nan_policy == "omit"
+    )
+    found = contains_nan(arr=values, nan_policy=nan_policy, name="'values'")
+    found |= contains_nan(arr=weights, nan_policy=nan_policy, name="'weights'")
+    _check_weights(weights)
+    return values, weights, found
+
+
+def _check_weights(weights: np.ndarray) -> None:
+    r"""Check that the weights are non-negative.
+
+    Args:
+        weights: The weights to check. The NaN values are ignored.
+
+    Raises:
+        ValueError: if the weights contain negative values.
+    """
+    if np.any(weights < 0):
+        msg = "Incorrect weights: the weights must be non-negative"
+        raise ValueError(msg)
+
+
+def _probabilities(num_quantiles: int) -> np.ndarray:
+    r"""Return the probabilities of the quantile sketch.
+
+    Args:
+        num_quantiles: The number of quantiles.
+
+    Returns:
+        The probabilities ``(i + 0.5) / num_quantiles``.
+    """
+    return (np.arange(num_quantiles) + 0.5) / num_quantiles
@@ -5,14 +5,9 @@ from __future__ import annotations
 
 __all__ = ["wasserstein_distance"]
 
-
 from typing import TYPE_CHECKING
 
-from analora.metric.utils import contains_nan, preprocess_same_shape_arrays
-from analora.utils.imports import check_scipy, is_scipy_available
-
-if is_scipy_available():
-    from scipy import stats
+from analora.metric.distribution.cdf import compute_cdf_distance
 
 if TYPE_CHECKING:
     import numpy as np
@@ -22,6 +17,8 @@ def wasserstein_distance(
     u_values: np.ndarray,
     v_values: np.ndarray,
     *,
+    u_weights: np.ndarray | None = None,
+    v_weights: np.ndarray | None = None,
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
@@ -29,6 +26,13 @@ def wasserstein_distance(
     r"""Return the Wasserstein distance between two 1D discrete
     distributions.
 
+    The distance is computed from the merged CDFs of the two samples
+    (see ``cdf_distance``), so the samples can have different sizes.
+    The NaN values are removed independently in each sample.
+    A large reference sample can be summarized once with
+    ``histogram_sketch`` or ``quantile_sketch``, and the sketch used as
+    values and weights to compute an approximate distance.
+
     Args:
         u_values: An array that contains a sample from a probability
             distribution or the support (set of all possible values)
@@ -36,6 +40,12 @@ def wasserstein_distance(
             observation or possible value.
         v_values: An array that contains a sample from or the support
             of a second distribution.
+        u_weights: The optional weights of the values in
+            ``u_values``. If ``None``, all the values have the same
+            weight.
+        v_weights: The optional weights of the values in
+            ``v_values``. If ``None``, all the values have the same
+            weight.
         prefix: The key prefix in the returned dictionary.
         suffix: The key suffix in the returned dictionary.
         nan_policy: The policy on how to handle NaN values in the input
@@ -43,7 +53,13 @@ def wasserstein_distance(
             ``'propagate'``, and ``'raise'``.
 
     Returns:
-        The computed metrics.
+        The computed metrics. ``'count'`` is the number of values in
+            ``u_values`` after the NaN values are removed.
+
+    Raises:
+        RuntimeError: if the weights and the values have different
+            shapes.
+        ValueError: if the weights contain negative values.
 
     Example usage:
 
@@ -55,20 +71,26 @@ def wasserstein_distance(
     ...     u_values=np.array([1, 2, 3, 4, 5]), v_values=np.array([1, 2, 3, 4, 5])
     ... )
     {'count': 5, 'wasserstein_distance': 0.0}
+    >>> wasserstein_distance(u_values=np.array([0, 1, 3]), v_values=np.array([5, 6, 8, 9]))
+    {'count': 3, 'wasserstein_distance': 5.666...}
+    >>> from analora.metric.distribution import histogram_sketch
+    >>> rng = np.random.default_rng(42)
+    >>> centers, counts = histogram_sketch(rng.normal(size=100_000), bins=200)
+    >>> wasserstein_distance(
+    ...     u_values=centers, v_values=rng.normal(loc=1.0, size=1000), u_weights=counts
+    ... )
+    {'count': ..., 'wasserstein_distance': 0.9...}
 
     ```
     """
-    check_scipy()
-    u_values, v_values = preprocess_same_shape_arrays(
-        arrays=[u_values.ravel(), v_values.ravel()], drop_nan=nan_policy == "omit"
+    count, dist = compute_cdf_distance(
+        u_values,
+        v_values,
+        p=1.0,
+        u_weights=u_weights,
+        v_weights=v_weights,
+        nan_policy=nan_policy,
     )
-    u_nan = contains_nan(arr=u_values, nan_policy=nan_policy, name="'u_values'")
-    v_nan = contains_nan(arr=v_values, nan_policy=nan_policy, name="'v_values'")
-
-    count = u_values.size
-    dist = float("nan")
-    if count > 0 and not u_nan and not v_nan:
-        dist = float(stats.wasserstein_distance(u_values, v_values))
     return {
         f"{prefix}count{suffix}": count,
         f"{prefix}wasserstein_distance{suffix}": dist,
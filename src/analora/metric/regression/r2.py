@@ -3,10 +3,10 @@ metrics."""
 
 from __future__ import annotations
 
-__all__ = ["r2_score"]
+__all__ = ["r2_score", "r2_score_from_sums"]
 
 
-from typing import TYPE_CHECKING
+import numpy as np
 
 from analora.metric.utils import contains_nan, preprocess_pred
 from analora.utils.imports import check_sklearn, is_sklearn_available
@@ -14,9 +14,6 @@ from analora.utils.imports import check_sklearn, is_sklearn_available
 if is_sklearn_available():  # pragma: no cover
     from sklearn import metrics
 
-if TYPE_CHECKING:
-    import numpy as np
-
 
 def r2_score(
     y_true: np.ndarray,
@@ -67,3 +64,39 @@ def r2_score(
         f"{prefix}count{suffix}": count,
         f"{prefix}r2_score{suffix}": error,
     }
+
+
+def r2_score_from_sums(
+    sum_sq_error: float | np.ndarray, sum_sq_dev: float | np.ndarray
+) -> float | np.ndarray:
+    r"""Return the R^2 score from the sum of squared errors and the sum
+    of squared deviations of the targets.
+
+    Like ``sklearn.metrics.r2_score``, a constant target gives a score
+    of ``1.0`` for perfect predictions and ``0.0`` otherwise.
+
+    Args:
+        sum_sq_error: The sum of squared errors, or an array of sums.
+        sum_sq_dev: The sum of squared deviations of the targets, or
+            an array of sums with the same shape.
+
+    Returns:
+        The R^2 score, or an array of scores if the inputs are arrays.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.regression.r2 import r2_score_from_sums
+    >>> r2_score_from_sums(sum_sq_error=1.0, sum_sq_dev=4.0)
+    0.75
+    >>> r2_score_from_sums(sum_sq_error=np.array([0.0, 1.0]), sum_sq_dev=np.array([0.0, 0.0]))
+    array([1., 0.])
+
+    ```
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = 1.0 - np.divide(sum_sq_error, sum_sq_dev)
+    score = np.where(np.equal(sum_sq_dev, 0), np.where(np.equal(sum_sq_error, 0), 1.0, 0.0), score)
+    return score if score.ndim else float(score)
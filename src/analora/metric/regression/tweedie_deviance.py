@@ -6,17 +6,13 @@ __all__ = ["mean_tweedie_deviance"]
 
 from typing import TYPE_CHECKING
 
-from analora.metric.utils import contains_nan, preprocess_pred
-from analora.utils.imports import check_sklearn, is_sklearn_available
+import numpy as np
 
-if is_sklearn_available():  # pragma: no cover
-    from sklearn import metrics
+from analora.metric.utils import contains_nan, preprocess_pred
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    import numpy as np
-
 
 def mean_tweedie_deviance(
     y_true: np.ndarray,
@@ -26,9 +22,15 @@ def mean_tweedie_deviance(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    chunk_size: int | None = 10000,
 ) -> dict[str, float]:
     r"""Return the mean Tweedie deviance regression loss.
 
+    All the powers are evaluated together: the logarithms of the
+    target and predicted values are computed once, and the deviances
+    of all the powers are computed with broadcasting. The values are
+    the same as ``sklearn.metrics.mean_tweedie_deviance``.
+
     Args:
         y_true: The ground truth target values.
         y_pred: The predicted values.
@@ -40,10 +42,21 @@ def mean_tweedie_deviance(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        chunk_size: The number of values processed at the same time.
+            The temporary arrays have at most
+            ``len(powers) * chunk_size`` values, so it bounds the
+            memory used for long arrays. If ``None``, all the values
+            are processed at the same time.
 
     Returns:
         The computed metrics.
 
+    Raises:
+        ValueError: if a power is in the interval ``(0, 1)``, where
+            the Tweedie deviance is not defined.
+        ValueError: if the values are not in the domain of a power.
+        ValueError: if ``chunk_size`` is not a positive integer.
+
     Example usage:
 
     ```pycon
@@ -54,10 +67,26 @@ def mean_tweedie_deviance(
     ...     y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5])
     ... )
     {'count': 5, 'mean_tweedie_deviance_power_0': 0.0}
+    >>> mean_tweedie_deviance(
+    ...     y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([2, 2, 2, 4, 4]), powers=[0, 1, 2]
+    ... )
+    {'count': 5,
+     'mean_tweedie_deviance_power_0': 0.6,
+     'mean_tweedie_deviance_power_1': 0.255...,
+     'mean_tweedie_deviance_power_2': 0.125...}
 
     ```
     """
-    check_sklearn()
+    for power in powers:
+        if 0 < power < 1:
+            msg = (
+                f"Incorrect power: {power}. The Tweedie deviance is only defined for "
+                "power <= 0 and power >= 1"
+            )
+            raise ValueError(msg)
+    if chunk_size is not None and chunk_size <= 0:
+        msg = f"Incorrect chunk_size: {chunk_size}. chunk_size must be a positive integer"
+        raise ValueError(msg)
     y_true, y_pred = preprocess_pred(
         y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
     )
@@ -65,10 +94,121 @@ def mean_tweedie_deviance(
     y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
 
     count = y_true.size
+    scores = np.full(len(powers), np.nan)
+    if count > 0 and not y_true_nan and not y_pred_nan:
+        scores = _mean_tweedie_deviances(
+            y_true=y_true.astype(np.float64, copy=False),
+            y_pred=y_pred.astype(np.float64, copy=False),
+            powers=np.asarray(powers, dtype=np.float64),
+            chunk_size=chunk_size or count,
+        )
     out = {f"{prefix}count{suffix}": count}
-    for power in powers:
-        score = float("nan")
-        if count > 0 and not y_true_nan and not y_pred_nan:
-            score = metrics.mean_tweedie_deviance(y_true=y_true, y_pred=y_pred, power=power)
+    for power, score in zip(powers, scores):
         out[f"{prefix}mean_tweedie_deviance_power_{power}{suffix}"] = float(score)
     return out
+
+
+def _check_tweedie_domain(y_true: np.ndarray, y_pred: np.ndarray, powers: np.ndarray) -> None:
+    r"""Check the values are in the domain of the Tweedie deviance for
+    all the powers.
+
+    Args:
+        y_true: The ground truth target values.
+        y_pred: The predicted values.
+        powers: The Tweedie powers.
+
+    Raises:
+        ValueError: if the values are not in the domain of a power.
+    """
+    if np.all(powers == 0):
+        return
+    min_true, min_pred = y_true.min(), y_pred.min()
+    for power in powers:
+        message = f"Mean Tweedie deviance error with power={float(power)} can only be used on "
+        if power < 0 and min_pred <= 0:
+            raise ValueError(message + "strictly positive y_pred.")
+        if 1 <= power < 2 and (min_true < 0 or min_pred <= 0):
+            raise ValueError(message + "non-negative y and strictly positive y_pred.")
+        if power >= 2 and (min_true <= 0 or min_pred <= 0):
+            raise ValueError(message + "strictly positive y and y_pred.")
+
+
+def _mean_tweedie_deviances(
+    y_true: np.ndarray, y_pred: np.ndarray, powers: np.ndarray, chunk_size: int
+) -> np.ndarray:
+    r"""Compute the mean Tweedie deviance for several powers.
+
+    Args:
+        y_true: The ground truth target values without NaN values.
+        y_pred: The predicted values without NaN values.
+        powers: The Tweedie powers.
+        chunk_size: The number of values processed at the same time.
+
+    Returns:
+        The mean Tweedie deviance for each power.
+
+    Raises:
+        ValueError: if the values are not in the domain of a power.
+    """
+    _check_tweedie_domain(y_true=y_true, y_pred=y_pred, powers=powers)
+    sums = np.zeros(powers.size)
+    for start in range(0, y_true.size, chunk_size):
+        sums += _sum_tweedie_deviances(
+            y_true=y_true[start : start + chunk_size],
+            y_pred=y_pred[start : start + chunk_size],
+            powers=powers,
+        )
+    return sums / y_true.size
+
+
+def _sum_tweedie_deviances(
+    y_true: np.ndarray, y_pred: np.ndarray, powers: np.ndarray
+) -> np.ndarray:
+    r"""Compute the sum of the Tweedie deviances for several powers.
+
+    The powers ``0``, ``1``, and ``2`` have specific formulas. The
+    other powers share the logarithms of the values:
+    ``y ** a`` is computed as ``exp(a * log(y))`` for all the powers
+    at the same time, and the sums of the products with the values are
+    matrix-vector products.
+
+    Args:
+        y_true: The ground truth target values in the domain of all
+            the powers.
+        y_pred: The predicted values in the domain of all the powers.
+        powers: The Tweedie powers.
+
+    Returns:
+        The sum of the Tweedie deviances for each power.
+    """
+    sums = np.zeros(powers.size)
+    is_normal = powers == 0
+    if is_normal.any():
+        residual = y_true - y_pred
+        sums[is_normal] = np.dot(residual, residual)
+    if is_normal.all():
+        return sums
+
+    with np.errstate(divide="ignore"):
+        # log(0) = -inf so the powers of zero targets are zero.
+        log_true = np.log(np.maximum(y_true, 0.0))
+    log_pred = np.log(y_pred)
+    is_poisson, is_gamma = powers == 1, powers == 2
+    if is_poisson.any():
+        # Same as scipy.special.xlogy(y_true, y_true / y_pred)
+        xlogy = np.multiply(
+            y_true, log_true - log_pred, out=np.zeros_like(y_true), where=y_true != 0
+        )
+        sums[is_poisson] = 2 * (xlogy.sum() - y_true.sum() + y_pred.sum())
+    if is_gamma.any():
+        sums[is_gamma] = 2 * (log_pred - log_true + y_true / y_pred - 1).sum()
+
+    is_other = ~(is_normal | is_poisson | is_gamma)
+    if is_other.any():
+        a, b = 2 - powers[is_other], 1 - powers[is_other]
+        pow_true = np.exp(np.outer(a, log_true)).sum(axis=1)
+        pow_pred = np.exp(np.outer(b, log_pred))
+        sums[is_other] = 2 * (
+            pow_true / (a * b) - pow_pred.dot(y_true) / b + pow_pred.dot(y_pred) / a
+        )
+    return sums
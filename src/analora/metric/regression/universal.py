@@ -4,17 +4,12 @@ from __future__ import annotations
 
 __all__ = ["regression_errors"]
 
+import math
 
-from typing import TYPE_CHECKING
+import numpy as np
 
-from analora.metric.regression.abs_error import (
-    mean_absolute_error,
-    median_absolute_error,
-)
-from analora.metric.regression.mse import mean_squared_error
-
-if TYPE_CHECKING:
-    import numpy as np
+from analora.metric.regression.r2 import r2_score_from_sums
+from analora.metric.utils import check_nan_policy, check_same_shape_pred, contains_nan
 
 
 def regression_errors(
@@ -27,6 +22,19 @@ def regression_errors(
 ) -> dict[str, float]:
     r"""Return the regression error metrics.
 
+    The metrics are computed from a single residual array, and the NaN
+    values are found in one pass over the residuals, so this function
+    is faster than calling the individual metric functions. The values
+    are the same as ``analora.metric.mean_absolute_error``,
+    ``analora.metric.median_absolute_error``,
+    ``analora.metric.mean_squared_error``,
+    ``analora.metric.root_mean_squared_error``,
+    ``analora.metric.mean_absolute_percentage_error``,
+    ``analora.metric.mean_squared_log_error``, and
+    ``analora.metric.r2_score``. The mean squared logarithmic error is
+    NaN if a value is lower than or equal to ``-1``, and the R^2 score
+    is NaN if there are less than two values.
+
     Args:
         y_true: The ground truth target values.
         y_pred: The predicted values.
@@ -39,6 +47,12 @@ def regression_errors(
     Returns:
         The computed metrics.
 
+    Raises:
+        RuntimeError: ``'y_true'`` and ``'y_pred'`` have different
+            shapes.
+        ValueError: if an input array contains at least one NaN value
+            and ``nan_policy`` is ``'raise'``.
+
     Example usage:
 
     ```pycon
@@ -49,30 +63,94 @@ def regression_errors(
     {'count': 5,
      'mean_absolute_error': 0.0,
      'median_absolute_error': 0.0,
-     'mean_squared_error': 0.0}
+     'mean_squared_error': 0.0,
+     'root_mean_squared_error': 0.0,
+     'mean_absolute_percentage_error': 0.0,
+     'mean_squared_log_error': 0.0,
+     'r2_score': 1.0}
 
     ```
     """
-    return (
-        mean_absolute_error(
-            y_true=y_true,
-            y_pred=y_pred,
-            prefix=prefix,
-            suffix=suffix,
-            nan_policy=nan_policy,
-        )
-        | median_absolute_error(
-            y_true=y_true,
-            y_pred=y_pred,
-            prefix=prefix,
-            suffix=suffix,
-            nan_policy=nan_policy,
-        )
-        | mean_squared_error(
-            y_true=y_true,
-            y_pred=y_pred,
-            prefix=prefix,
-            suffix=suffix,
-            nan_policy=nan_policy,
-        )
+    check_nan_policy(nan_policy)
+    y_true, y_pred = y_true.ravel(), y_pred.ravel()
+    check_same_shape_pred(y_true, y_pred)
+    residual = np.subtract(y_true, y_pred, dtype=np.float64)
+    nan_mask = np.isnan(residual)
+    if nan_mask.any():
+        # The residual of two infinite values can be NaN, so the input
+        # arrays are only checked when the residuals contain NaN values.
+        y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
+        y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
+        if nan_policy == "omit" and (y_true_nan or y_pred_nan):
+            mask = np.logical_not(np.logical_or(np.isnan(y_true), np.isnan(y_pred)))
+            y_true, y_pred, residual = y_true[mask], y_pred[mask], residual[mask]
+        elif y_true_nan or y_pred_nan:
+            residual = None
+
+    count = y_true.size
+    metrics = dict.fromkeys(
+        [
+            "mean_absolute_error",
+            "median_absolute_error",
+            "mean_squared_error",
+            "root_mean_squared_error",
+            "mean_absolute_percentage_error",
+            "mean_squared_log_error",
+            "r2_score",
+        ],
+        float("nan"),
     )
+    if count > 0 and residual is not None:
+        metrics |= _compute_regression_errors(
+            y_true=y_true.astype(np.float64, copy=False),
+            y_pred=y_pred.astype(np.float64, copy=False),
+            residual=residual,
+        )
+    return {f"{prefix}count{suffix}": count} | {
+        f"{prefix}{key}{suffix}": value for key, value in metrics.items()
+    }
+
+
+def _compute_regression_errors(
+    y_true: np.ndarray, y_pred: np.ndarray, residual: np.ndarray
+) -> dict[str, float]:
+    r"""Compute the regression error metrics from the residuals.
+
+    Args:
+        y_true: The ground truth target values without NaN values.
+        y_pred: The predicted values without NaN values.
+        residual: The residuals ``y_true - y_pred``. This array is
+            modified in-place.
+
+    Returns:
+        The computed metrics.
+    """
+    count = y_true.size
+    mse = float(np.dot(residual, residual)) / count
+    abs_error = np.abs(residual, out=residual)
+    mae = float(abs_error.mean())
+    # Same definition as sklearn.metrics.mean_absolute_percentage_error
+    denominator = np.maximum(np.abs(y_true), np.finfo(np.float64).eps)
+    mape = float(np.divide(abs_error, denominator, out=denominator).mean())
+    median = float(np.median(abs_error, overwrite_input=True))
+
+    r2 = float("nan")
+    if count > 1:
+        deviation = y_true - y_true.mean()
+        sum_sq_dev = float(np.dot(deviation, deviation))
+        r2 = r2_score_from_sums(sum_sq_error=mse * count, sum_sq_dev=sum_sq_dev)
+
+    msle = float("nan")
+    if min(y_true.min(), y_pred.min()) > -1:
+        log_error = np.subtract(np.log1p(y_true), np.log1p(y_pred))
+        msle = float(np.dot(log_error, log_error)) / count
+
+    return {
+        "mean_absolute_error": mae,
+        "median_absolute_error": median,
+        "mean_squared_error": mse,
+        "root_mean_squared_error": math.sqrt(mse),
+        "mean_absolute_percentage_error": mape,
+        "mean_squared_log_error": msle,
+        "r2_score": r2,
+    }
@@ -0,0 +1,10 @@
+r"""Contain functions to estimate the uncertainty of metrics by
+resampling the data."""
+
+from __future__ import annotations
+
+__all__ = ["bootstrap_ci", "evaluate_resamples", "permutation_test"]
+
+from analora.metric.resampling.bootstrap import bootstrap_ci
+from analora.metric.resampling.permutation import permutation_test
+from analora.metric.resampling.utils import evaluate_resamples
@@ -0,0 +1,128 @@
+r"""Implement the bootstrap confidence intervals of the metrics."""
+
+from __future__ import annotations
+
+__all__ = ["bootstrap_ci"]
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from analora.metric.resampling.utils import evaluate_resamples, interleave_keys
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def bootstrap_ci(
+    metric: Callable[..., dict],
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    confidence_level: float = 0.95,
+    num_resamples: int = 1000,
+    batch_size: int = 100,
+    num_workers: int = 0,
+    rng: np.random.Generator | None = None,
+    prefix: str = "",
+    suffix: str = "",
+    **kwargs: Any,
+) -> dict[str, Any]:
+    r"""Return the metrics and their bootstrap confidence intervals.
+
+    The rows of the input arrays are sampled with replacement, and the
+    confidence intervals are the percentile intervals of the metric
+    values over the resamples. See ``evaluate_resamples`` for more
+    information about how the resamples are evaluated.
+
+    Args:
+        metric: The metric function, e.g. ``analora.metric.accuracy``.
+        y_true: The first input array of the metric function, e.g.
+            the ground truth target labels or values.
+        y_pred: The second input array of the metric function, e.g.
+            the predicted labels, values or scores.
+        confidence_level: The confidence level of the intervals.
+        num_resamples: The number of bootstrap resamples.
+        batch_size: The number of resamples evaluated at once.
+        num_workers: The number of worker processes used to evaluate
+            the resamples. If ``0``, the resamples are evaluated in the
+            current process.
+        rng: The random number generator used to draw the resamples.
+            If ``None``, the default random number generator is used.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        **kwargs: The other keyword arguments of the metric function.
+
+    Returns:
+        The metrics computed on the input arrays. The lower and upper
+            bounds of the confidence interval of each scalar metric,
+            except ``'count'``, are added with the ``_ci_low`` and
+            ``_ci_high`` keys right after the metric.
+
+    Raises:
+        ValueError: if a parameter is invalid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import mean_absolute_error
+    >>> from analora.metric.resampling import bootstrap_ci
+    >>> rng = np.random.default_rng(42)
+    >>> y_true = rng.normal(size=100)
+    >>> bootstrap_ci(
+    ...     mean_absolute_error,
+    ...     y_true=y_true,
+    ...     y_pred=y_true + rng.normal(scale=0.1, size=100),
+    ...     rng=np.random.default_rng(42),
+    ... )
+    {'count': 100,
+     'mean_absolute_error': 0.078...,
+     'mean_absolute_error_ci_low': 0.066...,
+     'mean_absolute_error_ci_high': 0.089...}
+
+    ```
+    """
+    if not 0 < confidence_level < 1:
+        msg = (
+            f"Incorrect confidence_level: {confidence_level}. "
+            "confidence_level must be in the range (0, 1)"
+        )
+        raise ValueError(msg)
+    values = evaluate_resamples(
+        metric,
+        [y_true, y_pred],
+        mode="bootstrap",
+        num_resamples=num_resamples,
+        batch_size=batch_size,
+        num_workers=num_workers,
+        rng=rng,
+        kwargs=kwargs,
+    )
+    quantiles = [(1.0 - confidence_level) / 2, (1.0 + confidence_level) / 2]
+    extra = {}
+    for key, vals in values.items():
+        low, high = _percentiles(vals, quantiles)
+        extra[f"{prefix}{key}{suffix}"] = {
+            f"{prefix}{key}_ci_low{suffix}": low,
+            f"{prefix}{key}_ci_high{suffix}": high,
+        }
+    return interleave_keys(metric(y_true, y_pred, prefix=prefix, suffix=suffix, **kwargs), extra)
+
+
+def _percentiles(values: np.ndarray, quantiles: list[float]) -> tuple[float, float]:
+    r"""Compute the quantiles of the non-NaN values.
+
+    Args:
+        values: The values.
+        quantiles: The two quantiles to compute.
+
+    Returns:
+        The two quantiles, or NaN if all the values are NaN.
+    """
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return float("nan"), float("nan")
+    low, high = np.quantile(values, quantiles)
+    return float(low), float(high)
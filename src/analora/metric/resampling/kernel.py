@@ -0,0 +1,176 @@
+r"""Implement vectorized kernels to evaluate some metrics on many
+resamples at once."""
+
+from __future__ import annotations
+
+__all__ = ["find_kernel"]
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from analora.array import has_nan
+from analora.metric.classification.accuracy import accuracy
+from analora.metric.regression.abs_error import mean_absolute_error
+from analora.metric.regression.mse import mean_squared_error
+from analora.metric.regression.r2 import r2_score, r2_score_from_sums
+from analora.metric.regression.rmse import root_mean_squared_error
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    Kernel = Callable[[np.ndarray, np.ndarray], dict[str, np.ndarray]]
+
+
+def find_kernel(metric: Callable, arrays: Sequence[np.ndarray], kwargs: Mapping) -> Kernel | None:
+    r"""Find the vectorized kernel of a metric function.
+
+    A kernel takes two 2d arrays, where each row is a resample, and
+    returns the metric values for each resample, with the same keys as
+    the metric function except ``'count'``. A kernel is only used for
+    1d inputs without NaN values, and when the only keyword argument
+    of the metric function is ``nan_policy``, so it gives the same
+    values as the metric function.
+
+    Args:
+        metric: The metric function.
+        arrays: The input arrays of the metric function.
+        kwargs: The keyword arguments of the metric function.
+
+    Returns:
+        The kernel if the metric function has one and the inputs are
+            supported, otherwise ``None``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import mean_absolute_error, ndcg
+    >>> from analora.metric.resampling.kernel import find_kernel
+    >>> arrays = [np.array([1.0, 2.0, 3.0]), np.array([1.0, 2.0, 4.0])]
+    >>> kernel = find_kernel(mean_absolute_error, arrays, kwargs={})
+    >>> kernel(np.array([[1.0, 2.0, 3.0], [3.0, 3.0, 3.0]]), np.array([[1.0, 2.0, 4.0], [4.0, 4.0, 4.0]]))
+    {'mean_absolute_error': array([0.33333333, 1.        ])}
+    >>> find_kernel(ndcg, arrays, kwargs={}) is None
+    True
+
+    ```
+    """
+    kernel = _KERNELS.get(metric)
+    if kernel is None or set(kwargs) - {"nan_policy"}:
+        return None
+    if any(arr.ndim != 1 or has_nan(arr) for arr in arrays):
+        return None
+    return kernel
+
+
+def _accuracy_kernel(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, np.ndarray]:
+    r"""Compute the accuracy metrics for each resample.
+
+    Args:
+        y_true: The ground truth target labels of shape
+            ``(num_resamples, n)`` or ``(1, n)``.
+        y_pred: The predicted labels of shape ``(num_resamples, n)``.
+
+    Returns:
+        The accuracy metrics for each resample.
+    """
+    count = y_pred.shape[1]
+    if count == 0:
+        nan = np.full(y_pred.shape[0], np.nan)
+        return {"accuracy": nan, "count_correct": nan, "count_incorrect": nan, "error": nan}
+    correct = np.count_nonzero(y_true == y_pred, axis=1)
+    acc = correct / count
+    return {
+        "accuracy": acc,
+        "count_correct": correct,
+        "count_incorrect": count - correct,
+        "error": 1.0 - acc,
+    }
+
+
+def _mean_absolute_error_kernel(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, np.ndarray]:
+    r"""Compute the mean absolute error for each resample.
+
+    Args:
+        y_true: The ground truth target values of shape
+            ``(num_resamples, n)`` or ``(1, n)``.
+        y_pred: The predicted values of shape ``(num_resamples, n)``.
+
+    Returns:
+        The mean absolute error for each resample.
+    """
+    return {"mean_absolute_error": _mean(np.abs(y_true - y_pred))}
+
+
+def _mean_squared_error_kernel(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, np.ndarray]:
+    r"""Compute the mean squared error for each resample.
+
+    Args:
+        y_true: The ground truth target values of shape
+            ``(num_resamples, n)`` or ``(1, n)``.
+        y_pred: The predicted values of shape ``(num_resamples, n)``.
+
+    Returns:
+        The mean squared error for each resample.
+    """
+    return {"mean_squared_error": _mean(np.square(y_true - y_pred))}
+
+
+def _root_mean_squared_error_kernel(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> dict[str, np.ndarray]:
+    r"""Compute the root mean squared error for each resample.
+
+    Args:
+        y_true: The ground truth target values of shape
+            ``(num_resamples, n)`` or ``(1, n)``.
+        y_pred: The predicted values of shape ``(num_resamples, n)``.
+
+    Returns:
+        The root mean squared error for each resample.
+    """
+    return {"root_mean_squared_error": np.sqrt(_mean(np.square(y_true - y_pred)))}
+
+
+def _r2_score_kernel(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, np.ndarray]:
+    r"""Compute the R^2 score for each resample.
+
+    Args:
+        y_true: The ground truth target values of shape
+            ``(num_resamples, n)`` or ``(1, n)``.
+        y_pred: The predicted values of shape ``(num_resamples, n)``.
+
+    Returns:
+        The R^2 score for each resample.
+    """
+    count = y_pred.shape[1]
+    if count < 2:
+        return {"r2_score": np.full(y_pred.shape[0], np.nan)}
+    sum_sq_error = np.square(y_true - y_pred).sum(axis=1)
+    sum_sq_dev = np.square(y_true - y_true.mean(axis=1, keepdims=True)).sum(axis=1)
+    return {"r2_score": r2_score_from_sums(sum_sq_error=sum_sq_error, sum_sq_dev=sum_sq_dev)}
+
+
+def _mean(values: np.ndarray) -> np.ndarray:
+    r"""Compute the mean of each row, or NaN for empty rows.
+
+    Args:
+        values: The 2d array of values.
+
+    Returns:
+        The mean of each row.
+    """
+    if values.shape[1] == 0:
+        return np.full(values.shape[0], np.nan)
+    return values.mean(axis=1)
+
+
+_KERNELS: dict[Callable, Kernel] = {
+    accuracy: _accuracy_kernel,
+    mean_absolute_error: _mean_absolute_error_kernel,
+    mean_squared_error: _mean_squared_error_kernel,
+    r2_score: _r2_score_kernel,
+    root_mean_squared_error: _root_mean_squared_error_kernel,
+}
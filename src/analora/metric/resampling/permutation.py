@@ -0,0 +1,151 @@
+r"""Implement the permutation tests of the metrics."""
+
+from __future__ import annotations
+
+__all__ = ["permutation_test"]
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from analora.metric.resampling.utils import evaluate_resamples, interleave_keys
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def permutation_test(
+    metric: Callable[..., dict],
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    alternative: str = "two-sided",
+    num_resamples: int = 1000,
+    batch_size: int = 100,
+    num_workers: int = 0,
+    rng: np.random.Generator | None = None,
+    prefix: str = "",
+    suffix: str = "",
+    **kwargs: Any,
+) -> dict[str, Any]:
+    r"""Return the metrics and the p-values of permutation tests.
+
+    The null hypothesis is that the predictions are independent of the
+    targets. The null distribution of each metric is estimated by
+    permuting the rows of ``y_pred``, and the p-values are computed
+    like in ``scipy.stats.permutation_test``. See
+    ``evaluate_resamples`` for more information about how the
+    permutations are evaluated.
+
+    Args:
+        metric: The metric function, e.g. ``analora.metric.accuracy``.
+        y_true: The first input array of the metric function, e.g.
+            the ground truth target labels or values.
+        y_pred: The second input array of the metric function, e.g.
+            the predicted labels, values or scores.
+        alternative: The alternative hypothesis. Default is 'two-sided'.
+            The following options are available:
+            - 'two-sided': the metric is different from the null
+                distribution
+            - 'less': the metric is less than the null distribution
+            - 'greater': the metric is greater than the null
+                distribution
+        num_resamples: The number of permutations.
+        batch_size: The number of permutations evaluated at once.
+        num_workers: The number of worker processes used to evaluate
+            the permutations. If ``0``, the permutations are evaluated
+            in the current process.
+        rng: The random number generator used to draw the
+            permutations. If ``None``, the default random number
+            generator is used.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        **kwargs: The other keyword arguments of the metric function.
+
+    Returns:
+        The metrics computed on the input arrays. The p-value of each
+            scalar metric, except ``'count'``, is added with the
+            ``_pvalue`` key right after the metric.
+
+    Raises:
+        ValueError: if a parameter is invalid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import accuracy
+    >>> from analora.metric.resampling import permutation_test
+    >>> permutation_test(
+    ...     accuracy,
+    ...     y_true=np.array([1, 0, 0, 1, 1, 0, 1, 0, 0, 1]),
+    ...     y_pred=np.array([1, 0, 0, 1, 1, 0, 1, 0, 0, 1]),
+    ...     alternative="greater",
+    ...     rng=np.random.default_rng(42),
+    ... )
+    {'accuracy': 1.0,
+     'accuracy_pvalue': 0.00...,
+     'count_correct': 10,
+     'count_correct_pvalue': 0.00...,
+     'count_incorrect': 0,
+     'count_incorrect_pvalue': 1.0,
+     'count': 10,
+     'error': 0.0,
+     'error_pvalue': 1.0}
+
+    ```
+    """
+    if alternative not in {"two-sided", "less", "greater"}:
+        msg = (
+            f"Incorrect alternative: {alternative}. The valid values are "
+            "'two-sided', 'less', and 'greater'"
+        )
+        raise ValueError(msg)
+    values = evaluate_resamples(
+        metric,
+        [y_true, y_pred],
+        mode="permutation",
+        num_resamples=num_resamples,
+        batch_size=batch_size,
+        num_workers=num_workers,
+        rng=rng,
+        kwargs=kwargs,
+    )
+    out = metric(y_true, y_pred, prefix=prefix, suffix=suffix, **kwargs)
+    extra = {}
+    for key, null in values.items():
+        name = f"{prefix}{key}{suffix}"
+        extra[name] = {
+            f"{prefix}{key}_pvalue{suffix}": _pvalue(out[name], null, alternative=alternative)
+        }
+    return interleave_keys(out, extra)
+
+
+def _pvalue(observed: float, null: np.ndarray, alternative: str) -> float:
+    r"""Compute the p-value of an observed value given the null
+    distribution.
+
+    Like ``scipy.stats.permutation_test``, the observed value is
+    counted in the null distribution, and the values which are equal
+    up to the rounding errors are considered as ties.
+
+    Args:
+        observed: The observed value.
+        null: The values of the null distribution.
+        alternative: The alternative hypothesis.
+
+    Returns:
+        The p-value.
+    """
+    if np.isnan(observed):
+        return float("nan")
+    gamma = abs(observed) * np.finfo(float).eps * 100
+    size = null.size + 1
+    pvalue_less = (np.count_nonzero(null <= observed + gamma) + 1) / size
+    pvalue_greater = (np.count_nonzero(null >= observed - gamma) + 1) / size
+    if alternative == "less":
+        return float(pvalue_less)
+    if alternative == "greater":
+        return float(pvalue_greater)
+    return float(min(1.0, 2 * min(pvalue_less, pvalue_greater)))
@@ -0,0 +1,249 @@
+r"""Contain utility functions to evaluate metrics on many resamples of
+the data."""
+
+from __future__ import annotations
+
+__all__ = ["evaluate_resamples", "interleave_keys"]
+
+from concurrent.futures import ProcessPoolExecutor
+from numbers import Number
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from analora.metric.resampling.kernel import find_kernel
+from analora.utils.validation import check_num_workers
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def evaluate_resamples(
+    metric: Callable[..., dict],
+    arrays: Sequence[np.ndarray],
+    *,
+    mode: str = "bootstrap",
+    num_resamples: int = 1000,
+    batch_size: int = 100,
+    num_workers: int = 0,
+    rng: np.random.Generator | None = None,
+    kwargs: Mapping | None = None,
+) -> dict[str, np.ndarray]:
+    r"""Evaluate a metric function on many resamples of the data.
+
+    The resamples are drawn in batches: each batch draws an index
+    matrix of shape ``(batch_size, n)`` at once. The metrics with a
+    vectorized kernel (see ``find_kernel``) are evaluated on all the
+    resamples of a batch at once, and the other metrics are evaluated
+    on each resample. Each batch uses its own random number generator
+    spawned from ``rng``, so the result does not depend on
+    ``num_workers``.
+
+    Args:
+        metric: The metric function. Its first two positional
+            arguments are the input arrays.
+        arrays: The two input arrays of the metric function. They must
+            have the same number of rows, and the rows are resampled.
+        mode: The resampling mode. With ``'bootstrap'``, the rows of
+            both arrays are sampled with replacement. With
+            ``'permutation'``, the rows of the second array are
+            permuted, which breaks the pairing with the first array.
+        num_resamples: The number of resamples.
+        batch_size: The number of resamples in each batch.
+        num_workers: The number of worker processes used to evaluate
+            the batches. If ``0``, the batches are evaluated in the
+            current process.
+        rng: The random number generator used to draw the resamples.
+            If ``None``, the default random number generator is used.
+        kwargs: The keyword arguments of the metric function.
+
+    Returns:
+        The values of the scalar metrics for each resample. The
+            ``'count'`` key is not included.
+
+    Raises:
+        ValueError: if a parameter is invalid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import accuracy
+    >>> from analora.metric.resampling import evaluate_resamples
+    >>> out = evaluate_resamples(
+    ...     accuracy,
+    ...     [np.array([1, 0, 0, 1, 1]), np.array([1, 0, 0, 1, 0])],
+    ...     num_resamples=10,
+    ...     rng=np.random.default_rng(42),
+    ... )
+    >>> sorted(out)
+    ['accuracy', 'count_correct', 'count_incorrect', 'error']
+    >>> out["accuracy"].shape
+    (10,)
+
+    ```
+    """
+    _check_parameters(
+        mode=mode, num_resamples=num_resamples, batch_size=batch_size, num_workers=num_workers
+    )
+    arrays = [np.asarray(arr) for arr in arrays]
+    if arrays[0].shape[0] != arrays[1].shape[0]:
+        msg = (
+            "The input arrays have different numbers of rows: "
+            f"{arrays[0].shape[0]} vs {arrays[1].shape[0]}"
+        )
+        raise ValueError(msg)
+    kwargs = dict(kwargs or {})
+    if rng is None:
+        rng = np.random.default_rng()
+    sizes = [batch_size] * (num_resamples // batch_size)
+    if num_resamples % batch_size:
+        sizes.append(num_resamples % batch_size)
+    rngs = rng.spawn(len(sizes))
+    if num_workers == 0:
+        outputs = [
+            _evaluate_batch(metric, arrays, kwargs=kwargs, mode=mode, rng=r, size=size)
+            for r, size in zip(rngs, sizes)
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(metric, arrays, kwargs, mode),
+        ) as executor:
+            outputs = list(executor.map(_evaluate_worker_batch, rngs, sizes))
+    return {key: np.concatenate([out[key] for out in outputs]) for key in outputs[0]}
+
+
+def interleave_keys(
+    metrics: Mapping[str, Any], extra: Mapping[str, Mapping[str, Any]]
+) -> dict[str, Any]:
+    r"""Insert extra values right after the metric they refer to.
+
+    Args:
+        metrics: The metrics.
+        extra: The extra values for some metrics. The keys are the
+            metric keys, and the values are the items to insert after
+            the metric.
+
+    Returns:
+        The metrics with the extra values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from analora.metric.resampling.utils import interleave_keys
+    >>> interleave_keys(
+    ...     {"count": 5, "accuracy": 0.8},
+    ...     {"accuracy": {"accuracy_ci_low": 0.6, "accuracy_ci_high": 1.0}},
+    ... )
+    {'count': 5, 'accuracy': 0.8, 'accuracy_ci_low': 0.6, 'accuracy_ci_high': 1.0}
+
+    ```
+    """
+    out = {}
+    for key, value in metrics.items():
+        out[key] = value
+        out.update(extra.get(key, {}))
+    return out
+
+
+def _check_parameters(mode: str, num_resamples: int, batch_size: int, num_workers: int) -> None:
+    r"""Check the resampling parameters.
+
+    Args:
+        mode: The resampling mode.
+        num_resamples: The number of resamples.
+        batch_size: The number of resamples in each batch.
+        num_workers: The number of worker processes.
+
+    Raises:
+        ValueError: if a parameter is invalid.
+    """
+    if mode not in {"bootstrap", "permutation"}:
+        msg = f"Incorrect mode: {mode}. The valid values are 'bootstrap' and 'permutation'"
+        raise ValueError(msg)
+    if num_resamples < 1:
+        msg = (
+            f"Incorrect num_resamples: {num_resamples}. "
+            "num_resamples must be greater than or equal to 1"
+        )
+        raise ValueError(msg)
+    if batch_size < 1:
+        msg = f"Incorrect batch_size: {batch_size}. batch_size must be greater than or equal to 1"
+        raise ValueError(msg)
+    check_num_workers(num_workers)
+
+
+def _evaluate_batch(
+    metric: Callable[..., dict],
+    arrays: Sequence[np.ndarray],
+    *,
+    kwargs: Mapping,
+    mode: str,
+    rng: np.random.Generator,
+    size: int,
+) -> dict[str, np.ndarray]:
+    r"""Evaluate a metric function on a batch of resamples.
+
+    Args:
+        metric: The metric function.
+        arrays: The two input arrays of the metric function.
+        kwargs: The keyword arguments of the metric function.
+        mode: The resampling mode.
+        rng: The random number generator used to draw the resamples.
+        size: The number of resamples in the batch.
+
+    Returns:
+        The values of the scalar metrics for each resample.
+    """
+    first, second = arrays
+    num_rows = first.shape[0]
+    if mode == "bootstrap":
+        indices = rng.integers(0, max(num_rows, 1), size=(size, num_rows))
+        first = first[indices]
+    else:
+        indices = rng.permuted(np.tile(np.arange(num_rows), (size, 1)), axis=1)
+        first = first[None]
+    second = second[indices]
+
+    kernel = find_kernel(metric, arrays, kwargs=kwargs)
+    if kernel is not None:
+        return kernel(first, second)
+    outputs = [metric(first[min(i, first.shape[0] - 1)], second[i], **kwargs) for i in range(size)]
+    keys = [
+        key for key, value in outputs[0].items() if key != "count" and isinstance(value, Number)
+    ]
+    return {key: np.array([out[key] for out in outputs]) for key in keys}
+
+
+def _init_worker(
+    metric: Callable[..., dict], arrays: Sequence[np.ndarray], kwargs: Mapping, mode: str
+) -> None:
+    r"""Initialize a worker process with the data shared by all the
+    batches, so they are sent once to each worker.
+
+    Args:
+        metric: The metric function.
+        arrays: The two input arrays of the metric function.
+        kwargs: The keyword arguments of the metric function.
+        mode: The resampling mode.
+    """
+    _WORKER_STATE.update(metric=metric, arrays=arrays, kwargs=kwargs, mode=mode)
+
+
+def _evaluate_worker_batch(rng: np.random.Generator, size: int) -> dict[str, np.ndarray]:
+    r"""Evaluate a batch of resamples in a worker process.
+
+    Args:
+        rng: The random number generator used to draw the resamples.
+        size: The number of resamples in the batch.
+
+    Returns:
+        The values of the scalar metrics for each resample.
+    """
+    return _evaluate_batch(**_WORKER_STATE, rng=rng, size=size)
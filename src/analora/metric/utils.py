@@ -3,6 +3,8 @@ r"""Contain utility functions to compute metrics."""
 from __future__ import annotations
 
 __all__ = [
+    "PreprocessingCache",
+    "RankCache",
     "check_array_ndim",
     "check_label_type",
     "check_nan_policy",
@@ -16,16 +18,382 @@ __all__ = [
     "preprocess_score_binary",
     "preprocess_score_multiclass",
     "preprocess_score_multilabel",
+    "rankdata",
 ]
 
-from typing import TYPE_CHECKING
+import functools
+import inspect
+import sys
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import numpy as np
 
-from analora.array import check_same_shape, multi_isnan
+from analora.array import array_key, check_same_shape, has_nan, multi_isnan
+from analora.utils.imports import check_scipy, is_scipy_available
+
+if is_scipy_available():
+    from scipy import stats
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Hashable, Sequence
+    from contextvars import Token
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:  # pragma: no cover
+    from typing_extensions import (
+        Self,  # use backport because it was added in python 3.11
+    )
+
+T = TypeVar("T")
+
+_ACTIVE_CACHE: ContextVar[PreprocessingCache | None] = ContextVar(
+    "analora_preprocessing_cache", default=None
+)
+_ACTIVE_RANK_CACHE: ContextVar[RankCache | None] = ContextVar("analora_rank_cache", default=None)
+
+
+class PreprocessingCache:
+    r"""Implement a cache for the preprocessed arrays and the NaN flags
+    used by the metric functions.
+
+    While the cache is active, i.e. inside a ``with`` block, the
+    ``preprocess_*`` functions of this module compute the NaN mask and
+    the filtered arrays once for the same input arrays and
+    ``drop_nan`` value, and ``contains_nan`` scans each array for NaN
+    values once. The metric functions use these functions, so many
+    metrics evaluated on the same arrays share the same preprocessing.
+    The arrays are identified by their memory buffer, shape, strides
+    and data type, so different views of the same data (e.g. the
+    output of ``ravel``) share the same entries.
+
+    The arrays must not be modified in-place while the cache is
+    active. The cache is cleared when the ``with`` block exits.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import mean_absolute_error, mean_squared_error
+    >>> from analora.metric.utils import PreprocessingCache
+    >>> y_true = np.array([1, 2, 3, 4, 5, float("nan")])
+    >>> y_pred = np.array([1, 2, 3, 4, 6, 1])
+    >>> with PreprocessingCache() as cache:
+    ...     mae = mean_absolute_error(y_true, y_pred, nan_policy="omit")
+    ...     mse = mean_squared_error(y_true, y_pred, nan_policy="omit")
+    ...     cache
+    ...
+    PreprocessingCache(num_results=1, num_nan_flags=2)
+    >>> mae, mse
+    ({'count': 5, 'mean_absolute_error': 0.2}, {'count': 5, 'mean_squared_error': 0.2})
+
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[Hashable, Any] = {}
+        self._nan_flags: dict[Hashable, bool] = {}
+        # Keep a reference to the arrays so their memory cannot be
+        # reused by other arrays while the cache is active.
+        self._arrays: list[np.ndarray] = []
+        self._tokens: list[Token[PreprocessingCache | None]] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(num_results={len(self._results):,}, "
+            f"num_nan_flags={len(self._nan_flags):,})"
+        )
+
+    def __enter__(self) -> Self:
+        self._tokens.append(_ACTIVE_CACHE.set(self))
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        _ACTIVE_CACHE.reset(self._tokens.pop())
+        if not self._tokens:
+            self.clear()
+
+    def clear(self) -> None:
+        r"""Clear the cache.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.utils import PreprocessingCache, contains_nan
+        >>> with PreprocessingCache() as cache:
+        ...     contains_nan(np.array([1.0, float("nan")]))
+        ...     cache.clear()
+        ...     cache
+        ...
+        True
+        PreprocessingCache(num_results=0, num_nan_flags=0)
+
+        ```
+        """
+        self._results.clear()
+        self._nan_flags.clear()
+        self._arrays.clear()
+
+    def has_nan(self, arr: np.ndarray) -> bool:
+        r"""Indicate if the given array contains at least one NaN value.
+
+        The result is computed once for each array.
+
+        Args:
+            arr: The array to check.
+
+        Returns:
+            ``True`` if the array contains at least one NaN value.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.utils import PreprocessingCache
+        >>> cache = PreprocessingCache()
+        >>> cache.has_nan(np.array([1.0, float("nan")]))
+        True
+
+        ```
+        """
+        key = array_key(arr)
+        if key not in self._nan_flags:
+            self._arrays.append(arr)
+            self._nan_flags[key] = has_nan(arr)
+        return self._nan_flags[key]
+
+    def get_or_compute(
+        self, name: str, arrays: Sequence[np.ndarray], compute: Callable[[], T]
+    ) -> T:
+        r"""Return the cached preprocessing result of some arrays, or
+        compute it if it is not in the cache.
+
+        Args:
+            name: The name of the preprocessing.
+            arrays: The input arrays of the preprocessing.
+            compute: The function to call to compute the result.
+
+        Returns:
+            The preprocessing result.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.utils import PreprocessingCache
+        >>> cache = PreprocessingCache()
+        >>> x = np.array([1.0, float("nan")])
+        >>> cache.get_or_compute("nonnan", [x], lambda: x[~np.isnan(x)])
+        array([1.])
+
+        ```
+        """
+        key = (name, *(array_key(arr) for arr in arrays))
+        if key not in self._results:
+            self._arrays.extend(arrays)
+            self._results[key] = compute()
+        return self._results[key]
+
+    def set_nan_flag(self, arr: np.ndarray, has_nan: bool) -> None:
+        r"""Set the NaN flag of an array whose content is known.
+
+        Args:
+            arr: The array.
+            has_nan: ``True`` if the array contains at least one NaN
+                value.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.utils import PreprocessingCache
+        >>> cache = PreprocessingCache()
+        >>> x = np.array([1.0, 2.0])
+        >>> cache.set_nan_flag(x, has_nan=False)
+        >>> cache.has_nan(x)
+        False
+
+        ```
+        """
+        self._arrays.append(arr)
+        self._nan_flags[array_key(arr)] = has_nan
+
+
+class RankCache:
+    r"""Implement a least recently used (LRU) cache for the ranks of
+    the arrays.
+
+    While the cache is active, i.e. inside a ``with`` block,
+    ``rankdata`` ranks each array once for each NaN policy, so the
+    rank-based metrics like ``analora.metric.spearmanr`` do not rank
+    the same array again, e.g. the target in a sweep over many
+    features. The arrays are identified like in
+    ``PreprocessingCache``, and they must not be modified in-place
+    while the cache is active. When the cache is full, the least
+    recently used ranks are evicted. The cache is cleared when the
+    ``with`` block exits.
+
+    Args:
+        max_size: The maximum number of ranked arrays in the cache.
+
+    Raises:
+        ValueError: if ``max_size`` is lower than 1.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric import spearmanr
+    >>> from analora.metric.utils import RankCache
+    >>> rng = np.random.default_rng(42)
+    >>> target = rng.normal(size=100)
+    >>> with RankCache(max_size=2) as cache:
+    ...     out = [spearmanr(x=rng.normal(size=100), y=target) for _ in range(5)]
+    ...     cache
+    ...
+    RankCache(num_ranks=2, max_size=2, hits=4, misses=6)
+
+    ```
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        if max_size < 1:
+            msg = f"Incorrect max_size: {max_size}. max_size must be greater than or equal to 1"
+            raise ValueError(msg)
+        self._max_size = max_size
+        # Each entry keeps a reference to the array so its memory cannot
+        # be reused by another array while the ranks are in the cache.
+        self._ranks: OrderedDict[Hashable, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._tokens: list[Token[RankCache | None]] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(num_ranks={len(self._ranks):,}, "
+            f"max_size={self._max_size:,}, hits={self._hits:,}, misses={self._misses:,})"
+        )
+
+    def __enter__(self) -> Self:
+        self._tokens.append(_ACTIVE_RANK_CACHE.set(self))
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        _ACTIVE_RANK_CACHE.reset(self._tokens.pop())
+        if not self._tokens:
+            self.clear()
+
+    def clear(self) -> None:
+        r"""Clear the cache.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.utils import RankCache
+        >>> cache = RankCache()
+        >>> cache.rank(np.array([3, 1, 2]))
+        array([3., 1., 2.])
+        >>> cache.clear()
+        >>> cache
+        RankCache(num_ranks=0, max_size=128, hits=0, misses=0)
+
+        ```
+        """
+        self._ranks.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def rank(self, arr: np.ndarray, nan_policy: str = "propagate") -> np.ndarray:
+        r"""Return the cached ranks of an array, or compute them if they
+        are not in the cache.
+
+        Args:
+            arr: The array to rank.
+            nan_policy: The policy on how to handle NaN values in the
+                input array. See ``rankdata`` for more information.
+
+        Returns:
+            The ranks of the array. The returned array must not be
+                modified in-place.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.metric.utils import RankCache
+        >>> cache = RankCache()
+        >>> x = np.array([3, 1, 2])
+        >>> cache.rank(x)
+        array([3., 1., 2.])
+        >>> cache.rank(x)
+        array([3., 1., 2.])
+        >>> cache
+        RankCache(num_ranks=1, max_size=128, hits=1, misses=1)
+
+        ```
+        """
+        key = (nan_policy, array_key(arr))
+        if key in self._ranks:
+            self._hits += 1
+            self._ranks.move_to_end(key)
+            return self._ranks[key][1]
+        self._misses += 1
+        ranks = _rankdata(arr, nan_policy=nan_policy)
+        self._ranks[key] = (arr, ranks)
+        if len(self._ranks) > self._max_size:
+            self._ranks.popitem(last=False)
+        return ranks
+
+
+def _cache_preprocessing(func: Callable[..., T]) -> Callable[..., T]:
+    r"""Decorate a preprocessing function to use the active
+    ``PreprocessingCache`` when the NaN values are dropped.
+
+    The arrays returned when the NaN values are dropped do not contain
+    NaN values, so their NaN flags are also set in the cache.
+
+    Args:
+        func: The preprocessing function. It must have a ``drop_nan``
+            argument, and its other arguments must be arrays or
+            sequences of arrays.
+
+    Returns:
+        The decorated function.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        cache = _ACTIVE_CACHE.get()
+        if cache is None:
+            return func(*args, **kwargs)
+        arguments = signature.bind(*args, **kwargs).arguments
+        if not arguments.get("drop_nan", False):
+            return func(*args, **kwargs)
+        arrays = []
+        for name, value in arguments.items():
+            if name != "drop_nan":
+                arrays.extend(value if isinstance(value, (list, tuple)) else [value])
+        result = cache.get_or_compute(
+            name=func.__qualname__, arrays=arrays, compute=lambda: func(*args, **kwargs)
+        )
+        for arr in result:
+            cache.set_nan_flag(arr, has_nan=False)
+        return result
+
+    return wrapper
 
 
 def check_array_ndim(arr: np.ndarray, ndim: int) -> None:
@@ -132,10 +500,10 @@ def check_nan_pred(y_true: np.ndarray, y_pred: np.ndarray) -> None:
 
     ```
     """
-    if np.isnan(y_true).any():
+    if has_nan(y_true):
         msg = "'y_true' contains at least one NaN value"
         raise RuntimeError(msg)
-    if np.isnan(y_pred).any():
+    if has_nan(y_pred):
         msg = "'y_pred' contains at least one NaN value"
         raise RuntimeError(msg)
 
@@ -216,13 +584,15 @@ def contains_nan(arr: np.ndarray, nan_policy: str = "propagate", name: str = "in
             ``nan_policy`` is ``'raise'``.
     """
     check_nan_policy(nan_policy)
-    isnan = np.any(np.isnan(arr))
-    if isnan and nan_policy == "raise":
+    cache = _ACTIVE_CACHE.get()
+    found = has_nan(arr) if cache is None else cache.has_nan(arr)
+    if found and nan_policy == "raise":
         msg = f"{name} contains at least one NaN value"
         raise ValueError(msg)
-    return isnan
+    return found
 
 
+@_cache_preprocessing
 def preprocess_pred(
     y_true: np.ndarray, y_pred: np.ndarray, drop_nan: bool = False
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -259,12 +629,13 @@ def preprocess_pred(
     ```
     """
     check_same_shape_pred(y_true, y_pred)
-    if not drop_nan:
+    if not drop_nan or not (has_nan(y_true) or has_nan(y_pred)):
         return y_true, y_pred
     mask = np.logical_not(multi_isnan([y_true, y_pred]))
     return y_true[mask], y_pred[mask]
 
 
+@_cache_preprocessing
 def preprocess_pred_multilabel(
     y_true: np.ndarray, y_pred: np.ndarray, drop_nan: bool = False
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -325,13 +696,14 @@ def preprocess_pred_multilabel(
     if y_pred.ndim == 1:
         y_pred = y_pred.reshape((-1, 1))
     check_same_shape_pred(y_true, y_pred)
-    if not drop_nan:
+    if not drop_nan or not (has_nan(y_true) or has_nan(y_pred)):
         return y_true, y_pred
 
-    mask = np.logical_not(np.logical_or(np.isnan(y_true).any(axis=1), np.isnan(y_pred).any(axis=1)))
+    mask = np.logical_not(multi_isnan([y_true, y_pred], rowwise=True))
     return y_true[mask], y_pred[mask]
 
 
+@_cache_preprocessing
 def preprocess_same_shape_arrays(
     arrays: Sequence[np.ndarray], drop_nan: bool = False
 ) -> tuple[np.ndarray, ...]:
@@ -367,12 +739,13 @@ def preprocess_same_shape_arrays(
     ```
     """
     check_same_shape(arrays)
-    if not drop_nan:
+    if not drop_nan or not any(has_nan(arr) for arr in arrays):
         return tuple(arrays)
     mask = np.logical_not(multi_isnan(arrays))
     return tuple(arr[mask] for arr in arrays)
 
 
+@_cache_preprocessing
 def preprocess_score_binary(
     y_true: np.ndarray, y_score: np.ndarray, drop_nan: bool = False
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -411,7 +784,7 @@ def preprocess_score_binary(
         return y_true, y_score
 
     check_same_shape_score(y_true, y_score)
-    if not drop_nan:
+    if not drop_nan or not (has_nan(y_true) or has_nan(y_score)):
         return y_true, y_score
 
     # Remove NaN values
@@ -419,6 +792,7 @@ def preprocess_score_binary(
     return y_true[mask], y_score[mask]
 
 
+@_cache_preprocessing
 def preprocess_score_multiclass(
     y_true: np.ndarray, y_score: np.ndarray, drop_nan: bool = False
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -492,14 +866,15 @@ def preprocess_score_multiclass(
         msg = f"'y_score' must be a 2d array but received an array of shape: {y_score.shape}"
         raise RuntimeError(msg)
 
-    if not drop_nan:
+    if not drop_nan or not (has_nan(y_true) or has_nan(y_score)):
         return y_true, y_score
 
     # Remove NaN values
-    mask = np.logical_not(np.logical_or(np.isnan(y_true), np.isnan(y_score).any(axis=1)))
+    mask = np.logical_not(multi_isnan([y_true, y_score], rowwise=True))
     return y_true[mask], y_score[mask]
 
 
+@_cache_preprocessing
 def preprocess_score_multilabel(
     y_true: np.ndarray, y_score: np.ndarray, drop_nan: bool = False
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -563,11 +938,69 @@ def preprocess_score_multilabel(
         y_score = y_score.reshape((-1, 1))
     check_same_shape_score(y_true, y_score)
 
-    if not drop_nan:
+    if not drop_nan or not (has_nan(y_true) or has_nan(y_score)):
         return y_true, y_score
 
     # Remove NaN values
-    mask = np.logical_not(
-        np.logical_or(np.isnan(y_true).any(axis=1), np.isnan(y_score).any(axis=1))
-    )
+    mask = np.logical_not(multi_isnan([y_true, y_score], rowwise=True))
     return y_true[mask], y_score[mask]
+
+
+def rankdata(arr: np.ndarray, nan_policy: str = "propagate") -> np.ndarray:
+    r"""Rank the values of an array along the first axis.
+
+    The ties get the average of the ranks. If a ``RankCache`` is
+    active, the ranks are read from the cache when possible.
+
+    Args:
+        arr: The array to rank.
+        nan_policy: The policy on how to handle NaN values in the input
+            array. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``. With ``'omit'``, the NaN
+            values are ignored and their ranks are NaN. With
+            ``'propagate'``, the ranks of a 1d array, or of a column
+            of a 2d array, with at least one NaN value are NaN.
+
+    Returns:
+        The ranks of the values.
+
+    Raises:
+        ValueError: if the array contains at least one NaN value and
+            ``nan_policy`` is ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.metric.utils import rankdata
+    >>> rankdata(np.array([3, 1, 2, 1]))
+    array([4. , 1.5, 3. , 1.5])
+    >>> rankdata(np.array([3, 1, float("nan"), 2]), nan_policy="omit")
+    array([ 3.,  1., nan,  2.])
+
+    ```
+    """
+    check_scipy()
+    check_nan_policy(nan_policy)
+    cache = _ACTIVE_RANK_CACHE.get()
+    if cache is None:
+        return _rankdata(arr, nan_policy=nan_policy)
+    return cache.rank(arr, nan_policy=nan_policy)
+
+
+def _rankdata(arr: np.ndarray, nan_policy: str) -> np.ndarray:
+    r"""Rank the values of an array along the first axis.
+
+    Args:
+        arr: The array to rank.
+        nan_policy: The policy on how to handle NaN values in the input
+            array.
+
+    Returns:
+        The ranks of the values.
+    """
+    contains_nan(arr, nan_policy=nan_policy)
+    if arr.shape[0] == 0:
+        return arr.astype(float)
+    return stats.rankdata(arr, axis=0, nan_policy="omit" if nan_policy == "omit" else "propagate")
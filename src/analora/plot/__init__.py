@@ -3,6 +3,7 @@ r"""Contain plotting functionalities."""
 from __future__ import annotations
 
 __all__ = [
+    "FigureSpec",
     "bar_discrete",
     "bar_discrete_temporal",
     "binary_precision_recall_curve",
@@ -13,6 +14,10 @@ __all__ = [
     "hist_continuous2",
     "plot_cdf",
     "plot_null_temporal",
+    "ranked_precision_recall_curve",
+    "ranked_roc_curve",
+    "render_figure",
+    "render_figures",
 ]
 
 from analora.plot.cdf import plot_cdf
@@ -24,5 +29,6 @@ from analora.plot.continuous import (
 )
 from analora.plot.discrete import bar_discrete, bar_discrete_temporal
 from analora.plot.null_temporal import plot_null_temporal
-from analora.plot.pr import binary_precision_recall_curve
-from analora.plot.roc import binary_roc_curve
+from analora.plot.pr import binary_precision_recall_curve, ranked_precision_recall_curve
+from analora.plot.render import FigureSpec, render_figure, render_figures
+from analora.plot.roc import binary_roc_curve, ranked_roc_curve
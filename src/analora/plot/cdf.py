@@ -4,25 +4,26 @@ from __future__ import annotations
 
 __all__ = ["plot_cdf"]
 
-import itertools
 from typing import TYPE_CHECKING
 
-import numpy as np
-
-from analora.array import nonnan
+from analora.plot.utils import HistogramSummary
+from analora.plot.utils.hist import check_array_or_summary
 
 if TYPE_CHECKING:
+    import numpy as np
     from matplotlib.axes import Axes
 
 
 def plot_cdf(
     ax: Axes,
-    array: np.ndarray,
+    array: np.ndarray | None = None,
     nbins: int | None = None,
     xmin: float = float("-inf"),
     xmax: float = float("inf"),
     color: str = "tab:blue",
     labelcolor: str = "black",
+    *,
+    summary: HistogramSummary | None = None,
 ) -> None:
     r"""Plot the cumulative distribution function (CDF).
 
@@ -38,6 +39,12 @@ def plot_cdf(
             ``0`` is the minimum value and ``1`` is the maximum value.
         color: The plot color.
         labelcolor: The label color.
+        summary: An optional precomputed histogram summary of the
+            data. If given, the CDF is computed from its bins and
+            ``array``, ``nbins``, ``xmin`` and ``xmax`` are ignored.
+
+    Raises:
+        ValueError: if ``array`` and ``summary`` are both ``None``.
 
     Example usage:
 
@@ -51,15 +58,15 @@ def plot_cdf(
 
     ```
     """
-    array = nonnan(array.ravel())
-    if array.size == 0:
+    check_array_or_summary(array, summary)
+    if summary is None:
+        array = array.ravel()
+        summary = HistogramSummary.compute(
+            array, nbins=nbins or min(1000, max(array.size, 1)), xmin=xmin, xmax=xmax, quantiles=()
+        )
+    if summary.count == 0:
         return
-    nbins = nbins or min(1000, array.size)
-    nleft = array[array < xmin].size
-    nright = array[array > xmax].size
-    counts, edges = np.histogram(array[np.logical_and(array >= xmin, array <= xmax)], bins=nbins)
-    cdf = (np.cumsum(counts) + nleft) / (np.sum(counts) + nleft + nright)
-    x = [(left + right) * 0.5 for left, right in itertools.pairwise(edges)]
+    x, cdf = summary.cdf()
     ax.tick_params(axis="y", labelcolor=labelcolor)
     ax.plot(x, cdf, color=color, label="CDF")
     ax.set_ylim(0.0, 1.0)
@@ -13,16 +13,27 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from analora.array import find_range, nonnan
+from analora.array import (
+    QuantileSketch,
+    SketchCache,
+    find_range,
+    get_quantile_sketch,
+    nonnan,
+)
 from analora.plot.cdf import plot_cdf
 from analora.plot.utils import (
+    HistogramSummary,
     auto_yscale_continuous,
     axvline_quantile,
+    compute_box_stats,
+    compute_box_stats_sequence,
     readable_xticklabels,
 )
+from analora.plot.utils.hist import APPROXIMATE_MIN_SIZE, check_array_or_summary
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from typing import Any
 
     from matplotlib.axes import Axes
 
@@ -32,9 +43,16 @@ def boxplot_continuous(
     array: np.ndarray,
     xmin: float | str | None = None,
     xmax: float | str | None = None,
+    *,
+    approximate: bool | None = None,
+    max_fliers: int = 1000,
 ) -> None:
     r"""Plot the histogram of an array containing continuous values.
 
+    The statistics of the box are computed with
+    ``compute_box_stats`` and drawn with ``ax.bxp``, so the values
+    are not sorted and at most ``max_fliers`` fliers are drawn.
+
     Args:
         ax: The axes of the matplotlib figure to update.
         array: The array with the data.
@@ -44,6 +62,10 @@ def boxplot_continuous(
         xmax: The maximum value of the range or its
             associated quantile. ``q0.9`` means the 90% quantile.
             ``0`` is the minimum value and ``1`` is the maximum value.
+        approximate: If ``True``, the quartiles and quantiles are
+            estimated with the quantile sketch of the array.
+            If ``None``, the sketch is used only for large arrays.
+        max_fliers: The maximum number of fliers to draw.
 
     Example usage:
 
@@ -60,15 +82,13 @@ def boxplot_continuous(
     array = array.ravel()
     if array.size == 0:
         return
-    xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    ax.boxplot(
-        array,
-        notch=True,
-        orientation="vertical",
-        widths=0.7,
-        patch_artist=True,
-        boxprops={"facecolor": "lightblue"},
-    )
+    if approximate is None:
+        approximate = array.size >= APPROXIMATE_MIN_SIZE
+    # The sketch of the array is shared by the range and the box statistics.
+    with SketchCache.current_or_new():
+        xmin, xmax = find_range(array, xmin=xmin, xmax=xmax, approximate=approximate)
+        stats = compute_box_stats(array, approximate=approximate, max_fliers=max_fliers)
+    _draw_boxes(ax, [stats])
     readable_xticklabels(ax, max_num_xticks=100)
     if xmin < xmax:
         ax.set_xlim(xmin, xmax)
@@ -82,9 +102,18 @@ def boxplot_continuous_temporal(
     ymin: float | str | None = None,
     ymax: float | str | None = None,
     yscale: str = "linear",
+    *,
+    approximate: bool | None = None,
+    max_fliers: int = 1000,
+    num_workers: int = 1,
 ) -> None:
     r"""Plot the histogram of an array containing continuous values.
 
+    The statistics of each time step are computed with
+    ``compute_box_stats_sequence`` and drawn with ``ax.bxp``. The
+    arrays of the time steps are not concatenated, except to compute
+    the exact quantiles of the range.
+
     Args:
         ax: The axes of the matplotlib figure to update.
         data: The sequence of data where each item is a 1-d array with
@@ -99,6 +128,15 @@ def boxplot_continuous_temporal(
         yscale: The y-axis scale. If ``'auto'``, the
             ``'linear'`` or ``'log'/'symlog'`` scale is chosen based
             on the distribution.
+        approximate: If ``True``, the quartiles and quantiles are
+            estimated with the quantile sketch of each array, and the
+            quantiles of the range are estimated by merging the
+            sketches. If ``None``, the sketches are used only if the
+            arrays contain many values in total.
+        max_fliers: The maximum number of fliers to draw for each
+            time step.
+        num_workers: The number of threads used to compute the
+            statistics of the time steps.
 
     Raises:
         RuntimeError: if ``data`` and ``steps`` have different lengths
@@ -122,29 +160,31 @@ def boxplot_continuous_temporal(
     if len(data) != len(steps):
         msg = f"data and steps have different lengths: {len(data):,} vs {len(steps):,}"
         raise RuntimeError(msg)
-    data = [nonnan(x) for x in data]
-    ax.boxplot(
-        data,
-        notch=True,
-        orientation="vertical",
-        widths=0.7,
-        patch_artist=True,
-        boxprops={"facecolor": "lightblue"},
-    )
-    array = np.concatenate(data)
-    ymin, ymax = find_range(array, xmin=ymin, xmax=ymax)
+    if approximate is None:
+        approximate = sum(x.size for x in data) >= APPROXIMATE_MIN_SIZE
+    # The sketches of the arrays are shared by the box statistics and
+    # the range.
+    with SketchCache.current_or_new():
+        stats = compute_box_stats_sequence(
+            data, approximate=approximate, max_fliers=max_fliers, num_workers=num_workers
+        )
+        vmin, vmax = _find_min_max(stats)
+        ymin, ymax = _find_range_temporal(
+            data, vmin=vmin, vmax=vmax, ymin=ymin, ymax=ymax, approximate=approximate
+        )
+    _draw_boxes(ax, stats)
     if ymin < ymax:
         ax.set_ylim(ymin, ymax)
     ax.set_xticks(np.arange(len(steps)), labels=steps)
     if yscale == "auto":
-        yscale = auto_yscale_continuous(array=array, nbins=100)
+        yscale = _auto_yscale_temporal(data, vmin=vmin, vmax=vmax)
     ax.set_yscale(yscale)
     readable_xticklabels(ax)
 
 
 def hist_continuous(
     ax: Axes,
-    array: np.ndarray,
+    array: np.ndarray | None = None,
     nbins: int | None = None,
     density: bool = False,
     yscale: str = "linear",
@@ -152,9 +192,17 @@ def hist_continuous(
     xmax: float | str | None = None,
     cdf: bool = True,
     quantile: bool = True,
+    *,
+    summary: HistogramSummary | None = None,
 ) -> None:
     r"""Plot the histogram of an array containing continuous values.
 
+    The values are summarized once (see ``HistogramSummary``), and the
+    histogram, the y-axis scale, the CDF, and the quantiles are all
+    computed from this summary. If ``nbins`` is ``None``, the summary
+    has 1,000 bins for the CDF, which are merged into 10 bins for the
+    histogram and 100 bins for the y-axis scale.
+
     Args:
         ax: The axes of the matplotlib figure to update.
         array: The array with the data.
@@ -175,6 +223,16 @@ def hist_continuous(
         cdf: If ``True``, the CDF is added to the plot.
         quantile: If ``True``, the 5% and 95% quantiles are added to
             the plot.
+        summary: An optional precomputed histogram summary of the
+            data. If given, it is used for the histogram, the y-axis
+            scale, the CDF, and the quantiles, and ``array``,
+            ``nbins``, ``xmin`` and ``xmax`` are ignored. The
+            quantile lines are drawn only if the summary contains the
+            5% and 95% quantiles, which are computed by default by
+            ``HistogramSummary.compute``.
+
+    Raises:
+        ValueError: if ``array`` and ``summary`` are both ``None``.
 
     Example usage:
 
@@ -183,37 +241,44 @@ def hist_continuous(
     >>> import numpy as np
     >>> from matplotlib import pyplot as plt
     >>> from analora.plot import hist_continuous
+    >>> from analora.plot.utils import HistogramSummary
     >>> fig, ax = plt.subplots()
     >>> hist_continuous(ax, array=np.arange(101))
+    >>> summary = HistogramSummary.compute(np.arange(101), nbins=20)
+    >>> hist_continuous(ax, summary=summary, yscale="auto")
 
     ```
     """
-    array = array.ravel()
-    if array.size == 0:
+    check_array_or_summary(array, summary)
+    if summary is None:
+        summary = HistogramSummary.compute(array, nbins=nbins or 1000, xmin=xmin, xmax=xmax)
+        hist_summary = summary if nbins else summary.rebin(10)
+        yscale_summary = summary if nbins else summary.rebin(100)
+    else:
+        hist_summary = yscale_summary = summary
+    if summary.count == 0:
         return
-    xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    ax.hist(array, bins=nbins, range=(xmin, xmax), color="tab:blue", alpha=0.9, density=density)
+    xmin, xmax = summary.edges[0].item(), summary.edges[-1].item()
+    ax.stairs(
+        hist_summary.density() if density else hist_summary.counts,
+        hist_summary.edges,
+        fill=True,
+        color="tab:blue",
+        alpha=0.9,
+    )
     readable_xticklabels(ax, max_num_xticks=100)
     if xmin < xmax:
         ax.set_xlim(xmin, xmax)
     ax.set_ylabel("density (number of occurrences/total)" if density else "number of occurrences")
     if yscale == "auto":
-        yscale = auto_yscale_continuous(array=array, nbins=nbins)
+        yscale = auto_yscale_continuous(summary=yscale_summary)
     ax.set_yscale(yscale)
     if cdf:
-        plot_cdf(
-            ax=ax.twinx(),
-            array=array,
-            nbins=nbins,
-            xmin=xmin,
-            xmax=xmax,
-            color="tab:red",
-            labelcolor="tab:red",
-        )
+        plot_cdf(ax=ax.twinx(), color="tab:red", labelcolor="tab:red", summary=summary)
 
-    if not quantile:
+    if not quantile or not {0.05, 0.95}.issubset(summary.quantiles):
         return
-    q05, q95 = np.quantile(array, q=[0.05, 0.95])
+    q05, q95 = summary.quantiles[0.05], summary.quantiles[0.95]
     if xmin < q05 < xmax:
         axvline_quantile(ax, quantile=q05, label="q0.05 ", horizontalalignment="right")
     if xmin < q95 < xmax:
@@ -271,7 +336,9 @@ def hist_continuous2(
     array = np.concatenate([array1, array2])
     if array.size == 0:
         return
-    xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
+    xmin, xmax = find_range(
+        array, xmin=xmin, xmax=xmax, approximate=array.size >= APPROXIMATE_MIN_SIZE
+    )
     ax.hist(
         array1,
         bins=nbins,
@@ -298,3 +365,113 @@ def hist_continuous2(
         yscale = auto_yscale_continuous(array=array, nbins=nbins)
     ax.set_yscale(yscale)
     ax.legend()
+
+
+def _draw_boxes(ax: Axes, stats: Sequence[dict[str, Any]]) -> None:
+    r"""Draw boxes from their precomputed statistics.
+
+    Args:
+        ax: The axes of the matplotlib figure to update.
+        stats: The statistics of each box, e.g. computed by
+            ``compute_box_stats``.
+    """
+    ax.bxp(
+        stats,
+        shownotches=True,
+        orientation="vertical",
+        widths=0.7,
+        patch_artist=True,
+        boxprops={"facecolor": "lightblue"},
+    )
+
+
+def _find_min_max(stats: Sequence[dict[str, Any]]) -> tuple[float, float]:
+    r"""Find the minimum and maximum values from the statistics of
+    boxes.
+
+    The fliers always include the minimum and maximum fliers, so the
+    values are exact.
+
+    Args:
+        stats: The statistics of each box.
+
+    Returns:
+        The minimum and maximum values, or NaN if all the boxes are
+            empty.
+    """
+    vmin, vmax = float("nan"), float("nan")
+    for stat in stats:
+        if np.isnan(stat["whislo"]):
+            continue
+        fliers = stat["fliers"]
+        low = min(stat["whislo"], fliers[0]) if fliers.size else stat["whislo"]
+        high = max(stat["whishi"], fliers[-1]) if fliers.size else stat["whishi"]
+        vmin = low if np.isnan(vmin) else min(vmin, low)
+        vmax = high if np.isnan(vmax) else max(vmax, high)
+    return float(vmin), float(vmax)
+
+
+def _find_range_temporal(
+    data: Sequence[np.ndarray],
+    vmin: float,
+    vmax: float,
+    *,
+    ymin: float | str | None,
+    ymax: float | str | None,
+    approximate: bool,
+) -> tuple[float, float]:
+    r"""Find the range of the values of a sequence of arrays.
+
+    Args:
+        data: The sequence of arrays.
+        vmin: The minimum value of the arrays.
+        vmax: The maximum value of the arrays.
+        ymin: The minimum value of the range or its
+            associated quantile.
+        ymax: The maximum value of the range or its
+            associated quantile.
+        approximate: If ``True``, the quantiles are estimated by
+            merging the quantile sketches of the arrays. Otherwise,
+            the arrays are concatenated to compute the exact
+            quantiles.
+
+    Returns:
+        The minimum and maximum values of the range.
+    """
+    if not isinstance(ymin, str) and not isinstance(ymax, str):
+        return (vmin if ymin is None else ymin), (vmax if ymax is None else ymax)
+    if not approximate:
+        return find_range(
+            np.concatenate([nonnan(x, copy=False) for x in data]), xmin=ymin, xmax=ymax
+        )
+    sketch = QuantileSketch()
+    for x in data:
+        sketch.merge(get_quantile_sketch(x))
+    if isinstance(ymin, str):
+        ymin = sketch.quantile(float(ymin[1:]))
+    if isinstance(ymax, str):
+        ymax = sketch.quantile(float(ymax[1:]))
+    return (vmin if ymin is None else ymin), (vmax if ymax is None else ymax)
+
+
+def _auto_yscale_temporal(data: Sequence[np.ndarray], vmin: float, vmax: float) -> str:
+    r"""Find a good scale for the y-axis of a sequence of arrays.
+
+    The histograms of the arrays are accumulated on the same bins, so
+    the arrays are not concatenated.
+
+    Args:
+        data: The sequence of arrays.
+        vmin: The minimum value of the arrays.
+        vmax: The maximum value of the arrays.
+
+    Returns:
+        The scale for the y-axis.
+    """
+    if np.isnan(vmin):
+        return "linear"
+    counts, edges = 0, None
+    for x in data:
+        hist, edges = np.histogram(nonnan(x, copy=False), bins=100, range=(vmin, vmax))
+        counts = counts + hist
+    return auto_yscale_continuous(summary=HistogramSummary(counts, edges, vmin=vmin, vmax=vmax))
@@ -2,10 +2,11 @@ r"""Contain precision-recall curve plotting functionalities."""
 
 from __future__ import annotations
 
-__all__ = ["binary_precision_recall_curve"]
+__all__ = ["binary_precision_recall_curve", "ranked_precision_recall_curve"]
 
 from typing import TYPE_CHECKING, Any
 
+from analora.metric.classification.ranking import RankedScores
 from analora.metric.utils import preprocess_pred
 from analora.utils.imports import check_sklearn, is_sklearn_available
 
@@ -30,7 +31,7 @@ def binary_precision_recall_curve(
         y_pred: The predicted labels. This input must be an array of
             shape ``(n_samples,)`` with ``0`` and ``1`` values.
         **kwargs: Arbitrary keyword arguments that are passed to
-            ``PrecisionRecallDisplay.from_predictions``.
+            ``PrecisionRecallDisplay.plot``.
 
     Example usage:
 
@@ -48,4 +49,46 @@ def binary_precision_recall_curve(
     """
     check_sklearn()
     y_true, y_pred = preprocess_pred(y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=True)
-    PrecisionRecallDisplay.from_predictions(y_true=y_true, y_pred=y_pred, ax=ax, **kwargs)
+    ranked_precision_recall_curve(
+        ax=ax, ranked=RankedScores(y_true=y_true, y_score=y_pred), **kwargs
+    )
+
+
+def ranked_precision_recall_curve(ax: Axes, ranked: RankedScores, **kwargs: Any) -> None:
+    r"""Plot the precision-recall curve of already ranked binary
+    scores.
+
+    Args:
+        ax: The axes of the matplotlib figure to update.
+        ranked: The ranked scores. It can be shared with other
+            metrics or figures computed on the same scores.
+        **kwargs: Arbitrary keyword arguments that are passed to
+            ``PrecisionRecallDisplay.plot``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from matplotlib import pyplot as plt
+    >>> from analora.metric import RankedScores
+    >>> from analora.plot import ranked_precision_recall_curve
+    >>> ranked = RankedScores(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+    ... )
+    >>> fig, ax = plt.subplots()
+    >>> ranked_precision_recall_curve(ax=ax, ranked=ranked)
+
+    ```
+    """
+    check_sklearn()
+    if ranked.count == 0:
+        return
+    precision, recall, _ = ranked.precision_recall_curve()
+    PrecisionRecallDisplay(
+        precision=precision,
+        recall=recall,
+        average_precision=ranked.average_precision(),
+        pos_label=1,
+        prevalence_pos_label=ranked.num_positives / ranked.count,
+    ).plot(ax=ax, **kwargs)
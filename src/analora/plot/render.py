@@ -0,0 +1,197 @@
+r"""Contain functions to render many figures in parallel."""
+
+from __future__ import annotations
+
+__all__ = ["FigureSpec", "render_figure", "render_figures"]
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import matplotlib as mpl
+from matplotlib import pyplot as plt
+
+from analora.utils.html import figure2html
+from analora.utils.validation import check_num_workers
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from matplotlib.axes import Axes
+
+    from analora.utils.figure import FigureConfig
+
+
+class FigureSpec:
+    r"""Define a figure with a single axes to render.
+
+    The figure is described by a plotting function and its arguments,
+    instead of a matplotlib figure, so it can be sent to a worker
+    process and rendered there. The plotting function and its
+    arguments must be picklable, e.g. the plotting functions of
+    ``analora.plot``.
+
+    Args:
+        func: The plotting function. Its first argument is the
+            matplotlib axes to update, e.g. ``hist_continuous``.
+        kwargs: The keyword arguments of the plotting function.
+        figure_kwargs: The keyword arguments passed to
+            ``plt.subplots`` to create the figure, e.g. ``figsize``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.plot import FigureSpec, hist_continuous
+    >>> spec = FigureSpec(hist_continuous, kwargs={"array": np.arange(101)})
+    >>> spec
+    FigureSpec(func=hist_continuous, kwargs=['array'], figure_kwargs={})
+
+    ```
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        kwargs: Mapping[str, Any] | None = None,
+        figure_kwargs: Mapping[str, Any] | None = None,
+    ) -> None:
+        self._func = func
+        self._kwargs = dict(kwargs or {})
+        self._figure_kwargs = dict(figure_kwargs or {})
+
+    def __repr__(self) -> str:
+        name = getattr(self._func, "__qualname__", repr(self._func))
+        return (
+            f"{self.__class__.__qualname__}(func={name}, kwargs={sorted(self._kwargs)}, "
+            f"figure_kwargs={self._figure_kwargs})"
+        )
+
+    @property
+    def figure_kwargs(self) -> dict[str, Any]:
+        r"""The keyword arguments passed to ``plt.subplots``."""
+        return self._figure_kwargs
+
+    @property
+    def func(self) -> Callable[..., Any]:
+        r"""The plotting function."""
+        return self._func
+
+    @property
+    def kwargs(self) -> dict[str, Any]:
+        r"""The keyword arguments of the plotting function."""
+        return self._kwargs
+
+    def plot(self, ax: Axes) -> None:
+        r"""Plot the figure on an axes.
+
+        Args:
+            ax: The axes of the matplotlib figure to update.
+        """
+        self._func(ax, **self._kwargs)
+
+
+def render_figure(
+    spec: FigureSpec, reactive: bool = True, config: FigureConfig | None = None
+) -> str:
+    r"""Render a figure to a string that can be used in a HTML file.
+
+    The figure is always closed after it is rendered.
+
+    Args:
+        spec: The specification of the figure to render.
+        reactive: If ``True``, the generated is configured to be
+            reactive to the screen size.
+        config: The configuration used to create and encode the
+            figure. The ``figsize`` of the specification has priority
+            over the ``figsize`` of the configuration.
+
+    Returns:
+        The rendered figure.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.plot import FigureSpec, hist_continuous, render_figure
+    >>> html = render_figure(FigureSpec(hist_continuous, kwargs={"array": np.arange(101)}))
+    >>> html[:10]
+    '<img style'
+
+    ```
+    """
+    figure_kwargs = spec.figure_kwargs
+    if config is not None and config.figsize is not None:
+        figure_kwargs = {"figsize": config.figsize} | figure_kwargs
+    fig, ax = plt.subplots(**figure_kwargs)
+    try:
+        spec.plot(ax)
+        return figure2html(fig, reactive=reactive, config=config)
+    finally:
+        plt.close(fig)
+
+
+def render_figures(
+    specs: Sequence[FigureSpec],
+    *,
+    reactive: bool = True,
+    config: FigureConfig | None = None,
+    num_workers: int = 0,
+) -> list[str]:
+    r"""Render many figures to strings that can be used in a HTML file.
+
+    Matplotlib is not thread-safe, so the figures are rendered in a
+    pool of worker processes that use the non-interactive ``'Agg'``
+    backend. The rendered figures are returned in the same order as
+    the specifications, whatever the number of workers.
+
+    Args:
+        specs: The specifications of the figures to render.
+        reactive: If ``True``, the generated is configured to be
+            reactive to the screen size.
+        config: The configuration used to create and encode the
+            figures, e.g. ``FigureConfig.from_preset("compact")`` to
+            reduce the size of the report.
+        num_workers: The number of worker processes used to render
+            the figures. If ``0``, the figures are rendered in the
+            current process.
+
+    Returns:
+        The rendered figures.
+
+    Raises:
+        ValueError: if ``num_workers`` is lower than 0.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.plot import FigureSpec, bar_discrete, hist_continuous, render_figures
+    >>> htmls = render_figures(
+    ...     [
+    ...         FigureSpec(hist_continuous, kwargs={"array": np.arange(101)}),
+    ...         FigureSpec(bar_discrete, kwargs={"names": ["a", "b"], "counts": [5, 2]}),
+    ...     ]
+    ... )
+    >>> len(htmls)
+    2
+
+    ```
+    """
+    check_num_workers(num_workers)
+    if num_workers == 0 or len(specs) <= 1:
+        return [render_figure(spec, reactive=reactive, config=config) for spec in specs]
+    with ProcessPoolExecutor(
+        max_workers=min(num_workers, len(specs)), initializer=_init_worker
+    ) as executor:
+        return list(
+            executor.map(render_figure, specs, [reactive] * len(specs), [config] * len(specs))
+        )
+
+
+def _init_worker() -> None:
+    r"""Initialize a worker process to render figures with the
+    non-interactive ``'Agg'`` backend."""
+    mpl.use("Agg", force=True)
@@ -3,10 +3,11 @@ functionalities."""
 
 from __future__ import annotations
 
-__all__ = ["binary_roc_curve"]
+__all__ = ["binary_roc_curve", "ranked_roc_curve"]
 
 from typing import TYPE_CHECKING, Any
 
+from analora.metric.classification.ranking import RankedScores
 from analora.metric.utils import preprocess_score_binary
 from analora.utils.imports import check_sklearn, is_sklearn_available
 
@@ -31,7 +32,7 @@ def binary_roc_curve(ax: Axes, y_true: np.ndarray, y_score: np.ndarray, **kwargs
             or non-thresholded measure of decisions. This input must
             be an array of shape ``(n_samples,)``.
         **kwargs: Arbitrary keyword arguments that are passed to
-            ``RocCurveDisplay.from_predictions``.
+            ``RocCurveDisplay.plot``.
 
     Example usage:
 
@@ -51,4 +52,38 @@ def binary_roc_curve(ax: Axes, y_true: np.ndarray, y_score: np.ndarray, **kwargs
     y_true, y_score = preprocess_score_binary(
         y_true=y_true.ravel(), y_score=y_score.ravel(), drop_nan=True
     )
-    RocCurveDisplay.from_predictions(y_true=y_true, y_pred=y_score, ax=ax, **kwargs)
+    ranked_roc_curve(ax=ax, ranked=RankedScores(y_true=y_true, y_score=y_score), **kwargs)
+
+
+def ranked_roc_curve(ax: Axes, ranked: RankedScores, **kwargs: Any) -> None:
+    r"""Plot the Receiver Operating Characteristic Curve (ROC) of
+    already ranked binary scores.
+
+    Args:
+        ax: The axes of the matplotlib figure to update.
+        ranked: The ranked scores. It can be shared with other
+            metrics or figures computed on the same scores.
+        **kwargs: Arbitrary keyword arguments that are passed to
+            ``RocCurveDisplay.plot``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from matplotlib import pyplot as plt
+    >>> from analora.metric import RankedScores
+    >>> from analora.plot import ranked_roc_curve
+    >>> ranked = RankedScores(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+    ... )
+    >>> fig, ax = plt.subplots()
+    >>> ranked_roc_curve(ax=ax, ranked=ranked)
+
+    ```
+    """
+    check_sklearn()
+    if ranked.count == 0:
+        return
+    fpr, tpr, _ = ranked.roc_curve()
+    RocCurveDisplay(fpr=fpr, tpr=tpr, roc_auc=ranked.roc_auc(), pos_label=1).plot(ax=ax, **kwargs)
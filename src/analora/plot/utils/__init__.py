@@ -3,14 +3,19 @@ r"""Contain utility functions to generate plots."""
 from __future__ import annotations
 
 __all__ = [
+    "HistogramSummary",
     "auto_yscale_continuous",
     "auto_yscale_discrete",
     "axvline_median",
     "axvline_quantile",
+    "compute_box_stats",
+    "compute_box_stats_sequence",
     "readable_xticklabels",
     "readable_yticklabels",
 ]
 
+from analora.plot.utils.box import compute_box_stats, compute_box_stats_sequence
+from analora.plot.utils.hist import HistogramSummary
 from analora.plot.utils.line import axvline_median, axvline_quantile
 from analora.plot.utils.scale import auto_yscale_continuous, auto_yscale_discrete
 from analora.plot.utils.tick import readable_xticklabels, readable_yticklabels
@@ -0,0 +1,194 @@
+r"""Contain utility functions to compute the statistics of boxplots."""
+
+from __future__ import annotations
+
+__all__ = ["compute_box_stats", "compute_box_stats_sequence"]
+
+import contextvars
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from analora.array import get_quantile_sketch, nonnan
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def compute_box_stats(
+    array: np.ndarray,
+    *,
+    approximate: bool = False,
+    whis: float = 1.5,
+    max_fliers: int = 1000,
+    label: Any = None,
+) -> dict[str, Any]:
+    r"""Compute the statistics to draw a boxplot with ``ax.bxp``.
+
+    The statistics are the same as
+    ``matplotlib.cbook.boxplot_stats``, but the quartiles are computed
+    with ``np.quantile`` (i.e. a partition) or with the quantile sketch
+    of the array, so the values are not sorted, and the number
+    of fliers is capped. The NaN values are ignored.
+
+    Args:
+        array: The array with the data.
+        approximate: If ``True``, the quartiles are estimated with the
+            quantile sketch of the array (see
+            ``get_quantile_sketch``). The whiskers and fliers are
+            exact.
+        whis: The position of the whiskers, as a multiple of the
+            interquartile range (IQR) from the quartiles.
+        max_fliers: The maximum number of fliers. If there are more
+            fliers, evenly spaced fliers are kept, including the
+            minimum and maximum fliers.
+        label: The optional label of the box. If ``None``,
+            ``ax.bxp`` uses the position of the box as label.
+
+    Returns:
+        The statistics of the box. The values are NaN and there are
+            no fliers if the array has no value.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.plot.utils import compute_box_stats
+    >>> stats = compute_box_stats(np.array([1.0, 2.0, 3.0, 4.0, 5.0, 100.0]))
+    >>> stats["q1"], stats["med"], stats["q3"]
+    (2.25, 3.5, 4.75)
+    >>> stats["whislo"], stats["whishi"], stats["fliers"]
+    (1.0, 5.0, array([100.]))
+
+    ```
+    """
+    values = nonnan(array, copy=False)
+    nan = float("nan")
+    stats = {
+        "mean": nan,
+        "med": nan,
+        "q1": nan,
+        "q3": nan,
+        "iqr": nan,
+        "cilo": nan,
+        "cihi": nan,
+        "whislo": nan,
+        "whishi": nan,
+        "fliers": np.array([], dtype=float),
+    }
+    if label is not None:
+        stats["label"] = label
+    if values.size == 0:
+        return stats
+    if approximate:
+        q1, med, q3 = get_quantile_sketch(array).quantile([0.25, 0.5, 0.75]).tolist()
+    else:
+        q1, med, q3 = np.quantile(values, [0.25, 0.5, 0.75]).tolist()
+    iqr = q3 - q1
+    low, high = q1 - whis * iqr, q3 + whis * iqr
+    # Like matplotlib, the whiskers do not go inside the box, so the
+    # quartiles are the initial values of the reductions.
+    whislo = np.minimum.reduce(values, where=values >= low, initial=q1, dtype=float).item()
+    whishi = np.maximum.reduce(values, where=values <= high, initial=q3, dtype=float).item()
+    notch = 1.57 * iqr / math.sqrt(values.size)
+    stats.update(
+        {
+            "mean": values.mean().item(),
+            "med": med,
+            "q1": q1,
+            "q3": q3,
+            "iqr": iqr,
+            "cilo": med - notch,
+            "cihi": med + notch,
+            "whislo": whislo,
+            "whishi": whishi,
+            "fliers": _sample_fliers(values, low=whislo, high=whishi, max_fliers=max_fliers),
+        }
+    )
+    return stats
+
+
+def compute_box_stats_sequence(
+    data: Sequence[np.ndarray],
+    *,
+    approximate: bool = False,
+    whis: float = 1.5,
+    max_fliers: int = 1000,
+    num_workers: int = 1,
+) -> list[dict[str, Any]]:
+    r"""Compute the statistics to draw a boxplot for each array of a
+    sequence.
+
+    Args:
+        data: The sequence of arrays.
+        approximate: If ``True``, the quartiles are estimated with the
+            quantile sketch of each array.
+        whis: The position of the whiskers, as a multiple of the
+            interquartile range (IQR) from the quartiles.
+        max_fliers: The maximum number of fliers of each box.
+        num_workers: The number of threads used to compute the
+            statistics of the arrays in parallel. ``1`` means the
+            statistics are computed sequentially. NumPy releases the
+            GIL in the partition and reductions, so the threads run
+            in parallel.
+
+    Returns:
+        The statistics of each box.
+
+    Raises:
+        ValueError: if ``num_workers`` is lower than 1.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.plot.utils import compute_box_stats_sequence
+    >>> stats = compute_box_stats_sequence([np.arange(11), np.arange(21)], num_workers=2)
+    >>> [s["med"] for s in stats]
+    [5.0, 10.0]
+
+    ```
+    """
+    if num_workers < 1:
+        msg = f"Incorrect num_workers: {num_workers}. num_workers must be greater than 0"
+        raise ValueError(msg)
+
+    def compute(array: np.ndarray) -> dict[str, Any]:
+        return compute_box_stats(array, approximate=approximate, whis=whis, max_fliers=max_fliers)
+
+    if num_workers == 1 or len(data) <= 1:
+        return [compute(array) for array in data]
+    # The threads run in a copy of the current context, so they use the
+    # active sketch cache.
+    contexts = [contextvars.copy_context() for _ in data]
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        return list(executor.map(lambda ctx, array: ctx.run(compute, array), contexts, data))
+
+
+def _sample_fliers(values: np.ndarray, low: float, high: float, max_fliers: int) -> np.ndarray:
+    r"""Return the values outside a range, with at most
+    ``max_fliers`` values.
+
+    Args:
+        values: The values.
+        low: The lower bound of the range.
+        high: The upper bound of the range.
+        max_fliers: The maximum number of fliers.
+
+    Returns:
+        The sorted fliers. If there are more than ``max_fliers``
+            fliers, evenly spaced fliers are kept, including the
+            minimum and maximum fliers.
+    """
+    mask = values < low
+    mask |= values > high
+    fliers = np.sort(values[mask])
+    if fliers.size > max_fliers:
+        if max_fliers <= 0:
+            return fliers[:0]
+        fliers = fliers[np.linspace(0, fliers.size - 1, max_fliers).round().astype(np.intp)]
+    return fliers.astype(float, copy=False)
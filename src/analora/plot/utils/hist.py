@@ -2,12 +2,337 @@ r"""Contain utility functions to generate histograms."""
 
 from __future__ import annotations
 
-__all__ = ["adjust_nbins", "find_nbins"]
+__all__ = [
+    "APPROXIMATE_MIN_SIZE",
+    "HistogramSummary",
+    "adjust_nbins",
+    "check_array_or_summary",
+    "find_nbins",
+]
 
 import math
+from typing import TYPE_CHECKING
 
 import numpy as np
 
+from analora.array import get_quantile_sketch, nonnan
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# The ranges and quantiles of the arrays with at least this number of
+# values are estimated with their quantile sketch, so the values are not
+# copied and partitioned.
+APPROXIMATE_MIN_SIZE = 10_000_000
+
+
+class HistogramSummary:
+    r"""Implement a summary of the distribution of an array to draw
+    histograms and CDFs without binning the values again.
+
+    The summary contains the bin counts and edges of the histogram in
+    a range, the number of values on the left and on the right of the
+    range, the minimum and maximum values, and some quantiles. It is
+    computed once (see ``compute``), then it can be given to
+    ``hist_continuous``, ``plot_cdf`` and ``auto_yscale_continuous``.
+
+    Args:
+        counts: The number of values in each bin.
+        edges: The bin edges, with one more value than ``counts``.
+        nleft: The number of values lower than the first edge.
+        nright: The number of values greater than the last edge.
+        vmin: The minimum value, or NaN if there is no value.
+        vmax: The maximum value, or NaN if there is no value.
+        quantiles: The quantile values indexed by their probability.
+
+    Raises:
+        RuntimeError: if ``edges`` does not have one more value than
+            ``counts``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.plot.utils import HistogramSummary
+    >>> summary = HistogramSummary.compute(np.arange(101), nbins=4, xmin="q0.1", xmax=90)
+    >>> summary
+    HistogramSummary(nbins=4, count=101, nleft=10, nright=10, min=0, max=100)
+    >>> summary.counts
+    array([20, 20, 20, 21])
+    >>> summary.edges
+    array([10., 30., 50., 70., 90.])
+    >>> summary.quantiles
+    {0.05: 5.0, 0.95: 95.0}
+
+    ```
+    """
+
+    def __init__(
+        self,
+        counts: np.ndarray,
+        edges: np.ndarray,
+        *,
+        nleft: int = 0,
+        nright: int = 0,
+        vmin: float = float("nan"),
+        vmax: float = float("nan"),
+        quantiles: dict[float, float] | None = None,
+    ) -> None:
+        if edges.shape != (counts.size + 1,):
+            msg = (
+                f"Incorrect edges shape: {edges.shape}. "
+                f"edges must be a 1d array with {counts.size + 1:,} values"
+            )
+            raise RuntimeError(msg)
+        self._counts = counts
+        self._edges = edges
+        self._nleft = nleft
+        self._nright = nright
+        self._min = vmin
+        self._max = vmax
+        self._quantiles = quantiles or {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(nbins={self.nbins:,}, count={self.count:,}, "
+            f"nleft={self._nleft:,}, nright={self._nright:,}, min={self._min}, max={self._max})"
+        )
+
+    @property
+    def count(self) -> int:
+        r"""The number of non-NaN values."""
+        return self._nleft + int(self._counts.sum()) + self._nright
+
+    @property
+    def counts(self) -> np.ndarray:
+        r"""The number of values in each bin."""
+        return self._counts
+
+    @property
+    def edges(self) -> np.ndarray:
+        r"""The bin edges."""
+        return self._edges
+
+    @property
+    def max(self) -> float:
+        r"""The maximum value."""
+        return self._max
+
+    @property
+    def min(self) -> float:
+        r"""The minimum value."""
+        return self._min
+
+    @property
+    def nbins(self) -> int:
+        r"""The number of bins."""
+        return self._counts.size
+
+    @property
+    def nleft(self) -> int:
+        r"""The number of values lower than the first edge."""
+        return self._nleft
+
+    @property
+    def nright(self) -> int:
+        r"""The number of values greater than the last edge."""
+        return self._nright
+
+    @property
+    def quantiles(self) -> dict[float, float]:
+        r"""The quantile values indexed by their probability."""
+        return self._quantiles
+
+    def cdf(self) -> tuple[np.ndarray, np.ndarray]:
+        r"""Return the cumulative distribution function (CDF) evaluated
+        at the bin centers.
+
+        The values on the left of the range are included in the CDF.
+
+        Returns:
+            A tuple with the bin centers and the CDF values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.plot.utils import HistogramSummary
+        >>> summary = HistogramSummary.compute(np.arange(100), nbins=4, xmin=50)
+        >>> summary.cdf()
+        (array([56.125, 68.375, 80.625, 92.875]), array([0.63, 0.75, 0.87, 1.  ]))
+
+        ```
+        """
+        centers = (self._edges[:-1] + self._edges[1:]) * 0.5
+        return centers, (np.cumsum(self._counts) + self._nleft) / max(self.count, 1)
+
+    def density(self) -> np.ndarray:
+        r"""Return the probability density of each bin.
+
+        Like ``np.histogram(..., density=True)``, the density is
+        normalized with the number of values in the range, so the
+        area under the histogram is 1.
+
+        Returns:
+            The probability density of each bin.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.plot.utils import HistogramSummary
+        >>> summary = HistogramSummary.compute(np.array([0, 1, 1, 3]), nbins=2)
+        >>> summary.density()
+        array([0.5       , 0.16666667])
+
+        ```
+        """
+        total = self._counts.sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._counts / (total * np.diff(self._edges))
+
+    def rebin(self, nbins: int) -> HistogramSummary:
+        r"""Return the summary with fewer bins.
+
+        The consecutive bins are merged, so the number of bins must
+        divide the current number of bins.
+
+        Args:
+            nbins: The new number of bins.
+
+        Returns:
+            The summary with ``nbins`` bins.
+
+        Raises:
+            ValueError: if ``nbins`` does not divide the current
+                number of bins.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.plot.utils import HistogramSummary
+        >>> summary = HistogramSummary.compute(np.arange(100), nbins=10)
+        >>> summary.rebin(2).counts
+        array([50, 50])
+
+        ```
+        """
+        if nbins < 1 or self.nbins % nbins != 0:
+            msg = (
+                f"Incorrect nbins: {nbins}. nbins must divide the number of bins "
+                f"of the summary: {self.nbins:,}"
+            )
+            raise ValueError(msg)
+        factor = self.nbins // nbins
+        return self.__class__(
+            counts=self._counts.reshape(nbins, factor).sum(axis=1),
+            edges=self._edges[::factor],
+            nleft=self._nleft,
+            nright=self._nright,
+            vmin=self._min,
+            vmax=self._max,
+            quantiles=self._quantiles,
+        )
+
+    @classmethod
+    def compute(
+        cls,
+        array: np.ndarray,
+        nbins: int = 100,
+        *,
+        xmin: float | str | None = None,
+        xmax: float | str | None = None,
+        quantiles: Sequence[float] = (0.05, 0.95),
+        chunk_size: int = 1_048_576,
+    ) -> HistogramSummary:
+        r"""Compute the summary of an array.
+
+        The NaN values are ignored. The histogram and the number of
+        values outside the range are computed in a single pass, chunk
+        by chunk, so no mask or copy of the whole array is created.
+        All the quantiles, including the range quantiles, are computed
+        together. For arrays with at least 10M values, the range and
+        the quantiles are estimated with the quantile sketch of the
+        array (see ``get_quantile_sketch``).
+
+        Args:
+            array: The array with the data.
+            nbins: The number of bins.
+            xmin: The minimum value of the range or its
+                associated quantile. ``q0.1`` means the 10% quantile.
+                ``None`` or an infinite value means the minimum value.
+            xmax: The maximum value of the range or its
+                associated quantile. ``q0.9`` means the 90% quantile.
+                ``None`` or an infinite value means the maximum value.
+            quantiles: The probabilities of the quantiles to compute.
+            chunk_size: The number of values binned at once.
+
+        Returns:
+            The summary of the array.
+        """
+        array = array.ravel()
+        probs = [*quantiles, *(float(x[1:]) for x in [xmin, xmax] if isinstance(x, str))]
+        if array.size >= APPROXIMATE_MIN_SIZE:
+            sketch = get_quantile_sketch(array)
+            count, vmin, vmax = sketch.count, sketch.min, sketch.max
+            values = np.atleast_1d(sketch.quantile(probs)).tolist()
+        else:
+            array = nonnan(array, copy=False)
+            count = array.size
+            vmin, vmax = float("nan"), float("nan")
+            values = [float("nan")] * len(probs)
+            if count > 0:
+                vmin, vmax = array.min().item(), array.max().item()
+                if probs:
+                    values = np.quantile(array, probs).tolist()
+
+        summary_quantiles = dict(zip(quantiles, values[: len(quantiles)]))
+        if count == 0:
+            counts, edges = np.histogram(np.array([]), bins=nbins)
+            return cls(counts=counts, edges=edges, quantiles=summary_quantiles)
+        range_quantiles = iter(values[len(quantiles) :])
+        low, high = (
+            next(range_quantiles) if isinstance(x, str) else _bound(x, default)
+            for x, default in [(xmin, vmin), (xmax, vmax)]
+        )
+        if low > high:
+            counts, edges = np.histogram(np.array([]), bins=nbins)
+            nleft = np.count_nonzero(array < low)
+            return cls(
+                counts=counts,
+                edges=edges,
+                nleft=nleft,
+                nright=count - nleft,
+                vmin=vmin,
+                vmax=vmax,
+                quantiles=summary_quantiles,
+            )
+        if low == high:
+            # Same range as np.histogram, so the values on the left and
+            # on the right of the range are not counted in the bins.
+            low, high = low - 0.5, high + 0.5
+        counts, edges = np.histogram(np.array([]), bins=nbins, range=(low, high))
+        nleft = nright = 0
+        for start in range(0, array.size, chunk_size):
+            chunk = array[start : start + chunk_size]
+            counts += np.histogram(chunk, bins=nbins, range=(low, high))[0]
+            nleft += np.count_nonzero(chunk < low)
+            nright += np.count_nonzero(chunk > high)
+        return cls(
+            counts=counts,
+            edges=edges,
+            nleft=nleft,
+            nright=nright,
+            vmin=vmin,
+            vmax=vmax,
+            quantiles=summary_quantiles,
+        )
+
 
 def adjust_nbins(nbins: int | None, array: np.ndarray) -> int | None:
     r"""Return the adjusted number of bins.
@@ -37,6 +362,31 @@ def adjust_nbins(nbins: int | None, array: np.ndarray) -> int | None:
     return nbins
 
 
+def check_array_or_summary(array: np.ndarray | None, summary: HistogramSummary | None) -> None:
+    r"""Check that the data or its histogram summary is given.
+
+    Args:
+        array: The optional array with the data.
+        summary: The optional histogram summary of the data.
+
+    Raises:
+        ValueError: if ``array`` and ``summary`` are both ``None``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from analora.plot.utils.hist import check_array_or_summary
+    >>> check_array_or_summary(np.arange(10), summary=None)
+
+    ```
+    """
+    if array is None and summary is None:
+        msg = "Incorrect arguments: array and summary cannot both be None"
+        raise ValueError(msg)
+
+
 def find_nbins(bin_size: float, min: float, max: float) -> int:  # noqa: A002
     r"""Find the number of bins from the bin size and the range of
     values.
@@ -73,3 +423,19 @@ def find_nbins(bin_size: float, min: float, max: float) -> int:  # noqa: A002
     if min == max:
         return 1
     return math.ceil((max - min + 1) / bin_size)
+
+
+def _bound(value: float | None, default: float) -> float:
+    r"""Return the bound of a range.
+
+    Args:
+        value: The bound value. ``None`` or an infinite value means
+            the default value.
+        default: The default value.
+
+    Returns:
+        The bound of the range.
+    """
+    if value is None or math.isinf(value):
+        return default
+    return value
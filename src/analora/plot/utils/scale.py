@@ -5,21 +5,36 @@ from __future__ import annotations
 __all__ = ["auto_yscale_continuous", "auto_yscale_discrete"]
 
 
-import numpy as np
+from typing import TYPE_CHECKING
 
-from analora.array import nonnan
+from analora.plot.utils.hist import HistogramSummary, check_array_or_summary
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def auto_yscale_continuous(array: np.ndarray, nbins: int | None = None) -> str:
+
+def auto_yscale_continuous(
+    array: np.ndarray | None = None,
+    nbins: int | None = None,
+    *,
+    summary: HistogramSummary | None = None,
+) -> str:
     r"""Find a good scale for y-axis based on the data distribution.
 
     Args:
-        array: The data to use to find the scale.
-        nbins: The number of bins in the histogram.
+        array: The data to use to find the scale. It is ignored if
+            ``summary`` is given.
+        nbins: The number of bins in the histogram. It is ignored if
+            ``summary`` is given.
+        summary: An optional precomputed histogram summary of the
+            data, so the values are not binned again.
 
     Returns:
         The scale for y-axis.
 
+    Raises:
+        ValueError: if ``array`` and ``summary`` are both ``None``.
+
     Example usage:
 
     ```pycon
@@ -31,14 +46,13 @@ def auto_yscale_continuous(array: np.ndarray, nbins: int | None = None) -> str:
 
     ```
     """
-    if nbins is None:
-        nbins = 100
-    array = nonnan(array)
-    counts = np.histogram(array, bins=nbins)[0]
-    nonzero_count = [c for c in counts if c > 0]
-    if len(nonzero_count) <= 2 or (max(nonzero_count) / max(min(nonzero_count), 1)) < 50:
+    check_array_or_summary(array, summary)
+    if summary is None:
+        summary = HistogramSummary.compute(array, nbins=nbins or 100, quantiles=())
+    nonzero_count = summary.counts[summary.counts > 0]
+    if nonzero_count.size <= 2 or (nonzero_count.max() / max(nonzero_count.min(), 1)) < 50:
         return "linear"
-    if np.nanmin(array) <= 0.0:
+    if summary.min <= 0.0:
         return "symlog"
     return "log"
 
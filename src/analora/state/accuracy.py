@@ -4,9 +4,12 @@ from __future__ import annotations
 
 __all__ = ["AccuracyState"]
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from analora.metric.utils import check_nan_policy, check_same_shape_pred
+from analora.array import has_nan
+from analora.metric.classification.balanced_accuracy import per_class_counts
+from analora.metric.utils import check_nan_policy, check_same_shape_pred, preprocess_pred
 from analora.state.arg import BaseArgState
 
 if TYPE_CHECKING:
@@ -87,6 +90,41 @@ class AccuracyState(BaseArgState):
     def nan_policy(self) -> str:
         return self._nan_policy
 
+    @cached_property
+    def class_counts(self) -> tuple[np.ndarray, np.ndarray] | None:
+        r"""The number of samples and correct predictions of each class
+        in ``y_true``.
+
+        The counts are computed once (see ``per_class_counts``), so the
+        evaluators that use the same state share them. The NaN values
+        are removed if ``nan_policy='omit'``. The counts are ``None``
+        if the labels contain NaN values and ``nan_policy`` is not
+        ``'omit'``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from analora.state import AccuracyState
+        >>> state = AccuracyState(
+        ...     y_true=np.array([1, 0, 0, 1, 1]),
+        ...     y_pred=np.array([1, 0, 1, 1, 0]),
+        ...     y_true_name="target",
+        ...     y_pred_name="pred",
+        ... )
+        >>> state.class_counts
+        (array([2, 3]), array([1, 2]))
+
+        ```
+        """
+        y_true, y_pred = preprocess_pred(
+            y_true=self._y_true, y_pred=self._y_pred, drop_nan=self._nan_policy == "omit"
+        )
+        if has_nan(y_true) or has_nan(y_pred):
+            return None
+        return per_class_counts(y_true=y_true, y_pred=y_pred)
+
     def get_args(self) -> dict:
         return {
             "y_true": self._y_true,
@@ -0,0 +1,335 @@
+r"""Contain the configuration to encode matplotlib figures."""
+
+from __future__ import annotations
+
+__all__ = ["FigureConfig"]
+
+import hashlib
+import io
+import os
+import tempfile
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from matplotlib import pyplot as plt
+from PIL import features
+
+from analora.utils.path import sanitize_path
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_EXTENSIONS = {"jpeg": "jpg", "png": "png", "svg": "svg", "webp": "webp"}
+_MIME_TYPES = {
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "webp": "image/webp",
+}
+_PRESETS: dict[str, dict[str, Any]] = {
+    "default": {},
+    "compact": {"format": "png", "dpi": 72, "optimize": True},
+    "high": {"format": "png", "dpi": 200},
+    "lossy": {"format": "webp", "dpi": 100, "quality": 75},
+    "vector": {"format": "svg", "simplify_threshold": 0.5},
+}
+
+
+class FigureConfig:
+    r"""Define how the matplotlib figures are encoded in a report.
+
+    The configuration trades the size of the report and the render
+    time against the quality of the figures. The raster images are
+    encoded by matplotlib, and Pillow (a matplotlib dependency) is used
+    for the PNG compression options and the lossy formats. If the
+    installed Pillow does not support a lossy format, the figures are
+    encoded in PNG and a warning is raised.
+
+    By default, the images are inlined in the HTML as base64 data URIs.
+    If ``asset_dir`` is set, each image is written once in this
+    directory, in a file named by the SHA-256 hash of its content, and
+    the HTML references it by URL. The identical figures are written
+    once, and the HTML stays small. The figures are encoded
+    deterministically, so the file names are stable across runs.
+
+    Args:
+        format: The image format. The valid values are ``'jpeg'``,
+            ``'png'``, ``'svg'``, and ``'webp'``.
+        dpi: The resolution in dots per inch of the raster images.
+            If ``None``, the figure resolution is used.
+        figsize: The size in inches of the figures created for the
+            report. If ``None``, the matplotlib default size is used.
+        quality: The quality of the lossy formats, between ``1`` and
+            ``100``. If ``None``, the Pillow default is used.
+        optimize: If ``True``, the PNG images are compressed with the
+            optimized (but slower) Pillow encoder.
+        simplify_threshold: The threshold used to simplify the paths
+            of the SVG images, between ``0`` and ``1`` pixel. Larger
+            values give smaller files. If ``None``, the matplotlib
+            default is used.
+        tight: If ``True``, the layout is tightened and the white
+            space around the figure is removed.
+        asset_dir: The optional directory where the images are
+            written. If ``None``, the images are inlined in the HTML.
+        asset_url: The URL of the asset directory used in the HTML,
+            usually relative to the HTML file. If ``None``, the name
+            of the asset directory is used, i.e. the HTML file is
+            expected to be in the parent directory of ``asset_dir``.
+            If ``''``, the HTML file is expected to be in the asset
+            directory, and the images are referenced by file name.
+
+    Raises:
+        ValueError: if ``format``, ``quality`` or
+            ``simplify_threshold`` is invalid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from analora.utils.figure import FigureConfig
+    >>> config = FigureConfig(format="svg", simplify_threshold=0.5)
+    >>> config
+    FigureConfig(format='svg', dpi=None, figsize=None, quality=None, optimize=False, simplify_threshold=0.5, tight=True, asset_dir=None, asset_url=None)
+    >>> config.mime_type
+    'image/svg+xml'
+
+    ```
+    """
+
+    def __init__(
+        self,
+        format: str = "png",  # noqa: A002
+        *,
+        dpi: float | None = None,
+        figsize: tuple[float, float] | None = None,
+        quality: int | None = None,
+        optimize: bool = False,
+        simplify_threshold: float | None = None,
+        tight: bool = True,
+        asset_dir: Path | str | None = None,
+        asset_url: str | None = None,
+    ) -> None:
+        format = format.lower()  # noqa: A001
+        if format == "jpg":
+            format = "jpeg"  # noqa: A001
+        if format not in _MIME_TYPES:
+            msg = f"Incorrect format: {format}. The valid values are {sorted(_MIME_TYPES)}"
+            raise ValueError(msg)
+        if quality is not None and not 1 <= quality <= 100:
+            msg = f"Incorrect quality: {quality}. quality must be between 1 and 100"
+            raise ValueError(msg)
+        if simplify_threshold is not None and not 0 <= simplify_threshold <= 1:
+            msg = (
+                f"Incorrect simplify_threshold: {simplify_threshold}. "
+                "simplify_threshold must be between 0 and 1"
+            )
+            raise ValueError(msg)
+        if format in {"jpeg", "webp"} and not _is_pil_format_available(format):
+            msg = f"Pillow does not support the {format} format, so PNG is used instead"
+            warnings.warn(msg, RuntimeWarning, stacklevel=2)
+            format = "png"  # noqa: A001
+        self._format = format
+        self._dpi = dpi
+        self._figsize = None if figsize is None else tuple(figsize)
+        self._quality = quality
+        self._optimize = optimize
+        self._simplify_threshold = simplify_threshold
+        self._tight = tight
+        self._asset_dir = None if asset_dir is None else sanitize_path(asset_dir)
+        if asset_url is None and self._asset_dir is not None:
+            asset_url = self._asset_dir.name
+        if asset_url is not None:
+            # The root URL "/" is kept, but "" means the same directory.
+            asset_url = asset_url.rstrip("/") or asset_url[:1]
+        self._asset_url = asset_url
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(format={self._format!r}, dpi={self._dpi}, "
+            f"figsize={self._figsize}, quality={self._quality}, optimize={self._optimize}, "
+            f"simplify_threshold={self._simplify_threshold}, tight={self._tight}, "
+            f"asset_dir={self._asset_dir}, asset_url={self._asset_url})"
+        )
+
+    @property
+    def asset_dir(self) -> Path | None:
+        r"""The directory where the images are written, or ``None``
+        if the images are inlined."""
+        return self._asset_dir
+
+    @property
+    def asset_url(self) -> str | None:
+        r"""The URL of the asset directory used in the HTML."""
+        return self._asset_url
+
+    @property
+    def dpi(self) -> float | None:
+        r"""The resolution of the raster images."""
+        return self._dpi
+
+    @property
+    def figsize(self) -> tuple[float, float] | None:
+        r"""The size in inches of the figures created for the report."""
+        return self._figsize
+
+    @property
+    def format(self) -> str:
+        r"""The image format."""
+        return self._format
+
+    @property
+    def mime_type(self) -> str:
+        r"""The MIME type of the encoded images."""
+        return _MIME_TYPES[self._format]
+
+    @classmethod
+    def from_preset(cls, name: str) -> Self:
+        r"""Instantiate a configuration from a preset.
+
+        The available presets are:
+
+        - ``'default'``: PNG at the figure resolution.
+        - ``'compact'``: optimized PNG at 72 DPI.
+        - ``'high'``: PNG at 200 DPI.
+        - ``'lossy'``: WebP with quality 75 at 100 DPI.
+        - ``'vector'``: SVG with simplified paths.
+
+        Args:
+            name: The name of the preset.
+
+        Returns:
+            The instantiated configuration.
+
+        Raises:
+            ValueError: if the preset does not exist.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from analora.utils.figure import FigureConfig
+        >>> FigureConfig.from_preset("compact")
+        FigureConfig(format='png', dpi=72, figsize=None, quality=None, optimize=True, simplify_threshold=None, tight=True, asset_dir=None, asset_url=None)
+
+        ```
+        """
+        if name not in _PRESETS:
+            msg = f"Incorrect preset: {name}. The valid values are {sorted(_PRESETS)}"
+            raise ValueError(msg)
+        return cls(**_PRESETS[name])
+
+    def encode(self, fig: plt.Figure) -> bytes:
+        r"""Encode a figure to an image.
+
+        Args:
+            fig: The figure to encode.
+
+        Returns:
+            The encoded image.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from matplotlib import pyplot as plt
+        >>> from analora.utils.figure import FigureConfig
+        >>> fig, ax = plt.subplots()
+        >>> FigureConfig().encode(fig)[:8]
+        b'\x89PNG\r\n\x1a\n'
+
+        ```
+        """
+        kwargs: dict[str, Any] = {"format": self._format}
+        if self._tight:
+            fig.tight_layout()
+            kwargs["bbox_inches"] = "tight"
+        if self._dpi is not None:
+            kwargs["dpi"] = self._dpi
+        pil_kwargs = {}
+        if self._format == "png" and self._optimize:
+            pil_kwargs["optimize"] = True
+        if self._format in {"jpeg", "webp"} and self._quality is not None:
+            pil_kwargs["quality"] = self._quality
+        if pil_kwargs:
+            kwargs["pil_kwargs"] = pil_kwargs
+        rc: dict[str, Any] = {}
+        if self._format == "svg":
+            # The SVG ids and date are fixed, so the same figure gives
+            # the same file.
+            rc["svg.hashsalt"] = "analora"
+            kwargs["metadata"] = {"Date": None}
+            if self._simplify_threshold is not None:
+                rc.update(
+                    {"path.simplify": True, "path.simplify_threshold": self._simplify_threshold}
+                )
+        img = io.BytesIO()
+        with plt.rc_context(rc):
+            fig.savefig(img, **kwargs)
+        return img.getvalue()
+
+    def write_asset(self, data: bytes) -> str:
+        r"""Write an encoded image in the asset directory.
+
+        The file is named by the SHA-256 hash of the image, so it is
+        not written again if it already exists. The file is written
+        in a temporary file that is then renamed, so the figures can
+        be written by several processes at the same time.
+
+        Args:
+            data: The encoded image, e.g. computed by ``encode``.
+
+        Returns:
+            The URL of the image, to use in the HTML.
+
+        Raises:
+            RuntimeError: if the asset directory is not set.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from matplotlib import pyplot as plt
+        >>> from analora.utils.figure import FigureConfig
+        >>> fig, ax = plt.subplots()
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     config = FigureConfig(asset_dir=Path(tmpdir).joinpath("assets"))
+        ...     config.write_asset(config.encode(fig))
+        ...
+        'assets/....png'
+
+        ```
+        """
+        if self._asset_dir is None:
+            msg = "Cannot write the image because the asset directory is not set"
+            raise RuntimeError(msg)
+        name = f"{hashlib.sha256(data).hexdigest()}.{_EXTENSIONS[self._format]}"
+        path = self._asset_dir.joinpath(name)
+        if not path.is_file():
+            self._asset_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self._asset_dir, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            try:
+                with os.fdopen(fd, mode="wb") as file:
+                    file.write(data)
+                tmp_path.replace(path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+        if not self._asset_url:
+            return name
+        return f"{self._asset_url.rstrip('/')}/{name}"
+
+
+def _is_pil_format_available(format: str) -> bool:  # noqa: A002
+    r"""Indicate if the installed Pillow can encode an image format.
+
+    Args:
+        format: The image format.
+
+    Returns:
+        ``True`` if the format is supported, otherwise ``False``.
+    """
+    return bool(features.check({"jpeg": "jpg", "webp": "webp"}[format]))
@@ -13,11 +13,12 @@ __all__ = [
 ]
 
 import base64
-import io
 from typing import TYPE_CHECKING
 
 from matplotlib import pyplot as plt
 
+from analora.utils.figure import FigureConfig
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
@@ -128,7 +129,12 @@ def render_toc(
     return f'<li><a href="#{tags2id(tags)}">{number} {tag}</a></li>'
 
 
-def figure2html(fig: plt.Figure | None, reactive: bool = True, close_fig: bool = False) -> str:
+def figure2html(
+    fig: plt.Figure | None,
+    reactive: bool = True,
+    close_fig: bool = False,
+    config: FigureConfig | None = None,
+) -> str:
     r"""Convert a matplotlib figure to a string that can be used in a
     HTML file.
 
@@ -138,6 +144,12 @@ def figure2html(fig: plt.Figure | None, reactive: bool = True, close_fig: bool =
             reactive to the screen size.
         close_fig: If ``True``, the figure is closed after it is
             converted to HTML format.
+        config: The configuration used to encode the figure, e.g. the
+            image format and resolution. If ``None``, the figure is
+            encoded in PNG with the default configuration. If the
+            configuration has an asset directory, the image is
+            written in this directory and referenced by URL instead
+            of being inlined.
 
     Returns:
         The converted figure to a string.
@@ -147,20 +159,26 @@ def figure2html(fig: plt.Figure | None, reactive: bool = True, close_fig: bool =
     ```pycon
 
     >>> from matplotlib import pyplot as plt
+    >>> from analora.utils.figure import FigureConfig
     >>> from analora.utils.html import figure2html
     >>> fig, ax = plt.subplots()
     >>> string = figure2html(fig)
+    >>> string = figure2html(fig, config=FigureConfig(format="svg"))
+    >>> string[:42]
+    '<img style="width:100%; height:auto;" src='
 
     ```
     """
     if fig is None:
         return MISSING_FIGURE_MESSAGE
-    fig.tight_layout()
-    img = io.BytesIO()
-    fig.savefig(img, format="png", bbox_inches="tight")
-    img.seek(0)
-    data = base64.b64encode(img.getvalue()).decode("utf-8")
+    if config is None:
+        config = FigureConfig()
+    data = config.encode(fig)
     if close_fig:
         plt.close(fig)
+    if config.asset_dir is None:
+        src = f"data:{config.mime_type};charset=utf-8;base64, {base64.b64encode(data).decode()}"
+    else:
+        src = config.write_asset(data)
     style = 'style="width:100%; height:auto;" ' if reactive else ""
-    return f'<img {style}src="data:image/png;charset=utf-8;base64, {data}">'
+    return f'<img {style}src="{src}">'
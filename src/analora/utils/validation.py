@@ -2,7 +2,34 @@ r"""Contain some functions to validate variables."""
 
 from __future__ import annotations
 
-__all__ = ["check_positive"]
+__all__ = ["check_num_workers", "check_positive"]
+
+
+def check_num_workers(num_workers: int) -> None:
+    r"""Check the number of worker processes is valid (>=0).
+
+    ``0`` means that the work is done in the current process.
+
+    Args:
+        num_workers: The number of worker processes.
+
+    Raises:
+        ValueError: if ``num_workers`` is lower than 0.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from analora.utils.validation import check_num_workers
+    >>> check_num_workers(2)
+
+    ```
+    """
+    if num_workers < 0:
+        msg = (
+            f"Incorrect num_workers: {num_workers}. num_workers must be greater than or equal to 0"
+        )
+        raise ValueError(msg)
 
 
 def check_positive(name: str, value: float) -> None:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
+from coola import objects_are_equal
 
-from analora.array import check_square_matrix
+from analora.array import check_square_matrix, has_nan, isnan, multi_isnan
 
 #########################################
 #     Tests for check_square_matrix     #
@@ -27,3 +28,232 @@ def test_check_square_matrix_3d() -> None:
 def test_check_square_matrix_not_square() -> None:
     with pytest.raises(ValueError, match="Incorrect 'my_var'"):
         check_square_matrix("my_var", np.ones((3, 4)))
+
+
+#############################
+#     Tests for has_nan     #
+#############################
+
+
+def test_has_nan_float_true() -> None:
+    assert has_nan(np.array([1.0, 2.0, float("nan")]))
+
+
+def test_has_nan_float_false() -> None:
+    assert not has_nan(np.array([1.0, 2.0, 3.0]))
+
+
+def test_has_nan_float_2d() -> None:
+    assert has_nan(np.array([[1.0, 2.0], [float("nan"), 3.0]]))
+
+
+def test_has_nan_float32() -> None:
+    assert has_nan(np.array([1.0, float("nan")], dtype=np.float32))
+
+
+def test_has_nan_float_inf() -> None:
+    assert not has_nan(np.array([float("inf"), 1.0]))
+
+
+def test_has_nan_float_opposite_inf() -> None:
+    assert not has_nan(np.array([float("inf"), float("-inf"), 1.0]))
+
+
+def test_has_nan_float_opposite_inf_and_nan() -> None:
+    assert has_nan(np.array([float("inf"), float("-inf"), float("nan")]))
+
+
+def test_has_nan_complex() -> None:
+    assert has_nan(np.array([1.0 + 1.0j, complex(float("nan"), 0.0)]))
+
+
+@pytest.mark.parametrize("dtype", [bool, np.int8, np.int64, np.uint8])
+def test_has_nan_integer(dtype: np.dtype) -> None:
+    assert not has_nan(np.array([1, 0, 1], dtype=dtype))
+
+
+def test_has_nan_string() -> None:
+    assert not has_nan(np.array(["a", "b", "nan"]))
+
+
+def test_has_nan_object_true() -> None:
+    assert has_nan(np.array(["a", float("nan"), 1], dtype=object))
+
+
+def test_has_nan_object_false() -> None:
+    assert not has_nan(np.array(["a", None, 1], dtype=object))
+
+
+def test_has_nan_empty() -> None:
+    assert not has_nan(np.array([]))
+
+
+###########################
+#     Tests for isnan     #
+###########################
+
+
+def test_isnan_float() -> None:
+    assert objects_are_equal(
+        isnan(np.array([1.0, float("nan"), float("inf")])), np.array([False, True, False])
+    )
+
+
+def test_isnan_float_2d() -> None:
+    assert objects_are_equal(
+        isnan(np.array([[1.0, float("nan")], [2.0, 3.0]])),
+        np.array([[False, True], [False, False]]),
+    )
+
+
+@pytest.mark.parametrize("dtype", [bool, np.int8, np.int64, np.uint8])
+def test_isnan_integer(dtype: np.dtype) -> None:
+    assert objects_are_equal(
+        isnan(np.array([[1, 0], [0, 1]], dtype=dtype)), np.zeros((2, 2), dtype=bool)
+    )
+
+
+def test_isnan_string() -> None:
+    assert objects_are_equal(isnan(np.array(["a", "nan"])), np.array([False, False]))
+
+
+def test_isnan_object() -> None:
+    assert objects_are_equal(
+        isnan(np.array(["a", float("nan"), None, 1], dtype=object)),
+        np.array([False, True, False, False]),
+    )
+
+
+def test_isnan_empty() -> None:
+    assert objects_are_equal(isnan(np.array([])), np.array([], dtype=bool))
+
+
+#################################
+#     Tests for multi_isnan     #
+#################################
+
+
+def test_multi_isnan_out() -> None:
+    out = np.ones(4, dtype=bool)
+    mask = multi_isnan(
+        [np.array([1.0, float("nan"), 0.0, 1.0]), np.array([1.0, 2.0, 0.0, float("nan")])],
+        out=out,
+    )
+    assert mask is out
+    assert objects_are_equal(out, np.array([False, True, False, True]))
+
+
+def test_multi_isnan_out_no_nan() -> None:
+    out = np.ones(3, dtype=bool)
+    multi_isnan([np.array([1.0, 2.0, 3.0])], out=out)
+    assert objects_are_equal(out, np.array([False, False, False]))
+
+
+def test_multi_isnan_out_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'out' has an incorrect shape"):
+        multi_isnan([np.array([1.0, float("nan"), 3.0])], out=np.zeros(4, dtype=bool))
+
+
+def test_multi_isnan_2d() -> None:
+    assert objects_are_equal(
+        multi_isnan(
+            [
+                np.array([[1.0, float("nan")], [2.0, 3.0]]),
+                np.array([[1.0, 2.0], [float("nan"), 3.0]]),
+            ]
+        ),
+        np.array([[False, True], [True, False]]),
+    )
+
+
+def test_multi_isnan_object() -> None:
+    assert objects_are_equal(
+        multi_isnan(
+            [
+                np.array([1.0, 2.0, float("nan")]),
+                np.array(["a", float("nan"), "c"], dtype=object),
+            ]
+        ),
+        np.array([False, True, True]),
+    )
+
+
+def test_multi_isnan_scalar() -> None:
+    assert objects_are_equal(multi_isnan([np.array(float("nan"))]), np.array(True))
+
+
+def test_multi_isnan_rowwise() -> None:
+    assert objects_are_equal(
+        multi_isnan(
+            [
+                np.array([[1.0, 2.0], [float("nan"), 3.0], [4.0, 5.0]]),
+                np.array([[1.0, 2.0], [2.0, 3.0], [4.0, float("nan")]]),
+            ],
+            rowwise=True,
+        ),
+        np.array([False, True, True]),
+    )
+
+
+def test_multi_isnan_rowwise_1d_and_2d() -> None:
+    assert objects_are_equal(
+        multi_isnan(
+            [np.array([1, 0, float("nan")]), np.array([[1, 2], [float("nan"), 3], [4, 5]])],
+            rowwise=True,
+        ),
+        np.array([False, True, True]),
+    )
+
+
+def test_multi_isnan_rowwise_opposite_inf() -> None:
+    assert objects_are_equal(
+        multi_isnan(
+            [np.array([[float("inf"), float("-inf")], [float("nan"), 1.0], [1.0, 2.0]])],
+            rowwise=True,
+        ),
+        np.array([False, True, False]),
+    )
+
+
+def test_multi_isnan_rowwise_3d() -> None:
+    arr = np.zeros((3, 2, 2))
+    arr[1, 1, 0] = float("nan")
+    assert objects_are_equal(multi_isnan([arr], rowwise=True), np.array([False, True, False]))
+
+
+def test_multi_isnan_rowwise_object() -> None:
+    assert objects_are_equal(
+        multi_isnan(
+            [np.array([["a", "b"], ["c", float("nan")]], dtype=object)],
+            rowwise=True,
+        ),
+        np.array([False, True]),
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_multi_isnan_chunk_size(chunk_size: int) -> None:
+    rng = np.random.default_rng(42)
+    arrays = [rng.normal(size=(10, 3)) for _ in range(3)]
+    for arr in arrays:
+        arr[rng.random(arr.shape) < 0.1] = float("nan")
+    assert objects_are_equal(
+        multi_isnan(arrays, chunk_size=chunk_size),
+        np.isnan(arrays[0]) | np.isnan(arrays[1]) | np.isnan(arrays[2]),
+    )
+    assert objects_are_equal(
+        multi_isnan(arrays, rowwise=True, chunk_size=chunk_size),
+        np.isnan(np.concatenate(arrays, axis=1)).any(axis=1),
+    )
+
+
+def test_multi_isnan_empty_rows() -> None:
+    assert objects_are_equal(
+        multi_isnan([np.zeros((0, 3)), np.full((0, 3), float("nan"))], rowwise=True),
+        np.zeros(0, dtype=bool),
+    )
+
+
+def test_multi_isnan_incorrect_chunk_size() -> None:
+    with pytest.raises(ValueError, match="Incorrect chunk_size: 0"):
+        multi_isnan([np.array([1.0, 2.0])], chunk_size=0)
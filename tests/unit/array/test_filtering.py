@@ -29,6 +29,100 @@ def test_filter_range_empty() -> None:
     assert np.array_equal(filter_range(np.array([]), xmin=1, xmax=5), np.array([]))
 
 
+def test_filter_range_default_range() -> None:
+    array = np.arange(10)
+    out = filter_range(array)
+    assert np.array_equal(out, np.arange(10))
+    assert not np.shares_memory(out, array)
+
+
+def test_filter_range_2d() -> None:
+    assert np.array_equal(
+        filter_range(np.arange(10).reshape(2, 5), xmin=3, xmax=6), np.array([3, 4, 5, 6])
+    )
+
+
+def test_filter_range_mask() -> None:
+    assert np.array_equal(
+        filter_range(np.arange(10), xmin=2, xmax=7, mask=np.arange(10) % 2 == 0),
+        np.array([2, 4, 6]),
+    )
+
+
+def test_filter_range_mask_without_range() -> None:
+    assert np.array_equal(
+        filter_range(np.arange(10), mask=np.arange(10) % 2 == 0), np.array([0, 2, 4, 6, 8])
+    )
+
+
+def test_filter_range_mask_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'mask' has an incorrect shape"):
+        filter_range(np.arange(10), xmin=2, mask=np.ones(5, dtype=bool))
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 3, 10, 100])
+def test_filter_range_out(chunk_size: int | None) -> None:
+    out = np.zeros(12, dtype=int)
+    values = filter_range(np.arange(10), xmin=2, xmax=7, out=out, chunk_size=chunk_size)
+    assert np.array_equal(values, np.array([2, 3, 4, 5, 6, 7]))
+    assert np.shares_memory(values, out)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 3, 10, 100])
+def test_filter_range_out_in_place(chunk_size: int | None) -> None:
+    array = np.arange(10)
+    values = filter_range(array, xmin=2, xmax=7, out=array, chunk_size=chunk_size)
+    assert np.array_equal(values, np.array([2, 3, 4, 5, 6, 7]))
+    assert np.shares_memory(values, array)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 100])
+def test_filter_range_chunk_size(chunk_size: int) -> None:
+    assert np.array_equal(
+        filter_range(np.arange(10), xmin=2, xmax=7, chunk_size=chunk_size),
+        np.array([2, 3, 4, 5, 6, 7]),
+    )
+
+
+def test_filter_range_chunk_size_mask() -> None:
+    assert np.array_equal(
+        filter_range(np.arange(10), xmin=2, mask=np.arange(10) % 2 == 0, chunk_size=3),
+        np.array([2, 4, 6, 8]),
+    )
+
+
+def test_filter_range_out_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'out' has an incorrect shape"):
+        filter_range(np.arange(10), xmin=2, out=np.zeros(5))
+
+
+def test_filter_range_incorrect_chunk_size() -> None:
+    with pytest.raises(ValueError, match="Incorrect chunk_size: 0"):
+        filter_range(np.arange(10), xmin=2, chunk_size=0)
+
+
+def test_filter_range_nan() -> None:
+    assert np.array_equal(
+        filter_range(np.array([1.0, float("nan"), 3.0]), xmin=float("-inf"), xmax=float("inf")),
+        np.array([1.0, 3.0]),
+    )
+
+
+def test_filter_range_nan_default_range() -> None:
+    assert np.array_equal(
+        filter_range(np.array([[1.0, float("nan")], [float("nan"), 4.0]])), np.array([1.0, 4.0])
+    )
+
+
+def test_filter_range_nan_mask() -> None:
+    assert np.array_equal(
+        filter_range(
+            np.array([1.0, float("nan"), 3.0, 4.0]), mask=np.array([True, True, False, True])
+        ),
+        np.array([1.0, 4.0]),
+    )
+
+
 ############################
 #     Tests for nonnan     #
 ############################
@@ -48,3 +142,69 @@ def test_nonnan_2d() -> None:
     assert np.array_equal(
         nonnan(np.array([[1, 2, float("nan")], [4, 5, 6]])), np.array([1.0, 2.0, 4.0, 5.0, 6.0])
     )
+
+
+def test_nonnan_without_nan_copy() -> None:
+    array = np.array([[1.0, 2.0], [3.0, 4.0]])
+    out = nonnan(array)
+    assert np.array_equal(out, np.array([1.0, 2.0, 3.0, 4.0]))
+    assert not np.shares_memory(out, array)
+
+
+def test_nonnan_without_nan_copy_false() -> None:
+    array = np.array([[1.0, 2.0], [3.0, 4.0]])
+    out = nonnan(array, copy=False)
+    assert np.array_equal(out, np.array([1.0, 2.0, 3.0, 4.0]))
+    assert np.shares_memory(out, array)
+
+
+def test_nonnan_with_nan_copy_false() -> None:
+    array = np.array([1.0, float("nan"), 3.0])
+    out = nonnan(array, copy=False)
+    assert np.array_equal(out, np.array([1.0, 3.0]))
+    assert not np.shares_memory(out, array)
+
+
+def test_nonnan_int() -> None:
+    assert np.array_equal(nonnan(np.array([1, 2, 3])), np.array([1, 2, 3]))
+
+
+def test_nonnan_nan_mask() -> None:
+    assert np.array_equal(
+        nonnan(np.array([1.0, 2.0, 3.0, 4.0]), nan_mask=np.array([False, True, False, True])),
+        np.array([1.0, 3.0]),
+    )
+
+
+def test_nonnan_nan_mask_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'nan_mask' has an incorrect shape"):
+        nonnan(np.array([1.0, 2.0, 3.0]), nan_mask=np.array([False, True]))
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 2, 10])
+def test_nonnan_out(chunk_size: int | None) -> None:
+    out = np.zeros(5)
+    values = nonnan(np.array([1, 2, float("nan"), 5, 6]), out=out, chunk_size=chunk_size)
+    assert np.array_equal(values, np.array([1.0, 2.0, 5.0, 6.0]))
+    assert np.shares_memory(values, out)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 2, 10])
+def test_nonnan_out_in_place(chunk_size: int | None) -> None:
+    array = np.array([[float("nan"), 2, 3], [float("nan"), 5, float("nan")]])
+    values = nonnan(array, out=array.reshape(-1), chunk_size=chunk_size)
+    assert np.array_equal(values, np.array([2.0, 3.0, 5.0]))
+    assert np.shares_memory(values, array)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 10])
+def test_nonnan_chunk_size(chunk_size: int) -> None:
+    assert np.array_equal(
+        nonnan(np.array([1, 2, float("nan"), 5, 6]), chunk_size=chunk_size),
+        np.array([1.0, 2.0, 5.0, 6.0]),
+    )
+
+
+def test_nonnan_out_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'out' has an incorrect shape"):
+        nonnan(np.array([1, 2, float("nan"), 5, 6]), out=np.zeros((5, 1)))
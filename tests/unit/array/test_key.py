@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import numpy as np
+
+from analora.array import array_key
+
+###############################
+#     Tests for array_key     #
+###############################
+
+
+def test_array_key_same_array() -> None:
+    x = np.arange(6)
+    assert array_key(x) == array_key(x)
+
+
+def test_array_key_view() -> None:
+    x = np.arange(6)
+    assert array_key(x) == array_key(x.ravel())
+    assert array_key(x) == array_key(x[:])
+
+
+def test_array_key_different_views() -> None:
+    x = np.arange(6)
+    assert array_key(x) != array_key(x[1:])
+    assert array_key(x) != array_key(x.reshape(2, 3))
+    assert array_key(x) != array_key(x[::2])
+    assert array_key(x) != array_key(x.view(np.uint8))
+
+
+def test_array_key_different_arrays() -> None:
+    x, y = np.arange(6), np.arange(6)
+    assert array_key(x) != array_key(y)
+
+
+def test_array_key_hashable() -> None:
+    assert len({array_key(np.arange(6))}) == 1
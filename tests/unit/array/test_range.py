@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy as np
 from coola import objects_are_equal
 
-from analora.array import find_range
+from analora.array import SketchCache, find_range
 
 ################################
 #     Tests for find_range     #
@@ -99,3 +99,62 @@ def test_find_range_nan_str() -> None:
         ),
         (1.0, 9.0),
     )
+
+
+def test_find_range_approximate_xmin_none_xmax_none() -> None:
+    assert objects_are_equal(find_range(np.arange(101), approximate=True), (0, 100))
+
+
+def test_find_range_approximate_xmin_str_xmax_str() -> None:
+    assert objects_are_equal(
+        find_range(np.arange(101), xmin="q0.1", xmax="q0.9", approximate=True), (10.0, 90.0)
+    )
+
+
+def test_find_range_approximate_xmin_float_xmax_float() -> None:
+    assert objects_are_equal(
+        find_range(np.arange(101), xmin=0.25, xmax=0.75, approximate=True), (0.25, 0.75)
+    )
+
+
+def test_find_range_approximate_nan() -> None:
+    assert objects_are_equal(
+        find_range(np.array([float("nan"), 0.0, 1.0, 2.0, float("nan")]), approximate=True),
+        (0.0, 2.0),
+    )
+
+
+def test_find_range_approximate_empty() -> None:
+    assert objects_are_equal(
+        find_range(np.array([]), approximate=True), (float("nan"), float("nan")), equal_nan=True
+    )
+
+
+def test_find_range_approximate_modified_in_place() -> None:
+    values = np.arange(1000.0)
+    assert objects_are_equal(
+        find_range(values, xmin="q0.1", xmax="q0.9", approximate=True), (99.9, 899.1)
+    )
+    values *= 10
+    assert objects_are_equal(
+        find_range(values, xmin="q0.1", xmax="q0.9", approximate=True), (999.0, 8991.0)
+    )
+
+
+def test_find_range_approximate_sketch_cache() -> None:
+    values = np.arange(1001)
+    with SketchCache() as cache:
+        assert objects_are_equal(
+            find_range(values, xmin="q0.1", xmax="q0.9", approximate=True), (100.0, 900.0)
+        )
+        assert objects_are_equal(
+            find_range(values, xmin="q0.2", xmax="q0.8", approximate=True), (200.0, 800.0)
+        )
+        assert repr(cache) == "SketchCache(num_sketches=1)"
+
+
+def test_find_range_approximate_large() -> None:
+    values = np.random.default_rng(42).normal(size=1_000_000)
+    xmin, xmax = find_range(values, xmin="q0.05", xmax="q0.95", approximate=True)
+    assert abs(np.mean(values < xmin) - 0.05) < 0.002
+    assert abs(np.mean(values < xmax) - 0.95) < 0.002
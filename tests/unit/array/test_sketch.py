@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.array import QuantileSketch, SketchCache, get_quantile_sketch
+
+####################################
+#     Tests for QuantileSketch     #
+####################################
+
+
+def test_quantile_sketch_repr() -> None:
+    sketch = QuantileSketch(size=100)
+    sketch.update(np.arange(1001))
+    assert repr(sketch) == "QuantileSketch(count=1,001, size=100, num_centroids=100)"
+
+
+def test_quantile_sketch_size() -> None:
+    assert QuantileSketch(size=100).size == 100
+
+
+def test_quantile_sketch_size_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect size: 1"):
+        QuantileSketch(size=1)
+
+
+def test_quantile_sketch_empty() -> None:
+    sketch = QuantileSketch()
+    assert sketch.count == 0
+    assert objects_are_equal(sketch.min, float("nan"), equal_nan=True)
+    assert objects_are_equal(sketch.max, float("nan"), equal_nan=True)
+    assert objects_are_equal(sketch.quantile(0.5), float("nan"), equal_nan=True)
+    assert objects_are_equal(
+        sketch.quantile([0.1, 0.9]), np.array([float("nan"), float("nan")]), equal_nan=True
+    )
+
+
+def test_quantile_sketch_update() -> None:
+    sketch = QuantileSketch()
+    sketch.update(np.array([3.0, 1.0, 2.0]))
+    assert sketch.count == 3
+    assert sketch.min == 1.0
+    assert sketch.max == 3.0
+
+
+def test_quantile_sketch_update_nan() -> None:
+    sketch = QuantileSketch()
+    sketch.update(np.array([1.0, float("nan"), 3.0]))
+    assert sketch.count == 2
+    assert sketch.quantile(0.5) == 2.0
+
+
+def test_quantile_sketch_update_only_nan() -> None:
+    sketch = QuantileSketch()
+    sketch.update(np.array([float("nan"), float("nan")]))
+    assert sketch.count == 0
+
+
+def test_quantile_sketch_update_2d() -> None:
+    sketch = QuantileSketch()
+    sketch.update(np.arange(10).reshape(2, 5))
+    assert sketch.count == 10
+    assert sketch.quantile(0.5) == 4.5
+
+
+def test_quantile_sketch_update_multiple() -> None:
+    sketch = QuantileSketch()
+    sketch.update(np.arange(50))
+    sketch.update(np.arange(50, 101))
+    assert sketch.count == 101
+    assert objects_are_equal(sketch.quantile([0.1, 0.5, 0.9]), np.array([10.0, 50.0, 90.0]))
+
+
+def test_quantile_sketch_quantile_exact() -> None:
+    sketch = QuantileSketch()
+    sketch.update(np.arange(101))
+    assert objects_are_equal(sketch.quantile([0.0, 0.25, 1.0]), np.array([0.0, 25.0, 100.0]))
+
+
+def test_quantile_sketch_quantile_float() -> None:
+    sketch = QuantileSketch()
+    sketch.update(np.arange(101))
+    assert objects_are_equal(sketch.quantile(0.1), 10.0)
+
+
+@pytest.mark.parametrize("chunk_size", [1_000, 1_048_576])
+def test_quantile_sketch_quantile_approximate(chunk_size: int) -> None:
+    values = np.random.default_rng(42).normal(size=100_000)
+    sketch = QuantileSketch(size=200)
+    sketch.update(values, chunk_size=chunk_size)
+    q = np.array([0.01, 0.1, 0.5, 0.9, 0.99])
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(q)) / values.size
+    assert np.all(np.abs(ranks - q) <= 2 / sketch.size)
+
+
+def test_quantile_sketch_quantile_min_max() -> None:
+    values = np.random.default_rng(42).normal(size=10_000)
+    sketch = QuantileSketch(size=10)
+    sketch.update(values)
+    assert objects_are_allclose(sketch.quantile([0.0, 1.0]), np.array([values.min(), values.max()]))
+
+
+def test_quantile_sketch_merge() -> None:
+    sketch1, sketch2 = QuantileSketch(), QuantileSketch()
+    sketch1.update(np.array([1, 2, 3]))
+    sketch2.update(np.array([4, 5]))
+    assert sketch1.merge(sketch2) is sketch1
+    assert sketch1.count == 5
+    assert sketch1.min == 1
+    assert sketch1.max == 5
+    assert sketch1.quantile(0.5) == 3.0
+
+
+def test_quantile_sketch_merge_empty() -> None:
+    sketch = QuantileSketch()
+    sketch.update(np.array([1, 2, 3]))
+    sketch.merge(QuantileSketch())
+    assert sketch.count == 3
+    assert sketch.quantile(0.5) == 2.0
+
+
+def test_quantile_sketch_merge_into_empty() -> None:
+    sketch = QuantileSketch()
+    other = QuantileSketch()
+    other.update(np.array([1, 2, 3]))
+    sketch.merge(other)
+    assert sketch.count == 3
+    assert sketch.min == 1
+    assert sketch.max == 3
+
+
+def test_quantile_sketch_merge_approximate() -> None:
+    values = np.random.default_rng(42).normal(size=100_000)
+    sketches = [QuantileSketch(size=200) for _ in range(4)]
+    for sketch, chunk in zip(sketches, np.array_split(values, 4)):
+        sketch.update(chunk)
+    sketch = sketches[0]
+    for other in sketches[1:]:
+        sketch.merge(other)
+    assert sketch.count == values.size
+    q = np.array([0.01, 0.1, 0.5, 0.9, 0.99])
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(q)) / values.size
+    assert np.all(np.abs(ranks - q) <= 5 / sketch.size)
+
+
+#################################
+#     Tests for SketchCache     #
+#################################
+
+
+def test_sketch_cache_repr() -> None:
+    assert repr(SketchCache()) == "SketchCache(num_sketches=0)"
+
+
+def test_sketch_cache_get_sketch() -> None:
+    cache = SketchCache()
+    values = np.arange(101)
+    sketch = cache.get_sketch(values)
+    assert sketch.count == 101
+    assert cache.get_sketch(values) is sketch
+    assert cache.get_sketch(values.ravel()) is sketch
+
+
+def test_sketch_cache_get_sketch_view() -> None:
+    cache = SketchCache()
+    values = np.arange(101)
+    assert cache.get_sketch(values[10:]).count == 91
+    assert cache.get_sketch(values[10:]) is not cache.get_sketch(values)
+
+
+def test_sketch_cache_clear() -> None:
+    cache = SketchCache()
+    cache.get_sketch(np.arange(10))
+    cache.clear()
+    assert repr(cache) == "SketchCache(num_sketches=0)"
+
+
+def test_sketch_cache_cleared_on_exit() -> None:
+    with SketchCache() as cache:
+        get_quantile_sketch(np.arange(10))
+        assert repr(cache) == "SketchCache(num_sketches=1)"
+    assert repr(cache) == "SketchCache(num_sketches=0)"
+
+
+def test_sketch_cache_nested() -> None:
+    values = np.arange(10)
+    with SketchCache() as cache:
+        sketch = get_quantile_sketch(values)
+        with cache:
+            assert get_quantile_sketch(values) is sketch
+        assert get_quantile_sketch(values) is sketch
+    assert get_quantile_sketch(values) is not sketch
+
+
+def test_sketch_cache_current_or_new() -> None:
+    with SketchCache() as cache:
+        assert SketchCache.current_or_new() is cache
+    assert SketchCache.current_or_new() is not cache
+
+
+#########################################
+#     Tests for get_quantile_sketch     #
+#########################################
+
+
+def test_get_quantile_sketch() -> None:
+    values = np.arange(101)
+    sketch = get_quantile_sketch(values)
+    assert sketch.count == 101
+    assert sketch.quantile(0.5) == 50.0
+
+
+def test_get_quantile_sketch_not_cached() -> None:
+    values = np.arange(101)
+    assert get_quantile_sketch(values) is not get_quantile_sketch(values)
+
+
+def test_get_quantile_sketch_modified_in_place() -> None:
+    values = np.arange(1000.0)
+    assert get_quantile_sketch(values).max == 999.0
+    values *= 10
+    assert get_quantile_sketch(values).max == 9990.0
+
+
+def test_get_quantile_sketch_cache() -> None:
+    values = np.arange(101)
+    with SketchCache():
+        assert get_quantile_sketch(values) is get_quantile_sketch(values)
+
+
+def test_get_quantile_sketch_cache_different_arrays() -> None:
+    values1, values2 = np.arange(101), np.arange(11)
+    with SketchCache():
+        assert get_quantile_sketch(values1) is not get_quantile_sketch(values2)
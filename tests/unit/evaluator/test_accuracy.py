@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from unittest.mock import patch
 
 import numpy as np
@@ -418,7 +419,7 @@ def test_accuracy_evaluator_compute() -> None:
 
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_accuracy_evaluator_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         AccuracyEvaluator(
             AccuracyState(
                 y_true=np.array([1, 0, 0, 1, 1]),
@@ -426,4 +427,22 @@ def test_accuracy_evaluator_no_sklearn() -> None:
                 y_true_name="target",
                 y_pred_name="pred",
             ),
-        )
+        ).evaluate(),
+        {"accuracy": 1.0, "count_correct": 5, "count_incorrect": 0, "count": 5, "error": 0.0},
+    )
+
+
+@patch("analora.utils.imports.is_sklearn_available", lambda: False)
+def test_accuracy_evaluator_no_sklearn_nan() -> None:
+    evaluator = AccuracyEvaluator(
+        AccuracyState(
+            y_true=np.array([1, 0, 0, 1, float("nan")]),
+            y_pred=np.array([1, 0, 0, 1, 1]),
+            y_true_name="target",
+            y_pred_name="pred",
+        ),
+    )
+    with pytest.raises(
+        RuntimeError, match=re.escape("'sklearn' package is required but not installed.")
+    ):
+        evaluator.evaluate()
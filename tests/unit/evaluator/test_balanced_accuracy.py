@@ -6,16 +6,15 @@ import numpy as np
 import pytest
 from coola import objects_are_equal
 
-from analora.evaluator import BalancedAccuracyEvaluator, Evaluator
+from analora.evaluator import AccuracyEvaluator, BalancedAccuracyEvaluator, Evaluator
+from analora.metric.classification.balanced_accuracy import per_class_counts
 from analora.state import AccuracyState
-from analora.testing import sklearn_available
 
 ###############################################
 #     Tests for BalancedAccuracyEvaluator     #
 ###############################################
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_repr() -> None:
     assert repr(
         BalancedAccuracyEvaluator(
@@ -29,7 +28,6 @@ def test_balanced_accuracy_evaluator_repr() -> None:
     ).startswith("BalancedAccuracyEvaluator(")
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_str() -> None:
     assert str(
         BalancedAccuracyEvaluator(
@@ -43,7 +41,6 @@ def test_balanced_accuracy_evaluator_str() -> None:
     ).startswith("BalancedAccuracyEvaluator(")
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_state() -> None:
     assert BalancedAccuracyEvaluator(
         AccuracyState(
@@ -62,7 +59,6 @@ def test_balanced_accuracy_evaluator_state() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_equal_true() -> None:
     assert BalancedAccuracyEvaluator(
         AccuracyState(
@@ -83,7 +79,6 @@ def test_balanced_accuracy_evaluator_equal_true() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_equal_false_different_state() -> None:
     assert not BalancedAccuracyEvaluator(
         AccuracyState(
@@ -104,7 +99,6 @@ def test_balanced_accuracy_evaluator_equal_false_different_state() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_equal_false_different_type() -> None:
     assert not BalancedAccuracyEvaluator(
         AccuracyState(
@@ -116,7 +110,6 @@ def test_balanced_accuracy_evaluator_equal_false_different_type() -> None:
     ).equal(42)
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_correct() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -129,7 +122,6 @@ def test_balanced_accuracy_evaluator_evaluate_correct() -> None:
     assert objects_are_equal(evaluator.evaluate(), {"balanced_accuracy": 1.0, "count": 5})
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_binary_incorrect() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -142,7 +134,6 @@ def test_balanced_accuracy_evaluator_evaluate_binary_incorrect() -> None:
     assert objects_are_equal(evaluator.evaluate(), {"balanced_accuracy": 0.0, "count": 4})
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_empty() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -159,7 +150,6 @@ def test_balanced_accuracy_evaluator_evaluate_empty() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_prefix_suffix() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -175,7 +165,6 @@ def test_balanced_accuracy_evaluator_evaluate_prefix_suffix() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_nan_omit() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -189,7 +178,6 @@ def test_balanced_accuracy_evaluator_evaluate_nan_omit() -> None:
     assert objects_are_equal(evaluator.evaluate(), {"balanced_accuracy": 1.0, "count": 5})
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_nan_omit_y_true() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -203,7 +191,6 @@ def test_balanced_accuracy_evaluator_evaluate_nan_omit_y_true() -> None:
     assert objects_are_equal(evaluator.evaluate(), {"balanced_accuracy": 1.0, "count": 5})
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_nan_omit_y_pred() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -217,7 +204,6 @@ def test_balanced_accuracy_evaluator_evaluate_nan_omit_y_pred() -> None:
     assert objects_are_equal(evaluator.evaluate(), {"balanced_accuracy": 1.0, "count": 5})
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_nan_propagate() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -234,7 +220,6 @@ def test_balanced_accuracy_evaluator_evaluate_nan_propagate() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_nan_propagate_y_true() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -251,7 +236,6 @@ def test_balanced_accuracy_evaluator_evaluate_nan_propagate_y_true() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_nan_propagate_y_pred() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -268,7 +252,6 @@ def test_balanced_accuracy_evaluator_evaluate_nan_propagate_y_pred() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_nan_raise() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -283,7 +266,6 @@ def test_balanced_accuracy_evaluator_evaluate_nan_raise() -> None:
         evaluator.evaluate()
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_nan_raise_y_true() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -298,7 +280,6 @@ def test_balanced_accuracy_evaluator_evaluate_nan_raise_y_true() -> None:
         evaluator.evaluate()
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_evaluate_nan_raise_y_pred() -> None:
     evaluator = BalancedAccuracyEvaluator(
         AccuracyState(
@@ -313,7 +294,6 @@ def test_balanced_accuracy_evaluator_evaluate_nan_raise_y_pred() -> None:
         evaluator.evaluate()
 
 
-@sklearn_available
 def test_balanced_accuracy_evaluator_compute() -> None:
     assert (
         BalancedAccuracyEvaluator(
@@ -329,9 +309,28 @@ def test_balanced_accuracy_evaluator_compute() -> None:
     )
 
 
+def test_balanced_accuracy_evaluator_evaluate_shared_class_counts() -> None:
+    state = AccuracyState(
+        y_true=np.array([1, 0, 0, 1, 1]),
+        y_pred=np.array([1, 0, 1, 1, 0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    )
+    with patch("analora.state.accuracy.per_class_counts", wraps=per_class_counts) as counts:
+        assert objects_are_equal(
+            AccuracyEvaluator(state).evaluate(),
+            {"accuracy": 0.6, "count_correct": 3, "count_incorrect": 2, "count": 5, "error": 0.4},
+        )
+        assert objects_are_equal(
+            BalancedAccuracyEvaluator(state).evaluate(),
+            {"balanced_accuracy": 0.5833333333333333, "count": 5},
+        )
+    assert counts.call_count == 1
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_balanced_accuracy_evaluator_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         BalancedAccuracyEvaluator(
             AccuracyState(
                 y_true=np.array([1, 0, 0, 1, 1]),
@@ -339,4 +338,6 @@ def test_balanced_accuracy_evaluator_no_sklearn() -> None:
                 y_true_name="target",
                 y_pred_name="pred",
             ),
-        )
+        ).evaluate(),
+        {"balanced_accuracy": 1.0, "count": 5},
+    )
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_equal
+
+from analora.metric import accuracy
+from analora.metric.accumulator import AccuracyAccumulator, RegressionAccumulator
+from analora.testing import sklearn_available
+
+#########################################
+#     Tests for AccuracyAccumulator     #
+#########################################
+
+
+def test_accuracy_accumulator_repr() -> None:
+    assert repr(AccuracyAccumulator()) == (
+        "AccuracyAccumulator(count=0, count_correct=0, nan_policy='propagate')"
+    )
+
+
+def test_accuracy_accumulator_nan_policy() -> None:
+    assert AccuracyAccumulator(nan_policy="omit").nan_policy == "omit"
+
+
+def test_accuracy_accumulator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        AccuracyAccumulator(nan_policy="incorrect")
+
+
+def test_accuracy_accumulator_compute() -> None:
+    accumulator = AccuracyAccumulator()
+    accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    accumulator.update(y_true=np.array([[1, 1]]), y_pred=np.array([[1, 1]]))
+    assert objects_are_equal(
+        accumulator.compute(),
+        {
+            "accuracy": 0.8,
+            "count_correct": 4,
+            "count_incorrect": 1,
+            "count": 5,
+            "error": 0.19999999999999996,
+        },
+    )
+
+
+def test_accuracy_accumulator_compute_prefix_suffix() -> None:
+    accumulator = AccuracyAccumulator()
+    accumulator.update(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+    assert objects_are_equal(
+        accumulator.compute(prefix="prefix_", suffix="_suffix"),
+        {
+            "prefix_accuracy_suffix": 1.0,
+            "prefix_count_correct_suffix": 5,
+            "prefix_count_incorrect_suffix": 0,
+            "prefix_count_suffix": 5,
+            "prefix_error_suffix": 0.0,
+        },
+    )
+
+
+def test_accuracy_accumulator_compute_empty() -> None:
+    assert objects_are_equal(
+        AccuracyAccumulator().compute(),
+        {
+            "accuracy": float("nan"),
+            "count_correct": 0,
+            "count_incorrect": 0,
+            "count": 0,
+            "error": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+@sklearn_available
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate"])
+def test_accuracy_accumulator_same_as_accuracy(nan_policy: str) -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 5, size=100).astype(float)
+    y_pred = rng.integers(0, 5, size=100).astype(float)
+    y_pred[42] = float("nan")
+    accumulator = AccuracyAccumulator(nan_policy=nan_policy)
+    for i in range(0, 100, 30):
+        accumulator.update(y_true=y_true[i : i + 30], y_pred=y_pred[i : i + 30])
+    assert objects_are_equal(
+        accumulator.compute(),
+        accuracy(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy),
+        equal_nan=True,
+    )
+
+
+def test_accuracy_accumulator_update_nan_omit() -> None:
+    accumulator = AccuracyAccumulator(nan_policy="omit")
+    accumulator.update(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_pred=np.array([1, 0, 0, 1, float("nan"), 1]),
+    )
+    assert objects_are_equal(
+        accumulator.compute(),
+        {"accuracy": 1.0, "count_correct": 4, "count_incorrect": 0, "count": 4, "error": 0.0},
+    )
+
+
+def test_accuracy_accumulator_update_nan_propagate() -> None:
+    accumulator = AccuracyAccumulator()
+    accumulator.update(y_true=np.array([1, 0, float("nan")]), y_pred=np.array([1, 0, 1]))
+    accumulator.update(y_true=np.array([1, 0]), y_pred=np.array([1, 0]))
+    assert objects_are_equal(
+        accumulator.compute(),
+        {
+            "accuracy": float("nan"),
+            "count_correct": float("nan"),
+            "count_incorrect": float("nan"),
+            "count": 5,
+            "error": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_accuracy_accumulator_update_nan_raise() -> None:
+    accumulator = AccuracyAccumulator(nan_policy="raise")
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        accumulator.update(y_true=np.array([1, 0, float("nan")]), y_pred=np.array([1, 0, 1]))
+
+
+def test_accuracy_accumulator_update_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        AccuracyAccumulator().update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0]))
+
+
+def test_accuracy_accumulator_merge() -> None:
+    accumulator1 = AccuracyAccumulator()
+    accumulator1.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    accumulator2 = AccuracyAccumulator()
+    accumulator2.update(y_true=np.array([1, 1]), y_pred=np.array([1, 1]))
+    accumulator1.merge(accumulator2)
+    expected = AccuracyAccumulator()
+    expected.update(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 1, 1]))
+    assert accumulator1.equal(expected)
+
+
+def test_accuracy_accumulator_merge_nan() -> None:
+    accumulator1 = AccuracyAccumulator()
+    accumulator1.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    accumulator2 = AccuracyAccumulator()
+    accumulator2.update(y_true=np.array([1, float("nan")]), y_pred=np.array([1, 1]))
+    accumulator1.merge(accumulator2)
+    assert accumulator1.compute()["count"] == 5
+    assert np.isnan(accumulator1.compute()["accuracy"])
+
+
+def test_accuracy_accumulator_merge_incorrect_type() -> None:
+    with pytest.raises(TypeError, match="Incorrect accumulator type"):
+        AccuracyAccumulator().merge(RegressionAccumulator())
+
+
+def test_accuracy_accumulator_merge_incorrect_config() -> None:
+    with pytest.raises(ValueError, match="Cannot merge accumulators with different configurations"):
+        AccuracyAccumulator().merge(AccuracyAccumulator(nan_policy="omit"))
+
+
+def test_accuracy_accumulator_reset() -> None:
+    accumulator = AccuracyAccumulator()
+    accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    accumulator.reset()
+    assert accumulator.equal(AccuracyAccumulator())
+
+
+def test_accuracy_accumulator_equal_true() -> None:
+    assert AccuracyAccumulator().equal(AccuracyAccumulator())
+
+
+def test_accuracy_accumulator_equal_false_different_stats() -> None:
+    accumulator = AccuracyAccumulator()
+    accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    assert not accumulator.equal(AccuracyAccumulator())
+
+
+def test_accuracy_accumulator_equal_false_different_nan_policy() -> None:
+    assert not AccuracyAccumulator().equal(AccuracyAccumulator(nan_policy="omit"))
+
+
+def test_accuracy_accumulator_equal_false_different_type() -> None:
+    assert not AccuracyAccumulator().equal(42)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+from analora.metric.accumulator import AccuracyAccumulator, RegressionAccumulator
+from analora.metric.accumulator.base import check_same_accumulator, check_same_config
+
+############################################
+#     Tests for check_same_accumulator     #
+############################################
+
+
+def test_check_same_accumulator() -> None:
+    check_same_accumulator(AccuracyAccumulator(), AccuracyAccumulator())
+
+
+def test_check_same_accumulator_incorrect() -> None:
+    with pytest.raises(TypeError, match="Incorrect accumulator type: RegressionAccumulator"):
+        check_same_accumulator(AccuracyAccumulator(), RegressionAccumulator())
+
+
+#######################################
+#     Tests for check_same_config     #
+#######################################
+
+
+def test_check_same_config() -> None:
+    check_same_config({"k": (1, 2), "nan_policy": "omit"}, {"k": (1, 2), "nan_policy": "omit"})
+
+
+def test_check_same_config_incorrect() -> None:
+    with pytest.raises(ValueError, match="Cannot merge accumulators with different configurations"):
+        check_same_config({"nan_policy": "omit"}, {"nan_policy": "raise"})
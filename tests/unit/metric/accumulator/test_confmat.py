@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.metric import classification_report
+from analora.metric.accumulator import AccuracyAccumulator, ConfusionMatrixAccumulator
+
+################################################
+#     Tests for ConfusionMatrixAccumulator     #
+################################################
+
+
+def test_confusion_matrix_accumulator_repr() -> None:
+    assert repr(ConfusionMatrixAccumulator()) == (
+        "ConfusionMatrixAccumulator(count=0, num_classes=0, betas=(1,), nan_policy='propagate')"
+    )
+
+
+def test_confusion_matrix_accumulator_nan_policy() -> None:
+    assert ConfusionMatrixAccumulator(nan_policy="omit").nan_policy == "omit"
+
+
+def test_confusion_matrix_accumulator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        ConfusionMatrixAccumulator(nan_policy="incorrect")
+
+
+def test_confusion_matrix_accumulator_update() -> None:
+    accumulator = ConfusionMatrixAccumulator()
+    accumulator.update(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 0, 1]))
+    accumulator.update(y_true=np.array([1, 2, 2]), y_pred=np.array([1, 1, 1]))
+    assert objects_are_equal(accumulator.labels, np.array([0, 1, 2]))
+    assert objects_are_equal(accumulator.confmat, np.array([[2, 0, 0], [0, 2, 0], [0, 2, 0]]))
+
+
+def test_confusion_matrix_accumulator_update_new_labels() -> None:
+    accumulator = ConfusionMatrixAccumulator()
+    accumulator.update(y_true=np.array([1, 5]), y_pred=np.array([1, 1]))
+    accumulator.update(y_true=np.array([3, 5]), y_pred=np.array([3, 5]))
+    assert objects_are_equal(accumulator.labels, np.array([1, 3, 5]))
+    assert objects_are_equal(accumulator.confmat, np.array([[1, 0, 0], [0, 1, 0], [1, 0, 1]]))
+
+
+def test_confusion_matrix_accumulator_update_num_classes() -> None:
+    accumulator = ConfusionMatrixAccumulator(num_classes=4)
+    accumulator.update(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 0, 1]))
+    accumulator.update(y_true=np.array([1, 2, 2]), y_pred=np.array([1, 1, 1]))
+    assert objects_are_equal(accumulator.labels, np.array([0, 1, 2, 3]))
+    assert objects_are_equal(
+        accumulator.confmat,
+        np.array([[2, 0, 0, 0], [0, 2, 0, 0], [0, 2, 0, 0], [0, 0, 0, 0]]),
+    )
+
+
+def test_confusion_matrix_accumulator_update_num_classes_invalid_labels() -> None:
+    accumulator = ConfusionMatrixAccumulator(num_classes=2)
+    with pytest.raises(ValueError, match=r"'y_true' must contain integer labels in \[0, 1\]"):
+        accumulator.update(y_true=np.array([0, 2]), y_pred=np.array([0, 1]))
+
+
+def test_confusion_matrix_accumulator_compute() -> None:
+    accumulator = ConfusionMatrixAccumulator()
+    accumulator.update(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 0, 1]))
+    accumulator.update(y_true=np.array([1, 2, 2]), y_pred=np.array([1, 1, 1]))
+    assert objects_are_allclose(
+        accumulator.compute(),
+        classification_report(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 1, 1])
+        ),
+    )
+
+
+def test_confusion_matrix_accumulator_compute_prefix_suffix() -> None:
+    accumulator = ConfusionMatrixAccumulator()
+    accumulator.update(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 0, 1]))
+    out = accumulator.compute(prefix="prefix_", suffix="_suffix")
+    assert len(out) == 17
+    assert all(key.startswith("prefix_") and key.endswith("_suffix") for key in out)
+
+
+def test_confusion_matrix_accumulator_compute_empty() -> None:
+    assert objects_are_equal(
+        ConfusionMatrixAccumulator().compute(),
+        classification_report(y_true=np.array([]), y_pred=np.array([])),
+        equal_nan=True,
+    )
+
+
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate"])
+def test_confusion_matrix_accumulator_same_as_classification_report(nan_policy: str) -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 5, size=100).astype(float)
+    y_pred = rng.integers(0, 5, size=100).astype(float)
+    y_pred[42] = float("nan")
+    accumulator = ConfusionMatrixAccumulator(betas=(0.5, 1), nan_policy=nan_policy)
+    for i in range(0, 100, 30):
+        accumulator.update(y_true=y_true[i : i + 30], y_pred=y_pred[i : i + 30])
+    assert objects_are_allclose(
+        accumulator.compute(),
+        classification_report(y_true=y_true, y_pred=y_pred, betas=(0.5, 1), nan_policy=nan_policy),
+        equal_nan=True,
+    )
+
+
+def test_confusion_matrix_accumulator_update_nan_raise() -> None:
+    accumulator = ConfusionMatrixAccumulator(nan_policy="raise")
+    with pytest.raises(ValueError, match="'y_pred' contains at least one NaN value"):
+        accumulator.update(y_true=np.array([1, 0, 1]), y_pred=np.array([1, 0, float("nan")]))
+
+
+def test_confusion_matrix_accumulator_merge() -> None:
+    accumulator1 = ConfusionMatrixAccumulator()
+    accumulator1.update(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 0, 1]))
+    accumulator2 = ConfusionMatrixAccumulator()
+    accumulator2.update(y_true=np.array([1, 2, 2]), y_pred=np.array([1, 1, 1]))
+    accumulator1.merge(accumulator2)
+    expected = ConfusionMatrixAccumulator()
+    expected.update(y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 1, 1]))
+    assert accumulator1.equal(expected)
+
+
+def test_confusion_matrix_accumulator_merge_into_empty() -> None:
+    accumulator = ConfusionMatrixAccumulator()
+    other = ConfusionMatrixAccumulator()
+    other.update(y_true=np.array([1, 2, 2]), y_pred=np.array([1, 1, 1]))
+    accumulator.merge(other)
+    assert accumulator.equal(other)
+
+
+def test_confusion_matrix_accumulator_merge_num_classes() -> None:
+    accumulator1 = ConfusionMatrixAccumulator(num_classes=3)
+    accumulator1.update(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 0, 1]))
+    accumulator2 = ConfusionMatrixAccumulator(num_classes=3)
+    accumulator2.update(y_true=np.array([1, 2, 2]), y_pred=np.array([1, 1, 1]))
+    accumulator1.merge(accumulator2)
+    assert objects_are_equal(accumulator1.confmat, np.array([[2, 0, 0], [0, 2, 0], [0, 2, 0]]))
+
+
+def test_confusion_matrix_accumulator_merge_incorrect_type() -> None:
+    with pytest.raises(TypeError, match="Incorrect accumulator type"):
+        ConfusionMatrixAccumulator().merge(AccuracyAccumulator())
+
+
+def test_confusion_matrix_accumulator_merge_incorrect_config() -> None:
+    with pytest.raises(ValueError, match="Cannot merge accumulators with different configurations"):
+        ConfusionMatrixAccumulator().merge(ConfusionMatrixAccumulator(num_classes=3))
+
+
+def test_confusion_matrix_accumulator_reset() -> None:
+    accumulator = ConfusionMatrixAccumulator(num_classes=3)
+    accumulator.update(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 0, 1]))
+    accumulator.reset()
+    assert accumulator.equal(ConfusionMatrixAccumulator(num_classes=3))
+
+
+def test_confusion_matrix_accumulator_equal_false_different_stats() -> None:
+    accumulator = ConfusionMatrixAccumulator()
+    accumulator.update(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 0, 1]))
+    assert not accumulator.equal(ConfusionMatrixAccumulator())
+
+
+def test_confusion_matrix_accumulator_equal_false_different_type() -> None:
+    assert not ConfusionMatrixAccumulator().equal(42)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.metric import (
+    mean_absolute_error,
+    mean_squared_error,
+    r2_score,
+    root_mean_squared_error,
+)
+from analora.metric.accumulator import AccuracyAccumulator, RegressionAccumulator
+from analora.testing import sklearn_available
+
+###########################################
+#     Tests for RegressionAccumulator     #
+###########################################
+
+
+def test_regression_accumulator_repr() -> None:
+    assert repr(RegressionAccumulator()) == "RegressionAccumulator(count=0, nan_policy='propagate')"
+
+
+def test_regression_accumulator_nan_policy() -> None:
+    assert RegressionAccumulator(nan_policy="omit").nan_policy == "omit"
+
+
+def test_regression_accumulator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        RegressionAccumulator(nan_policy="incorrect")
+
+
+def test_regression_accumulator_compute() -> None:
+    accumulator = RegressionAccumulator()
+    accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 4]))
+    accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([3, 5]))
+    assert objects_are_allclose(
+        accumulator.compute(),
+        {
+            "count": 5,
+            "mean_absolute_error": 0.4,
+            "mean_squared_error": 0.4,
+            "root_mean_squared_error": 0.6324555320336759,
+            "r2_score": 0.8,
+        },
+    )
+
+
+def test_regression_accumulator_compute_correct() -> None:
+    accumulator = RegressionAccumulator()
+    accumulator.update(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]))
+    assert objects_are_equal(
+        accumulator.compute(),
+        {
+            "count": 5,
+            "mean_absolute_error": 0.0,
+            "mean_squared_error": 0.0,
+            "root_mean_squared_error": 0.0,
+            "r2_score": 1.0,
+        },
+    )
+
+
+def test_regression_accumulator_compute_prefix_suffix() -> None:
+    accumulator = RegressionAccumulator()
+    accumulator.update(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]))
+    assert objects_are_equal(
+        accumulator.compute(prefix="prefix_", suffix="_suffix"),
+        {
+            "prefix_count_suffix": 5,
+            "prefix_mean_absolute_error_suffix": 0.0,
+            "prefix_mean_squared_error_suffix": 0.0,
+            "prefix_root_mean_squared_error_suffix": 0.0,
+            "prefix_r2_score_suffix": 1.0,
+        },
+    )
+
+
+def test_regression_accumulator_compute_constant_target() -> None:
+    accumulator = RegressionAccumulator()
+    accumulator.update(y_true=np.array([2, 2, 2]), y_pred=np.array([1, 2, 3]))
+    assert accumulator.compute()["r2_score"] == 0.0
+
+
+def test_regression_accumulator_compute_one_sample() -> None:
+    accumulator = RegressionAccumulator()
+    accumulator.update(y_true=np.array([2]), y_pred=np.array([1]))
+    assert objects_are_equal(
+        accumulator.compute(),
+        {
+            "count": 1,
+            "mean_absolute_error": 1.0,
+            "mean_squared_error": 1.0,
+            "root_mean_squared_error": 1.0,
+            "r2_score": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_regression_accumulator_compute_empty() -> None:
+    assert objects_are_equal(
+        RegressionAccumulator().compute(),
+        {
+            "count": 0,
+            "mean_absolute_error": float("nan"),
+            "mean_squared_error": float("nan"),
+            "root_mean_squared_error": float("nan"),
+            "r2_score": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+@sklearn_available
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate"])
+def test_regression_accumulator_same_as_metrics(nan_policy: str) -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.normal(loc=1e6, size=100)
+    y_pred = y_true + rng.normal(size=100)
+    y_pred[42] = float("nan")
+    accumulator = RegressionAccumulator(nan_policy=nan_policy)
+    for i in range(0, 100, 30):
+        accumulator.update(y_true=y_true[i : i + 30], y_pred=y_pred[i : i + 30])
+    assert objects_are_allclose(
+        accumulator.compute(),
+        mean_absolute_error(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | mean_squared_error(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | root_mean_squared_error(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | r2_score(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy),
+        equal_nan=True,
+    )
+
+
+def test_regression_accumulator_update_nan_propagate() -> None:
+    accumulator = RegressionAccumulator()
+    accumulator.update(y_true=np.array([1, 2, float("nan")]), y_pred=np.array([1, 2, 3]))
+    accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([4, 5]))
+    assert objects_are_equal(
+        accumulator.compute(),
+        {
+            "count": 5,
+            "mean_absolute_error": float("nan"),
+            "mean_squared_error": float("nan"),
+            "root_mean_squared_error": float("nan"),
+            "r2_score": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_regression_accumulator_update_nan_raise() -> None:
+    accumulator = RegressionAccumulator(nan_policy="raise")
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        accumulator.update(y_true=np.array([1, 2, float("nan")]), y_pred=np.array([1, 2, 3]))
+
+
+def test_regression_accumulator_merge() -> None:
+    accumulator1 = RegressionAccumulator()
+    accumulator1.update(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 4]))
+    accumulator2 = RegressionAccumulator()
+    accumulator2.update(y_true=np.array([4, 5]), y_pred=np.array([3, 5]))
+    accumulator1.merge(accumulator2)
+    expected = RegressionAccumulator()
+    expected.update(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 4, 3, 5]))
+    assert objects_are_allclose(accumulator1.compute(), expected.compute())
+
+
+def test_regression_accumulator_merge_empty() -> None:
+    accumulator = RegressionAccumulator()
+    accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 4]))
+    expected = RegressionAccumulator()
+    expected.update(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 4]))
+    accumulator.merge(RegressionAccumulator())
+    assert accumulator.equal(expected)
+
+
+def test_regression_accumulator_merge_incorrect_type() -> None:
+    with pytest.raises(TypeError, match="Incorrect accumulator type"):
+        RegressionAccumulator().merge(AccuracyAccumulator())
+
+
+def test_regression_accumulator_merge_incorrect_config() -> None:
+    with pytest.raises(ValueError, match="Cannot merge accumulators with different configurations"):
+        RegressionAccumulator().merge(RegressionAccumulator(nan_policy="omit"))
+
+
+def test_regression_accumulator_reset() -> None:
+    accumulator = RegressionAccumulator()
+    accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 4]))
+    accumulator.reset()
+    assert accumulator.equal(RegressionAccumulator())
+
+
+def test_regression_accumulator_equal_false_different_stats() -> None:
+    accumulator = RegressionAccumulator()
+    accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 4]))
+    assert not accumulator.equal(RegressionAccumulator())
+
+
+def test_regression_accumulator_equal_false_different_type() -> None:
+    assert not RegressionAccumulator().equal(42)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.metric import top_k_accuracy
+from analora.metric.accumulator import AccuracyAccumulator, TopKAccuracyAccumulator
+from analora.testing import sklearn_available
+
+#############################################
+#     Tests for TopKAccuracyAccumulator     #
+#############################################
+
+
+def test_top_k_accuracy_accumulator_repr() -> None:
+    assert repr(TopKAccuracyAccumulator()) == (
+        "TopKAccuracyAccumulator(count=0, k=(2,), nan_policy='propagate')"
+    )
+
+
+def test_top_k_accuracy_accumulator_nan_policy() -> None:
+    assert TopKAccuracyAccumulator(nan_policy="omit").nan_policy == "omit"
+
+
+def test_top_k_accuracy_accumulator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        TopKAccuracyAccumulator(nan_policy="incorrect")
+
+
+def test_top_k_accuracy_accumulator_compute_multiclass() -> None:
+    accumulator = TopKAccuracyAccumulator(k=[1, 2, 3])
+    accumulator.update(
+        y_true=np.array([0, 1, 2]),
+        y_pred=np.array([[0.7, 0.2, 0.1], [0.4, 0.3, 0.3], [0.1, 0.8, 0.1]]),
+    )
+    accumulator.update(y_true=np.array([2, 0]), y_pred=np.array([[0.2, 0.3, 0.5], [0.4, 0.4, 0.2]]))
+    assert objects_are_equal(
+        accumulator.compute(),
+        {"count": 5, "top_1_accuracy": 0.4, "top_2_accuracy": 0.8, "top_3_accuracy": 1.0},
+    )
+
+
+def test_top_k_accuracy_accumulator_compute_binary() -> None:
+    accumulator = TopKAccuracyAccumulator(k=[1, 2])
+    accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([0.9, 0.2, 0.6]))
+    accumulator.update(y_true=np.array([1, 1]), y_pred=np.array([0.4, 0.8]))
+    assert objects_are_equal(
+        accumulator.compute(), {"count": 5, "top_1_accuracy": 0.6, "top_2_accuracy": 1.0}
+    )
+
+
+def test_top_k_accuracy_accumulator_compute_binary_scores_out_of_unit_range() -> None:
+    accumulator = TopKAccuracyAccumulator(k=[1])
+    accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([0.9, 0.2, 0.6]))
+    accumulator.update(y_true=np.array([1, 0]), y_pred=np.array([2.0, -1.0]))
+    assert objects_are_equal(accumulator.compute(), {"count": 5, "top_1_accuracy": 0.6})
+
+
+def test_top_k_accuracy_accumulator_compute_prefix_suffix() -> None:
+    accumulator = TopKAccuracyAccumulator(k=[1])
+    accumulator.update(y_true=np.array([1, 0]), y_pred=np.array([0.9, 0.2]))
+    assert objects_are_equal(
+        accumulator.compute(prefix="prefix_", suffix="_suffix"),
+        {"prefix_count_suffix": 2, "prefix_top_1_accuracy_suffix": 1.0},
+    )
+
+
+def test_top_k_accuracy_accumulator_compute_empty() -> None:
+    assert objects_are_equal(
+        TopKAccuracyAccumulator(k=[1, 2]).compute(),
+        {"count": 0, "top_1_accuracy": float("nan"), "top_2_accuracy": float("nan")},
+        equal_nan=True,
+    )
+
+
+@sklearn_available
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate"])
+def test_top_k_accuracy_accumulator_same_as_top_k_accuracy(nan_policy: str) -> None:
+    rng = np.random.default_rng(42)
+    y_true = np.arange(100) % 5
+    y_score = rng.integers(0, 4, size=(100, 5)).astype(float)
+    y_score[42, 1] = float("nan")
+    accumulator = TopKAccuracyAccumulator(k=[1, 2, 3], nan_policy=nan_policy)
+    for i in range(0, 100, 30):
+        accumulator.update(y_true=y_true[i : i + 30], y_pred=y_score[i : i + 30])
+    assert objects_are_allclose(
+        accumulator.compute(),
+        top_k_accuracy(y_true=y_true, y_score=y_score, k=[1, 2, 3], nan_policy=nan_policy),
+        equal_nan=True,
+    )
+
+
+def test_top_k_accuracy_accumulator_update_mixed_label_types() -> None:
+    accumulator = TopKAccuracyAccumulator()
+    accumulator.update(y_true=np.array([1, 0]), y_pred=np.array([0.9, 0.2]))
+    with pytest.raises(ValueError, match="Cannot mix binary"):
+        accumulator.update(y_true=np.array([1, 0]), y_pred=np.array([[0.1, 0.9], [0.8, 0.2]]))
+
+
+def test_top_k_accuracy_accumulator_update_nan_raise() -> None:
+    accumulator = TopKAccuracyAccumulator(nan_policy="raise")
+    with pytest.raises(ValueError, match="'y_pred' contains at least one NaN value"):
+        accumulator.update(y_true=np.array([1, 0]), y_pred=np.array([0.9, float("nan")]))
+
+
+def test_top_k_accuracy_accumulator_merge() -> None:
+    accumulator1 = TopKAccuracyAccumulator(k=[1, 2])
+    accumulator1.update(
+        y_true=np.array([0, 1, 2]),
+        y_pred=np.array([[0.7, 0.2, 0.1], [0.4, 0.3, 0.3], [0.1, 0.8, 0.1]]),
+    )
+    accumulator2 = TopKAccuracyAccumulator(k=[1, 2])
+    accumulator2.update(
+        y_true=np.array([2, 0]), y_pred=np.array([[0.2, 0.3, 0.5], [0.4, 0.4, 0.2]])
+    )
+    accumulator1.merge(accumulator2)
+    assert objects_are_equal(
+        accumulator1.compute(), {"count": 5, "top_1_accuracy": 0.4, "top_2_accuracy": 0.8}
+    )
+
+
+def test_top_k_accuracy_accumulator_merge_into_empty() -> None:
+    accumulator = TopKAccuracyAccumulator()
+    other = TopKAccuracyAccumulator()
+    other.update(y_true=np.array([1, 0]), y_pred=np.array([0.9, 0.2]))
+    accumulator.merge(other)
+    assert accumulator.equal(other)
+
+
+def test_top_k_accuracy_accumulator_merge_mixed_label_types() -> None:
+    accumulator = TopKAccuracyAccumulator()
+    accumulator.update(y_true=np.array([1, 0]), y_pred=np.array([0.9, 0.2]))
+    other = TopKAccuracyAccumulator()
+    other.update(y_true=np.array([1, 0]), y_pred=np.array([[0.1, 0.9], [0.8, 0.2]]))
+    with pytest.raises(ValueError, match="Cannot mix binary"):
+        accumulator.merge(other)
+
+
+def test_top_k_accuracy_accumulator_merge_incorrect_type() -> None:
+    with pytest.raises(TypeError, match="Incorrect accumulator type"):
+        TopKAccuracyAccumulator().merge(AccuracyAccumulator())
+
+
+def test_top_k_accuracy_accumulator_merge_incorrect_config() -> None:
+    with pytest.raises(ValueError, match="Cannot merge accumulators with different configurations"):
+        TopKAccuracyAccumulator(k=[1]).merge(TopKAccuracyAccumulator(k=[2]))
+
+
+def test_top_k_accuracy_accumulator_reset() -> None:
+    accumulator = TopKAccuracyAccumulator()
+    accumulator.update(y_true=np.array([1, 0]), y_pred=np.array([0.9, 0.2]))
+    accumulator.reset()
+    assert accumulator.equal(TopKAccuracyAccumulator())
+
+
+def test_top_k_accuracy_accumulator_equal_false_different_stats() -> None:
+    accumulator = TopKAccuracyAccumulator()
+    accumulator.update(y_true=np.array([1, 0]), y_pred=np.array([0.9, 0.2]))
+    assert not accumulator.equal(TopKAccuracyAccumulator())
+
+
+def test_top_k_accuracy_accumulator_equal_false_different_type() -> None:
+    assert not TopKAccuracyAccumulator().equal(42)
@@ -7,6 +7,7 @@ import pytest
 from coola import objects_are_allclose, objects_are_equal
 
 from analora.metric import accuracy
+from analora.metric.classification.accuracy import accuracy_from_counts
 from analora.testing import sklearn_available
 
 ##############################
@@ -235,3 +236,42 @@ def test_accuracy_nan_raise_y_pred() -> None:
 def test_accuracy_no_sklearn() -> None:
     with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
         accuracy(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+
+
+##########################################
+#     Tests for accuracy_from_counts     #
+##########################################
+
+
+def test_accuracy_from_counts() -> None:
+    assert objects_are_allclose(
+        accuracy_from_counts(count=5, correct=4),
+        {"accuracy": 0.8, "count_correct": 4, "count_incorrect": 1, "count": 5, "error": 0.2},
+    )
+
+
+def test_accuracy_from_counts_prefix_suffix() -> None:
+    assert objects_are_equal(
+        accuracy_from_counts(count=5, correct=5, prefix="prefix_", suffix="_suffix"),
+        {
+            "prefix_accuracy_suffix": 1.0,
+            "prefix_count_correct_suffix": 5,
+            "prefix_count_incorrect_suffix": 0,
+            "prefix_count_suffix": 5,
+            "prefix_error_suffix": 0.0,
+        },
+    )
+
+
+def test_accuracy_from_counts_empty() -> None:
+    assert objects_are_equal(
+        accuracy_from_counts(count=0, correct=float("nan")),
+        {
+            "accuracy": float("nan"),
+            "count_correct": float("nan"),
+            "count_incorrect": float("nan"),
+            "count": 0,
+            "error": float("nan"),
+        },
+        equal_nan=True,
+    )
@@ -388,8 +388,8 @@ def test_average_precision_label_type_incorrect() -> None:
 def test_average_precision_no_sklearn() -> None:
     with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
         average_precision(
-            y_true=np.array([1, 0, 0, 1, 1]),
-            y_score=np.array([2, -1, 0, 3, 1]),
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+            y_score=np.array([[2, -1, -1], [-1, 1, 2], [0, 2, 3], [3, -2, -4], [1, -3, -5]]),
         )
 
 
@@ -567,13 +567,22 @@ def test_binary_average_precision_nan_raise_y_score() -> None:
         )
 
 
+def test_binary_average_precision_no_positive() -> None:
+    assert objects_are_equal(
+        binary_average_precision(y_true=np.array([0, 0, 0]), y_score=np.array([2, -1, 0])),
+        {"average_precision": 0.0, "count": 3},
+    )
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_binary_average_precision_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         binary_average_precision(
             y_true=np.array([1, 0, 0, 1, 1]),
             y_score=np.array([2, -1, 0, 3, 1]),
-        )
+        ),
+        {"average_precision": 1.0, "count": 5},
+    )
 
 
 ##################################################
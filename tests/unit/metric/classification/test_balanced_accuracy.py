@@ -6,15 +6,18 @@ import numpy as np
 import pytest
 from coola import objects_are_allclose, objects_are_equal
 
-from analora.metric import balanced_accuracy
+from analora.metric import balanced_accuracy, per_class_counts
 from analora.testing import sklearn_available
+from analora.utils.imports import is_sklearn_available
+
+if is_sklearn_available():
+    from sklearn import metrics
 
 #######################################
 #     Tests for balanced_accuracy     #
 #######################################
 
 
-@sklearn_available
 def test_balanced_accuracy_binary_correct() -> None:
     assert objects_are_equal(
         balanced_accuracy(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])),
@@ -22,7 +25,6 @@ def test_balanced_accuracy_binary_correct() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_binary_correct_2d() -> None:
     assert objects_are_equal(
         balanced_accuracy(
@@ -32,7 +34,6 @@ def test_balanced_accuracy_binary_correct_2d() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_binary_incorrect() -> None:
     assert objects_are_equal(
         balanced_accuracy(y_true=np.array([1, 0, 0, 1]), y_pred=np.array([0, 1, 1, 0])),
@@ -40,7 +41,6 @@ def test_balanced_accuracy_binary_incorrect() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_multiclass_correct() -> None:
     assert objects_are_equal(
         balanced_accuracy(y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 2, 2])),
@@ -48,7 +48,6 @@ def test_balanced_accuracy_multiclass_correct() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_multiclass_incorrect() -> None:
     assert objects_are_allclose(
         balanced_accuracy(
@@ -58,7 +57,6 @@ def test_balanced_accuracy_multiclass_incorrect() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_empty() -> None:
     assert objects_are_equal(
         balanced_accuracy(y_true=np.array([]), y_pred=np.array([])),
@@ -67,7 +65,6 @@ def test_balanced_accuracy_empty() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_prefix_suffix() -> None:
     assert objects_are_equal(
         balanced_accuracy(
@@ -83,7 +80,6 @@ def test_balanced_accuracy_prefix_suffix() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_nan_omit() -> None:
     assert objects_are_equal(
         balanced_accuracy(
@@ -95,7 +91,6 @@ def test_balanced_accuracy_nan_omit() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_nan_omit_y_true() -> None:
     assert objects_are_equal(
         balanced_accuracy(
@@ -107,7 +102,6 @@ def test_balanced_accuracy_nan_omit_y_true() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_nan_omit_y_pred() -> None:
     assert objects_are_equal(
         balanced_accuracy(
@@ -119,7 +113,6 @@ def test_balanced_accuracy_nan_omit_y_pred() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_nan_propagate() -> None:
     assert objects_are_equal(
         balanced_accuracy(
@@ -132,7 +125,6 @@ def test_balanced_accuracy_nan_propagate() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_nan_propagate_y_true() -> None:
     assert objects_are_equal(
         balanced_accuracy(
@@ -145,7 +137,6 @@ def test_balanced_accuracy_nan_propagate_y_true() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_nan_propagate_y_pred() -> None:
     assert objects_are_equal(
         balanced_accuracy(
@@ -158,7 +149,6 @@ def test_balanced_accuracy_nan_propagate_y_pred() -> None:
     )
 
 
-@sklearn_available
 def test_balanced_accuracy_nan_raise() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         balanced_accuracy(
@@ -168,7 +158,6 @@ def test_balanced_accuracy_nan_raise() -> None:
         )
 
 
-@sklearn_available
 def test_balanced_accuracy_nan_raise_y_true() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         balanced_accuracy(
@@ -178,7 +167,6 @@ def test_balanced_accuracy_nan_raise_y_true() -> None:
         )
 
 
-@sklearn_available
 def test_balanced_accuracy_nan_raise_y_pred() -> None:
     with pytest.raises(ValueError, match="'y_pred' contains at least one NaN value"):
         balanced_accuracy(
@@ -188,7 +176,181 @@ def test_balanced_accuracy_nan_raise_y_pred() -> None:
         )
 
 
+def test_balanced_accuracy_num_classes() -> None:
+    assert objects_are_allclose(
+        balanced_accuracy(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 1, 1, 1, 2, 0]), num_classes=4
+        ),
+        {"balanced_accuracy": 2.0 / 3.0, "count": 6},
+    )
+
+
+def test_balanced_accuracy_num_classes_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect num_classes: 2"):
+        balanced_accuracy(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 1, 1, 1, 2, 0]), num_classes=2
+        )
+
+
+def test_balanced_accuracy_sample_weight() -> None:
+    assert objects_are_allclose(
+        balanced_accuracy(
+            y_true=np.array([1, 0, 0, 1, 1]),
+            y_pred=np.array([1, 0, 1, 1, 0]),
+            sample_weight=np.array([1.0, 1.0, 3.0, 1.0, 1.0]),
+        ),
+        {"balanced_accuracy": 0.4583333333333333, "count": 5},
+    )
+
+
+def test_balanced_accuracy_sample_weight_nan_omit() -> None:
+    assert objects_are_allclose(
+        balanced_accuracy(
+            y_true=np.array([1, 0, 0, 1, 1, 0]),
+            y_pred=np.array([1, 0, 1, 1, 0, 0]),
+            sample_weight=np.array([1.0, 1.0, 3.0, 1.0, 1.0, float("nan")]),
+            nan_policy="omit",
+        ),
+        {"balanced_accuracy": 0.4583333333333333, "count": 5},
+    )
+
+
+def test_balanced_accuracy_sample_weight_nan_propagate() -> None:
+    assert objects_are_allclose(
+        balanced_accuracy(
+            y_true=np.array([1, 0, 0, 1, 1, 0]),
+            y_pred=np.array([1, 0, 1, 1, 0, 0]),
+            sample_weight=np.array([1.0, 1.0, 3.0, 1.0, 1.0, float("nan")]),
+        ),
+        {"balanced_accuracy": float("nan"), "count": 6},
+        equal_nan=True,
+    )
+
+
+def test_balanced_accuracy_sample_weight_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'sample_weight' contains at least one NaN value"):
+        balanced_accuracy(
+            y_true=np.array([1, 0, 0, 1, 1, 0]),
+            y_pred=np.array([1, 0, 1, 1, 0, 0]),
+            sample_weight=np.array([1.0, 1.0, 3.0, 1.0, 1.0, float("nan")]),
+            nan_policy="raise",
+        )
+
+
+def test_balanced_accuracy_string_labels() -> None:
+    assert objects_are_allclose(
+        balanced_accuracy(
+            y_true=np.array(["cat", "dog", "dog", "bird"]),
+            y_pred=np.array(["cat", "dog", "cat", "cat"]),
+        ),
+        {"balanced_accuracy": 0.5, "count": 4},
+    )
+
+
+@sklearn_available
+@pytest.mark.parametrize("weighted", [True, False])
+def test_balanced_accuracy_sklearn(weighted: bool) -> None:
+    rng = np.random.default_rng(42)
+    y_true, y_pred = rng.integers(0, 5, size=100) * 3, rng.integers(0, 6, size=100) * 3
+    sample_weight = rng.random(100) if weighted else None
+    assert objects_are_allclose(
+        balanced_accuracy(y_true=y_true, y_pred=y_pred, sample_weight=sample_weight)[
+            "balanced_accuracy"
+        ],
+        float(
+            metrics.balanced_accuracy_score(
+                y_true=y_true, y_pred=y_pred, sample_weight=sample_weight
+            )
+        ),
+    )
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_balanced_accuracy_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
-        balanced_accuracy(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+    assert objects_are_equal(
+        balanced_accuracy(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])),
+        {"balanced_accuracy": 1.0, "count": 5},
+    )
+
+
+######################################
+#     Tests for per_class_counts     #
+######################################
+
+
+def test_per_class_counts() -> None:
+    assert objects_are_equal(
+        per_class_counts(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 1, 0])),
+        (np.array([2, 3]), np.array([1, 2])),
+    )
+
+
+def test_per_class_counts_missing_class() -> None:
+    assert objects_are_equal(
+        per_class_counts(y_true=np.array([2, 0, 0, 2, 2]), y_pred=np.array([2, 0, 1, 2, 0])),
+        (np.array([2, 3]), np.array([1, 2])),
+    )
+
+
+def test_per_class_counts_num_classes() -> None:
+    assert objects_are_equal(
+        per_class_counts(
+            y_true=np.array([2, 0, 0, 2, 2]), y_pred=np.array([2, 0, 1, 2, 0]), num_classes=4
+        ),
+        (np.array([2, 0, 3, 0]), np.array([1, 0, 2, 0])),
+    )
+
+
+def test_per_class_counts_num_classes_float_labels() -> None:
+    assert objects_are_equal(
+        per_class_counts(
+            y_true=np.array([1.0, 0.0, 0.0, 1.0]),
+            y_pred=np.array([1.0, 0.0, 1.0, 1.0]),
+            num_classes=2,
+        ),
+        (np.array([2, 2]), np.array([1, 2])),
+    )
+
+
+@pytest.mark.parametrize("y_true", [np.array([1, 0, -1]), np.array([1.0, 0.5, 0.0])])
+def test_per_class_counts_num_classes_incorrect(y_true: np.ndarray) -> None:
+    with pytest.raises(ValueError, match="Incorrect num_classes: 2"):
+        per_class_counts(y_true=y_true, y_pred=np.array([1, 0, 0]), num_classes=2)
+
+
+def test_per_class_counts_large_labels() -> None:
+    assert objects_are_equal(
+        per_class_counts(
+            y_true=np.array([100, -5, -5, 100, 100]), y_pred=np.array([100, -5, 100, 100, -5])
+        ),
+        (np.array([2, 3]), np.array([1, 2])),
+    )
+
+
+def test_per_class_counts_sample_weight() -> None:
+    assert objects_are_equal(
+        per_class_counts(
+            y_true=np.array([1, 0, 0, 1, 1]),
+            y_pred=np.array([1, 0, 1, 1, 0]),
+            sample_weight=np.array([1.0, 1.0, 3.0, 0.0, 1.0]),
+        ),
+        (np.array([4.0, 2.0]), np.array([1.0, 1.0])),
+    )
+
+
+def test_per_class_counts_sample_weight_zero_weight_class() -> None:
+    assert objects_are_equal(
+        per_class_counts(
+            y_true=np.array([2, 0, 0]),
+            y_pred=np.array([2, 0, 1]),
+            sample_weight=np.array([0.0, 1.0, 3.0]),
+        ),
+        (np.array([4.0, 0.0]), np.array([1.0, 0.0])),
+    )
+
+
+def test_per_class_counts_empty() -> None:
+    assert objects_are_equal(
+        per_class_counts(y_true=np.array([]), y_pred=np.array([])),
+        (np.array([], dtype=np.int64), np.array([], dtype=np.int64)),
+    )
@@ -336,8 +336,36 @@ def test_confusion_matrix_label_type_incorrect() -> None:
 
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_confusion_matrix_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
-        confusion_matrix(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+    assert objects_are_equal(
+        confusion_matrix(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])),
+        {
+            "confusion_matrix": np.array([[2, 0], [0, 3]]),
+            "count": 5,
+            "false_negative_rate": 0.0,
+            "false_negative": 0,
+            "false_positive_rate": 0.0,
+            "false_positive": 0,
+            "true_negative_rate": 1.0,
+            "true_negative": 2,
+            "true_positive_rate": 1.0,
+            "true_positive": 3,
+        },
+    )
+
+
+def test_confusion_matrix_multiclass_num_classes() -> None:
+    assert objects_are_equal(
+        confusion_matrix(
+            y_true=np.array([0, 1, 1, 2, 2, 2]),
+            y_pred=np.array([0, 1, 1, 2, 2, 2]),
+            label_type="multiclass",
+            num_classes=4,
+        ),
+        {
+            "confusion_matrix": np.array([[1, 0, 0, 0], [0, 2, 0, 0], [0, 0, 3, 0], [0, 0, 0, 0]]),
+            "count": 6,
+        },
+    )
 
 
 #############################################
@@ -624,8 +652,45 @@ def test_binary_confusion_matrix_nan_raise_y_pred() -> None:
 
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_binary_confusion_matrix_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
-        binary_confusion_matrix(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+    assert objects_are_equal(
+        binary_confusion_matrix(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])),
+        {
+            "confusion_matrix": np.array([[2, 0], [0, 3]]),
+            "count": 5,
+            "false_negative_rate": 0.0,
+            "false_negative": 0,
+            "false_positive_rate": 0.0,
+            "false_positive": 0,
+            "true_negative_rate": 1.0,
+            "true_negative": 2,
+            "true_positive_rate": 1.0,
+            "true_positive": 3,
+        },
+    )
+
+
+def test_binary_confusion_matrix_only_positive() -> None:
+    assert objects_are_equal(
+        binary_confusion_matrix(y_true=np.array([1, 1, 1]), y_pred=np.array([1, 1, 1])),
+        {
+            "confusion_matrix": np.array([[0, 0], [0, 3]]),
+            "count": 3,
+            "false_negative_rate": 0.0,
+            "false_negative": 0,
+            "false_positive_rate": float("nan"),
+            "false_positive": 0,
+            "true_negative_rate": float("nan"),
+            "true_negative": 0,
+            "true_positive_rate": 1.0,
+            "true_positive": 3,
+        },
+        equal_nan=True,
+    )
+
+
+def test_binary_confusion_matrix_invalid_labels() -> None:
+    with pytest.raises(ValueError, match=r"'y_pred' must contain integer labels in \[0, 1\]"):
+        binary_confusion_matrix(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 2, 1, 1]))
 
 
 #################################################
@@ -672,6 +737,20 @@ def test_multiclass_confusion_matrix_incorrect() -> None:
     )
 
 
+@pytest.mark.parametrize("dtype", [np.uint32, np.uint64])
+def test_multiclass_confusion_matrix_unsigned(dtype: np.dtype) -> None:
+    assert objects_are_equal(
+        multiclass_confusion_matrix(
+            y_true=np.array([0, 1, 2, 0, 1, 2], dtype=dtype),
+            y_pred=np.array([0, 1, 1, 2, 2, 2], dtype=dtype),
+        ),
+        {
+            "confusion_matrix": np.array([[1, 0, 1], [0, 1, 1], [0, 1, 1]]),
+            "count": 6,
+        },
+    )
+
+
 @sklearn_available
 def test_multiclass_confusion_matrix_empty() -> None:
     assert objects_are_equal(
@@ -818,12 +897,58 @@ def test_multiclass_confusion_matrix_nan_raise_y_pred() -> None:
 
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_multiclass_confusion_matrix_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         multiclass_confusion_matrix(
             y_true=np.array([0, 1, 1, 2, 2, 2]), y_pred=np.array([0, 1, 1, 2, 2, 2])
+        ),
+        {"confusion_matrix": np.array([[1, 0, 0], [0, 2, 0], [0, 0, 3]]), "count": 6},
+    )
+
+
+def test_multiclass_confusion_matrix_num_classes() -> None:
+    assert objects_are_equal(
+        multiclass_confusion_matrix(
+            y_true=np.array([0, 1, 1, 3, 3, 3]),
+            y_pred=np.array([0, 1, 1, 3, 3, 1]),
+            num_classes=4,
+        ),
+        {
+            "confusion_matrix": np.array([[1, 0, 0, 0], [0, 2, 0, 0], [0, 0, 0, 0], [0, 1, 0, 2]]),
+            "count": 6,
+        },
+    )
+
+
+def test_multiclass_confusion_matrix_num_classes_nan_omit() -> None:
+    assert objects_are_equal(
+        multiclass_confusion_matrix(
+            y_true=np.array([0, 1, 1, 2, 2, 2, float("nan")]),
+            y_pred=np.array([0, 1, 1, 2, 2, 2, 1]),
+            nan_policy="omit",
+            num_classes=3,
+        ),
+        {"confusion_matrix": np.array([[1, 0, 0], [0, 2, 0], [0, 0, 3]]), "count": 6},
+    )
+
+
+def test_multiclass_confusion_matrix_num_classes_invalid_labels() -> None:
+    with pytest.raises(ValueError, match=r"'y_true' must contain integer labels in \[0, 1\]"):
+        multiclass_confusion_matrix(
+            y_true=np.array([0, 1, 1, 2, 2, 2]),
+            y_pred=np.array([0, 1, 1, 1, 1, 1]),
+            num_classes=2,
         )
 
 
+def test_multiclass_confusion_matrix_non_contiguous_labels() -> None:
+    assert objects_are_equal(
+        multiclass_confusion_matrix(
+            y_true=np.array([-1, 4, 4, 9, 9, 9]), y_pred=np.array([-1, 4, 4, 9, 9, 4])
+        ),
+        {"confusion_matrix": np.array([[1, 0, 0], [0, 2, 0], [0, 1, 2]]), "count": 6},
+    )
+
+
 #################################################
 #     Tests for multilabel_confusion_matrix     #
 #################################################
@@ -1044,8 +1169,15 @@ def test_multilabel_confusion_matrix_nan_raise_y_pred() -> None:
 
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_multilabel_confusion_matrix_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         multilabel_confusion_matrix(
             y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
             y_pred=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
-        )
+        ),
+        {
+            "confusion_matrix": np.array(
+                [[[2, 0], [0, 3]], [[3, 0], [0, 2]], [[2, 0], [0, 3]]], dtype=np.int64
+            ),
+            "count": 5,
+        },
+    )
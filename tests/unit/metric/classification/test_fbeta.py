@@ -852,11 +852,19 @@ def test_multiclass_fbeta_score_nan_raise_y_pred() -> None:
 
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_multiclass_fbeta_score_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         multiclass_fbeta_score(
             y_true=np.array([0, 0, 1, 1, 2, 2]),
             y_pred=np.array([0, 0, 1, 1, 2, 2]),
-        )
+        ),
+        {
+            "count": 6,
+            "f1": np.array([1.0, 1.0, 1.0]),
+            "macro_f1": 1.0,
+            "micro_f1": 1.0,
+            "weighted_f1": 1.0,
+        },
+    )
 
 
 ############################################
@@ -688,11 +688,19 @@ def test_multiclass_jaccard_nan_raise_y_pred() -> None:
 
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_multiclass_jaccard_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         multiclass_jaccard(
             y_true=np.array([0, 0, 1, 1, 2, 2]),
             y_pred=np.array([0, 0, 1, 1, 2, 2]),
-        )
+        ),
+        {
+            "count": 6,
+            "jaccard": np.array([1.0, 1.0, 1.0]),
+            "macro_jaccard": 1.0,
+            "micro_jaccard": 1.0,
+            "weighted_jaccard": 1.0,
+        },
+    )
 
 
 ########################################
@@ -8,14 +8,19 @@ from coola import objects_are_allclose
 
 from analora.metric import ndcg
 from analora.testing import scipy_available, sklearn_available
+from analora.utils.imports import is_scipy_available, is_sklearn_available
+
+if is_scipy_available():
+    from scipy import sparse
+
+if is_sklearn_available():
+    from sklearn.metrics import ndcg_score
 
 ##########################
 #     Tests for ndcg     #
 ##########################
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_correct() -> None:
     assert objects_are_allclose(
         ndcg(
@@ -26,8 +31,6 @@ def test_ndcg_correct() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_different() -> None:
     assert objects_are_allclose(
         ndcg(
@@ -38,8 +41,6 @@ def test_ndcg_different() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_empty() -> None:
     assert objects_are_allclose(
         ndcg(y_true=np.ones((0, 0)), y_score=np.ones((0, 0))),
@@ -48,8 +49,6 @@ def test_ndcg_empty() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_prefix_suffix() -> None:
     assert objects_are_allclose(
         ndcg(
@@ -62,8 +61,6 @@ def test_ndcg_prefix_suffix() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_nan_omit() -> None:
     assert objects_are_allclose(
         ndcg(
@@ -77,8 +74,6 @@ def test_ndcg_nan_omit() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_omit_y_true() -> None:
     assert objects_are_allclose(
         ndcg(
@@ -90,8 +85,6 @@ def test_ndcg_omit_y_true() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_omit_y_score() -> None:
     assert objects_are_allclose(
         ndcg(
@@ -105,8 +98,6 @@ def test_ndcg_omit_y_score() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_nan_propagate() -> None:
     assert objects_are_allclose(
         ndcg(
@@ -120,8 +111,6 @@ def test_ndcg_nan_propagate() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_nan_propagate_y_true() -> None:
     assert objects_are_allclose(
         ndcg(
@@ -133,8 +122,6 @@ def test_ndcg_nan_propagate_y_true() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_nan_propagate_y_score() -> None:
     assert objects_are_allclose(
         ndcg(
@@ -148,8 +135,6 @@ def test_ndcg_nan_propagate_y_score() -> None:
     )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_nan_raise() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         ndcg(
@@ -161,8 +146,6 @@ def test_ndcg_nan_raise() -> None:
         )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_nan_raise_y_true() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         ndcg(
@@ -172,8 +155,6 @@ def test_ndcg_nan_raise_y_true() -> None:
         )
 
 
-@sklearn_available
-@scipy_available
 def test_ndcg_nan_raise_y_score() -> None:
     with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
         ndcg(
@@ -185,10 +166,166 @@ def test_ndcg_nan_raise_y_score() -> None:
         )
 
 
+def test_ndcg_k() -> None:
+    assert objects_are_allclose(
+        ndcg(
+            y_true=np.array([[10, 0, 0, 1, 5], [10, 0, 0, 1, 5]]),
+            y_score=np.array([[0.1, 0.2, 0.3, 4, 70], [0.05, 1.1, 1.0, 0.5, 0.0]]),
+            k=2,
+        ),
+        {"count": 2, "ndcg": 0.2140281300147803},
+    )
+
+
+def test_ndcg_ties() -> None:
+    assert objects_are_allclose(
+        ndcg(
+            y_true=np.array([[10, 0, 0, 1, 5], [10, 0, 0, 1, 5]]),
+            y_score=np.array([[1, 0, 0, 1, 1], [0, 1, 1, 1, 0]]),
+            k=2,
+        ),
+        {"count": 2, "ndcg": 0.3512801988609705},
+    )
+
+
+def test_ndcg_all_irrelevant() -> None:
+    assert objects_are_allclose(
+        ndcg(
+            y_true=np.array([[1, 0, 0], [0, 0, 0]]),
+            y_score=np.array([[2.0, 1.0, 0.0], [0.0, 1.0, -1.0]]),
+        ),
+        {"count": 2, "ndcg": 0.5},
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100, None])
+def test_ndcg_chunk_size(chunk_size: int | None) -> None:
+    assert objects_are_allclose(
+        ndcg(
+            y_true=np.array([[10, 0, 0, 1, 5], [10, 0, 0, 1, 5], [1, 2, 3, 4, 5]]),
+            y_score=np.array([[0.1, 0.2, 0.3, 4, 70], [0.05, 1.1, 1.0, 0.5, 0.0], [5, 4, 3, 2, 1]]),
+            chunk_size=chunk_size,
+        ),
+        {"count": 3, "ndcg": 0.6372058715795463},
+    )
+
+
+@pytest.mark.parametrize("k", [0, -1])
+def test_ndcg_incorrect_k(k: int) -> None:
+    with pytest.raises(ValueError, match="Incorrect k:"):
+        ndcg(
+            y_true=np.array([[1, 0, 0], [1, 2, 0]]),
+            y_score=np.array([[2.0, 1.0, 0.0], [0.0, 1.0, -1.0]]),
+            k=k,
+        )
+
+
+def test_ndcg_negative_y_true() -> None:
+    with pytest.raises(ValueError, match="ndcg_score should not be used on negative y_true values"):
+        ndcg(
+            y_true=np.array([[1, 0, -1], [1, 2, 0]]),
+            y_score=np.array([[2.0, 1.0, 0.0], [0.0, 1.0, -1.0]]),
+        )
+
+
+def test_ndcg_one_label() -> None:
+    with pytest.raises(ValueError, match="Computing NDCG is only meaningful when there is more"):
+        ndcg(y_true=np.array([[1], [0]]), y_score=np.array([[2.0], [0.0]]))
+
+
+@scipy_available
+@pytest.mark.parametrize("k", [None, 1, 2, 5])
+def test_ndcg_sparse(k: int | None) -> None:
+    y_true = np.array([[10, 0, 0, 1, 5], [10, 0, 0, 1, 5], [0, 0, 0, 0, 0], [0, 3, 0, 0, 0]])
+    y_score = np.array([[0.1, 0.2, 0.3, 4, 70], [1, 0, 0, 1, 1], [5, 4, 3, 2, 1], [1, 2, 2, 0, 0]])
+    assert objects_are_allclose(
+        ndcg(y_true=sparse.csr_array(y_true), y_score=y_score, k=k, chunk_size=3),
+        ndcg(y_true=y_true, y_score=y_score, k=k),
+    )
+
+
+@scipy_available
+def test_ndcg_sparse_coo() -> None:
+    assert objects_are_allclose(
+        ndcg(
+            y_true=sparse.coo_matrix(np.array([[10, 0, 0, 1, 5], [10, 0, 0, 1, 5]])),
+            y_score=np.array([[0.1, 0.2, 0.3, 4, 70], [0.05, 1.1, 1.0, 0.5, 0.0]]),
+        ),
+        {"count": 2, "ndcg": 0.5946871178793418},
+    )
+
+
+@scipy_available
+def test_ndcg_sparse_nan_omit() -> None:
+    assert objects_are_allclose(
+        ndcg(
+            y_true=sparse.csr_array(
+                np.array([[1, 0, 0], [1, 2, float("nan")], [1, 1, 2], [0, 0, 1]])
+            ),
+            y_score=np.array(
+                [[2.0, 1.0, 0.0], [0.0, 1.0, -1.0], [0.0, float("nan"), 1.0], [1.0, 2.0, 3.0]]
+            ),
+            nan_policy="omit",
+        ),
+        {"count": 2, "ndcg": 1.0},
+    )
+
+
+@scipy_available
+def test_ndcg_sparse_nan_propagate() -> None:
+    assert objects_are_allclose(
+        ndcg(
+            y_true=sparse.csr_array(
+                np.array([[1, 0, 0], [1, 2, float("nan")], [1, 1, 2], [0, 0, 1]])
+            ),
+            y_score=np.array([[2.0, 1.0, 0.0], [0.0, 1.0, -1.0], [0.0, 0.0, 1.0], [1.0, 2.0, 3.0]]),
+        ),
+        {"count": 4, "ndcg": float("nan")},
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_ndcg_sparse_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        ndcg(
+            y_true=sparse.csr_array(
+                np.array([[1, 0, 0], [1, 2, float("nan")], [1, 1, 2], [0, 0, 1]])
+            ),
+            y_score=np.array([[2.0, 1.0, 0.0], [0.0, 1.0, -1.0], [0.0, 0.0, 1.0], [1.0, 2.0, 3.0]]),
+            nan_policy="raise",
+        )
+
+
+@scipy_available
+def test_ndcg_sparse_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_score' have different shapes"):
+        ndcg(
+            y_true=sparse.csr_array(np.array([[1, 0, 0], [1, 2, 0]])),
+            y_score=np.array([[2.0, 1.0, 0.0, 1.0], [0.0, 1.0, -1.0, 1.0]]),
+        )
+
+
+@sklearn_available
+@scipy_available
+@pytest.mark.parametrize("k", [None, 1, 3, 10])
+def test_ndcg_same_as_sklearn(k: int | None) -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 4, size=(200, 20)) * (rng.random((200, 20)) < 0.3)
+    y_score = rng.integers(0, 5, size=(200, 20)).astype(float)
+    expected = {"count": 200, "ndcg": float(ndcg_score(y_true=y_true, y_score=y_score, k=k))}
+    assert objects_are_allclose(ndcg(y_true=y_true, y_score=y_score, k=k, chunk_size=16), expected)
+    assert objects_are_allclose(
+        ndcg(y_true=sparse.csr_array(y_true), y_score=y_score, k=k, chunk_size=16), expected
+    )
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_ndcg_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_allclose(
         ndcg(
             y_true=np.array([[1, 0, 0], [1, 2, 0], [1, 1, 2], [0, 0, 1]]),
             y_score=np.array([[2.0, 1.0, 0.0], [0.0, 1.0, -1.0], [0.0, 0.0, 1.0], [1.0, 2.0, 3.0]]),
-        )
+        ),
+        {"count": 4, "ndcg": 1.0},
+    )
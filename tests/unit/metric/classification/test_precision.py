@@ -729,11 +729,19 @@ def test_multiclass_precision_nan_raise_y_pred() -> None:
 
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_multiclass_precision_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         multiclass_precision(
             y_true=np.array([0, 0, 1, 1, 2, 2]),
             y_pred=np.array([0, 0, 1, 1, 2, 2]),
-        )
+        ),
+        {
+            "count": 6,
+            "macro_precision": 1.0,
+            "micro_precision": 1.0,
+            "precision": np.array([1.0, 1.0, 1.0]),
+            "weighted_precision": 1.0,
+        },
+    )
 
 
 ##########################################
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.metric import RankedScores
+from analora.testing import sklearn_available
+from analora.utils.imports import is_sklearn_available
+
+if is_sklearn_available():
+    from sklearn import metrics
+
+
+@pytest.fixture
+def ranked() -> RankedScores:
+    return RankedScores(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]))
+
+
+@pytest.fixture
+def random_scores() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(42)
+    return rng.integers(0, 2, size=1000), rng.integers(0, 20, size=1000).astype(float)
+
+
+##################################
+#     Tests for RankedScores     #
+##################################
+
+
+def test_ranked_scores_repr(ranked: RankedScores) -> None:
+    assert repr(ranked) == (
+        "RankedScores(count=5, num_positives=3, num_negatives=2, num_thresholds=5)"
+    )
+
+
+def test_ranked_scores_count(ranked: RankedScores) -> None:
+    assert ranked.count == 5
+
+
+def test_ranked_scores_num_positives(ranked: RankedScores) -> None:
+    assert ranked.num_positives == 3
+
+
+def test_ranked_scores_num_negatives(ranked: RankedScores) -> None:
+    assert ranked.num_negatives == 2
+
+
+def test_ranked_scores_thresholds(ranked: RankedScores) -> None:
+    assert objects_are_equal(ranked.thresholds, np.array([3, 2, 1, 0, -1]))
+
+
+def test_ranked_scores_true_positives(ranked: RankedScores) -> None:
+    assert objects_are_equal(ranked.true_positives, np.array([1, 2, 3, 3, 3]))
+
+
+def test_ranked_scores_false_positives(ranked: RankedScores) -> None:
+    assert objects_are_equal(ranked.false_positives, np.array([0, 0, 0, 1, 2]))
+
+
+def test_ranked_scores_ties() -> None:
+    ranked = RankedScores(
+        y_true=np.array([1, 0, 1, 0, 1, 0]), y_score=np.array([0.5, 0.5, 0.9, 0.1, 0.1, 0.1])
+    )
+    assert objects_are_equal(ranked.thresholds, np.array([0.9, 0.5, 0.1]))
+    assert objects_are_equal(ranked.true_positives, np.array([1, 2, 3]))
+    assert objects_are_equal(ranked.false_positives, np.array([0, 1, 3]))
+
+
+def test_ranked_scores_bool() -> None:
+    ranked = RankedScores(
+        y_true=np.array([True, False, False, True, True]), y_score=np.array([2, -1, 0, 3, 1])
+    )
+    assert objects_are_equal(ranked.true_positives, np.array([1, 2, 3, 3, 3]))
+
+
+def test_ranked_scores_2d() -> None:
+    ranked = RankedScores(
+        y_true=np.array([[1, 0, 0], [1, 1, 0]]), y_score=np.array([[2, -1, 0], [3, 1, -2]])
+    )
+    assert ranked.count == 6
+    assert ranked.roc_auc() == 1.0
+
+
+def test_ranked_scores_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_score' have different shapes:"):
+        RankedScores(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1, 6]))
+
+
+def test_ranked_scores_empty() -> None:
+    ranked = RankedScores(y_true=np.array([]), y_score=np.array([]))
+    assert ranked.count == 0
+    assert ranked.num_positives == 0
+    assert ranked.num_negatives == 0
+    assert objects_are_equal(ranked.thresholds, np.array([]))
+
+
+def test_ranked_scores_roc_curve(ranked: RankedScores) -> None:
+    assert objects_are_allclose(
+        ranked.roc_curve(),
+        (
+            np.array([0.0, 0.0, 0.0, 1.0]),
+            np.array([0.0, 1.0 / 3.0, 1.0, 1.0]),
+            np.array([np.inf, 3.0, 1.0, -1.0]),
+        ),
+    )
+
+
+def test_ranked_scores_roc_curve_keep_intermediate(ranked: RankedScores) -> None:
+    assert objects_are_allclose(
+        ranked.roc_curve(drop_intermediate=False),
+        (
+            np.array([0.0, 0.0, 0.0, 0.0, 0.5, 1.0]),
+            np.array([0.0, 1.0 / 3.0, 2.0 / 3.0, 1.0, 1.0, 1.0]),
+            np.array([np.inf, 3.0, 2.0, 1.0, 0.0, -1.0]),
+        ),
+    )
+
+
+def test_ranked_scores_roc_curve_only_one_class() -> None:
+    fpr, tpr, _ = RankedScores(y_true=np.array([1, 1, 1]), y_score=np.array([2, -1, 0])).roc_curve(
+        drop_intermediate=False
+    )
+    assert np.isnan(fpr).all()
+    assert objects_are_equal(tpr, np.array([0.0, 1.0 / 3.0, 2.0 / 3.0, 1.0]))
+
+
+def test_ranked_scores_precision_recall_curve(ranked: RankedScores) -> None:
+    assert objects_are_allclose(
+        ranked.precision_recall_curve(),
+        (
+            np.array([0.6, 0.75, 1.0, 1.0, 1.0, 1.0]),
+            np.array([1.0, 1.0, 1.0, 2.0 / 3.0, 1.0 / 3.0, 0.0]),
+            np.array([-1, 0, 1, 2, 3]),
+        ),
+    )
+
+
+def test_ranked_scores_precision_recall_curve_drop_intermediate(ranked: RankedScores) -> None:
+    assert objects_are_allclose(
+        ranked.precision_recall_curve(drop_intermediate=True),
+        (
+            np.array([0.6, 1.0, 1.0, 1.0, 1.0]),
+            np.array([1.0, 1.0, 2.0 / 3.0, 1.0 / 3.0, 0.0]),
+            np.array([-1, 1, 2, 3]),
+        ),
+    )
+
+
+def test_ranked_scores_precision_recall_curve_no_positive() -> None:
+    assert objects_are_allclose(
+        RankedScores(
+            y_true=np.array([0, 0, 0]), y_score=np.array([2, -1, 0])
+        ).precision_recall_curve(),
+        (
+            np.array([0.0, 0.0, 0.0, 1.0]),
+            np.array([1.0, 1.0, 1.0, 0.0]),
+            np.array([-1, 0, 2]),
+        ),
+    )
+
+
+def test_ranked_scores_roc_auc(ranked: RankedScores) -> None:
+    assert ranked.roc_auc() == 1.0
+
+
+def test_ranked_scores_roc_auc_incorrect() -> None:
+    assert (
+        RankedScores(y_true=np.array([1, 0, 0, 1]), y_score=np.array([-1, 1, 0, -2])).roc_auc()
+        == 0.0
+    )
+
+
+def test_ranked_scores_roc_auc_ties() -> None:
+    assert (
+        RankedScores(y_true=np.array([1, 0, 1, 0]), y_score=np.array([1, 1, 1, 1])).roc_auc() == 0.5
+    )
+
+
+def test_ranked_scores_roc_auc_only_one_class() -> None:
+    assert np.isnan(
+        RankedScores(y_true=np.array([1, 1, 1]), y_score=np.array([2, -1, 0])).roc_auc()
+    )
+
+
+def test_ranked_scores_roc_auc_empty() -> None:
+    assert np.isnan(RankedScores(y_true=np.array([]), y_score=np.array([])).roc_auc())
+
+
+def test_ranked_scores_average_precision(ranked: RankedScores) -> None:
+    assert ranked.average_precision() == 1.0
+
+
+def test_ranked_scores_average_precision_incorrect() -> None:
+    assert objects_are_allclose(
+        RankedScores(
+            y_true=np.array([1, 0, 0, 1]), y_score=np.array([-1, 1, 0, -2])
+        ).average_precision(),
+        0.4166666666666667,
+    )
+
+
+def test_ranked_scores_average_precision_no_positive() -> None:
+    assert (
+        RankedScores(y_true=np.array([0, 0, 0]), y_score=np.array([2, -1, 0])).average_precision()
+        == 0.0
+    )
+
+
+def test_ranked_scores_average_precision_empty() -> None:
+    assert np.isnan(RankedScores(y_true=np.array([]), y_score=np.array([])).average_precision())
+
+
+@sklearn_available
+@pytest.mark.parametrize("drop_intermediate", [True, False])
+def test_ranked_scores_roc_curve_same_as_sklearn(
+    random_scores: tuple[np.ndarray, np.ndarray], drop_intermediate: bool
+) -> None:
+    y_true, y_score = random_scores
+    assert objects_are_allclose(
+        RankedScores(y_true=y_true, y_score=y_score).roc_curve(drop_intermediate=drop_intermediate),
+        metrics.roc_curve(y_true, y_score, drop_intermediate=drop_intermediate),
+    )
+
+
+@sklearn_available
+@pytest.mark.parametrize("drop_intermediate", [True, False])
+def test_ranked_scores_precision_recall_curve_same_as_sklearn(
+    random_scores: tuple[np.ndarray, np.ndarray], drop_intermediate: bool
+) -> None:
+    y_true, y_score = random_scores
+    assert objects_are_allclose(
+        RankedScores(y_true=y_true, y_score=y_score).precision_recall_curve(
+            drop_intermediate=drop_intermediate
+        ),
+        metrics.precision_recall_curve(y_true, y_score, drop_intermediate=drop_intermediate),
+    )
+
+
+@sklearn_available
+def test_ranked_scores_roc_auc_same_as_sklearn(
+    random_scores: tuple[np.ndarray, np.ndarray],
+) -> None:
+    y_true, y_score = random_scores
+    assert objects_are_allclose(
+        RankedScores(y_true=y_true, y_score=y_score).roc_auc(),
+        metrics.roc_auc_score(y_true, y_score),
+    )
+
+
+@sklearn_available
+def test_ranked_scores_average_precision_same_as_sklearn(
+    random_scores: tuple[np.ndarray, np.ndarray],
+) -> None:
+    y_true, y_score = random_scores
+    assert objects_are_allclose(
+        RankedScores(y_true=y_true, y_score=y_score).average_precision(),
+        metrics.average_precision_score(y_true, y_score),
+    )
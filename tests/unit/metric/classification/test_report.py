@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.metric import (
+    classification_report,
+    multiclass_fbeta_score,
+    multiclass_jaccard,
+    multiclass_precision,
+    multiclass_recall,
+)
+from analora.testing import sklearn_available
+
+###########################################
+#     Tests for classification_report     #
+###########################################
+
+
+def test_classification_report_correct() -> None:
+    assert objects_are_equal(
+        classification_report(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 2, 2])
+        ),
+        {
+            "count": 6,
+            "macro_precision": 1.0,
+            "micro_precision": 1.0,
+            "precision": np.array([1.0, 1.0, 1.0]),
+            "weighted_precision": 1.0,
+            "macro_recall": 1.0,
+            "micro_recall": 1.0,
+            "recall": np.array([1.0, 1.0, 1.0]),
+            "weighted_recall": 1.0,
+            "f1": np.array([1.0, 1.0, 1.0]),
+            "macro_f1": 1.0,
+            "micro_f1": 1.0,
+            "weighted_f1": 1.0,
+            "jaccard": np.array([1.0, 1.0, 1.0]),
+            "macro_jaccard": 1.0,
+            "micro_jaccard": 1.0,
+            "weighted_jaccard": 1.0,
+        },
+    )
+
+
+def test_classification_report_incorrect() -> None:
+    assert objects_are_allclose(
+        classification_report(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 1, 1])
+        ),
+        {
+            "count": 6,
+            "macro_precision": 0.5,
+            "micro_precision": 0.6666666666666666,
+            "precision": np.array([1.0, 0.5, 0.0]),
+            "weighted_precision": 0.5,
+            "macro_recall": 0.6666666666666666,
+            "micro_recall": 0.6666666666666666,
+            "recall": np.array([1.0, 1.0, 0.0]),
+            "weighted_recall": 0.6666666666666666,
+            "f1": np.array([1.0, 0.6666666666666666, 0.0]),
+            "macro_f1": 0.5555555555555555,
+            "micro_f1": 0.6666666666666666,
+            "weighted_f1": 0.5555555555555555,
+            "jaccard": np.array([1.0, 0.5, 0.0]),
+            "macro_jaccard": 0.5,
+            "micro_jaccard": 0.5,
+            "weighted_jaccard": 0.5,
+        },
+    )
+
+
+@sklearn_available
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate"])
+def test_classification_report_same_as_metrics(nan_policy: str) -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 5, size=100).astype(float)
+    y_pred = rng.integers(0, 5, size=100).astype(float)
+    y_pred[3] = float("nan")
+    assert objects_are_allclose(
+        classification_report(y_true=y_true, y_pred=y_pred, betas=(0.5, 1), nan_policy=nan_policy),
+        multiclass_precision(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | multiclass_recall(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | multiclass_fbeta_score(
+            y_true=y_true, y_pred=y_pred, betas=(0.5, 1), nan_policy=nan_policy
+        )
+        | multiclass_jaccard(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy),
+        equal_nan=True,
+    )
+
+
+def test_classification_report_num_classes() -> None:
+    out = classification_report(
+        y_true=np.array([0, 0, 1, 1]), y_pred=np.array([0, 0, 1, 1]), num_classes=3
+    )
+    assert objects_are_equal(out["precision"], np.array([1.0, 1.0, 0.0]))
+    assert objects_are_equal(out["recall"], np.array([1.0, 1.0, 0.0]))
+    assert out["weighted_f1"] == 1.0
+
+
+def test_classification_report_empty() -> None:
+    assert objects_are_equal(
+        classification_report(y_true=np.array([]), y_pred=np.array([])),
+        {
+            "count": 0,
+            "macro_precision": float("nan"),
+            "micro_precision": float("nan"),
+            "precision": np.array([]),
+            "weighted_precision": float("nan"),
+            "macro_recall": float("nan"),
+            "micro_recall": float("nan"),
+            "recall": np.array([]),
+            "weighted_recall": float("nan"),
+            "f1": np.array([]),
+            "macro_f1": float("nan"),
+            "micro_f1": float("nan"),
+            "weighted_f1": float("nan"),
+            "jaccard": np.array([]),
+            "macro_jaccard": float("nan"),
+            "micro_jaccard": float("nan"),
+            "weighted_jaccard": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_classification_report_prefix_suffix() -> None:
+    out = classification_report(
+        y_true=np.array([0, 0, 1, 1, 2, 2]),
+        y_pred=np.array([0, 0, 1, 1, 2, 2]),
+        prefix="prefix_",
+        suffix="_suffix",
+    )
+    assert len(out) == 17
+    assert all(key.startswith("prefix_") and key.endswith("_suffix") for key in out)
+
+
+def test_classification_report_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        classification_report(
+            y_true=np.array([0, 0, 1, 1, 2, float("nan")]),
+            y_pred=np.array([0, 0, 1, 1, 2, 2]),
+            nan_policy="raise",
+        )
@@ -387,7 +387,10 @@ def test_roc_auc_label_type_incorrect() -> None:
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_roc_auc_no_sklearn() -> None:
     with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
-        roc_auc(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]))
+        roc_auc(
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+            y_score=np.array([[2, -1, -1], [-1, 1, 2], [0, 2, 3], [3, -2, -4], [1, -3, -5]]),
+        )
 
 
 ####################################
@@ -561,13 +564,23 @@ def test_binary_roc_auc_nan_raise_y_score() -> None:
         )
 
 
+def test_binary_roc_auc_only_one_class() -> None:
+    assert objects_are_equal(
+        binary_roc_auc(y_true=np.array([1, 1, 1]), y_score=np.array([2, -1, 0])),
+        {"count": 3, "roc_auc": float("nan")},
+        equal_nan=True,
+    )
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_binary_roc_auc_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         binary_roc_auc(
             y_true=np.array([1, 0, 0, 1, 1]),
             y_score=np.array([2, -1, 0, 3, 1]),
-        )
+        ),
+        {"count": 5, "roc_auc": 1.0},
+    )
 
 
 ########################################
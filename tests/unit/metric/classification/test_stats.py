@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.metric.classification.stats import (
+    binary_confmat,
+    compute_multiclass_confmat,
+    multiclass_confmat,
+    multiclass_fbeta_from_confmat,
+    multiclass_jaccard_from_confmat,
+    multiclass_precision_from_confmat,
+    multiclass_recall_from_confmat,
+    multilabel_confmat,
+)
+
+CONFMAT = np.array([[2, 0, 0], [0, 2, 0], [0, 2, 0]])
+EMPTY = np.zeros((0, 0), dtype=np.int64)
+
+####################################
+#     Tests for binary_confmat     #
+####################################
+
+
+def test_binary_confmat() -> None:
+    assert objects_are_equal(
+        binary_confmat(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 1, 0])),
+        np.array([[1, 1], [1, 2]]),
+    )
+
+
+def test_binary_confmat_bool() -> None:
+    assert objects_are_equal(
+        binary_confmat(
+            y_true=np.array([True, False, False, True, True]),
+            y_pred=np.array([True, False, True, True, False]),
+        ),
+        np.array([[1, 1], [1, 2]]),
+    )
+
+
+def test_binary_confmat_float() -> None:
+    assert objects_are_equal(
+        binary_confmat(
+            y_true=np.array([1.0, 0.0, 0.0, 1.0, 1.0]), y_pred=np.array([1.0, 0.0, 1.0, 1.0, 0.0])
+        ),
+        np.array([[1, 1], [1, 2]]),
+    )
+
+
+def test_binary_confmat_only_one_label() -> None:
+    assert objects_are_equal(
+        binary_confmat(y_true=np.array([1, 1, 1]), y_pred=np.array([1, 1, 1])),
+        np.array([[0, 0], [0, 3]]),
+    )
+
+
+def test_binary_confmat_empty() -> None:
+    assert objects_are_equal(
+        binary_confmat(y_true=np.array([]), y_pred=np.array([])),
+        np.zeros((2, 2), dtype=np.int64),
+    )
+
+
+def test_binary_confmat_invalid_labels() -> None:
+    with pytest.raises(ValueError, match=r"'y_true' must contain integer labels in \[0, 1\]"):
+        binary_confmat(y_true=np.array([1, 0, 2]), y_pred=np.array([1, 0, 1]))
+
+
+########################################
+#     Tests for multiclass_confmat     #
+########################################
+
+
+def test_multiclass_confmat() -> None:
+    assert objects_are_equal(
+        multiclass_confmat(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 1, 1])
+        ),
+        CONFMAT,
+    )
+
+
+def test_multiclass_confmat_label_only_in_y_pred() -> None:
+    assert objects_are_equal(
+        multiclass_confmat(y_true=np.array([0, 0, 1]), y_pred=np.array([0, 2, 1])),
+        np.array([[1, 0, 1], [0, 1, 0], [0, 0, 0]]),
+    )
+
+
+def test_multiclass_confmat_non_contiguous_labels() -> None:
+    assert objects_are_equal(
+        multiclass_confmat(y_true=np.array([-1, 5, 5, 10]), y_pred=np.array([-1, 5, 10, 10])),
+        np.array([[1, 0, 0], [0, 1, 1], [0, 0, 1]]),
+    )
+
+
+def test_multiclass_confmat_float() -> None:
+    assert objects_are_equal(
+        multiclass_confmat(
+            y_true=np.array([0.0, 0.0, 1.0, 1.0, 2.0, 2.0]),
+            y_pred=np.array([0.0, 0.0, 1.0, 1.0, 1.0, 1.0]),
+        ),
+        CONFMAT,
+    )
+
+
+def test_multiclass_confmat_non_integer_float() -> None:
+    assert objects_are_equal(
+        multiclass_confmat(y_true=np.array([0.5, 1.5, 1.5]), y_pred=np.array([0.5, 0.5, 2.5])),
+        np.array([[1, 0, 0], [1, 0, 1], [0, 0, 0]]),
+    )
+
+
+def test_multiclass_confmat_str() -> None:
+    assert objects_are_equal(
+        multiclass_confmat(y_true=np.array(["a", "b", "b"]), y_pred=np.array(["a", "a", "b"])),
+        np.array([[1, 0], [1, 1]]),
+    )
+
+
+def test_multiclass_confmat_large_label_range() -> None:
+    assert objects_are_equal(
+        multiclass_confmat(y_true=np.array([0, 10**9, 10**9]), y_pred=np.array([0, 0, 10**9])),
+        np.array([[1, 0], [1, 1]]),
+    )
+
+
+def test_multiclass_confmat_num_classes() -> None:
+    assert objects_are_equal(
+        multiclass_confmat(
+            y_true=np.array([0, 0, 1, 1, 2, 2]),
+            y_pred=np.array([0, 0, 1, 1, 1, 1]),
+            num_classes=4,
+        ),
+        np.array([[2, 0, 0, 0], [0, 2, 0, 0], [0, 2, 0, 0], [0, 0, 0, 0]]),
+    )
+
+
+def test_multiclass_confmat_num_classes_empty() -> None:
+    assert objects_are_equal(
+        multiclass_confmat(y_true=np.array([]), y_pred=np.array([]), num_classes=2),
+        np.zeros((2, 2), dtype=np.int64),
+    )
+
+
+@pytest.mark.parametrize(
+    "y_true", [np.array([0, 1, 3]), np.array([0, 1, -1]), np.array([0, 1, 0.5])]
+)
+def test_multiclass_confmat_num_classes_invalid_labels(y_true: np.ndarray) -> None:
+    with pytest.raises(ValueError, match=r"'y_true' must contain integer labels in \[0, 2\]"):
+        multiclass_confmat(y_true=y_true, y_pred=np.array([0, 1, 1]), num_classes=3)
+
+
+########################################
+#     Tests for multilabel_confmat     #
+########################################
+
+
+def test_multilabel_confmat() -> None:
+    assert objects_are_equal(
+        multilabel_confmat(
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+            y_pred=np.array([[1, 0, 0], [0, 1, 1], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+        ),
+        np.array([[[2, 0], [0, 3]], [[3, 0], [0, 2]], [[1, 1], [1, 2]]]),
+    )
+
+
+def test_multilabel_confmat_1_class() -> None:
+    assert objects_are_equal(
+        multilabel_confmat(
+            y_true=np.array([[1], [0], [0], [1], [1]]), y_pred=np.array([[1], [1], [0], [1], [0]])
+        ),
+        np.array([[[1, 1], [1, 2]]]),
+    )
+
+
+def test_multilabel_confmat_many_samples() -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 2, size=(1001, 4))
+    y_pred = rng.integers(0, 2, size=(1001, 4))
+    expected = np.stack(
+        [
+            np.array(
+                [
+                    [np.sum((y_true[:, i] == t) & (y_pred[:, i] == p)) for p in (0, 1)]
+                    for t in (0, 1)
+                ]
+            )
+            for i in range(4)
+        ]
+    )
+    assert objects_are_equal(multilabel_confmat(y_true=y_true, y_pred=y_pred), expected)
+
+
+################################################
+#     Tests for compute_multiclass_confmat     #
+################################################
+
+
+def test_compute_multiclass_confmat() -> None:
+    assert objects_are_equal(
+        compute_multiclass_confmat(
+            y_true=np.array([[0, 0, 1], [1, 2, 2]]), y_pred=np.array([[0, 0, 1], [1, 1, 1]])
+        ),
+        (6, CONFMAT),
+    )
+
+
+def test_compute_multiclass_confmat_num_classes() -> None:
+    assert objects_are_equal(
+        compute_multiclass_confmat(
+            y_true=np.array([0, 1, 1]), y_pred=np.array([0, 1, 0]), num_classes=3
+        ),
+        (3, np.array([[1, 0, 0], [1, 1, 0], [0, 0, 0]])),
+    )
+
+
+def test_compute_multiclass_confmat_empty() -> None:
+    assert objects_are_equal(
+        compute_multiclass_confmat(y_true=np.array([]), y_pred=np.array([])), (0, EMPTY)
+    )
+
+
+def test_compute_multiclass_confmat_nan_omit() -> None:
+    assert objects_are_equal(
+        compute_multiclass_confmat(
+            y_true=np.array([0, 0, 1, 1, 2, 2, float("nan")]),
+            y_pred=np.array([0, 0, 1, 1, 1, 1, 1]),
+            nan_policy="omit",
+        ),
+        (6, CONFMAT),
+    )
+
+
+def test_compute_multiclass_confmat_nan_propagate() -> None:
+    assert objects_are_equal(
+        compute_multiclass_confmat(
+            y_true=np.array([0, 0, 1, 1, 2, 2, float("nan")]),
+            y_pred=np.array([0, 0, 1, 1, 1, 1, 1]),
+        ),
+        (7, EMPTY),
+    )
+
+
+def test_compute_multiclass_confmat_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_pred' contains at least one NaN value"):
+        compute_multiclass_confmat(
+            y_true=np.array([0, 0, 1, 1, 2, 2]),
+            y_pred=np.array([0, 0, 1, 1, 1, float("nan")]),
+            nan_policy="raise",
+        )
+
+
+#######################################################
+#     Tests for multiclass_precision_from_confmat     #
+#######################################################
+
+
+def test_multiclass_precision_from_confmat() -> None:
+    assert objects_are_allclose(
+        multiclass_precision_from_confmat(CONFMAT),
+        {
+            "macro_precision": 0.5,
+            "micro_precision": 0.6666666666666666,
+            "precision": np.array([1.0, 0.5, 0.0]),
+            "weighted_precision": 0.5,
+        },
+    )
+
+
+def test_multiclass_precision_from_confmat_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        multiclass_precision_from_confmat(CONFMAT, prefix="prefix_", suffix="_suffix"),
+        {
+            "prefix_macro_precision_suffix": 0.5,
+            "prefix_micro_precision_suffix": 0.6666666666666666,
+            "prefix_precision_suffix": np.array([1.0, 0.5, 0.0]),
+            "prefix_weighted_precision_suffix": 0.5,
+        },
+    )
+
+
+def test_multiclass_precision_from_confmat_empty() -> None:
+    assert objects_are_equal(
+        multiclass_precision_from_confmat(EMPTY),
+        {
+            "macro_precision": float("nan"),
+            "micro_precision": float("nan"),
+            "precision": np.array([]),
+            "weighted_precision": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+####################################################
+#     Tests for multiclass_recall_from_confmat     #
+####################################################
+
+
+def test_multiclass_recall_from_confmat() -> None:
+    assert objects_are_allclose(
+        multiclass_recall_from_confmat(CONFMAT),
+        {
+            "macro_recall": 0.6666666666666666,
+            "micro_recall": 0.6666666666666666,
+            "recall": np.array([1.0, 1.0, 0.0]),
+            "weighted_recall": 0.6666666666666666,
+        },
+    )
+
+
+def test_multiclass_recall_from_confmat_empty() -> None:
+    assert objects_are_equal(
+        multiclass_recall_from_confmat(EMPTY),
+        {
+            "macro_recall": float("nan"),
+            "micro_recall": float("nan"),
+            "recall": np.array([]),
+            "weighted_recall": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+###################################################
+#     Tests for multiclass_fbeta_from_confmat     #
+###################################################
+
+
+def test_multiclass_fbeta_from_confmat() -> None:
+    assert objects_are_allclose(
+        multiclass_fbeta_from_confmat(CONFMAT),
+        {
+            "f1": np.array([1.0, 0.6666666666666666, 0.0]),
+            "macro_f1": 0.5555555555555555,
+            "micro_f1": 0.6666666666666666,
+            "weighted_f1": 0.5555555555555555,
+        },
+    )
+
+
+def test_multiclass_fbeta_from_confmat_betas() -> None:
+    assert objects_are_allclose(
+        multiclass_fbeta_from_confmat(CONFMAT, betas=(0.5, 2)),
+        {
+            "f0.5": np.array([1.0, 0.5555555555555556, 0.0]),
+            "macro_f0.5": 0.5185185185185185,
+            "micro_f0.5": 0.6666666666666666,
+            "weighted_f0.5": 0.5185185185185185,
+            "f2": np.array([1.0, 0.8333333333333334, 0.0]),
+            "macro_f2": 0.6111111111111112,
+            "micro_f2": 0.6666666666666666,
+            "weighted_f2": 0.6111111111111112,
+        },
+    )
+
+
+def test_multiclass_fbeta_from_confmat_empty() -> None:
+    assert objects_are_equal(
+        multiclass_fbeta_from_confmat(EMPTY),
+        {
+            "f1": np.array([]),
+            "macro_f1": float("nan"),
+            "micro_f1": float("nan"),
+            "weighted_f1": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+#####################################################
+#     Tests for multiclass_jaccard_from_confmat     #
+#####################################################
+
+
+def test_multiclass_jaccard_from_confmat() -> None:
+    assert objects_are_allclose(
+        multiclass_jaccard_from_confmat(CONFMAT),
+        {
+            "jaccard": np.array([1.0, 0.5, 0.0]),
+            "macro_jaccard": 0.5,
+            "micro_jaccard": 0.5,
+            "weighted_jaccard": 0.5,
+        },
+    )
+
+
+def test_multiclass_jaccard_from_confmat_empty() -> None:
+    assert objects_are_equal(
+        multiclass_jaccard_from_confmat(EMPTY),
+        {
+            "jaccard": np.array([]),
+            "macro_jaccard": float("nan"),
+            "micro_jaccard": float("nan"),
+            "weighted_jaccard": float("nan"),
+        },
+        equal_nan=True,
+    )
@@ -11,14 +11,18 @@ from analora.metric import (
     multiclass_top_k_accuracy,
     top_k_accuracy,
 )
+from analora.metric.classification.topk_accuracy import top_k_correct
 from analora.testing import sklearn_available
+from analora.utils.imports import is_sklearn_available
+
+if is_sklearn_available():
+    from sklearn import metrics
 
 ####################################
 #     Tests for top_k_accuracy     #
 ####################################
 
 
-@sklearn_available
 def test_top_k_accuracy_empty() -> None:
     assert objects_are_equal(
         top_k_accuracy(y_true=np.array([]), y_score=np.array([]), k=[1]),
@@ -27,7 +31,6 @@ def test_top_k_accuracy_empty() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_binary_correct() -> None:
     assert objects_are_equal(
         top_k_accuracy(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), k=[1]),
@@ -35,11 +38,6 @@ def test_top_k_accuracy_binary_correct() -> None:
     )
 
 
-@pytest.mark.filterwarnings(
-    r"ignore:'k' \(2\) greater than or equal to 'n_classes' \(2\) will result in a perfect score "
-    r"and is therefore meaningless."
-)
-@sklearn_available
 def test_top_k_accuracy_binary_k() -> None:
     assert objects_are_equal(
         top_k_accuracy(
@@ -49,7 +47,6 @@ def test_top_k_accuracy_binary_k() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_binary_incorrect() -> None:
     assert objects_are_equal(
         top_k_accuracy(y_true=np.array([1, 0, 0, 1]), y_score=np.array([0, 1, 1, 0]), k=[1]),
@@ -57,7 +54,6 @@ def test_top_k_accuracy_binary_incorrect() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_binary_prefix_suffix() -> None:
     assert objects_are_equal(
         top_k_accuracy(
@@ -71,7 +67,6 @@ def test_top_k_accuracy_binary_prefix_suffix() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_multiclass() -> None:
     assert objects_are_equal(
         top_k_accuracy(
@@ -82,7 +77,6 @@ def test_top_k_accuracy_multiclass() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_multiclass_k() -> None:
     assert objects_are_equal(
         top_k_accuracy(
@@ -94,7 +88,6 @@ def test_top_k_accuracy_multiclass_k() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_multiclass_prefix_suffix() -> None:
     assert objects_are_equal(
         top_k_accuracy(
@@ -112,7 +105,6 @@ def test_top_k_accuracy_multiclass_prefix_suffix() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_binary_nan_omit() -> None:
     assert objects_are_equal(
         top_k_accuracy(
@@ -125,7 +117,6 @@ def test_top_k_accuracy_binary_nan_omit() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_binary_nan_propagate() -> None:
     assert objects_are_equal(
         top_k_accuracy(
@@ -137,7 +128,6 @@ def test_top_k_accuracy_binary_nan_propagate() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_binary_nan_raise() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         binary_top_k_accuracy(
@@ -147,7 +137,6 @@ def test_top_k_accuracy_binary_nan_raise() -> None:
         )
 
 
-@sklearn_available
 def test_top_k_accuracy_multiclass_nan_omit() -> None:
     assert objects_are_equal(
         top_k_accuracy(
@@ -167,7 +156,6 @@ def test_top_k_accuracy_multiclass_nan_omit() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_multiclass_nan_propagate() -> None:
     assert objects_are_equal(
         top_k_accuracy(
@@ -181,7 +169,6 @@ def test_top_k_accuracy_multiclass_nan_propagate() -> None:
     )
 
 
-@sklearn_available
 def test_top_k_accuracy_multiclass_nan_raise() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         top_k_accuracy(
@@ -193,10 +180,47 @@ def test_top_k_accuracy_multiclass_nan_raise() -> None:
         )
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100, None])
+def test_top_k_accuracy_multiclass_chunk_size(chunk_size: int | None) -> None:
+    assert objects_are_equal(
+        top_k_accuracy(
+            y_true=np.array([0, 1, 2, 2]),
+            y_score=np.array([[0.5, 0.2, 0.2], [0.3, 0.4, 0.2], [0.2, 0.4, 0.3], [0.7, 0.2, 0.1]]),
+            k=[1, 2, 3],
+            chunk_size=chunk_size,
+        ),
+        {"count": 4, "top_1_accuracy": 0.5, "top_2_accuracy": 0.75, "top_3_accuracy": 1.0},
+    )
+
+
+def test_top_k_accuracy_incorrect_k() -> None:
+    with pytest.raises(ValueError, match="Incorrect k: 0."):
+        top_k_accuracy(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), k=[1, 0]
+        )
+
+
+@sklearn_available
+@pytest.mark.parametrize("k", [1, 2, 5, 10, 20])
+def test_top_k_accuracy_multiclass_same_as_sklearn(k: int) -> None:
+    rng = np.random.default_rng(42)
+    y_true = np.concatenate([np.arange(10), rng.integers(0, 10, size=990)])
+    y_score = rng.integers(0, 5, size=(1000, 10)).astype(float)
+    assert objects_are_equal(
+        top_k_accuracy(y_true=y_true, y_score=y_score, k=[k], chunk_size=64),
+        {
+            "count": 1000,
+            f"top_{k}_accuracy": metrics.top_k_accuracy_score(y_true=y_true, y_score=y_score, k=k),
+        },
+    )
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_top_k_accuracy_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
-        top_k_accuracy(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), k=[1])
+    assert objects_are_equal(
+        top_k_accuracy(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), k=[1]),
+        {"count": 5, "top_1_accuracy": 1.0},
+    )
 
 
 ###########################################
@@ -204,7 +228,6 @@ def test_top_k_accuracy_no_sklearn() -> None:
 ###########################################
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_correct() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(
@@ -214,7 +237,6 @@ def test_binary_top_k_accuracy_correct() -> None:
     )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_incorrect() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(y_true=np.array([1, 0, 0, 1]), y_score=np.array([0, 1, 1, 0]), k=[1]),
@@ -222,11 +244,6 @@ def test_binary_top_k_accuracy_incorrect() -> None:
     )
 
 
-@pytest.mark.filterwarnings(
-    r"ignore:'k' \(2\) greater than or equal to 'n_classes' \(2\) will result in a perfect score "
-    r"and is therefore meaningless."
-)
-@sklearn_available
 def test_binary_top_k_accuracy_k() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(
@@ -236,7 +253,6 @@ def test_binary_top_k_accuracy_k() -> None:
     )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_prefix_suffix() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(
@@ -250,7 +266,6 @@ def test_binary_top_k_accuracy_prefix_suffix() -> None:
     )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_nan_omit() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(
@@ -263,7 +278,6 @@ def test_binary_top_k_accuracy_nan_omit() -> None:
     )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_nan_omit_y_true() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(
@@ -276,7 +290,6 @@ def test_binary_top_k_accuracy_nan_omit_y_true() -> None:
     )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_nan_omit_y_score() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(
@@ -289,7 +302,6 @@ def test_binary_top_k_accuracy_nan_omit_y_score() -> None:
     )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_nan_propagate() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(
@@ -302,7 +314,6 @@ def test_binary_top_k_accuracy_nan_propagate() -> None:
     )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_nan_propagate_y_true() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(
@@ -315,7 +326,6 @@ def test_binary_top_k_accuracy_nan_propagate_y_true() -> None:
     )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_nan_propagate_y_score() -> None:
     assert objects_are_equal(
         binary_top_k_accuracy(
@@ -328,7 +338,6 @@ def test_binary_top_k_accuracy_nan_propagate_y_score() -> None:
     )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_nan_raise() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         binary_top_k_accuracy(
@@ -339,7 +348,6 @@ def test_binary_top_k_accuracy_nan_raise() -> None:
         )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_nan_raise_y_true() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         binary_top_k_accuracy(
@@ -350,7 +358,6 @@ def test_binary_top_k_accuracy_nan_raise_y_true() -> None:
         )
 
 
-@sklearn_available
 def test_binary_top_k_accuracy_nan_raise_y_score() -> None:
     with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
         binary_top_k_accuracy(
@@ -361,12 +368,39 @@ def test_binary_top_k_accuracy_nan_raise_y_score() -> None:
         )
 
 
+def test_binary_top_k_accuracy_unit_range_threshold() -> None:
+    assert objects_are_equal(
+        binary_top_k_accuracy(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.4, 0.2, 0.6, 0.3]), k=[1]
+        ),
+        {"count": 5, "top_1_accuracy": 0.8},
+    )
+
+
+def test_binary_top_k_accuracy_labels() -> None:
+    assert objects_are_equal(
+        binary_top_k_accuracy(
+            y_true=np.array([2, 1, 1, 2, 2]), y_score=np.array([2, -1, 0, 3, 1]), k=[1]
+        ),
+        {"count": 5, "top_1_accuracy": 1.0},
+    )
+
+
+def test_binary_top_k_accuracy_one_class() -> None:
+    with pytest.raises(ValueError, match="Number of classes in 'y_true' \\(1\\) not equal"):
+        binary_top_k_accuracy(
+            y_true=np.array([1, 1, 1, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), k=[1]
+        )
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_binary_top_k_accuracy_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         binary_top_k_accuracy(
             y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), k=[1]
-        )
+        ),
+        {"count": 5, "top_1_accuracy": 1.0},
+    )
 
 
 ###############################################
@@ -374,7 +408,6 @@ def test_binary_top_k_accuracy_no_sklearn() -> None:
 ###############################################
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy() -> None:
     assert objects_are_equal(
         multiclass_top_k_accuracy(
@@ -385,7 +418,6 @@ def test_multiclass_top_k_accuracy() -> None:
     )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_k() -> None:
     assert objects_are_equal(
         multiclass_top_k_accuracy(
@@ -397,7 +429,6 @@ def test_multiclass_top_k_accuracy_k() -> None:
     )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_prefix_suffix() -> None:
     assert objects_are_equal(
         multiclass_top_k_accuracy(
@@ -415,7 +446,6 @@ def test_multiclass_top_k_accuracy_prefix_suffix() -> None:
     )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_nan_omit() -> None:
     assert objects_are_equal(
         multiclass_top_k_accuracy(
@@ -435,7 +465,6 @@ def test_multiclass_top_k_accuracy_nan_omit() -> None:
     )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_nan_omit_y_true() -> None:
     assert objects_are_equal(
         multiclass_top_k_accuracy(
@@ -447,7 +476,6 @@ def test_multiclass_top_k_accuracy_nan_omit_y_true() -> None:
     )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_nan_omit_y_score() -> None:
     assert objects_are_equal(
         multiclass_top_k_accuracy(
@@ -461,7 +489,6 @@ def test_multiclass_top_k_accuracy_nan_omit_y_score() -> None:
     )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_nan_propagate() -> None:
     assert objects_are_equal(
         multiclass_top_k_accuracy(
@@ -475,7 +502,6 @@ def test_multiclass_top_k_accuracy_nan_propagate() -> None:
     )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_nan_propagate_y_true() -> None:
     assert objects_are_equal(
         multiclass_top_k_accuracy(
@@ -487,7 +513,6 @@ def test_multiclass_top_k_accuracy_nan_propagate_y_true() -> None:
     )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_nan_propagate_y_score() -> None:
     assert objects_are_equal(
         multiclass_top_k_accuracy(
@@ -501,7 +526,6 @@ def test_multiclass_top_k_accuracy_nan_propagate_y_score() -> None:
     )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_nan_raise() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         multiclass_top_k_accuracy(
@@ -513,7 +537,6 @@ def test_multiclass_top_k_accuracy_nan_raise() -> None:
         )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_nan_raise_y_true() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         multiclass_top_k_accuracy(
@@ -523,7 +546,6 @@ def test_multiclass_top_k_accuracy_nan_raise_y_true() -> None:
         )
 
 
-@sklearn_available
 def test_multiclass_top_k_accuracy_nan_raise_y_score() -> None:
     with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
         multiclass_top_k_accuracy(
@@ -535,10 +557,90 @@ def test_multiclass_top_k_accuracy_nan_raise_y_score() -> None:
         )
 
 
+def test_multiclass_top_k_accuracy_labels() -> None:
+    assert objects_are_equal(
+        multiclass_top_k_accuracy(
+            y_true=np.array([3, 5, 7, 7]),
+            y_score=np.array([[0.5, 0.2, 0.2], [0.3, 0.4, 0.2], [0.2, 0.4, 0.3], [0.7, 0.2, 0.1]]),
+            k=[1, 2],
+        ),
+        {"count": 4, "top_1_accuracy": 0.5, "top_2_accuracy": 0.75},
+    )
+
+
+def test_multiclass_top_k_accuracy_ties() -> None:
+    assert objects_are_equal(
+        multiclass_top_k_accuracy(
+            y_true=np.array([0, 1, 2, 2]),
+            y_score=np.array([[0.4, 0.3, 0.3], [0.5, 0.5, 0.0], [0.5, 0.5, 0.0], [0.1, 0.1, 0.1]]),
+            k=[1, 2],
+        ),
+        {"count": 4, "top_1_accuracy": 0.75, "top_2_accuracy": 0.75},
+    )
+
+
+def test_multiclass_top_k_accuracy_missing_class() -> None:
+    with pytest.raises(ValueError, match="Number of classes in 'y_true' \\(2\\) not equal"):
+        multiclass_top_k_accuracy(
+            y_true=np.array([0, 1, 1, 1]),
+            y_score=np.array([[0.5, 0.2, 0.2], [0.3, 0.4, 0.2], [0.2, 0.4, 0.3], [0.7, 0.2, 0.1]]),
+        )
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_multiclass_top_k_accuracy_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
+    assert objects_are_equal(
         multiclass_top_k_accuracy(
             y_true=np.array([0, 1, 2, 2]),
             y_score=np.array([[0.5, 0.2, 0.2], [0.3, 0.4, 0.2], [0.2, 0.4, 0.3], [0.7, 0.2, 0.1]]),
-        )
+        ),
+        {"count": 4, "top_2_accuracy": 0.75},
+    )
+
+
+###################################
+#     Tests for top_k_correct     #
+###################################
+
+
+def test_top_k_correct() -> None:
+    assert objects_are_equal(
+        top_k_correct(
+            y_true=np.array([0, 1, 2, 2]),
+            y_score=np.array([[0.5, 0.2, 0.2], [0.3, 0.4, 0.2], [0.2, 0.4, 0.3], [0.7, 0.2, 0.1]]),
+            k=[1, 2, 3, 4],
+        ),
+        np.array([2, 3, 4, 4]),
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100, None])
+def test_top_k_correct_chunk_size(chunk_size: int | None) -> None:
+    assert objects_are_equal(
+        top_k_correct(
+            y_true=np.array([0, 1, 2, 2]),
+            y_score=np.array([[0.5, 0.2, 0.2], [0.3, 0.4, 0.2], [0.2, 0.4, 0.3], [0.7, 0.2, 0.1]]),
+            k=[2, 1],
+            chunk_size=chunk_size,
+        ),
+        np.array([3, 2]),
+    )
+
+
+def test_top_k_correct_ties() -> None:
+    # The tied classes with a greater index are ranked first.
+    assert objects_are_equal(
+        top_k_correct(
+            y_true=np.array([0, 1, 1]),
+            y_score=np.array([[0.5, 0.5, 0.0], [0.5, 0.5, 0.0], [0.5, 0.5, 0.5]]),
+            k=[1, 2],
+        ),
+        np.array([1, 3]),
+    )
+
+
+def test_top_k_correct_empty() -> None:
+    assert objects_are_equal(
+        top_k_correct(y_true=np.array([]), y_score=np.zeros((0, 3)), k=[1, 2]),
+        np.array([0, 0]),
+    )
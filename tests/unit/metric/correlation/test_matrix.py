@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+
+from analora.metric import pearsonr, pearsonr_matrix, spearmanr, spearmanr_matrix
+from analora.testing import polars_available, scipy_available
+from analora.utils.imports import is_polars_available
+
+if is_polars_available():
+    import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@pytest.fixture
+def x() -> np.ndarray:
+    return np.array([[1, 5, 2], [2, 4, 1], [3, 3, 5], [4, 2, 3], [5, 1, 4]])
+
+
+def random_arrays(seed: int = 0, nan: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    x = rng.integers(0, 5, size=(20, 4)).astype(float)
+    y = rng.normal(size=(20, 3))
+    if nan:
+        x[rng.random(x.shape) < 0.2] = float("nan")
+        y[rng.random(y.shape) < 0.2] = float("nan")
+    return x, y
+
+
+def pairwise(
+    func: Callable, x: np.ndarray, y: np.ndarray, name: str, **kwargs: Any
+) -> dict[str, np.ndarray]:
+    outs = [
+        [func(x=x[:, i], y=y[:, j], **kwargs) for j in range(y.shape[1])] for i in range(x.shape[1])
+    ]
+    return {
+        key: np.array([[out[key] for out in row] for row in outs])
+        for key in ["count", f"{name}_coeff", f"{name}_pvalue"]
+    }
+
+
+#####################################
+#     Tests for pearsonr_matrix     #
+#####################################
+
+
+@scipy_available
+def test_pearsonr_matrix(x: np.ndarray) -> None:
+    assert objects_are_allclose(
+        pearsonr_matrix(x),
+        {
+            "count": np.full((3, 3), 5),
+            "pearson_coeff": np.array([[1.0, -1.0, 0.6], [-1.0, 1.0, -0.6], [0.6, -0.6, 1.0]]),
+            "pearson_pvalue": np.array(
+                [
+                    [0.0, 0.0, 0.2847569800444033],
+                    [0.0, 0.0, 0.2847569800444033],
+                    [0.2847569800444033, 0.2847569800444033, 0.0],
+                ]
+            ),
+        },
+    )
+
+
+@scipy_available
+def test_pearsonr_matrix_1d() -> None:
+    assert objects_are_allclose(
+        pearsonr_matrix(x=np.array([1, 2, 3, 4, 5]), y=np.array([5, 4, 3, 2, 1])),
+        {
+            "count": np.array([[5]]),
+            "pearson_coeff": np.array([[-1.0]]),
+            "pearson_pvalue": np.array([[0.0]]),
+        },
+    )
+
+
+@scipy_available
+@pytest.mark.parametrize("alternative", ["two-sided", "less", "greater"])
+def test_pearsonr_matrix_same_as_pearsonr(alternative: str) -> None:
+    x, y = random_arrays()
+    assert objects_are_allclose(
+        pearsonr_matrix(x, y, alternative=alternative),
+        pairwise(pearsonr, x, y, name="pearson", alternative=alternative),
+    )
+
+
+@scipy_available
+def test_pearsonr_matrix_constant() -> None:
+    assert objects_are_allclose(
+        pearsonr_matrix(x=np.array([[0.1, 1.0], [0.1, 2.0], [0.1, 3.0]])),
+        {
+            "count": np.full((2, 2), 3),
+            "pearson_coeff": np.array([[float("nan"), float("nan")], [float("nan"), 1.0]]),
+            "pearson_pvalue": np.array([[float("nan"), float("nan")], [float("nan"), 0.0]]),
+        },
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_pearsonr_matrix_two_rows() -> None:
+    assert objects_are_allclose(
+        pearsonr_matrix(x=np.array([1, 2]), y=np.array([2, 1])),
+        {
+            "count": np.array([[2]]),
+            "pearson_coeff": np.array([[-1.0]]),
+            "pearson_pvalue": np.array([[1.0]]),
+        },
+    )
+
+
+@scipy_available
+def test_pearsonr_matrix_empty() -> None:
+    assert objects_are_allclose(
+        pearsonr_matrix(x=np.zeros((0, 2))),
+        {
+            "count": np.zeros((2, 2), dtype=np.int64),
+            "pearson_coeff": np.full((2, 2), float("nan")),
+            "pearson_pvalue": np.full((2, 2), float("nan")),
+        },
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_pearsonr_matrix_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        pearsonr_matrix(
+            x=np.array([1, 2, 3, 4, 5]),
+            y=np.array([1, 2, 3, 4, 5]),
+            prefix="prefix_",
+            suffix="_suffix",
+        ),
+        {
+            "prefix_count_suffix": np.array([[5]]),
+            "prefix_pearson_coeff_suffix": np.array([[1.0]]),
+            "prefix_pearson_pvalue_suffix": np.array([[0.0]]),
+        },
+    )
+
+
+@scipy_available
+def test_pearsonr_matrix_nan_omit() -> None:
+    x, y = random_arrays(nan=True)
+    assert objects_are_allclose(
+        pearsonr_matrix(x, y, nan_policy="omit"),
+        pairwise(pearsonr, x, y, name="pearson", nan_policy="omit"),
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_pearsonr_matrix_nan_omit_constant_rows() -> None:
+    assert objects_are_allclose(
+        pearsonr_matrix(
+            x=np.array([[1.0, 1.0], [0.1, 2.0], [0.1, 3.0], [0.1, 4.0]]),
+            y=np.array([float("nan"), 1.0, 2.0, 3.0]),
+            nan_policy="omit",
+        ),
+        {
+            "count": np.array([[3], [3]]),
+            "pearson_coeff": np.array([[float("nan")], [1.0]]),
+            "pearson_pvalue": np.array([[float("nan")], [0.0]]),
+        },
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_pearsonr_matrix_nan_propagate() -> None:
+    assert objects_are_allclose(
+        pearsonr_matrix(
+            x=np.array([[1.0, 1.0], [2.0, 2.0], [3.0, float("nan")]]), y=np.array([1.0, 2.0, 3.0])
+        ),
+        {
+            "count": np.array([[3], [3]]),
+            "pearson_coeff": np.array([[1.0], [float("nan")]]),
+            "pearson_pvalue": np.array([[0.0], [float("nan")]]),
+        },
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_pearsonr_matrix_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'x' contains at least one NaN value"):
+        pearsonr_matrix(x=np.array([[1.0, float("nan")], [2.0, 3.0]]), nan_policy="raise")
+
+
+@scipy_available
+def test_pearsonr_matrix_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        pearsonr_matrix(x=np.ones((3, 2)), nan_policy="incorrect")
+
+
+@scipy_available
+def test_pearsonr_matrix_incorrect_alternative() -> None:
+    with pytest.raises(ValueError, match="Incorrect alternative: incorrect"):
+        pearsonr_matrix(x=np.ones((3, 2)), alternative="incorrect")
+
+
+@scipy_available
+def test_pearsonr_matrix_different_rows() -> None:
+    with pytest.raises(RuntimeError, match="'x' and 'y' have different numbers of rows"):
+        pearsonr_matrix(x=np.ones((3, 2)), y=np.ones((4, 2)))
+
+
+@scipy_available
+def test_pearsonr_matrix_incorrect_ndim() -> None:
+    with pytest.raises(RuntimeError, match="'x' must be a 1d or 2d array"):
+        pearsonr_matrix(x=np.ones((3, 2, 2)))
+
+
+@scipy_available
+@polars_available
+def test_pearsonr_matrix_polars() -> None:
+    assert objects_are_allclose(
+        pearsonr_matrix(
+            x=pl.DataFrame({"a": [1, 2, 3, None, 5], "b": [5.0, 4.0, 3.0, 2.0, 1.0]}),
+            nan_policy="omit",
+        ),
+        {
+            "count": np.array([[4, 4], [4, 5]]),
+            "pearson_coeff": np.array([[1.0, -1.0], [-1.0, 1.0]]),
+            "pearson_pvalue": np.array([[0.0, 0.0], [0.0, 0.0]]),
+        },
+    )
+
+
+######################################
+#     Tests for spearmanr_matrix     #
+######################################
+
+
+@scipy_available
+def test_spearmanr_matrix(x: np.ndarray) -> None:
+    assert objects_are_allclose(
+        spearmanr_matrix(x, y=np.array([[1], [4], [9], [16], [25]])),
+        {
+            "count": np.full((3, 1), 5),
+            "spearman_coeff": np.array([[1.0], [-1.0], [0.6]]),
+            "spearman_pvalue": np.array([[0.0], [0.0], [0.2847569800444033]]),
+        },
+    )
+
+
+@scipy_available
+@pytest.mark.parametrize("alternative", ["two-sided", "less", "greater"])
+def test_spearmanr_matrix_same_as_spearmanr(alternative: str) -> None:
+    x, y = random_arrays()
+    assert objects_are_allclose(
+        spearmanr_matrix(x, y, alternative=alternative),
+        pairwise(spearmanr, x, y, name="spearman", alternative=alternative),
+    )
+
+
+@scipy_available
+def test_spearmanr_matrix_symmetric() -> None:
+    x, _ = random_arrays()
+    assert objects_are_allclose(spearmanr_matrix(x), spearmanr_matrix(x, x))
+
+
+@scipy_available
+def test_spearmanr_matrix_two_rows() -> None:
+    assert objects_are_allclose(
+        spearmanr_matrix(x=np.array([1, 2]), y=np.array([1, 2])),
+        {
+            "count": np.array([[2]]),
+            "spearman_coeff": np.array([[1.0]]),
+            "spearman_pvalue": np.array([[float("nan")]]),
+        },
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_spearmanr_matrix_empty() -> None:
+    assert objects_are_allclose(
+        spearmanr_matrix(x=np.zeros((0, 1)), y=np.zeros((0, 2))),
+        {
+            "count": np.zeros((1, 2), dtype=np.int64),
+            "spearman_coeff": np.full((1, 2), float("nan")),
+            "spearman_pvalue": np.full((1, 2), float("nan")),
+        },
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_spearmanr_matrix_nan_omit() -> None:
+    x, y = random_arrays(nan=True)
+    assert objects_are_allclose(
+        spearmanr_matrix(x, y, nan_policy="omit"),
+        pairwise(spearmanr, x, y, name="spearman", nan_policy="omit"),
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_spearmanr_matrix_nan_propagate() -> None:
+    assert objects_are_allclose(
+        spearmanr_matrix(
+            x=np.array([[1.0, 1.0], [2.0, 2.0], [3.0, float("nan")]]), y=np.array([1.0, 2.0, 3.0])
+        ),
+        {
+            "count": np.array([[3], [3]]),
+            "spearman_coeff": np.array([[1.0], [float("nan")]]),
+            "spearman_pvalue": np.array([[0.0], [float("nan")]]),
+        },
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_spearmanr_matrix_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y' contains at least one NaN value"):
+        spearmanr_matrix(x=np.ones((2, 2)), y=np.array([1.0, float("nan")]), nan_policy="raise")
+
+
+@scipy_available
+def test_spearmanr_matrix_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        spearmanr_matrix(
+            x=np.array([1, 2, 3, 4, 5]),
+            y=np.array([1, 2, 3, 4, 5]),
+            prefix="prefix_",
+            suffix="_suffix",
+        ),
+        {
+            "prefix_count_suffix": np.array([[5]]),
+            "prefix_spearman_coeff_suffix": np.array([[1.0]]),
+            "prefix_spearman_pvalue_suffix": np.array([[0.0]]),
+        },
+    )
+
+
+@scipy_available
+@polars_available
+def test_spearmanr_matrix_polars() -> None:
+    assert objects_are_allclose(
+        spearmanr_matrix(
+            x=pl.DataFrame({"a": [1, 2, 3, 4, 5]}),
+            y=pl.DataFrame({"b": [1.0, 4.0, 9.0, 16.0, 25.0], "c": [5, 4, 3, 2, 1]}),
+        ),
+        {
+            "count": np.array([[5, 5]]),
+            "spearman_coeff": np.array([[1.0, -1.0]]),
+            "spearman_pvalue": np.array([[0.0, 0.0]]),
+        },
+    )
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+
+from analora.metric.correlation.utils import correlation_pvalues, pearson_coefficients
+from analora.testing import scipy_available
+from analora.utils.imports import is_scipy_available
+
+if is_scipy_available():
+    from scipy import stats
+
+#########################################
+#     Tests for correlation_pvalues     #
+#########################################
+
+
+@scipy_available
+@pytest.mark.parametrize("alternative", ["two-sided", "less", "greater"])
+def test_correlation_pvalues(alternative: str) -> None:
+    rng = np.random.default_rng(42)
+    x, y = rng.normal(size=20), rng.normal(size=20)
+    res = stats.pearsonr(x, y, alternative=alternative)
+    assert objects_are_allclose(
+        correlation_pvalues(
+            np.array([[res.statistic]]), count=np.array([[20]]), alternative=alternative
+        ),
+        np.array([[res.pvalue]]),
+    )
+
+
+@scipy_available
+def test_correlation_pvalues_too_few_samples() -> None:
+    assert objects_are_allclose(
+        correlation_pvalues(np.array([[0.5, 0.5]]), count=np.array([[2, 1]]), alternative="less"),
+        np.array([[float("nan"), float("nan")]]),
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_correlation_pvalues_incorrect_alternative() -> None:
+    with pytest.raises(ValueError, match="Incorrect alternative: incorrect"):
+        correlation_pvalues(np.array([[0.5]]), count=np.array([[10]]), alternative="incorrect")
+
+
+##########################################
+#     Tests for pearson_coefficients     #
+##########################################
+
+
+def test_pearson_coefficients() -> None:
+    x = np.array([[1.0, 5.0], [2.0, 4.0], [3.0, 3.0], [4.0, 2.0]])
+    assert objects_are_allclose(pearson_coefficients(x, x), np.array([[1.0, -1.0], [-1.0, 1.0]]))
+
+
+def test_pearson_coefficients_different_arrays() -> None:
+    rng = np.random.default_rng(42)
+    x, y = rng.normal(size=(20, 3)), rng.normal(size=(20, 2))
+    assert objects_are_allclose(pearson_coefficients(x, y), np.corrcoef(x, y, rowvar=False)[:3, 3:])
+
+
+def test_pearson_coefficients_constant_column() -> None:
+    x = np.array([[1.0, 2.0], [2.0, 2.0], [3.0, 2.0]])
+    assert objects_are_allclose(
+        pearson_coefficients(x, x),
+        np.array([[1.0, float("nan")], [float("nan"), float("nan")]]),
+        equal_nan=True,
+    )
+
+
+def test_pearson_coefficients_nan() -> None:
+    x = np.array([[1.0, 1.0], [2.0, float("nan")], [3.0, 3.0]])
+    assert objects_are_allclose(
+        pearson_coefficients(x, x),
+        np.array([[1.0, float("nan")], [float("nan"), float("nan")]]),
+        equal_nan=True,
+    )
+
+
+def test_pearson_coefficients_empty() -> None:
+    assert objects_are_allclose(
+        pearson_coefficients(np.zeros((0, 2)), np.zeros((0, 3))),
+        np.full((2, 3), float("nan")),
+        equal_nan=True,
+    )
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.metric.distribution import cdf_distance, histogram_sketch, quantile_sketch
+from analora.metric.distribution.cdf import compute_cdf_distance
+from analora.testing import scipy_available
+from analora.utils.imports import is_scipy_available
+
+if is_scipy_available():
+    from scipy import stats
+
+##################################
+#     Tests for cdf_distance     #
+##################################
+
+
+def test_cdf_distance_same() -> None:
+    assert cdf_distance(np.array([1, 2, 3, 4, 5]), np.array([5, 4, 3, 2, 1])) == 0.0
+
+
+def test_cdf_distance_different() -> None:
+    assert cdf_distance(np.array([0.0, 1.0, 3.0]), np.array([5.0, 6.0, 8.0])) == 5.0
+
+
+def test_cdf_distance_different_sizes() -> None:
+    assert cdf_distance(np.array([0.0]), np.array([0.0, 2.0])) == 1.0
+
+
+def test_cdf_distance_p2() -> None:
+    assert objects_are_allclose(
+        cdf_distance(np.array([0.0]), np.array([2.0]), p=2), float(np.sqrt(2))
+    )
+
+
+def test_cdf_distance_p3() -> None:
+    assert objects_are_allclose(cdf_distance(np.array([0.0]), np.array([8.0]), p=3), 2.0)
+
+
+def test_cdf_distance_weights() -> None:
+    assert (
+        cdf_distance(
+            np.array([0.0, 1.0]),
+            np.array([0.0, 1.0]),
+            u_weights=np.array([3.0, 1.0]),
+            v_weights=np.array([1.0, 3.0]),
+        )
+        == 0.5
+    )
+
+
+def test_cdf_distance_ties() -> None:
+    assert cdf_distance(np.array([1.0, 1.0, 2.0]), np.array([2.0, 1.0, 2.0])) == pytest.approx(
+        1 / 3
+    )
+
+
+def test_cdf_distance_empty() -> None:
+    assert np.isnan(cdf_distance(np.array([]), np.array([1.0, 2.0])))
+
+
+def test_cdf_distance_zero_weights() -> None:
+    assert np.isnan(
+        cdf_distance(np.array([1.0, 2.0]), np.array([1.0, 2.0]), u_weights=np.array([0.0, 0.0]))
+    )
+
+
+@scipy_available
+@pytest.mark.parametrize("p", [1, 2, 3])
+def test_cdf_distance_scipy(p: int) -> None:
+    rng = np.random.default_rng(42)
+    u_values, v_values = rng.integers(0, 10, size=50).astype(float), rng.normal(size=30)
+    u_weights, v_weights = rng.random(50), rng.random(30)
+    assert objects_are_allclose(
+        cdf_distance(u_values, v_values, p=p, u_weights=u_weights, v_weights=v_weights),
+        float(stats._stats_py._cdf_distance(p, u_values, v_values, u_weights, v_weights)),
+    )
+
+
+##########################################
+#     Tests for compute_cdf_distance     #
+##########################################
+
+
+def test_compute_cdf_distance() -> None:
+    assert objects_are_equal(
+        compute_cdf_distance(
+            np.array([0.0, 1.0, 3.0]),
+            np.array([5.0, 6.0, 8.0]),
+            p=1.0,
+            u_weights=None,
+            v_weights=None,
+            nan_policy="propagate",
+        ),
+        (3, 5.0),
+    )
+
+
+def test_compute_cdf_distance_nan_omit_same_size() -> None:
+    # The NaN values are removed in each sample, not pairwise.
+    assert objects_are_equal(
+        compute_cdf_distance(
+            np.array([float("nan"), 1.0, 2.0]),
+            np.array([1.0, 2.0, float("nan")]),
+            p=1.0,
+            u_weights=None,
+            v_weights=None,
+            nan_policy="omit",
+        ),
+        (2, 0.0),
+    )
+
+
+def test_compute_cdf_distance_nan_omit_weights() -> None:
+    assert objects_are_equal(
+        compute_cdf_distance(
+            np.array([1.0, 2.0, 3.0]),
+            np.array([1.0, 2.0, 3.0]),
+            p=1.0,
+            u_weights=np.array([1.0, 1.0, float("nan")]),
+            v_weights=None,
+            nan_policy="omit",
+        ),
+        (2, 0.5),
+    )
+
+
+def test_compute_cdf_distance_nan_propagate() -> None:
+    assert objects_are_equal(
+        compute_cdf_distance(
+            np.array([1.0, 2.0, float("nan")]),
+            np.array([1.0, 2.0, 3.0]),
+            p=1.0,
+            u_weights=None,
+            v_weights=None,
+            nan_policy="propagate",
+        ),
+        (3, float("nan")),
+        equal_nan=True,
+    )
+
+
+def test_compute_cdf_distance_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'v_values' contains at least one NaN value"):
+        compute_cdf_distance(
+            np.array([1.0, 2.0, 3.0]),
+            np.array([1.0, 2.0, float("nan")]),
+            p=1.0,
+            u_weights=None,
+            v_weights=None,
+            nan_policy="raise",
+        )
+
+
+def test_compute_cdf_distance_negative_weights() -> None:
+    with pytest.raises(ValueError, match="Incorrect v_weights: the weights must be non-negative"):
+        compute_cdf_distance(
+            np.array([1.0, 2.0, 3.0]),
+            np.array([1.0, 2.0, 3.0]),
+            p=1.0,
+            u_weights=None,
+            v_weights=np.array([1.0, -1.0, 1.0]),
+            nan_policy="propagate",
+        )
+
+
+@scipy_available
+@pytest.mark.parametrize("p", [1, 2])
+def test_compute_cdf_distance_nan_omit_scipy(p: int) -> None:
+    rng = np.random.default_rng(42)
+    u_values, v_values = rng.normal(size=50), rng.normal(size=50)
+    u_values[rng.random(50) < 0.2] = float("nan")
+    v_values[rng.random(50) < 0.2] = float("nan")
+    u_clean, v_clean = u_values[~np.isnan(u_values)], v_values[~np.isnan(v_values)]
+    assert objects_are_allclose(
+        compute_cdf_distance(
+            u_values, v_values, p=p, u_weights=None, v_weights=None, nan_policy="omit"
+        ),
+        (u_clean.size, float(stats._stats_py._cdf_distance(p, u_clean, v_clean))),
+    )
+
+
+######################################
+#     Tests for histogram_sketch     #
+######################################
+
+
+def test_histogram_sketch() -> None:
+    assert objects_are_equal(
+        histogram_sketch(np.array([0.0, 1.0, 1.5, 4.0]), bins=4),
+        (np.array([0.5, 1.5, 3.5]), np.array([1.0, 2.0, 1.0])),
+    )
+
+
+def test_histogram_sketch_edges() -> None:
+    assert objects_are_equal(
+        histogram_sketch(np.array([0.0, 1.0, 1.5, 4.0]), bins=np.array([0.0, 2.0, 4.0])),
+        (np.array([1.0, 3.0]), np.array([3.0, 1.0])),
+    )
+
+
+def test_histogram_sketch_weights() -> None:
+    assert objects_are_equal(
+        histogram_sketch(
+            np.array([0.0, 1.0, 1.5, float("nan")]),
+            bins=2,
+            weights=np.array([1.0, 2.0, 3.0, 4.0]),
+        ),
+        (np.array([0.375, 1.125]), np.array([1.0, 5.0])),
+    )
+
+
+def test_histogram_sketch_nan() -> None:
+    assert objects_are_equal(
+        histogram_sketch(np.array([0.0, float("nan"), 2.0]), bins=2),
+        (np.array([0.5, 1.5]), np.array([1.0, 1.0])),
+    )
+
+
+def test_histogram_sketch_wasserstein_distance() -> None:
+    rng = np.random.default_rng(42)
+    u_values, v_values = rng.normal(size=10000), rng.normal(loc=1.0, size=500)
+    centers, counts = histogram_sketch(u_values, bins=100)
+    width = (u_values.max() - u_values.min()) / 100
+    assert (
+        abs(cdf_distance(centers, v_values, u_weights=counts) - cdf_distance(u_values, v_values))
+        <= width / 2
+    )
+
+
+#####################################
+#     Tests for quantile_sketch     #
+#####################################
+
+
+def test_quantile_sketch() -> None:
+    assert objects_are_equal(
+        quantile_sketch(np.arange(101), num_quantiles=4), np.array([12.5, 37.5, 62.5, 87.5])
+    )
+
+
+def test_quantile_sketch_nan() -> None:
+    assert objects_are_equal(
+        quantile_sketch(np.array([float("nan"), 0.0, 2.0]), num_quantiles=1), np.array([1.0])
+    )
+
+
+def test_quantile_sketch_empty() -> None:
+    assert objects_are_equal(quantile_sketch(np.array([])), np.array([], dtype=float))
+
+
+def test_quantile_sketch_incorrect_num_quantiles() -> None:
+    with pytest.raises(ValueError, match="Incorrect num_quantiles: 0"):
+        quantile_sketch(np.arange(10), num_quantiles=0)
+
+
+def test_quantile_sketch_wasserstein_distance() -> None:
+    rng = np.random.default_rng(42)
+    u_values, v_values = rng.normal(size=10000), rng.normal(loc=1.0, size=500)
+    assert objects_are_allclose(
+        cdf_distance(quantile_sketch(u_values, num_quantiles=1000), v_values),
+        cdf_distance(u_values, v_values),
+        atol=1e-2,
+    )
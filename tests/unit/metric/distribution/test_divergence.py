@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+
+from analora.metric import batched_divergences, jensen_shannon_divergence, kl_div
+from analora.testing import scipy_available
+
+#########################################
+#     Tests for batched_divergences     #
+#########################################
+
+
+def test_batched_divergences_same() -> None:
+    assert objects_are_allclose(
+        batched_divergences(
+            p=np.array([[0.1, 0.6, 0.1, 0.2], [0.25, 0.25, 0.25, 0.25]]),
+            q=np.array([[0.1, 0.6, 0.1, 0.2], [0.25, 0.25, 0.25, 0.25]]),
+        ),
+        {
+            "size": 4,
+            "kl_pq": np.array([0.0, 0.0]),
+            "kl_qp": np.array([0.0, 0.0]),
+            "jensen_shannon_divergence": np.array([0.0, 0.0]),
+        },
+    )
+
+
+def test_batched_divergences_different() -> None:
+    assert objects_are_allclose(
+        batched_divergences(p=np.array([[0.10, 0.40, 0.50]]), q=np.array([[0.80, 0.15, 0.05]])),
+        {
+            "size": 3,
+            "kl_pq": np.array([1.3356800935337299]),
+            "kl_qp": np.array([1.4012995907424075]),
+            "jensen_shannon_divergence": np.array([0.29126084]),
+        },
+    )
+
+
+def test_batched_divergences_broadcast() -> None:
+    assert objects_are_allclose(
+        batched_divergences(
+            p=np.array([0.10, 0.40, 0.50]), q=np.array([[0.10, 0.40, 0.50], [0.80, 0.15, 0.05]])
+        ),
+        {
+            "size": 3,
+            "kl_pq": np.array([0.0, 1.3356800935337299]),
+            "kl_qp": np.array([0.0, 1.4012995907424075]),
+            "jensen_shannon_divergence": np.array([0.0, 0.29126084]),
+        },
+    )
+
+
+def test_batched_divergences_zeros() -> None:
+    assert objects_are_allclose(
+        batched_divergences(p=np.array([[0.5, 0.5, 0.0]]), q=np.array([[0.5, 0.0, 0.5]])),
+        {
+            "size": 3,
+            "kl_pq": np.array([float("inf")]),
+            "kl_qp": np.array([float("inf")]),
+            "jensen_shannon_divergence": np.array([np.log(2) / 2]),
+        },
+    )
+
+
+def test_batched_divergences_negative() -> None:
+    assert objects_are_allclose(
+        batched_divergences(p=np.array([[0.5, 0.5], [1.5, -0.5]]), q=np.array([0.5, 0.5])),
+        {
+            "size": 2,
+            "kl_pq": np.array([0.0, float("inf")]),
+            "kl_qp": np.array([0.0, float("inf")]),
+            "jensen_shannon_divergence": np.array([0.0, float("inf")]),
+        },
+    )
+
+
+def test_batched_divergences_nan() -> None:
+    assert objects_are_allclose(
+        batched_divergences(p=np.array([[0.5, 0.5], [float("nan"), 0.5]]), q=np.array([0.5, 0.5])),
+        {
+            "size": 2,
+            "kl_pq": np.array([0.0, float("nan")]),
+            "kl_qp": np.array([0.0, float("nan")]),
+            "jensen_shannon_divergence": np.array([0.0, float("nan")]),
+        },
+        equal_nan=True,
+    )
+
+
+def test_batched_divergences_zero_vs_nan() -> None:
+    assert objects_are_allclose(
+        batched_divergences(p=np.array([[0.0, 1.0], [1.0, 0.0]]), q=np.array([float("nan"), 1.0])),
+        {
+            "size": 2,
+            "kl_pq": np.array([float("nan"), float("nan")]),
+            "kl_qp": np.array([float("nan"), float("nan")]),
+            "jensen_shannon_divergence": np.array([float("nan"), float("nan")]),
+        },
+        equal_nan=True,
+    )
+
+
+def test_batched_divergences_negative_nan() -> None:
+    assert objects_are_allclose(
+        batched_divergences(p=np.array([[1.5, -0.5, 0.0]]), q=np.array([0.5, 0.5, float("nan")])),
+        {
+            "size": 3,
+            "kl_pq": np.array([float("nan")]),
+            "kl_qp": np.array([float("nan")]),
+            "jensen_shannon_divergence": np.array([float("nan")]),
+        },
+        equal_nan=True,
+    )
+
+
+def test_batched_divergences_empty() -> None:
+    assert objects_are_allclose(
+        batched_divergences(p=np.zeros((2, 0)), q=np.zeros((2, 0))),
+        {
+            "size": 0,
+            "kl_pq": np.array([float("nan"), float("nan")]),
+            "kl_qp": np.array([float("nan"), float("nan")]),
+            "jensen_shannon_divergence": np.array([float("nan"), float("nan")]),
+        },
+        equal_nan=True,
+    )
+
+
+def test_batched_divergences_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        batched_divergences(
+            p=np.array([[0.1, 0.6, 0.1, 0.2]]),
+            q=np.array([[0.1, 0.6, 0.1, 0.2]]),
+            prefix="prefix_",
+            suffix="_suffix",
+        ),
+        {
+            "prefix_size_suffix": 4,
+            "prefix_kl_pq_suffix": np.array([0.0]),
+            "prefix_kl_qp_suffix": np.array([0.0]),
+            "prefix_jensen_shannon_divergence_suffix": np.array([0.0]),
+        },
+    )
+
+
+def test_batched_divergences_incorrect_ndim() -> None:
+    with pytest.raises(RuntimeError, match="'p' must be a 1d or 2d array"):
+        batched_divergences(p=np.ones((2, 3, 4)), q=np.ones((2, 3)))
+
+
+def test_batched_divergences_incorrect_shapes() -> None:
+    with pytest.raises(RuntimeError, match="'p' and 'q' have incompatible shapes"):
+        batched_divergences(p=np.ones((2, 3)), q=np.ones((2, 4)))
+
+
+@scipy_available
+def test_batched_divergences_pairs() -> None:
+    rng = np.random.default_rng(42)
+    p, q = rng.random((20, 5)), rng.random((20, 5))
+    p[rng.random(p.shape) < 0.2] = 0.0
+    q[rng.random(q.shape) < 0.2] = 0.0
+    out = batched_divergences(p, q)
+    for i in range(20):
+        kl = kl_div(p[i], q[i])
+        assert objects_are_allclose(float(out["kl_pq"][i]), kl["kl_pq"])
+        assert objects_are_allclose(float(out["kl_qp"][i]), kl["kl_qp"])
+        assert objects_are_allclose(
+            float(out["jensen_shannon_divergence"][i]),
+            jensen_shannon_divergence(p[i], q[i])["jensen_shannon_divergence"],
+        )
+
+
+@scipy_available
+def test_batched_divergences_pairs_nan_negative() -> None:
+    rng = np.random.default_rng(42)
+    values = np.array([0.0, 0.1, 0.5, 1.0, float("nan"), -0.2])
+    p, q = rng.choice(values, size=(200, 3)), rng.choice(values, size=(200, 3))
+    out = batched_divergences(p, q)
+    for i in range(200):
+        kl = kl_div(p[i], q[i])
+        assert objects_are_allclose(float(out["kl_pq"][i]), kl["kl_pq"], equal_nan=True)
+        assert objects_are_allclose(float(out["kl_qp"][i]), kl["kl_qp"], equal_nan=True)
+        assert objects_are_allclose(
+            float(out["jensen_shannon_divergence"][i]),
+            jensen_shannon_divergence(p[i], q[i])["jensen_shannon_divergence"],
+            equal_nan=True,
+        )
@@ -1,20 +1,21 @@
 from __future__ import annotations
 
-from unittest.mock import patch
-
 import numpy as np
 import pytest
 from coola import objects_are_allclose
 
 from analora.metric import energy_distance
 from analora.testing import scipy_available
+from analora.utils.imports import is_scipy_available
+
+if is_scipy_available():
+    from scipy import stats
 
 #####################################
 #     Tests for energy_distance     #
 #####################################
 
 
-@scipy_available
 def test_energy_distance_same() -> None:
     assert objects_are_allclose(
         energy_distance(u_values=np.array([1, 2, 3, 4, 5]), v_values=np.array([1, 2, 3, 4, 5])),
@@ -22,7 +23,6 @@ def test_energy_distance_same() -> None:
     )
 
 
-@scipy_available
 def test_energy_distance_perfect_same_2d() -> None:
     assert objects_are_allclose(
         energy_distance(
@@ -32,7 +32,6 @@ def test_energy_distance_perfect_same_2d() -> None:
     )
 
 
-@scipy_available
 def test_energy_distance_different() -> None:
     assert objects_are_allclose(
         energy_distance(u_values=np.array([0, 0, 0, 0, 0]), v_values=np.array([2, 2, 2, 2, 2])),
@@ -40,7 +39,6 @@ def test_energy_distance_different() -> None:
     )
 
 
-@scipy_available
 def test_energy_distance_empty() -> None:
     assert objects_are_allclose(
         energy_distance(u_values=np.array([]), v_values=np.array([])),
@@ -49,7 +47,6 @@ def test_energy_distance_empty() -> None:
     )
 
 
-@scipy_available
 def test_energy_distance_prefix_suffix() -> None:
     assert objects_are_allclose(
         energy_distance(
@@ -62,7 +59,6 @@ def test_energy_distance_prefix_suffix() -> None:
     )
 
 
-@scipy_available
 def test_energy_distance_nan_omit() -> None:
     assert objects_are_allclose(
         energy_distance(
@@ -70,11 +66,10 @@ def test_energy_distance_nan_omit() -> None:
             v_values=np.array([1, 2, 3, 4, 5, float("nan"), float("nan")]),
             nan_policy="omit",
         ),
-        {"count": 4, "energy_distance": 0.0},
+        {"count": 5, "energy_distance": 0.6324555320336759},
     )
 
 
-@scipy_available
 def test_energy_distance_omit_u_values() -> None:
     assert objects_are_allclose(
         energy_distance(
@@ -82,11 +77,10 @@ def test_energy_distance_omit_u_values() -> None:
             v_values=np.array([1, 2, 3, 4, 5, 0]),
             nan_policy="omit",
         ),
-        {"count": 5, "energy_distance": 0.0},
+        {"count": 5, "energy_distance": 0.3496029493900505},
     )
 
 
-@scipy_available
 def test_energy_distance_omit_v_values() -> None:
     assert objects_are_allclose(
         energy_distance(
@@ -94,11 +88,10 @@ def test_energy_distance_omit_v_values() -> None:
             v_values=np.array([1, 2, 3, 4, 5, float("nan")]),
             nan_policy="omit",
         ),
-        {"count": 5, "energy_distance": 0.0},
+        {"count": 6, "energy_distance": 0.3496029493900505},
     )
 
 
-@scipy_available
 def test_energy_distance_nan_propagate() -> None:
     assert objects_are_allclose(
         energy_distance(
@@ -110,7 +103,6 @@ def test_energy_distance_nan_propagate() -> None:
     )
 
 
-@scipy_available
 def test_energy_distance_nan_propagate_u_values() -> None:
     assert objects_are_allclose(
         energy_distance(
@@ -122,7 +114,6 @@ def test_energy_distance_nan_propagate_u_values() -> None:
     )
 
 
-@scipy_available
 def test_energy_distance_nan_propagate_v_values() -> None:
     assert objects_are_allclose(
         energy_distance(
@@ -134,7 +125,6 @@ def test_energy_distance_nan_propagate_v_values() -> None:
     )
 
 
-@scipy_available
 def test_energy_distance_nan_raise() -> None:
     with pytest.raises(ValueError, match="'u_values' contains at least one NaN value"):
         energy_distance(
@@ -144,7 +134,6 @@ def test_energy_distance_nan_raise() -> None:
         )
 
 
-@scipy_available
 def test_energy_distance_nan_raise_u_values() -> None:
     with pytest.raises(ValueError, match="'u_values' contains at least one NaN value"):
         energy_distance(
@@ -154,7 +143,6 @@ def test_energy_distance_nan_raise_u_values() -> None:
         )
 
 
-@scipy_available
 def test_energy_distance_nan_raise_v_values() -> None:
     with pytest.raises(ValueError, match="'v_values' contains at least one NaN value"):
         energy_distance(
@@ -164,7 +152,90 @@ def test_energy_distance_nan_raise_v_values() -> None:
         )
 
 
-@patch("analora.utils.imports.is_scipy_available", lambda: False)
-def test_energy_distance_no_scipy() -> None:
-    with pytest.raises(RuntimeError, match="'scipy' package is required but not installed."):
-        energy_distance(u_values=np.array([1, 2, 3, 4, 5]), v_values=np.array([1, 2, 3, 4, 5]))
+def test_energy_distance_different_sizes() -> None:
+    assert objects_are_allclose(
+        energy_distance(u_values=np.array([0, 0, 0]), v_values=np.array([2, 2, 2, 2, 2])),
+        {"count": 3, "energy_distance": 2.0},
+    )
+
+
+def test_energy_distance_weights() -> None:
+    assert objects_are_allclose(
+        energy_distance(
+            u_values=np.array([0, 2]),
+            v_values=np.array([0, 2, 2]),
+            u_weights=np.array([1.0, 2.0]),
+        ),
+        {"count": 2, "energy_distance": 0.0},
+    )
+
+
+def test_energy_distance_nan_omit_different_sizes() -> None:
+    assert objects_are_allclose(
+        energy_distance(
+            u_values=np.array([float("nan"), 2, 3, 4, 5, 6, float("nan")]),
+            v_values=np.array([2, 3, 4, 5, 6, float("nan")]),
+            nan_policy="omit",
+        ),
+        {"count": 5, "energy_distance": 0.0},
+    )
+
+
+def test_energy_distance_nan_omit_weights() -> None:
+    assert objects_are_allclose(
+        energy_distance(
+            u_values=np.array([1, 2, 3, 4, 5]),
+            v_values=np.array([1, 2, 3, 4, 5]),
+            u_weights=np.array([1.0, 1.0, 1.0, 1.0, float("nan")]),
+            nan_policy="omit",
+        ),
+        {"count": 4, "energy_distance": 0.3872983346207417},
+    )
+
+
+def test_energy_distance_nan_propagate_weights() -> None:
+    assert objects_are_allclose(
+        energy_distance(
+            u_values=np.array([1, 2, 3, 4, 5]),
+            v_values=np.array([1, 2, 3, 4, 5]),
+            v_weights=np.array([1.0, 1.0, 1.0, 1.0, float("nan")]),
+        ),
+        {"count": 5, "energy_distance": float("nan")},
+        equal_nan=True,
+    )
+
+
+def test_energy_distance_incorrect_weights_shape() -> None:
+    with pytest.raises(RuntimeError, match="have different shapes"):
+        energy_distance(
+            u_values=np.array([1, 2, 3, 4, 5]),
+            v_values=np.array([1, 2, 3]),
+            u_weights=np.array([1.0, 1.0]),
+        )
+
+
+def test_energy_distance_negative_weights() -> None:
+    with pytest.raises(ValueError, match="Incorrect v_weights: the weights must be non-negative"):
+        energy_distance(
+            u_values=np.array([1, 2, 3]),
+            v_values=np.array([1, 2, 3]),
+            v_weights=np.array([1.0, -1.0, 1.0]),
+        )
+
+
+@scipy_available
+def test_energy_distance_scipy() -> None:
+    rng = np.random.default_rng(42)
+    u_values, v_values = rng.normal(size=20), rng.normal(size=30)
+    u_weights, v_weights = rng.random(20), rng.random(30)
+    assert objects_are_allclose(
+        energy_distance(
+            u_values=u_values, v_values=v_values, u_weights=u_weights, v_weights=v_weights
+        ),
+        {
+            "count": 20,
+            "energy_distance": float(
+                stats.energy_distance(u_values, v_values, u_weights, v_weights)
+            ),
+        },
+    )
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.metric import (
+    energy_distance,
+    jensen_shannon_divergence,
+    kl_div,
+    wasserstein_distance,
+)
+from analora.metric.distribution import ReferenceDistribution
+from analora.testing import scipy_available
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+###########################################
+#     Tests for ReferenceDistribution     #
+###########################################
+
+
+def test_reference_distribution_repr() -> None:
+    assert (
+        repr(ReferenceDistribution(np.array([1, 2, 2, 3, 5]), bins=4, num_quantiles=2))
+        == "ReferenceDistribution(count=5, num_values=4, num_bins=4, num_quantiles=2)"
+    )
+
+
+def test_reference_distribution_properties() -> None:
+    ref = ReferenceDistribution(np.array([5, 2, 2, 3, 1]), bins=4, num_quantiles=2)
+    assert ref.count == 5
+    assert objects_are_equal(ref.values, np.array([1.0, 2.0, 3.0, 5.0]))
+    assert objects_are_allclose(ref.cdf, np.array([0.2, 0.6, 0.8, 1.0]))
+    assert objects_are_equal(ref.bin_edges, np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
+    assert objects_are_equal(ref.bin_counts, np.array([1.0, 2.0, 1.0, 1.0]))
+    assert objects_are_equal(ref.quantiles, np.array([2.0, 3.0]))
+
+
+def test_reference_distribution_nan() -> None:
+    ref = ReferenceDistribution(np.array([1, float("nan"), 3]))
+    assert ref.count == 2
+    assert objects_are_equal(ref.values, np.array([1.0, 3.0]))
+
+
+def test_reference_distribution_weights() -> None:
+    ref = ReferenceDistribution(np.array([1, 2, 3]), weights=np.array([2.0, 1.0, 1.0]))
+    assert objects_are_allclose(ref.cdf, np.array([0.5, 0.75, 1.0]))
+
+
+def test_reference_distribution_empty() -> None:
+    with pytest.raises(ValueError, match="must have at least one non-NaN value"):
+        ReferenceDistribution(np.array([float("nan")]))
+
+
+def test_reference_distribution_negative_weights() -> None:
+    with pytest.raises(ValueError, match="the weights must be non-negative"):
+        ReferenceDistribution(np.array([1, 2, 3]), weights=np.array([2.0, -1.0, 1.0]))
+
+
+def test_reference_distribution_incorrect_num_quantiles() -> None:
+    with pytest.raises(ValueError, match="Incorrect num_quantiles: 0"):
+        ReferenceDistribution(np.array([1, 2, 3]), num_quantiles=0)
+
+
+def test_reference_distribution_wasserstein_distance() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 1, 3])).wasserstein_distance(np.array([5, 6, 8])),
+        {"count": 3, "wasserstein_distance": 5.0},
+    )
+
+
+def test_reference_distribution_wasserstein_distance_same() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([1, 2, 3, 4, 5])).wasserstein_distance(
+            np.array([5, 4, 3, 2, 1])
+        ),
+        {"count": 5, "wasserstein_distance": 0.0},
+    )
+
+
+def test_reference_distribution_wasserstein_distance_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 1, 3])).wasserstein_distance(
+            np.array([5, 6, 8]), prefix="prefix_", suffix="_suffix"
+        ),
+        {"prefix_count_suffix": 3, "prefix_wasserstein_distance_suffix": 5.0},
+    )
+
+
+def test_reference_distribution_wasserstein_distance_empty() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 1, 3])).wasserstein_distance(np.array([])),
+        {"count": 0, "wasserstein_distance": float("nan")},
+        equal_nan=True,
+    )
+
+
+def test_reference_distribution_wasserstein_distance_nan_omit() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 1, 3])).wasserstein_distance(
+            np.array([5, float("nan"), 6, 8]), nan_policy="omit"
+        ),
+        {"count": 3, "wasserstein_distance": 5.0},
+    )
+
+
+def test_reference_distribution_wasserstein_distance_nan_propagate() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 1, 3])).wasserstein_distance(
+            np.array([5, float("nan"), 6, 8])
+        ),
+        {"count": 4, "wasserstein_distance": float("nan")},
+        equal_nan=True,
+    )
+
+
+def test_reference_distribution_wasserstein_distance_nan_raise() -> None:
+    ref = ReferenceDistribution(np.array([0, 1, 3]))
+    with pytest.raises(ValueError, match="'values' contains at least one NaN value"):
+        ref.wasserstein_distance(np.array([5, float("nan"), 6, 8]), nan_policy="raise")
+
+
+def test_reference_distribution_wasserstein_distance_approximate() -> None:
+    rng = np.random.default_rng(42)
+    ref = ReferenceDistribution(rng.normal(size=10000), num_quantiles=1000)
+    values = rng.normal(loc=1.0, size=5000)
+    assert objects_are_allclose(
+        ref.wasserstein_distance(values, approximate=True),
+        ref.wasserstein_distance(values),
+        atol=1e-2,
+    )
+
+
+def test_reference_distribution_energy_distance() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 0, 0])).energy_distance(np.array([2, 2, 2, 2])),
+        {"count": 4, "energy_distance": 2.0},
+    )
+
+
+def test_reference_distribution_energy_distance_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 0, 0])).energy_distance(
+            np.array([2, 2, 2, 2]), prefix="prefix_", suffix="_suffix"
+        ),
+        {"prefix_count_suffix": 4, "prefix_energy_distance_suffix": 2.0},
+    )
+
+
+def test_reference_distribution_energy_distance_approximate() -> None:
+    rng = np.random.default_rng(42)
+    ref = ReferenceDistribution(rng.normal(size=10000), num_quantiles=1000)
+    values = rng.normal(loc=1.0, size=5000)
+    assert objects_are_allclose(
+        ref.energy_distance(values, approximate=True), ref.energy_distance(values), atol=1e-2
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3, 4])
+def test_reference_distribution_distances_match_metrics(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    reference = rng.integers(0, 10, size=50).astype(float)
+    values, weights = rng.normal(loc=4.0, scale=3.0, size=30), rng.random(30)
+    ref = ReferenceDistribution(reference)
+    assert objects_are_allclose(
+        ref.wasserstein_distance(values, weights=weights),
+        wasserstein_distance(values, reference, u_weights=weights),
+    )
+    assert objects_are_allclose(
+        ref.energy_distance(values, weights=weights),
+        energy_distance(values, reference, u_weights=weights),
+    )
+
+
+@scipy_available
+def test_reference_distribution_kl_div() -> None:
+    ref = ReferenceDistribution(np.array([1, 2, 2, 3, 5]), bins=4)
+    assert objects_are_allclose(
+        ref.kl_div(np.array([1, 2, 3, 5, 5])),
+        kl_div(p=np.array([0.2, 0.4, 0.2, 0.2]), q=np.array([0.2, 0.2, 0.2, 0.4])),
+    )
+
+
+def test_reference_distribution_kl_div_out_of_range() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 1, 2, 3]), bins=2).kl_div(np.array([-5, 1, 2, 10])),
+        {"size": 2, "kl_pq": 0.0, "kl_qp": 0.0},
+    )
+
+
+def test_reference_distribution_kl_div_nan() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 1, 2, 3]), bins=2).kl_div(
+            np.array([0, float("nan")]), prefix="prefix_", suffix="_suffix"
+        ),
+        {
+            "prefix_size_suffix": 2,
+            "prefix_kl_pq_suffix": float("nan"),
+            "prefix_kl_qp_suffix": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_reference_distribution_kl_div_zero_weights() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = ReferenceDistribution(np.array([0, 1, 2, 3]), bins=2).kl_div(
+            np.array([0, 1, 2]), weights=np.zeros(3)
+        )
+    assert objects_are_allclose(
+        out, {"size": 2, "kl_pq": float("nan"), "kl_qp": float("nan")}, equal_nan=True
+    )
+
+
+@pytest.mark.parametrize(
+    "method", ["wasserstein_distance", "energy_distance", "kl_div", "jensen_shannon_divergence"]
+)
+def test_reference_distribution_sample_negative_weights(method: str) -> None:
+    ref = ReferenceDistribution(np.array([0, 1, 2, 3]), bins=2)
+    with pytest.raises(ValueError, match="the weights must be non-negative"):
+        getattr(ref, method)(np.array([0, 1, 2]), weights=np.array([1.0, -1.0, 1.0]))
+
+
+@scipy_available
+def test_reference_distribution_jensen_shannon_divergence() -> None:
+    ref = ReferenceDistribution(np.array([1, 2, 2, 3, 5]), bins=4)
+    assert objects_are_allclose(
+        ref.jensen_shannon_divergence(np.array([1, 2, 3, 5, 5])),
+        jensen_shannon_divergence(
+            p=np.array([0.2, 0.4, 0.2, 0.2]), q=np.array([0.2, 0.2, 0.2, 0.4])
+        ),
+    )
+
+
+def test_reference_distribution_jensen_shannon_divergence_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        ReferenceDistribution(np.array([0, 1, 2, 3]), bins=2).jensen_shannon_divergence(
+            np.array([0, 1, 2, 3]), prefix="prefix_", suffix="_suffix"
+        ),
+        {"prefix_size_suffix": 2, "prefix_jensen_shannon_divergence_suffix": 0.0},
+    )
+
+
+def test_reference_distribution_save_load(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data", "ref.npz")
+    rng = np.random.default_rng(42)
+    ref = ReferenceDistribution(rng.normal(size=100), bins=10, num_quantiles=5)
+    ref.save(path)
+    loaded = ReferenceDistribution.load(path)
+    assert repr(loaded) == repr(ref)
+    assert objects_are_equal(loaded.values, ref.values)
+    assert objects_are_equal(loaded.quantiles, ref.quantiles)
+    values = rng.normal(size=20)
+    assert objects_are_equal(loaded.wasserstein_distance(values), ref.wasserstein_distance(values))
+    assert objects_are_equal(loaded.kl_div(values), ref.kl_div(values))
@@ -1,20 +1,21 @@
 from __future__ import annotations
 
-from unittest.mock import patch
-
 import numpy as np
 import pytest
 from coola import objects_are_allclose
 
 from analora.metric import wasserstein_distance
 from analora.testing import scipy_available
+from analora.utils.imports import is_scipy_available
+
+if is_scipy_available():
+    from scipy import stats
 
 ##########################################
 #     Tests for wasserstein_distance     #
 ##########################################
 
 
-@scipy_available
 def test_wasserstein_distance_same() -> None:
     assert objects_are_allclose(
         wasserstein_distance(
@@ -24,7 +25,6 @@ def test_wasserstein_distance_same() -> None:
     )
 
 
-@scipy_available
 def test_wasserstein_distance_perfect_positive_correlation_2d() -> None:
     assert objects_are_allclose(
         wasserstein_distance(
@@ -34,7 +34,6 @@ def test_wasserstein_distance_perfect_positive_correlation_2d() -> None:
     )
 
 
-@scipy_available
 def test_wasserstein_distance_different() -> None:
     assert objects_are_allclose(
         wasserstein_distance(u_values=np.array([0, 1, 3]), v_values=np.array([5, 6, 8])),
@@ -42,7 +41,6 @@ def test_wasserstein_distance_different() -> None:
     )
 
 
-@scipy_available
 def test_wasserstein_distance_empty() -> None:
     assert objects_are_allclose(
         wasserstein_distance(u_values=np.array([]), v_values=np.array([])),
@@ -51,7 +49,6 @@ def test_wasserstein_distance_empty() -> None:
     )
 
 
-@scipy_available
 def test_wasserstein_distance_prefix_suffix() -> None:
     assert objects_are_allclose(
         wasserstein_distance(
@@ -64,7 +61,6 @@ def test_wasserstein_distance_prefix_suffix() -> None:
     )
 
 
-@scipy_available
 def test_wasserstein_distance_nan_omit() -> None:
     assert objects_are_allclose(
         wasserstein_distance(
@@ -72,11 +68,10 @@ def test_wasserstein_distance_nan_omit() -> None:
             v_values=np.array([1, 2, 3, 4, 5, float("nan"), float("nan")]),
             nan_policy="omit",
         ),
-        {"count": 4, "wasserstein_distance": 0.0},
+        {"count": 5, "wasserstein_distance": 1.0},
     )
 
 
-@scipy_available
 def test_wasserstein_distance_omit_u_values() -> None:
     assert objects_are_allclose(
         wasserstein_distance(
@@ -84,11 +79,10 @@ def test_wasserstein_distance_omit_u_values() -> None:
             v_values=np.array([1, 2, 3, 4, 5, 0]),
             nan_policy="omit",
         ),
-        {"count": 5, "wasserstein_distance": 0.0},
+        {"count": 5, "wasserstein_distance": 0.5},
     )
 
 
-@scipy_available
 def test_wasserstein_distance_omit_v_values() -> None:
     assert objects_are_allclose(
         wasserstein_distance(
@@ -96,11 +90,10 @@ def test_wasserstein_distance_omit_v_values() -> None:
             v_values=np.array([1, 2, 3, 4, 5, float("nan")]),
             nan_policy="omit",
         ),
-        {"count": 5, "wasserstein_distance": 0.0},
+        {"count": 6, "wasserstein_distance": 0.5},
     )
 
 
-@scipy_available
 def test_wasserstein_distance_nan_propagate() -> None:
     assert objects_are_allclose(
         wasserstein_distance(
@@ -112,7 +105,6 @@ def test_wasserstein_distance_nan_propagate() -> None:
     )
 
 
-@scipy_available
 def test_wasserstein_distance_nan_propagate_u_values() -> None:
     assert objects_are_allclose(
         wasserstein_distance(
@@ -124,7 +116,6 @@ def test_wasserstein_distance_nan_propagate_u_values() -> None:
     )
 
 
-@scipy_available
 def test_wasserstein_distance_nan_propagate_v_values() -> None:
     assert objects_are_allclose(
         wasserstein_distance(
@@ -136,7 +127,6 @@ def test_wasserstein_distance_nan_propagate_v_values() -> None:
     )
 
 
-@scipy_available
 def test_wasserstein_distance_nan_raise() -> None:
     with pytest.raises(ValueError, match="'u_values' contains at least one NaN value"):
         wasserstein_distance(
@@ -146,7 +136,6 @@ def test_wasserstein_distance_nan_raise() -> None:
         )
 
 
-@scipy_available
 def test_wasserstein_distance_nan_raise_u_values() -> None:
     with pytest.raises(ValueError, match="'u_values' contains at least one NaN value"):
         wasserstein_distance(
@@ -156,7 +145,6 @@ def test_wasserstein_distance_nan_raise_u_values() -> None:
         )
 
 
-@scipy_available
 def test_wasserstein_distance_nan_raise_v_values() -> None:
     with pytest.raises(ValueError, match="'v_values' contains at least one NaN value"):
         wasserstein_distance(
@@ -166,7 +154,90 @@ def test_wasserstein_distance_nan_raise_v_values() -> None:
         )
 
 
-@patch("analora.utils.imports.is_scipy_available", lambda: False)
-def test_wasserstein_distance_no_scipy() -> None:
-    with pytest.raises(RuntimeError, match="'scipy' package is required but not installed."):
-        wasserstein_distance(u_values=np.array([1, 2, 3, 4, 5]), v_values=np.array([1, 2, 3, 4, 5]))
+def test_wasserstein_distance_different_sizes() -> None:
+    assert objects_are_allclose(
+        wasserstein_distance(u_values=np.array([0, 0, 0]), v_values=np.array([2, 2, 2, 2, 2])),
+        {"count": 3, "wasserstein_distance": 2.0},
+    )
+
+
+def test_wasserstein_distance_weights() -> None:
+    assert objects_are_allclose(
+        wasserstein_distance(
+            u_values=np.array([0, 2]),
+            v_values=np.array([0, 2, 2]),
+            u_weights=np.array([1.0, 2.0]),
+        ),
+        {"count": 2, "wasserstein_distance": 0.0},
+    )
+
+
+def test_wasserstein_distance_nan_omit_different_sizes() -> None:
+    assert objects_are_allclose(
+        wasserstein_distance(
+            u_values=np.array([float("nan"), 2, 3, 4, 5, 6, float("nan")]),
+            v_values=np.array([2, 3, 4, 5, 6, float("nan")]),
+            nan_policy="omit",
+        ),
+        {"count": 5, "wasserstein_distance": 0.0},
+    )
+
+
+def test_wasserstein_distance_nan_omit_weights() -> None:
+    assert objects_are_allclose(
+        wasserstein_distance(
+            u_values=np.array([1, 2, 3, 4, 5]),
+            v_values=np.array([1, 2, 3, 4, 5]),
+            u_weights=np.array([1.0, 1.0, 1.0, 1.0, float("nan")]),
+            nan_policy="omit",
+        ),
+        {"count": 4, "wasserstein_distance": 0.5},
+    )
+
+
+def test_wasserstein_distance_nan_propagate_weights() -> None:
+    assert objects_are_allclose(
+        wasserstein_distance(
+            u_values=np.array([1, 2, 3, 4, 5]),
+            v_values=np.array([1, 2, 3, 4, 5]),
+            v_weights=np.array([1.0, 1.0, 1.0, 1.0, float("nan")]),
+        ),
+        {"count": 5, "wasserstein_distance": float("nan")},
+        equal_nan=True,
+    )
+
+
+def test_wasserstein_distance_incorrect_weights_shape() -> None:
+    with pytest.raises(RuntimeError, match="have different shapes"):
+        wasserstein_distance(
+            u_values=np.array([1, 2, 3, 4, 5]),
+            v_values=np.array([1, 2, 3]),
+            u_weights=np.array([1.0, 1.0]),
+        )
+
+
+def test_wasserstein_distance_negative_weights() -> None:
+    with pytest.raises(ValueError, match="Incorrect v_weights: the weights must be non-negative"):
+        wasserstein_distance(
+            u_values=np.array([1, 2, 3]),
+            v_values=np.array([1, 2, 3]),
+            v_weights=np.array([1.0, -1.0, 1.0]),
+        )
+
+
+@scipy_available
+def test_wasserstein_distance_scipy() -> None:
+    rng = np.random.default_rng(42)
+    u_values, v_values = rng.normal(size=20), rng.normal(size=30)
+    u_weights, v_weights = rng.random(20), rng.random(30)
+    assert objects_are_allclose(
+        wasserstein_distance(
+            u_values=u_values, v_values=v_values, u_weights=u_weights, v_weights=v_weights
+        ),
+        {
+            "count": 20,
+            "wasserstein_distance": float(
+                stats.wasserstein_distance(u_values, v_values, u_weights, v_weights)
+            ),
+        },
+    )
@@ -4,9 +4,10 @@ from unittest.mock import patch
 
 import numpy as np
 import pytest
-from coola import objects_are_equal
+from coola import objects_are_allclose, objects_are_equal
 
 from analora.metric import r2_score
+from analora.metric.regression.r2 import r2_score_from_sums
 from analora.testing import sklearn_available
 
 ##############################
@@ -169,3 +170,42 @@ def test_r2_score_nan_raise_y_pred() -> None:
 def test_r2_score_no_sklearn() -> None:
     with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
         r2_score(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]))
+
+
+########################################
+#     Tests for r2_score_from_sums     #
+########################################
+
+
+def test_r2_score_from_sums() -> None:
+    assert objects_are_equal(r2_score_from_sums(sum_sq_error=1.0, sum_sq_dev=4.0), 0.75)
+
+
+def test_r2_score_from_sums_constant_target_perfect() -> None:
+    assert objects_are_equal(r2_score_from_sums(sum_sq_error=0.0, sum_sq_dev=0.0), 1.0)
+
+
+def test_r2_score_from_sums_constant_target_error() -> None:
+    assert objects_are_equal(r2_score_from_sums(sum_sq_error=2.0, sum_sq_dev=0.0), 0.0)
+
+
+def test_r2_score_from_sums_array() -> None:
+    assert objects_are_equal(
+        r2_score_from_sums(
+            sum_sq_error=np.array([1.0, 0.0, 2.0]), sum_sq_dev=np.array([4.0, 0.0, 0.0])
+        ),
+        np.array([0.75, 1.0, 0.0]),
+    )
+
+
+@sklearn_available
+def test_r2_score_from_sums_same_as_r2_score() -> None:
+    rng = np.random.default_rng(42)
+    y_true, y_pred = rng.normal(size=20), rng.normal(size=20)
+    assert objects_are_allclose(
+        r2_score_from_sums(
+            sum_sq_error=float(np.square(y_true - y_pred).sum()),
+            sum_sq_dev=float(np.square(y_true - y_true.mean()).sum()),
+        ),
+        r2_score(y_true=y_true, y_pred=y_pred)["r2_score"],
+    )
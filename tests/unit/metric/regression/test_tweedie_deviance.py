@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+import re
 from unittest.mock import patch
 
 import numpy as np
 import pytest
-from coola import objects_are_equal
+from coola import objects_are_allclose, objects_are_equal
 
 from analora.metric import mean_tweedie_deviance
 from analora.testing import sklearn_available
+from analora.utils.imports import is_sklearn_available
+
+if is_sklearn_available():
+    from sklearn import metrics
 
 ###########################################
 #     Tests for mean_tweedie_deviance     #
 ###########################################
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_correct() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5])),
@@ -22,7 +26,6 @@ def test_mean_tweedie_deviance_correct() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_correct_2d() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(
@@ -32,7 +35,6 @@ def test_mean_tweedie_deviance_correct_2d() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_incorrect() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(y_true=np.array([4, 3, 2, 1]), y_pred=np.array([1, 2, 3, 4])),
@@ -40,7 +42,6 @@ def test_mean_tweedie_deviance_incorrect() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_powers() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(
@@ -55,7 +56,6 @@ def test_mean_tweedie_deviance_powers() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_empty() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(y_true=np.array([]), y_pred=np.array([])),
@@ -64,7 +64,6 @@ def test_mean_tweedie_deviance_empty() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_prefix_suffix() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(
@@ -77,7 +76,6 @@ def test_mean_tweedie_deviance_prefix_suffix() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_nan_omit() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(
@@ -89,7 +87,6 @@ def test_mean_tweedie_deviance_nan_omit() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_nan_omit_y_true() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(
@@ -101,7 +98,6 @@ def test_mean_tweedie_deviance_nan_omit_y_true() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_nan_omit_y_pred() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(
@@ -113,7 +109,6 @@ def test_mean_tweedie_deviance_nan_omit_y_pred() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_nan_propagate() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(
@@ -126,7 +121,6 @@ def test_mean_tweedie_deviance_nan_propagate() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_nan_propagate_y_true() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(
@@ -139,7 +133,6 @@ def test_mean_tweedie_deviance_nan_propagate_y_true() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_nan_propagate_y_pred() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(
@@ -152,7 +145,6 @@ def test_mean_tweedie_deviance_nan_propagate_y_pred() -> None:
     )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_nan_raise() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         mean_tweedie_deviance(
@@ -162,7 +154,6 @@ def test_mean_tweedie_deviance_nan_raise() -> None:
         )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_nan_raise_y_true() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         mean_tweedie_deviance(
@@ -172,7 +163,6 @@ def test_mean_tweedie_deviance_nan_raise_y_true() -> None:
         )
 
 
-@sklearn_available
 def test_mean_tweedie_deviance_nan_raise_y_pred() -> None:
     with pytest.raises(ValueError, match="'y_pred' contains at least one NaN value"):
         mean_tweedie_deviance(
@@ -182,7 +172,123 @@ def test_mean_tweedie_deviance_nan_raise_y_pred() -> None:
         )
 
 
+def test_mean_tweedie_deviance_many_powers() -> None:
+    assert objects_are_allclose(
+        mean_tweedie_deviance(
+            y_true=np.array([1, 2, 3, 4, 5]),
+            y_pred=np.array([2, 2, 2, 4, 4]),
+            powers=[-1, 0, 1, 1.5, 2, 3],
+        ),
+        {
+            "count": 5,
+            "mean_tweedie_deviance_power_-1": 1.6666666666666639,
+            "mean_tweedie_deviance_power_0": 0.6,
+            "mean_tweedie_deviance_power_1": 0.2555863601342388,
+            "mean_tweedie_deviance_power_1.5": 0.17649334348403728,
+            "mean_tweedie_deviance_power_2": 0.12581540845502842,
+            "mean_tweedie_deviance_power_3": 0.06916666666666664,
+        },
+    )
+
+
+def test_mean_tweedie_deviance_zero_target() -> None:
+    assert objects_are_allclose(
+        mean_tweedie_deviance(
+            y_true=np.array([0, 0, 1, 2]), y_pred=np.array([1, 2, 1, 2]), powers=[1, 1.5]
+        ),
+        {
+            "count": 4,
+            "mean_tweedie_deviance_power_1": 1.5,
+            "mean_tweedie_deviance_power_1.5": 2.414213562373095,
+        },
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100, None])
+def test_mean_tweedie_deviance_chunk_size(chunk_size: int | None) -> None:
+    assert objects_are_allclose(
+        mean_tweedie_deviance(
+            y_true=np.array([1, 2, 3, 4, 5]),
+            y_pred=np.array([2, 2, 2, 4, 4]),
+            powers=[0, 1, 1.5, 2],
+            chunk_size=chunk_size,
+        ),
+        {
+            "count": 5,
+            "mean_tweedie_deviance_power_0": 0.6,
+            "mean_tweedie_deviance_power_1": 0.2555863601342388,
+            "mean_tweedie_deviance_power_1.5": 0.17649334348403728,
+            "mean_tweedie_deviance_power_2": 0.12581540845502842,
+        },
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_mean_tweedie_deviance_incorrect_chunk_size(chunk_size: int) -> None:
+    with pytest.raises(ValueError, match="Incorrect chunk_size:"):
+        mean_tweedie_deviance(
+            y_true=np.array([1, 2, 3, 4, 5]),
+            y_pred=np.array([1, 2, 3, 4, 5]),
+            chunk_size=chunk_size,
+        )
+
+
+def test_mean_tweedie_deviance_incorrect_power() -> None:
+    with pytest.raises(ValueError, match=re.escape("Incorrect power: 0.5.")):
+        mean_tweedie_deviance(
+            y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]), powers=[0, 0.5]
+        )
+
+
+def test_mean_tweedie_deviance_negative_power_incorrect_values() -> None:
+    with pytest.raises(
+        ValueError, match=re.escape("can only be used on strictly positive y_pred.")
+    ):
+        mean_tweedie_deviance(
+            y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([0, 2, 3, 4, 5]), powers=[-1]
+        )
+
+
+def test_mean_tweedie_deviance_poisson_incorrect_values() -> None:
+    with pytest.raises(
+        ValueError,
+        match=re.escape("can only be used on non-negative y and strictly positive y_pred."),
+    ):
+        mean_tweedie_deviance(
+            y_true=np.array([-1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]), powers=[1]
+        )
+
+
+def test_mean_tweedie_deviance_gamma_incorrect_values() -> None:
+    with pytest.raises(
+        ValueError, match=re.escape("can only be used on strictly positive y and y_pred.")
+    ):
+        mean_tweedie_deviance(
+            y_true=np.array([0, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]), powers=[2]
+        )
+
+
+@sklearn_available
+def test_mean_tweedie_deviance_same_as_sklearn() -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.gamma(shape=2.0, scale=2.0, size=1000)
+    y_pred = rng.gamma(shape=2.0, scale=2.0, size=1000)
+    powers = [-2, -0.5, 0, 1, 1.2, 1.5, 1.9, 2, 2.5, 3]
+    assert objects_are_allclose(
+        mean_tweedie_deviance(y_true=y_true, y_pred=y_pred, powers=powers, chunk_size=128),
+        {"count": 1000}
+        | {
+            f"mean_tweedie_deviance_power_{power}": float(
+                metrics.mean_tweedie_deviance(y_true=y_true, y_pred=y_pred, power=power)
+            )
+            for power in powers
+        },
+    )
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_mean_tweedie_deviance_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
-        mean_tweedie_deviance(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]))
+    assert objects_are_equal(
+        mean_tweedie_deviance(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5])),
+        {"count": 5, "mean_tweedie_deviance_power_0": 0.0},
+    )
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import math
 from unittest.mock import patch
 
 import numpy as np
 import pytest
-from coola import objects_are_equal
-
-from analora.metric import regression_errors
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.metric import (
+    mean_absolute_error,
+    mean_absolute_percentage_error,
+    mean_squared_error,
+    mean_squared_log_error,
+    median_absolute_error,
+    r2_score,
+    regression_errors,
+    root_mean_squared_error,
+)
 from analora.testing import sklearn_available
 
 #######################################
@@ -14,7 +24,6 @@ from analora.testing import sklearn_available
 #######################################
 
 
-@sklearn_available
 def test_regression_errors_correct() -> None:
     assert objects_are_equal(
         regression_errors(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5])),
@@ -23,11 +32,14 @@ def test_regression_errors_correct() -> None:
             "mean_absolute_error": 0.0,
             "median_absolute_error": 0.0,
             "mean_squared_error": 0.0,
+            "root_mean_squared_error": 0.0,
+            "mean_absolute_percentage_error": 0.0,
+            "mean_squared_log_error": 0.0,
+            "r2_score": 1.0,
         },
     )
 
 
-@sklearn_available
 def test_regression_errors_correct_2d() -> None:
     assert objects_are_equal(
         regression_errors(
@@ -38,11 +50,14 @@ def test_regression_errors_correct_2d() -> None:
             "mean_absolute_error": 0.0,
             "median_absolute_error": 0.0,
             "mean_squared_error": 0.0,
+            "root_mean_squared_error": 0.0,
+            "mean_absolute_percentage_error": 0.0,
+            "mean_squared_log_error": 0.0,
+            "r2_score": 1.0,
         },
     )
 
 
-@sklearn_available
 def test_regression_errors_incorrect() -> None:
     assert objects_are_equal(
         regression_errors(y_true=np.array([4, 3, 2, 1]), y_pred=np.array([1, 2, 3, 4])),
@@ -51,11 +66,14 @@ def test_regression_errors_incorrect() -> None:
             "mean_absolute_error": 2.0,
             "median_absolute_error": 2.0,
             "mean_squared_error": 5.0,
+            "root_mean_squared_error": 2.23606797749979,
+            "mean_absolute_percentage_error": 1.1458333333333333,
+            "mean_squared_log_error": 0.4611748400643131,
+            "r2_score": -3.0,
         },
     )
 
 
-@sklearn_available
 def test_regression_errors_empty() -> None:
     assert objects_are_equal(
         regression_errors(y_true=np.array([]), y_pred=np.array([])),
@@ -64,12 +82,15 @@ def test_regression_errors_empty() -> None:
             "mean_absolute_error": float("nan"),
             "median_absolute_error": float("nan"),
             "mean_squared_error": float("nan"),
+            "root_mean_squared_error": float("nan"),
+            "mean_absolute_percentage_error": float("nan"),
+            "mean_squared_log_error": float("nan"),
+            "r2_score": float("nan"),
         },
         equal_nan=True,
     )
 
 
-@sklearn_available
 def test_regression_errors_prefix_suffix() -> None:
     assert objects_are_equal(
         regression_errors(
@@ -83,11 +104,14 @@ def test_regression_errors_prefix_suffix() -> None:
             "prefix_mean_absolute_error_suffix": 0.0,
             "prefix_median_absolute_error_suffix": 0.0,
             "prefix_mean_squared_error_suffix": 0.0,
+            "prefix_root_mean_squared_error_suffix": 0.0,
+            "prefix_mean_absolute_percentage_error_suffix": 0.0,
+            "prefix_mean_squared_log_error_suffix": 0.0,
+            "prefix_r2_score_suffix": 1.0,
         },
     )
 
 
-@sklearn_available
 def test_regression_errors_nan_omit() -> None:
     assert objects_are_equal(
         regression_errors(
@@ -100,11 +124,14 @@ def test_regression_errors_nan_omit() -> None:
             "mean_absolute_error": 0.0,
             "median_absolute_error": 0.0,
             "mean_squared_error": 0.0,
+            "root_mean_squared_error": 0.0,
+            "mean_absolute_percentage_error": 0.0,
+            "mean_squared_log_error": 0.0,
+            "r2_score": 1.0,
         },
     )
 
 
-@sklearn_available
 def test_regression_errors_nan_omit_y_true() -> None:
     assert objects_are_equal(
         regression_errors(
@@ -117,11 +144,14 @@ def test_regression_errors_nan_omit_y_true() -> None:
             "mean_absolute_error": 0.0,
             "median_absolute_error": 0.0,
             "mean_squared_error": 0.0,
+            "root_mean_squared_error": 0.0,
+            "mean_absolute_percentage_error": 0.0,
+            "mean_squared_log_error": 0.0,
+            "r2_score": 1.0,
         },
     )
 
 
-@sklearn_available
 def test_regression_errors_nan_omit_y_pred() -> None:
     assert objects_are_equal(
         regression_errors(
@@ -134,11 +164,14 @@ def test_regression_errors_nan_omit_y_pred() -> None:
             "mean_absolute_error": 0.0,
             "median_absolute_error": 0.0,
             "mean_squared_error": 0.0,
+            "root_mean_squared_error": 0.0,
+            "mean_absolute_percentage_error": 0.0,
+            "mean_squared_log_error": 0.0,
+            "r2_score": 1.0,
         },
     )
 
 
-@sklearn_available
 def test_regression_errors_nan_propagate() -> None:
     assert objects_are_equal(
         regression_errors(
@@ -151,12 +184,15 @@ def test_regression_errors_nan_propagate() -> None:
             "mean_absolute_error": float("nan"),
             "median_absolute_error": float("nan"),
             "mean_squared_error": float("nan"),
+            "root_mean_squared_error": float("nan"),
+            "mean_absolute_percentage_error": float("nan"),
+            "mean_squared_log_error": float("nan"),
+            "r2_score": float("nan"),
         },
         equal_nan=True,
     )
 
 
-@sklearn_available
 def test_regression_errors_nan_propagate_y_true() -> None:
     assert objects_are_equal(
         regression_errors(
@@ -169,12 +205,15 @@ def test_regression_errors_nan_propagate_y_true() -> None:
             "mean_absolute_error": float("nan"),
             "median_absolute_error": float("nan"),
             "mean_squared_error": float("nan"),
+            "root_mean_squared_error": float("nan"),
+            "mean_absolute_percentage_error": float("nan"),
+            "mean_squared_log_error": float("nan"),
+            "r2_score": float("nan"),
         },
         equal_nan=True,
     )
 
 
-@sklearn_available
 def test_regression_errors_nan_propagate_y_pred() -> None:
     assert objects_are_equal(
         regression_errors(
@@ -187,12 +226,15 @@ def test_regression_errors_nan_propagate_y_pred() -> None:
             "mean_absolute_error": float("nan"),
             "median_absolute_error": float("nan"),
             "mean_squared_error": float("nan"),
+            "root_mean_squared_error": float("nan"),
+            "mean_absolute_percentage_error": float("nan"),
+            "mean_squared_log_error": float("nan"),
+            "r2_score": float("nan"),
         },
         equal_nan=True,
     )
 
 
-@sklearn_available
 def test_regression_errors_nan_raise() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         regression_errors(
@@ -202,7 +244,6 @@ def test_regression_errors_nan_raise() -> None:
         )
 
 
-@sklearn_available
 def test_regression_errors_nan_raise_y_true() -> None:
     with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
         regression_errors(
@@ -212,7 +253,6 @@ def test_regression_errors_nan_raise_y_true() -> None:
         )
 
 
-@sklearn_available
 def test_regression_errors_nan_raise_y_pred() -> None:
     with pytest.raises(ValueError, match="'y_pred' contains at least one NaN value"):
         regression_errors(
@@ -222,7 +262,86 @@ def test_regression_errors_nan_raise_y_pred() -> None:
         )
 
 
+def test_regression_errors_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        regression_errors(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4]))
+
+
+def test_regression_errors_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        regression_errors(
+            y_true=np.array([1, 2, 3, 4, 5]),
+            y_pred=np.array([1, 2, 3, 4, 5]),
+            nan_policy="incorrect",
+        )
+
+
+def test_regression_errors_msle_invalid_values() -> None:
+    out = regression_errors(y_true=np.array([-1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]))
+    assert math.isnan(out["mean_squared_log_error"])
+    assert out["mean_squared_error"] == 0.8
+
+
+def test_regression_errors_one_value() -> None:
+    out = regression_errors(y_true=np.array([2.0]), y_pred=np.array([1.0]))
+    assert out["mean_squared_error"] == 1.0
+    assert math.isnan(out["r2_score"])
+
+
+def test_regression_errors_constant_target() -> None:
+    out = regression_errors(y_true=np.array([2, 2, 2]), y_pred=np.array([1, 2, 3]))
+    assert out["r2_score"] == 0.0
+
+
+def test_regression_errors_infinite_residual() -> None:
+    out = regression_errors(
+        y_true=np.array([float("inf"), 2, 3]), y_pred=np.array([float("inf"), 2, 3])
+    )
+    assert out["count"] == 3
+    assert math.isnan(out["mean_squared_error"])
+
+
+def test_regression_errors_does_not_modify_inputs() -> None:
+    y_true = np.array([4.0, 3.0, 2.0, 1.0])
+    y_pred = np.array([1.0, 2.0, 3.0, 4.0])
+    regression_errors(y_true=y_true, y_pred=y_pred)
+    assert objects_are_equal(y_true, np.array([4.0, 3.0, 2.0, 1.0]))
+    assert objects_are_equal(y_pred, np.array([1.0, 2.0, 3.0, 4.0]))
+
+
+@sklearn_available
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate"])
+def test_regression_errors_same_as_individual_metrics(nan_policy: str) -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.uniform(0, 10, size=1000)
+    y_pred = rng.uniform(0, 10, size=1000)
+    y_true[::97] = float("nan")
+    y_pred[::89] = float("nan")
+    assert objects_are_allclose(
+        regression_errors(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy),
+        mean_absolute_error(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | median_absolute_error(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | mean_squared_error(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | root_mean_squared_error(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | mean_absolute_percentage_error(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | mean_squared_log_error(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        | r2_score(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy),
+        equal_nan=True,
+    )
+
+
 @patch("analora.utils.imports.is_sklearn_available", lambda: False)
 def test_regression_errors_no_sklearn() -> None:
-    with pytest.raises(RuntimeError, match="'sklearn' package is required but not installed."):
-        regression_errors(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]))
+    assert objects_are_equal(
+        regression_errors(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5])),
+        {
+            "count": 5,
+            "mean_absolute_error": 0.0,
+            "median_absolute_error": 0.0,
+            "mean_squared_error": 0.0,
+            "root_mean_squared_error": 0.0,
+            "mean_absolute_percentage_error": 0.0,
+            "mean_squared_log_error": 0.0,
+            "r2_score": 1.0,
+        },
+    )
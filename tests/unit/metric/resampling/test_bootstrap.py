@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+
+from analora.metric import accuracy, mean_absolute_error, regression_errors
+from analora.metric.resampling import bootstrap_ci
+from analora.testing import sklearn_available
+
+##################################
+#     Tests for bootstrap_ci     #
+##################################
+
+
+@sklearn_available
+def test_bootstrap_ci_accuracy() -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 2, size=1000)
+    y_pred = np.where(rng.random(1000) < 0.8, y_true, 1 - y_true)
+    out = bootstrap_ci(accuracy, y_true, y_pred, rng=np.random.default_rng(42))
+    assert list(out) == [
+        "accuracy",
+        "accuracy_ci_low",
+        "accuracy_ci_high",
+        "count_correct",
+        "count_correct_ci_low",
+        "count_correct_ci_high",
+        "count_incorrect",
+        "count_incorrect_ci_low",
+        "count_incorrect_ci_high",
+        "count",
+        "error",
+        "error_ci_low",
+        "error_ci_high",
+    ]
+    assert out["accuracy_ci_low"] < out["accuracy"] < out["accuracy_ci_high"]
+    assert 0.75 < out["accuracy_ci_low"] < out["accuracy_ci_high"] < 0.85
+
+
+@sklearn_available
+def test_bootstrap_ci_perfect() -> None:
+    assert objects_are_allclose(
+        bootstrap_ci(
+            mean_absolute_error,
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([1.0, 2.0, 3.0]),
+            num_resamples=10,
+        ),
+        {
+            "count": 3,
+            "mean_absolute_error": 0.0,
+            "mean_absolute_error_ci_low": 0.0,
+            "mean_absolute_error_ci_high": 0.0,
+        },
+    )
+
+
+@sklearn_available
+def test_bootstrap_ci_confidence_level() -> None:
+    rng = np.random.default_rng(42)
+    y_true, y_pred = rng.normal(size=100), rng.normal(size=100)
+    out1 = bootstrap_ci(
+        mean_absolute_error, y_true, y_pred, confidence_level=0.5, rng=np.random.default_rng(1)
+    )
+    out2 = bootstrap_ci(
+        mean_absolute_error, y_true, y_pred, confidence_level=0.99, rng=np.random.default_rng(1)
+    )
+    assert out2["mean_absolute_error_ci_low"] < out1["mean_absolute_error_ci_low"]
+    assert out1["mean_absolute_error_ci_high"] < out2["mean_absolute_error_ci_high"]
+
+
+@sklearn_available
+def test_bootstrap_ci_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        bootstrap_ci(
+            mean_absolute_error,
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([1.0, 2.0, 3.0]),
+            num_resamples=10,
+            prefix="prefix_",
+            suffix="_suffix",
+        ),
+        {
+            "prefix_count_suffix": 3,
+            "prefix_mean_absolute_error_suffix": 0.0,
+            "prefix_mean_absolute_error_ci_low_suffix": 0.0,
+            "prefix_mean_absolute_error_ci_high_suffix": 0.0,
+        },
+    )
+
+
+def test_bootstrap_ci_kwargs() -> None:
+    out = bootstrap_ci(
+        regression_errors,
+        y_true=np.array([1.0, 2.0, 3.0, float("nan")]),
+        y_pred=np.array([1.0, 2.0, 3.0, 4.0]),
+        num_resamples=10,
+        nan_policy="omit",
+    )
+    assert out["count"] == 3
+    assert out["mean_absolute_error_ci_low"] == 0.0
+    assert out["mean_absolute_error_ci_high"] == 0.0
+
+
+def test_bootstrap_ci_nan_propagate() -> None:
+    out = bootstrap_ci(
+        regression_errors,
+        y_true=np.array([float("nan"), float("nan")]),
+        y_pred=np.array([1.0, 2.0]),
+        num_resamples=10,
+    )
+    assert np.isnan(out["mean_absolute_error_ci_low"])
+    assert np.isnan(out["mean_absolute_error_ci_high"])
+
+
+@pytest.mark.parametrize("confidence_level", [0.0, 1.0, 1.5])
+def test_bootstrap_ci_incorrect_confidence_level(confidence_level: float) -> None:
+    with pytest.raises(ValueError, match="Incorrect confidence_level"):
+        bootstrap_ci(regression_errors, np.ones(3), np.ones(3), confidence_level=confidence_level)
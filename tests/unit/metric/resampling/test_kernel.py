@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+
+from analora.metric import (
+    accuracy,
+    mean_absolute_error,
+    mean_squared_error,
+    ndcg,
+    r2_score,
+    root_mean_squared_error,
+)
+from analora.metric.resampling.kernel import find_kernel
+from analora.testing import sklearn_available
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+METRICS = [accuracy, mean_absolute_error, mean_squared_error, r2_score, root_mean_squared_error]
+
+
+#################################
+#     Tests for find_kernel     #
+#################################
+
+
+@pytest.mark.parametrize("metric", METRICS)
+def test_find_kernel(metric: Callable) -> None:
+    assert find_kernel(metric, [np.array([1, 2]), np.array([1, 2])], kwargs={}) is not None
+
+
+def test_find_kernel_nan_policy() -> None:
+    assert (
+        find_kernel(accuracy, [np.array([1, 2]), np.array([1, 2])], kwargs={"nan_policy": "omit"})
+        is not None
+    )
+
+
+def test_find_kernel_no_kernel() -> None:
+    assert find_kernel(ndcg, [np.array([1, 2]), np.array([1, 2])], kwargs={}) is None
+
+
+def test_find_kernel_other_kwargs() -> None:
+    assert find_kernel(accuracy, [np.array([1, 2]), np.array([1, 2])], kwargs={"k": 1}) is None
+
+
+def test_find_kernel_nan() -> None:
+    assert (
+        find_kernel(accuracy, [np.array([1, 2]), np.array([1.0, float("nan")])], kwargs={}) is None
+    )
+
+
+def test_find_kernel_2d() -> None:
+    assert find_kernel(accuracy, [np.ones((2, 2)), np.ones((2, 2))], kwargs={}) is None
+
+
+@sklearn_available
+@pytest.mark.filterwarnings("ignore:R\\^2 score is not well-defined with less than two samples.")
+@pytest.mark.parametrize("metric", METRICS)
+@pytest.mark.parametrize("n", [1, 2, 10])
+def test_find_kernel_same_as_metric(metric: Callable, n: int) -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 3, size=(5, n)).astype(float)
+    y_pred = rng.integers(0, 3, size=(5, n)).astype(float)
+    kernel = find_kernel(metric, [y_true[0], y_pred[0]], kwargs={})
+    outputs = [metric(y_true[i], y_pred[i]) for i in range(5)]
+    expected = {
+        key: np.array([out[key] for out in outputs]) for key in outputs[0] if key != "count"
+    }
+    assert objects_are_allclose(kernel(y_true, y_pred), expected, equal_nan=True)
+
+
+@sklearn_available
+def test_find_kernel_accuracy_empty() -> None:
+    kernel = find_kernel(accuracy, [np.array([]), np.array([])], kwargs={})
+    assert objects_are_allclose(
+        kernel(np.zeros((2, 0)), np.zeros((2, 0))),
+        {
+            "accuracy": np.full(2, float("nan")),
+            "count_correct": np.full(2, float("nan")),
+            "count_incorrect": np.full(2, float("nan")),
+            "error": np.full(2, float("nan")),
+        },
+        equal_nan=True,
+    )
+
+
+def test_find_kernel_r2_score_constant() -> None:
+    kernel = find_kernel(r2_score, [np.array([1.0, 2.0]), np.array([1.0, 2.0])], kwargs={})
+    assert objects_are_allclose(
+        kernel(np.array([[1.0, 1.0], [1.0, 1.0]]), np.array([[1.0, 1.0], [1.0, 2.0]])),
+        {"r2_score": np.array([1.0, 0.0])},
+    )
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+
+from analora.metric import accuracy, regression_errors
+from analora.metric.resampling import permutation_test
+from analora.metric.resampling.permutation import _pvalue
+from analora.testing import sklearn_available
+
+######################################
+#     Tests for permutation_test     #
+######################################
+
+
+@sklearn_available
+def test_permutation_test_accuracy() -> None:
+    assert objects_are_allclose(
+        permutation_test(
+            accuracy,
+            y_true=np.array([1, 0, 0, 1, 1, 0, 1, 0, 0, 1]),
+            y_pred=np.array([1, 0, 0, 1, 1, 0, 1, 0, 0, 1]),
+            alternative="greater",
+            rng=np.random.default_rng(42),
+        ),
+        {
+            "accuracy": 1.0,
+            "accuracy_pvalue": 1 / 1001,
+            "count_correct": 10,
+            "count_correct_pvalue": 1 / 1001,
+            "count_incorrect": 0,
+            "count_incorrect_pvalue": 1.0,
+            "count": 10,
+            "error": 0.0,
+            "error_pvalue": 1.0,
+        },
+    )
+
+
+@sklearn_available
+def test_permutation_test_random_predictions() -> None:
+    rng = np.random.default_rng(42)
+    out = permutation_test(
+        accuracy,
+        y_true=rng.integers(0, 2, size=200),
+        y_pred=rng.integers(0, 2, size=200),
+        num_resamples=200,
+        rng=np.random.default_rng(42),
+    )
+    assert out["accuracy_pvalue"] > 0.05
+
+
+def test_permutation_test_alternative_less() -> None:
+    out = permutation_test(
+        regression_errors,
+        y_true=np.arange(10, dtype=float),
+        y_pred=np.arange(10, dtype=float),
+        alternative="less",
+        num_resamples=100,
+        rng=np.random.default_rng(42),
+    )
+    assert out["mean_absolute_error_pvalue"] == 1 / 101
+
+
+def test_permutation_test_prefix_suffix() -> None:
+    out = permutation_test(
+        regression_errors,
+        y_true=np.arange(10, dtype=float),
+        y_pred=np.arange(10, dtype=float),
+        num_resamples=10,
+        prefix="prefix_",
+        suffix="_suffix",
+    )
+    assert "prefix_mean_absolute_error_pvalue_suffix" in out
+    assert "prefix_count_pvalue_suffix" not in out
+
+
+def test_permutation_test_incorrect_alternative() -> None:
+    with pytest.raises(ValueError, match="Incorrect alternative: incorrect"):
+        permutation_test(regression_errors, np.ones(3), np.ones(3), alternative="incorrect")
+
+
+#############################
+#     Tests for _pvalue     #
+#############################
+
+
+def test_pvalue_greater() -> None:
+    assert _pvalue(3.0, np.array([1.0, 2.0, 3.0, 4.0]), alternative="greater") == 0.6
+
+
+def test_pvalue_less() -> None:
+    assert _pvalue(3.0, np.array([1.0, 2.0, 3.0, 4.0]), alternative="less") == 0.8
+
+
+def test_pvalue_two_sided() -> None:
+    assert _pvalue(4.0, np.array([1.0, 2.0, 3.0, 4.0]), alternative="two-sided") == 0.8
+
+
+def test_pvalue_nan() -> None:
+    assert np.isnan(_pvalue(float("nan"), np.array([1.0, 2.0]), alternative="greater"))
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_equal
+
+from analora.metric import accuracy, balanced_accuracy, regression_errors
+from analora.metric.resampling import evaluate_resamples
+from analora.metric.resampling.utils import interleave_keys
+from analora.testing import sklearn_available
+
+########################################
+#     Tests for evaluate_resamples     #
+########################################
+
+
+@sklearn_available
+@pytest.mark.parametrize("mode", ["bootstrap", "permutation"])
+def test_evaluate_resamples(mode: str) -> None:
+    out = evaluate_resamples(
+        accuracy,
+        [np.array([1, 0, 0, 1, 1]), np.array([1, 0, 0, 1, 0])],
+        mode=mode,
+        num_resamples=10,
+        rng=np.random.default_rng(42),
+    )
+    assert list(out) == ["accuracy", "count_correct", "count_incorrect", "error"]
+    assert all(values.shape == (10,) for values in out.values())
+
+
+def test_evaluate_resamples_bootstrap_values() -> None:
+    out = evaluate_resamples(
+        regression_errors,
+        [np.array([1.0, 2.0, 3.0]), np.array([1.0, 2.0, 3.0])],
+        num_resamples=5,
+        rng=np.random.default_rng(42),
+    )
+    assert objects_are_equal(out["mean_absolute_error"], np.zeros(5))
+
+
+@sklearn_available
+def test_evaluate_resamples_permutation_keeps_values() -> None:
+    out = evaluate_resamples(
+        accuracy,
+        [np.array([1, 1, 1, 1]), np.array([1, 1, 0, 0])],
+        mode="permutation",
+        num_resamples=5,
+        rng=np.random.default_rng(42),
+    )
+    assert objects_are_equal(out["count_correct"], np.full(5, 2))
+
+
+@sklearn_available
+@pytest.mark.parametrize("mode", ["bootstrap", "permutation"])
+def test_evaluate_resamples_same_seed(mode: str) -> None:
+    arrays = [np.array([1, 0, 0, 1, 1, 0]), np.array([1, 0, 1, 1, 0, 0])]
+    assert objects_are_equal(
+        evaluate_resamples(
+            balanced_accuracy, arrays, mode=mode, num_resamples=7, rng=np.random.default_rng(1)
+        ),
+        evaluate_resamples(
+            balanced_accuracy, arrays, mode=mode, num_resamples=7, rng=np.random.default_rng(1)
+        ),
+        equal_nan=True,
+    )
+
+
+@sklearn_available
+def test_evaluate_resamples_num_workers() -> None:
+    arrays = [np.array([1, 0, 0, 1, 1, 0]), np.array([1, 0, 1, 1, 0, 0])]
+    assert objects_are_equal(
+        evaluate_resamples(
+            accuracy, arrays, num_resamples=7, batch_size=2, rng=np.random.default_rng(1)
+        ),
+        evaluate_resamples(
+            accuracy,
+            arrays,
+            num_resamples=7,
+            batch_size=2,
+            num_workers=2,
+            rng=np.random.default_rng(1),
+        ),
+    )
+
+
+@sklearn_available
+def test_evaluate_resamples_generic_same_as_kernel() -> None:
+    arrays = [np.array([1, 0, 0, 1, 1, 0]), np.array([1, 0, 1, 1, 0, 0])]
+    assert objects_are_equal(
+        evaluate_resamples(accuracy, arrays, num_resamples=7, rng=np.random.default_rng(1)),
+        evaluate_resamples(
+            accuracy,
+            arrays,
+            num_resamples=7,
+            rng=np.random.default_rng(1),
+            kwargs={"prefix": ""},
+        ),
+    )
+
+
+def test_evaluate_resamples_incorrect_mode() -> None:
+    with pytest.raises(ValueError, match="Incorrect mode: incorrect"):
+        evaluate_resamples(accuracy, [np.ones(3), np.ones(3)], mode="incorrect")
+
+
+def test_evaluate_resamples_incorrect_num_resamples() -> None:
+    with pytest.raises(ValueError, match="Incorrect num_resamples: 0"):
+        evaluate_resamples(accuracy, [np.ones(3), np.ones(3)], num_resamples=0)
+
+
+def test_evaluate_resamples_incorrect_batch_size() -> None:
+    with pytest.raises(ValueError, match="Incorrect batch_size: 0"):
+        evaluate_resamples(accuracy, [np.ones(3), np.ones(3)], batch_size=0)
+
+
+def test_evaluate_resamples_incorrect_num_workers() -> None:
+    with pytest.raises(ValueError, match="Incorrect num_workers: -1"):
+        evaluate_resamples(accuracy, [np.ones(3), np.ones(3)], num_workers=-1)
+
+
+def test_evaluate_resamples_different_rows() -> None:
+    with pytest.raises(ValueError, match="different numbers of rows: 3 vs 4"):
+        evaluate_resamples(accuracy, [np.ones(3), np.ones(4)])
+
+
+#####################################
+#     Tests for interleave_keys     #
+#####################################
+
+
+def test_interleave_keys() -> None:
+    assert list(
+        interleave_keys(
+            {"a": 1, "b": 2, "c": 3}, {"a": {"a_low": 0, "a_high": 2}, "c": {"c_low": 1}}
+        )
+    ) == ["a", "a_low", "a_high", "b", "c", "c_low"]
+
+
+def test_interleave_keys_empty() -> None:
+    assert interleave_keys({"a": 1}, {}) == {"a": 1}
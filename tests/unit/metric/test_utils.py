@@ -5,7 +5,10 @@ import pytest
 from coola import objects_are_equal
 
 from analora.array.checking import check_same_shape, multi_isnan
+from analora.metric import mean_absolute_error, mean_squared_error, spearmanr
 from analora.metric.utils import (
+    PreprocessingCache,
+    RankCache,
     check_array_ndim,
     check_label_type,
     check_nan_policy,
@@ -19,11 +22,236 @@ from analora.metric.utils import (
     preprocess_score_binary,
     preprocess_score_multiclass,
     preprocess_score_multilabel,
+    rankdata,
 )
+from analora.testing import scipy_available, sklearn_available
 
 NAN_POLICIES = ["omit", "propagate", "raise"]
 
 
+########################################
+#     Tests for PreprocessingCache     #
+########################################
+
+
+def test_preprocessing_cache_repr() -> None:
+    assert repr(PreprocessingCache()) == "PreprocessingCache(num_results=0, num_nan_flags=0)"
+
+
+def test_preprocessing_cache_has_nan() -> None:
+    cache = PreprocessingCache()
+    assert cache.has_nan(np.array([1.0, float("nan")]))
+    assert not cache.has_nan(np.array([1.0, 2.0]))
+
+
+def test_preprocessing_cache_has_nan_computed_once() -> None:
+    cache = PreprocessingCache()
+    x = np.array([1.0, 2.0])
+    assert not cache.has_nan(x)
+    cache.set_nan_flag(x, has_nan=True)
+    assert cache.has_nan(x)
+    assert cache.has_nan(x.ravel())
+
+
+def test_preprocessing_cache_get_or_compute() -> None:
+    cache = PreprocessingCache()
+    x = np.array([1.0, float("nan"), 3.0])
+    calls = []
+
+    def compute() -> np.ndarray:
+        calls.append(1)
+        return x[~np.isnan(x)]
+
+    out1 = cache.get_or_compute(name="nonnan", arrays=[x], compute=compute)
+    out2 = cache.get_or_compute(name="nonnan", arrays=[x], compute=compute)
+    assert out1 is out2
+    assert objects_are_equal(out1, np.array([1.0, 3.0]))
+    assert len(calls) == 1
+
+
+def test_preprocessing_cache_get_or_compute_different_name() -> None:
+    cache = PreprocessingCache()
+    x = np.array([1.0, 2.0])
+    assert cache.get_or_compute(name="a", arrays=[x], compute=lambda: 1) == 1
+    assert cache.get_or_compute(name="b", arrays=[x], compute=lambda: 2) == 2
+
+
+def test_preprocessing_cache_get_or_compute_different_views() -> None:
+    cache = PreprocessingCache()
+    x = np.array([1.0, 2.0, 3.0, 4.0])
+    assert cache.get_or_compute(name="a", arrays=[x], compute=lambda: 1) == 1
+    assert cache.get_or_compute(name="a", arrays=[x.ravel()], compute=lambda: 2) == 1
+    assert cache.get_or_compute(name="a", arrays=[x[::2]], compute=lambda: 3) == 3
+    assert cache.get_or_compute(name="a", arrays=[x.reshape(2, 2)], compute=lambda: 4) == 4
+
+
+def test_preprocessing_cache_clear() -> None:
+    cache = PreprocessingCache()
+    cache.has_nan(np.array([1.0, 2.0]))
+    cache.get_or_compute(name="a", arrays=[np.array([1.0])], compute=lambda: 1)
+    cache.clear()
+    assert repr(cache) == "PreprocessingCache(num_results=0, num_nan_flags=0)"
+
+
+def test_preprocessing_cache_context_manager() -> None:
+    y_true = np.array([1, 2, 3, 4, 5, float("nan")])
+    y_pred = np.array([1, 2, 3, 4, 6, 1])
+    with PreprocessingCache() as cache:
+        out1 = preprocess_pred(y_true, y_pred, drop_nan=True)
+        out2 = preprocess_pred(y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=True)
+        assert out1 is out2
+        assert not contains_nan(out1[0])
+        assert repr(cache) == "PreprocessingCache(num_results=1, num_nan_flags=2)"
+    assert repr(cache) == "PreprocessingCache(num_results=0, num_nan_flags=0)"
+    assert preprocess_pred(y_true, y_pred, drop_nan=True) is not out1
+
+
+def test_preprocessing_cache_keep_nan_not_cached() -> None:
+    y_true = np.array([1, 2, 3, 4, 5, float("nan")])
+    y_pred = np.array([1, 2, 3, 4, 6, 1])
+    with PreprocessingCache() as cache:
+        preprocess_pred(y_true, y_pred)
+        assert repr(cache) == "PreprocessingCache(num_results=0, num_nan_flags=0)"
+
+
+def test_preprocessing_cache_contains_nan_raise() -> None:
+    x = np.array([1.0, float("nan")])
+    with PreprocessingCache():
+        assert contains_nan(x, nan_policy="omit")
+        with pytest.raises(ValueError, match="'x' contains at least one NaN"):
+            contains_nan(x, nan_policy="raise", name="'x'")
+
+
+def test_preprocessing_cache_nested() -> None:
+    x = np.array([1.0, float("nan")])
+    with PreprocessingCache() as cache:
+        with cache:
+            contains_nan(x)
+        assert repr(cache) == "PreprocessingCache(num_results=0, num_nan_flags=1)"
+        with PreprocessingCache() as inner:
+            contains_nan(x)
+            assert repr(inner) == "PreprocessingCache(num_results=0, num_nan_flags=1)"
+    assert repr(cache) == "PreprocessingCache(num_results=0, num_nan_flags=0)"
+
+
+def test_preprocessing_cache_same_array_sequence() -> None:
+    x = np.array([1.0, 2.0, float("nan")])
+    y = np.array([1.0, float("nan"), 3.0])
+    with PreprocessingCache():
+        out1 = preprocess_same_shape_arrays([x, y], drop_nan=True)
+        out2 = preprocess_same_shape_arrays(arrays=(x, y), drop_nan=True)
+        assert out1 is out2
+    assert objects_are_equal(out1, (np.array([1.0]), np.array([1.0])))
+
+
+@sklearn_available
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate"])
+def test_preprocessing_cache_metrics(nan_policy: str) -> None:
+    y_true = np.array([1, 2, 3, 4, 5, float("nan")])
+    y_pred = np.array([1, 2, 3, 4, 6, 1])
+    expected = [
+        mean_absolute_error(y_true, y_pred, nan_policy=nan_policy),
+        mean_squared_error(y_true, y_pred, nan_policy=nan_policy),
+    ]
+    with PreprocessingCache():
+        assert objects_are_equal(
+            [
+                mean_absolute_error(y_true, y_pred, nan_policy=nan_policy),
+                mean_squared_error(y_true, y_pred, nan_policy=nan_policy),
+            ],
+            expected,
+            equal_nan=True,
+        )
+
+
+###############################
+#     Tests for RankCache     #
+###############################
+
+
+def test_rank_cache_repr() -> None:
+    assert repr(RankCache()) == "RankCache(num_ranks=0, max_size=128, hits=0, misses=0)"
+
+
+def test_rank_cache_incorrect_max_size() -> None:
+    with pytest.raises(ValueError, match="Incorrect max_size: 0"):
+        RankCache(max_size=0)
+
+
+@scipy_available
+def test_rank_cache_rank() -> None:
+    cache = RankCache()
+    x = np.array([3, 1, 2, 1])
+    ranks = cache.rank(x)
+    assert objects_are_equal(ranks, np.array([4.0, 1.5, 3.0, 1.5]))
+    assert cache.rank(x) is ranks
+    assert repr(cache) == "RankCache(num_ranks=1, max_size=128, hits=1, misses=1)"
+
+
+@scipy_available
+def test_rank_cache_rank_view() -> None:
+    cache = RankCache()
+    x = np.array([3, 1, 2, 1])
+    ranks = cache.rank(x)
+    assert cache.rank(x.ravel()) is ranks
+
+
+@scipy_available
+def test_rank_cache_rank_nan_policy() -> None:
+    cache = RankCache()
+    x = np.array([3.0, 1.0, float("nan"), 2.0])
+    assert objects_are_equal(
+        cache.rank(x, nan_policy="omit"), np.array([3.0, 1.0, float("nan"), 2.0]), equal_nan=True
+    )
+    assert objects_are_equal(
+        cache.rank(x, nan_policy="propagate"), np.full((4,), float("nan")), equal_nan=True
+    )
+    assert repr(cache) == "RankCache(num_ranks=2, max_size=128, hits=0, misses=2)"
+
+
+@scipy_available
+def test_rank_cache_lru_eviction() -> None:
+    cache = RankCache(max_size=2)
+    x1, x2, x3 = np.array([1, 2]), np.array([2, 1]), np.array([1, 1])
+    cache.rank(x1)
+    cache.rank(x2)
+    cache.rank(x1)
+    cache.rank(x3)  # evict x2
+    assert repr(cache) == "RankCache(num_ranks=2, max_size=2, hits=1, misses=3)"
+    cache.rank(x1)
+    cache.rank(x2)
+    assert repr(cache) == "RankCache(num_ranks=2, max_size=2, hits=2, misses=4)"
+
+
+@scipy_available
+def test_rank_cache_clear() -> None:
+    cache = RankCache()
+    cache.rank(np.array([3, 1, 2]))
+    cache.clear()
+    assert repr(cache) == "RankCache(num_ranks=0, max_size=128, hits=0, misses=0)"
+
+
+@scipy_available
+def test_rank_cache_context_spearmanr() -> None:
+    rng = np.random.default_rng(42)
+    x, y = rng.normal(size=(3, 20)), rng.normal(size=20)
+    expected = [spearmanr(x=xi, y=y) for xi in x]
+    with RankCache() as cache:
+        assert [spearmanr(x=xi, y=y) for xi in x] == expected
+        assert repr(cache) == "RankCache(num_ranks=4, max_size=128, hits=2, misses=4)"
+    assert repr(cache) == "RankCache(num_ranks=0, max_size=128, hits=0, misses=0)"
+
+
+@scipy_available
+def test_rank_cache_nested() -> None:
+    x = np.array([3, 1, 2])
+    with RankCache() as cache:
+        with cache:
+            rankdata(x)
+        assert repr(cache) == "RankCache(num_ranks=1, max_size=128, hits=0, misses=1)"
+    assert repr(cache) == "RankCache(num_ranks=0, max_size=128, hits=0, misses=0)"
+
+
 ######################################
 #     Tests for check_array_ndim     #
 ######################################
@@ -203,6 +431,14 @@ def test_contains_nan_raise_name() -> None:
         contains_nan(np.array([1, 2, 3, 4, np.nan]), nan_policy="raise", name="'x'")
 
 
+def test_contains_nan_int() -> None:
+    assert not contains_nan(np.array([1, 2, 3, 4]), nan_policy="raise")
+
+
+def test_contains_nan_object() -> None:
+    assert contains_nan(np.array(["a", "b", float("nan")], dtype=object))
+
+
 #################################
 #     Tests for multi_isnan     #
 #################################
@@ -245,6 +481,20 @@ def test_multi_isnan_empty() -> None:
         multi_isnan([])
 
 
+def test_multi_isnan_int_and_float() -> None:
+    assert objects_are_equal(
+        multi_isnan([np.array([1, 0, 0, 1]), np.array([1.0, float("nan"), 0.0, 1.0])]),
+        np.array([False, True, False, False]),
+    )
+
+
+def test_multi_isnan_no_nan() -> None:
+    assert objects_are_equal(
+        multi_isnan([np.array([1, 0, 0, 1]), np.array([1.0, 2.0, 0.0, 1.0])]),
+        np.array([False, False, False, False]),
+    )
+
+
 #####################################
 #     Tests for preprocess_pred     #
 #####################################
@@ -309,6 +559,13 @@ def test_preprocess_pred_incorrect_shapes() -> None:
         preprocess_pred(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([0, 1, 0, 1, 1, 0]))
 
 
+def test_preprocess_pred_drop_nan_int() -> None:
+    y_true, y_pred = np.array([1, 0, 0, 1, 1]), np.array([0, 1, 0, 1, 1])
+    out = preprocess_pred(y_true=y_true, y_pred=y_pred, drop_nan=True)
+    assert out[0] is y_true
+    assert out[1] is y_pred
+
+
 ################################################
 #     Tests for preprocess_pred_multilabel     #
 ################################################
@@ -995,3 +1252,56 @@ def test_preprocess_score_multilabel_incorrect_ndim_y_true() -> None:
         RuntimeError, match="'y_true' must be a 1d or 2d array but received an array of shape"
     ):
         preprocess_score_multilabel(y_true=np.ones((5, 3, 1)), y_score=np.ones((5, 3)))
+
+
+##############################
+#     Tests for rankdata     #
+##############################
+
+
+@scipy_available
+def test_rankdata() -> None:
+    assert objects_are_equal(rankdata(np.array([3, 1, 2, 1])), np.array([4.0, 1.5, 3.0, 1.5]))
+
+
+@scipy_available
+def test_rankdata_2d() -> None:
+    assert objects_are_equal(
+        rankdata(np.array([[3, 1], [1, 2], [2, 3]])),
+        np.array([[3.0, 1.0], [1.0, 2.0], [2.0, 3.0]]),
+    )
+
+
+@scipy_available
+def test_rankdata_empty() -> None:
+    assert objects_are_equal(rankdata(np.array([])), np.array([]))
+
+
+@scipy_available
+def test_rankdata_nan_omit() -> None:
+    assert objects_are_equal(
+        rankdata(np.array([3.0, 1.0, float("nan"), 2.0]), nan_policy="omit"),
+        np.array([3.0, 1.0, float("nan"), 2.0]),
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_rankdata_nan_propagate() -> None:
+    assert objects_are_equal(
+        rankdata(np.array([[3.0, 1.0], [float("nan"), 2.0]])),
+        np.array([[float("nan"), 1.0], [float("nan"), 2.0]]),
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_rankdata_nan_raise() -> None:
+    with pytest.raises(ValueError, match="input array contains at least one NaN value"):
+        rankdata(np.array([3.0, float("nan")]), nan_policy="raise")
+
+
+@scipy_available
+def test_rankdata_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        rankdata(np.array([3.0, 1.0]), nan_policy="incorrect")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from matplotlib import pyplot as plt
 
 from analora.plot import plot_cdf
+from analora.plot.utils import HistogramSummary
 
 ##############################
 #     Tests for plot_cdf     #
@@ -23,3 +25,36 @@ def test_plot_cdf_empty() -> None:
 def test_plot_cdf_nan() -> None:
     _fig, ax = plt.subplots()
     plot_cdf(ax, array=np.array([1, 2, np.nan, 3, np.nan]))
+
+
+def test_plot_cdf_range() -> None:
+    _fig, ax = plt.subplots()
+    plot_cdf(ax, array=np.arange(100), nbins=4, xmin=50, xmax=89)
+    line = ax.get_lines()[0]
+    assert np.allclose(line.get_ydata(), np.array([0.6, 0.7, 0.8, 0.9]))
+
+
+def test_plot_cdf_range_outside() -> None:
+    _fig, ax = plt.subplots()
+    plot_cdf(ax, array=np.arange(100), nbins=4, xmin=200)
+    line = ax.get_lines()[0]
+    assert np.allclose(line.get_ydata(), np.array([1.0, 1.0, 1.0, 1.0]))
+
+
+def test_plot_cdf_summary() -> None:
+    _fig, ax = plt.subplots()
+    plot_cdf(ax, summary=HistogramSummary.compute(np.arange(100), nbins=4, xmin=50, xmax=89))
+    line = ax.get_lines()[0]
+    assert np.allclose(line.get_ydata(), np.array([0.6, 0.7, 0.8, 0.9]))
+
+
+def test_plot_cdf_summary_empty() -> None:
+    _fig, ax = plt.subplots()
+    plot_cdf(ax, summary=HistogramSummary.compute(np.array([]), nbins=4))
+    assert len(ax.get_lines()) == 0
+
+
+def test_plot_cdf_no_array_no_summary() -> None:
+    _fig, ax = plt.subplots()
+    with pytest.raises(ValueError, match="array and summary cannot both be None"):
+        plot_cdf(ax)
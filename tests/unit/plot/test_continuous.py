@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -12,6 +13,11 @@ from analora.plot import (
     hist_continuous,
     hist_continuous2,
 )
+from analora.plot.utils import (
+    HistogramSummary,
+    compute_box_stats,
+    compute_box_stats_sequence,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -48,6 +54,38 @@ def test_boxplot_continuous_empty() -> None:
     boxplot_continuous(ax=ax, array=np.array([]))
 
 
+def test_boxplot_continuous_nan() -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous(ax=ax, array=np.array([1.0, float("nan"), 3.0, 100.0]))
+
+
+@pytest.mark.parametrize("approximate", [True, False])
+def test_boxplot_continuous_approximate(approximate: bool) -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous(ax=ax, array=np.arange(101), xmin="q0.1", approximate=approximate)
+    assert ax.get_xlim() == (10.0, 100.0)
+
+
+@pytest.mark.parametrize(("min_size", "approximate"), [(10, True), (10_000, False)])
+def test_boxplot_continuous_approximate_auto(min_size: int, approximate: bool) -> None:
+    _fig, ax = plt.subplots()
+    with (
+        patch("analora.plot.continuous.APPROXIMATE_MIN_SIZE", min_size),
+        patch("analora.plot.continuous.compute_box_stats", wraps=compute_box_stats) as compute,
+    ):
+        boxplot_continuous(ax=ax, array=np.arange(101))
+    assert compute.call_args.kwargs["approximate"] is approximate
+
+
+def test_boxplot_continuous_max_fliers() -> None:
+    _fig, ax = plt.subplots()
+    array = np.concatenate([np.zeros(1000), np.arange(1, 101) * 1000.0])
+    boxplot_continuous(ax=ax, array=array, max_fliers=5)
+    fliers = [line for line in ax.lines if line.get_linestyle() == "None"]
+    assert len(fliers) == 1
+    assert fliers[0].get_ydata().size == 5
+
+
 ################################################
 #    Tests for boxplot_continuous_temporal     #
 ################################################
@@ -95,6 +133,80 @@ def test_boxplot_continuous_temporal_yscale(data_temp: Sequence[np.ndarray], ysc
     )
 
 
+@pytest.mark.parametrize("yscale", ["linear", "auto"])
+@pytest.mark.parametrize("ymin", [None, "q0.1"])
+def test_boxplot_continuous_temporal_approximate(
+    data_temp: Sequence[np.ndarray], ymin: str | None, yscale: str
+) -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous_temporal(
+        ax=ax,
+        data=data_temp,
+        steps=list(range(len(data_temp))),
+        ymin=ymin,
+        ymax="q0.9",
+        yscale=yscale,
+        approximate=True,
+    )
+
+
+@pytest.mark.parametrize(("min_size", "approximate"), [(10, True), (10_000, False)])
+def test_boxplot_continuous_temporal_approximate_auto(
+    data_temp: Sequence[np.ndarray], min_size: int, approximate: bool
+) -> None:
+    _fig, ax = plt.subplots()
+    with (
+        patch("analora.plot.continuous.APPROXIMATE_MIN_SIZE", min_size),
+        patch(
+            "analora.plot.continuous.compute_box_stats_sequence",
+            wraps=compute_box_stats_sequence,
+        ) as compute,
+    ):
+        boxplot_continuous_temporal(ax=ax, data=data_temp, steps=list(range(len(data_temp))))
+    assert compute.call_args.kwargs["approximate"] is approximate
+
+
+def test_boxplot_continuous_temporal_num_workers(data_temp: Sequence[np.ndarray]) -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous_temporal(
+        ax=ax, data=data_temp, steps=list(range(len(data_temp))), num_workers=2
+    )
+
+
+def test_boxplot_continuous_temporal_ylim() -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous_temporal(
+        ax=ax, data=[np.arange(11), np.array([-5.0, float("nan"), 20.0])], steps=[0, 1]
+    )
+    assert ax.get_ylim() == (-5.0, 20.0)
+
+
+def test_boxplot_continuous_temporal_ylim_quantile() -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous_temporal(
+        ax=ax, data=[np.arange(51), np.arange(51, 101)], steps=[0, 1], ymin="q0.1", ymax="q0.9"
+    )
+    assert ax.get_ylim() == (10.0, 90.0)
+
+
+def test_boxplot_continuous_temporal_nan_steps() -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous_temporal(
+        ax=ax, data=[np.array([float("nan")]), np.array([])], steps=[0, 1], yscale="auto"
+    )
+    assert ax.get_yscale() == "linear"
+
+
+@pytest.mark.parametrize("yscale", ["log", "symlog"])
+def test_boxplot_continuous_temporal_yscale_auto_skewed(yscale: str) -> None:
+    rng = np.random.default_rng(42)
+    sign = 1.0 if yscale == "log" else -1.0
+    data = [np.exp(rng.standard_normal(10000) * 5) * (sign if i == 0 else 1.0) for i in range(3)]
+    _fig, ax = plt.subplots()
+    boxplot_continuous_temporal(ax=ax, data=data, steps=[0, 1, 2], yscale="auto")
+    assert ax.get_yscale() == yscale
+
+
 def test_boxplot_continuous_temporal_empty() -> None:
     _fig, ax = plt.subplots()
     boxplot_continuous_temporal(ax=ax, data=[], steps=[])
@@ -116,6 +228,35 @@ def test_hist_continuous() -> None:
     hist_continuous(ax=ax, array=np.arange(101))
 
 
+def test_hist_continuous_summary() -> None:
+    _fig, ax = plt.subplots()
+    hist_continuous(
+        ax=ax, summary=HistogramSummary.compute(np.arange(101), nbins=10), yscale="auto"
+    )
+    assert ax.get_xlim() == (0.0, 100.0)
+
+
+def test_hist_continuous_summary_without_quantiles() -> None:
+    _fig, ax = plt.subplots()
+    hist_continuous(
+        ax=ax, summary=HistogramSummary.compute(np.arange(101), nbins=10, quantiles=()), cdf=False
+    )
+    assert len(ax.get_lines()) == 0
+
+
+def test_hist_continuous_no_array_no_summary() -> None:
+    _fig, ax = plt.subplots()
+    with pytest.raises(ValueError, match="array and summary cannot both be None"):
+        hist_continuous(ax)
+
+
+def test_hist_continuous_approximate() -> None:
+    _fig, ax = plt.subplots()
+    with patch("analora.plot.utils.hist.APPROXIMATE_MIN_SIZE", 10):
+        hist_continuous(ax=ax, array=np.arange(101), xmin="q0.1", xmax="q0.9")
+    assert ax.get_xlim() == (10.0, 90.0)
+
+
 @pytest.mark.parametrize("nbins", [1, 2, 4])
 def test_hist_continuous_nbins(nbins: int) -> None:
     _fig, ax = plt.subplots()
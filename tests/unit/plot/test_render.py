@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+
+from analora.plot import (
+    FigureSpec,
+    bar_discrete,
+    hist_continuous,
+    render_figure,
+    render_figures,
+)
+from analora.utils.figure import FigureConfig
+from analora.utils.html import figure2html
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from matplotlib.axes import Axes
+
+
+def _failing_plot(ax: Axes) -> None:  # noqa: ARG001
+    msg = "incorrect data"
+    raise RuntimeError(msg)
+
+
+################################
+#     Tests for FigureSpec     #
+################################
+
+
+def test_figure_spec_repr() -> None:
+    assert (
+        repr(FigureSpec(hist_continuous, kwargs={"array": np.arange(5), "nbins": 2}))
+        == "FigureSpec(func=hist_continuous, kwargs=['array', 'nbins'], figure_kwargs={})"
+    )
+
+
+def test_figure_spec_properties() -> None:
+    spec = FigureSpec(bar_discrete, kwargs={"names": ["a"]}, figure_kwargs={"figsize": (4, 3)})
+    assert spec.func is bar_discrete
+    assert spec.kwargs == {"names": ["a"]}
+    assert spec.figure_kwargs == {"figsize": (4, 3)}
+
+
+def test_figure_spec_default() -> None:
+    spec = FigureSpec(bar_discrete)
+    assert spec.kwargs == {}
+    assert spec.figure_kwargs == {}
+
+
+def test_figure_spec_plot() -> None:
+    func = Mock()
+    _fig, ax = plt.subplots()
+    FigureSpec(func, kwargs={"array": 1}).plot(ax)
+    func.assert_called_once_with(ax, array=1)
+
+
+###################################
+#     Tests for render_figure     #
+###################################
+
+
+def test_render_figure() -> None:
+    html = render_figure(FigureSpec(hist_continuous, kwargs={"array": np.arange(101)}))
+    assert html.startswith('<img style="width:100%; height:auto;" src="data:image/png')
+
+
+def test_render_figure_reactive_false() -> None:
+    html = render_figure(
+        FigureSpec(hist_continuous, kwargs={"array": np.arange(101)}), reactive=False
+    )
+    assert html.startswith('<img src="data:image/png')
+
+
+def test_render_figure_same_as_figure2html() -> None:
+    fig, ax = plt.subplots(figsize=(4, 3))
+    bar_discrete(ax, names=["a", "b"], counts=[5, 2])
+    assert render_figure(
+        FigureSpec(
+            bar_discrete,
+            kwargs={"names": ["a", "b"], "counts": [5, 2]},
+            figure_kwargs={"figsize": (4, 3)},
+        )
+    ) == figure2html(fig, close_fig=True)
+
+
+def test_render_figure_config() -> None:
+    html = render_figure(
+        FigureSpec(hist_continuous, kwargs={"array": np.arange(101)}),
+        config=FigureConfig(format="svg"),
+    )
+    assert html.startswith('<img style="width:100%; height:auto;" src="data:image/svg+xml')
+
+
+def test_render_figure_config_figsize() -> None:
+    config = FigureConfig(figsize=(2, 1), tight=False)
+    spec = FigureSpec(bar_discrete, kwargs={"names": ["a", "b"], "counts": [5, 2]})
+    fig, ax = plt.subplots(figsize=(2, 1))
+    bar_discrete(ax, names=["a", "b"], counts=[5, 2])
+    assert render_figure(spec, config=config) == figure2html(fig, config=config, close_fig=True)
+
+
+def test_render_figure_config_figsize_spec_priority() -> None:
+    config = FigureConfig(figsize=(2, 1), tight=False)
+    spec = FigureSpec(
+        bar_discrete,
+        kwargs={"names": ["a", "b"], "counts": [5, 2]},
+        figure_kwargs={"figsize": (4, 3)},
+    )
+    fig, ax = plt.subplots(figsize=(4, 3))
+    bar_discrete(ax, names=["a", "b"], counts=[5, 2])
+    assert render_figure(spec, config=config) == figure2html(fig, config=config, close_fig=True)
+
+
+def test_render_figure_closes_figure() -> None:
+    num_figures = len(plt.get_fignums())
+    render_figure(FigureSpec(hist_continuous, kwargs={"array": np.arange(101)}))
+    assert len(plt.get_fignums()) == num_figures
+
+
+def test_render_figure_closes_figure_error() -> None:
+    num_figures = len(plt.get_fignums())
+    with pytest.raises(RuntimeError, match="incorrect data"):
+        render_figure(FigureSpec(_failing_plot))
+    assert len(plt.get_fignums()) == num_figures
+
+
+####################################
+#     Tests for render_figures     #
+####################################
+
+
+@pytest.fixture
+def specs() -> list[FigureSpec]:
+    rng = np.random.default_rng(42)
+    return [
+        FigureSpec(hist_continuous, kwargs={"array": rng.standard_normal(1000)}),
+        FigureSpec(bar_discrete, kwargs={"names": ["a", "b", "c"], "counts": [5, 2, 8]}),
+        FigureSpec(hist_continuous, kwargs={"array": np.arange(101), "nbins": 5}),
+    ]
+
+
+def test_render_figures(specs: list[FigureSpec]) -> None:
+    assert render_figures(specs) == [render_figure(spec) for spec in specs]
+
+
+def test_render_figures_empty() -> None:
+    assert render_figures([], num_workers=2) == []
+
+
+def test_render_figures_reactive_false(specs: list[FigureSpec]) -> None:
+    htmls = render_figures(specs, reactive=False)
+    assert all(html.startswith('<img src="data:image/png') for html in htmls)
+
+
+def test_render_figures_num_workers(specs: list[FigureSpec]) -> None:
+    assert render_figures(specs, num_workers=2) == render_figures(specs)
+
+
+def test_render_figures_config(specs: list[FigureSpec]) -> None:
+    config = FigureConfig.from_preset("compact")
+    assert render_figures(specs, config=config, num_workers=2) == [
+        render_figure(spec, config=config) for spec in specs
+    ]
+
+
+def test_render_figures_asset_dir(specs: list[FigureSpec], tmp_path: Path) -> None:
+    config = FigureConfig(asset_dir=tmp_path.joinpath("assets"))
+    htmls = render_figures([*specs, specs[0]], config=config, num_workers=2)
+    assert len(htmls) == 4
+    assert htmls[0] == htmls[3]
+    assert all(
+        html.startswith('<img style="width:100%; height:auto;" src="assets/') for html in htmls
+    )
+    assert len(list(tmp_path.joinpath("assets").iterdir())) == 3
+
+
+def test_render_figures_num_workers_error() -> None:
+    with pytest.raises(RuntimeError, match="incorrect data"):
+        render_figures(
+            [
+                FigureSpec(bar_discrete, kwargs={"names": [], "counts": []}),
+                FigureSpec(_failing_plot),
+            ],
+            num_workers=2,
+        )
+
+
+def test_render_figures_incorrect_num_workers() -> None:
+    with pytest.raises(ValueError, match="Incorrect num_workers: -1"):
+        render_figures([], num_workers=-1)
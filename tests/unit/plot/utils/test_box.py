@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+from matplotlib import cbook
+
+from analora.array import SketchCache
+from analora.plot.utils import compute_box_stats, compute_box_stats_sequence
+
+#######################################
+#     Tests for compute_box_stats     #
+#######################################
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(101),
+        np.array([1.0, 2.0, 3.0, 4.0, 5.0, 100.0]),
+        np.array([-50, 1, 2, 3, 4, 5, 100]),
+        np.random.default_rng(42).standard_normal(1000),
+    ],
+)
+def test_compute_box_stats_same_as_matplotlib(array: np.ndarray) -> None:
+    stats = compute_box_stats(array)
+    expected = cbook.boxplot_stats(array)[0]
+    assert objects_are_allclose(
+        {key: float(stats[key]) for key in ["mean", "med", "q1", "q3", "iqr", "cilo", "cihi"]},
+        {key: float(expected[key]) for key in ["mean", "med", "q1", "q3", "iqr", "cilo", "cihi"]},
+    )
+    assert stats["whislo"] == expected["whislo"]
+    assert stats["whishi"] == expected["whishi"]
+    assert objects_are_equal(stats["fliers"], np.sort(expected["fliers"]).astype(float))
+
+
+def test_compute_box_stats_2d() -> None:
+    stats = compute_box_stats(np.arange(12).reshape(3, 4))
+    assert stats["med"] == 5.5
+    assert stats["whislo"] == 0.0
+    assert stats["whishi"] == 11.0
+
+
+def test_compute_box_stats_nan() -> None:
+    stats = compute_box_stats(np.array([1.0, 2.0, float("nan"), 3.0, 4.0, 5.0, 100.0]))
+    assert stats["med"] == 3.5
+    assert objects_are_equal(stats["fliers"], np.array([100.0]))
+
+
+@pytest.mark.parametrize("array", [np.array([]), np.array([float("nan"), float("nan")])])
+def test_compute_box_stats_empty(array: np.ndarray) -> None:
+    stats = compute_box_stats(array)
+    assert objects_are_equal(
+        stats,
+        {
+            "mean": float("nan"),
+            "med": float("nan"),
+            "q1": float("nan"),
+            "q3": float("nan"),
+            "iqr": float("nan"),
+            "cilo": float("nan"),
+            "cihi": float("nan"),
+            "whislo": float("nan"),
+            "whishi": float("nan"),
+            "fliers": np.array([], dtype=float),
+        },
+        equal_nan=True,
+    )
+
+
+def test_compute_box_stats_label() -> None:
+    assert compute_box_stats(np.arange(10), label="step1")["label"] == "step1"
+
+
+def test_compute_box_stats_no_label() -> None:
+    assert "label" not in compute_box_stats(np.arange(10))
+
+
+def test_compute_box_stats_whis() -> None:
+    stats = compute_box_stats(np.array([1.0, 2.0, 3.0, 4.0, 5.0, 100.0]), whis=100.0)
+    assert stats["whishi"] == 100.0
+    assert stats["fliers"].size == 0
+
+
+def test_compute_box_stats_max_fliers() -> None:
+    array = np.concatenate([np.zeros(100), np.arange(1, 11) * 1000.0])
+    stats = compute_box_stats(array, max_fliers=4)
+    assert objects_are_equal(stats["fliers"], np.array([1000.0, 4000.0, 7000.0, 10000.0]))
+
+
+def test_compute_box_stats_max_fliers_0() -> None:
+    array = np.concatenate([np.zeros(100), np.arange(1, 11) * 1000.0])
+    assert compute_box_stats(array, max_fliers=0)["fliers"].size == 0
+
+
+def test_compute_box_stats_approximate() -> None:
+    array = np.random.default_rng(42).standard_normal(100_000)
+    stats = compute_box_stats(array, approximate=True)
+    expected = compute_box_stats(array)
+    assert objects_are_allclose(
+        [stats["q1"], stats["med"], stats["q3"]],
+        [expected["q1"], expected["med"], expected["q3"]],
+        atol=0.02,
+    )
+    assert stats["whislo"] >= array.min()
+    assert stats["whishi"] <= array.max()
+
+
+def test_compute_box_stats_approximate_small() -> None:
+    assert objects_are_equal(
+        compute_box_stats(np.arange(101), approximate=True), compute_box_stats(np.arange(101))
+    )
+
+
+################################################
+#     Tests for compute_box_stats_sequence     #
+################################################
+
+
+def test_compute_box_stats_sequence() -> None:
+    stats = compute_box_stats_sequence([np.arange(11), np.arange(21), np.array([])])
+    assert len(stats) == 3
+    assert objects_are_equal(
+        [stats[0]["med"], stats[1]["med"], stats[2]["med"]],
+        [5.0, 10.0, float("nan")],
+        equal_nan=True,
+    )
+
+
+def test_compute_box_stats_sequence_empty() -> None:
+    assert compute_box_stats_sequence([]) == []
+
+
+@pytest.mark.parametrize("num_workers", [1, 2, 4])
+def test_compute_box_stats_sequence_num_workers(num_workers: int) -> None:
+    rng = np.random.default_rng(42)
+    data = [rng.standard_normal(1000) for _ in range(5)]
+    assert objects_are_equal(
+        compute_box_stats_sequence(data, num_workers=num_workers),
+        [compute_box_stats(x) for x in data],
+    )
+
+
+def test_compute_box_stats_sequence_max_fliers() -> None:
+    array = np.concatenate([np.zeros(100), np.arange(1, 11) * 1000.0])
+    stats = compute_box_stats_sequence([array, array], max_fliers=2)
+    assert objects_are_equal(
+        [s["fliers"] for s in stats],
+        [np.array([1000.0, 10000.0]), np.array([1000.0, 10000.0])],
+    )
+
+
+@pytest.mark.parametrize("num_workers", [0, -1])
+def test_compute_box_stats_sequence_incorrect_num_workers(num_workers: int) -> None:
+    with pytest.raises(ValueError, match="Incorrect num_workers"):
+        compute_box_stats_sequence([np.arange(10)], num_workers=num_workers)
+
+
+def test_compute_box_stats_sequence_sketch_cache() -> None:
+    rng = np.random.default_rng(42)
+    data = [rng.standard_normal(1000) for _ in range(3)]
+    with SketchCache() as cache:
+        compute_box_stats_sequence(data, approximate=True, num_workers=2)
+        assert repr(cache) == "SketchCache(num_sketches=3)"
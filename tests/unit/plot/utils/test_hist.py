@@ -1,9 +1,141 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
-from analora.plot.utils.hist import adjust_nbins, find_nbins
+from coola import objects_are_allclose, objects_are_equal
+
+from analora.plot.utils import HistogramSummary
+from analora.plot.utils.hist import adjust_nbins, check_array_or_summary, find_nbins
+
+######################################
+#     Tests for HistogramSummary     #
+######################################
+
+
+def test_histogram_summary_repr() -> None:
+    assert (
+        repr(HistogramSummary.compute(np.arange(101), nbins=4, xmin="q0.1", xmax=90))
+        == "HistogramSummary(nbins=4, count=101, nleft=10, nright=10, min=0, max=100)"
+    )
+
+
+def test_histogram_summary_init_incorrect_edges() -> None:
+    with pytest.raises(RuntimeError, match="Incorrect edges shape"):
+        HistogramSummary(counts=np.array([1, 2]), edges=np.array([0.0, 1.0]))
+
+
+def test_histogram_summary_compute() -> None:
+    summary = HistogramSummary.compute(np.arange(101), nbins=4)
+    assert objects_are_equal(summary.counts, np.histogram(np.arange(101), bins=4)[0])
+    assert objects_are_equal(summary.edges, np.array([0.0, 25.0, 50.0, 75.0, 100.0]))
+    assert summary.nbins == 4
+    assert summary.count == 101
+    assert summary.nleft == 0
+    assert summary.nright == 0
+    assert summary.min == 0
+    assert summary.max == 100
+    assert objects_are_equal(summary.quantiles, {0.05: 5.0, 0.95: 95.0})
+
+
+def test_histogram_summary_compute_range() -> None:
+    summary = HistogramSummary.compute(np.arange(101), nbins=4, xmin="q0.1", xmax=90)
+    assert objects_are_equal(summary.counts, np.array([20, 20, 20, 21]))
+    assert objects_are_equal(summary.edges, np.array([10.0, 30.0, 50.0, 70.0, 90.0]))
+    assert summary.nleft == 10
+    assert summary.nright == 10
+
+
+def test_histogram_summary_compute_infinite_range() -> None:
+    summary = HistogramSummary.compute(
+        np.arange(101), nbins=4, xmin=float("-inf"), xmax=float("inf")
+    )
+    assert objects_are_equal(summary.edges, np.array([0.0, 25.0, 50.0, 75.0, 100.0]))
+
+
+def test_histogram_summary_compute_range_outside() -> None:
+    summary = HistogramSummary.compute(np.arange(100), nbins=4, xmin=200)
+    assert objects_are_equal(summary.counts, np.array([0, 0, 0, 0]))
+    assert summary.nleft == 100
+    assert summary.nright == 0
+
+
+def test_histogram_summary_compute_single_value() -> None:
+    summary = HistogramSummary.compute(np.ones(10), nbins=2)
+    assert objects_are_equal(summary.counts, np.array([0, 10]))
+    assert objects_are_equal(summary.edges, np.array([0.5, 1.0, 1.5]))
+    assert summary.count == 10
+
+
+def test_histogram_summary_compute_nan() -> None:
+    summary = HistogramSummary.compute(np.array([0.0, float("nan"), 1.0, 2.0, 3.0]), nbins=2)
+    assert objects_are_equal(summary.counts, np.array([2, 2]))
+    assert summary.count == 4
+
+
+def test_histogram_summary_compute_empty() -> None:
+    summary = HistogramSummary.compute(np.array([]), nbins=2)
+    assert objects_are_equal(summary.counts, np.array([0, 0]))
+    assert summary.count == 0
+    assert objects_are_equal(
+        summary.quantiles, {0.05: float("nan"), 0.95: float("nan")}, equal_nan=True
+    )
+
+
+def test_histogram_summary_compute_quantiles() -> None:
+    assert objects_are_equal(
+        HistogramSummary.compute(np.arange(101), quantiles=[0.25, 0.5]).quantiles,
+        {0.25: 25.0, 0.5: 50.0},
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_histogram_summary_compute_chunk_size(chunk_size: int) -> None:
+    array = np.random.default_rng(42).normal(size=1000)
+    summary = HistogramSummary.compute(array, nbins=10, xmin=-1.0, xmax=1.0, chunk_size=chunk_size)
+    assert objects_are_equal(summary.counts, np.histogram(array, bins=10, range=(-1.0, 1.0))[0])
+    assert summary.nleft == np.count_nonzero(array < -1.0)
+    assert summary.nright == np.count_nonzero(array > 1.0)
+
+
+def test_histogram_summary_compute_approximate() -> None:
+    array = np.random.default_rng(42).normal(size=10_000)
+    with patch("analora.plot.utils.hist.APPROXIMATE_MIN_SIZE", 100):
+        summary = HistogramSummary.compute(array, nbins=10, xmin="q0.01", xmax="q0.99")
+    assert summary.count == 10_000
+    assert summary.min == array.min()
+    assert summary.max == array.max()
+    assert objects_are_allclose(summary.edges[[0, -1]], np.quantile(array, [0.01, 0.99]), atol=0.05)
+
+
+def test_histogram_summary_cdf() -> None:
+    x, cdf = HistogramSummary.compute(np.arange(100), nbins=4, xmin=50).cdf()
+    assert objects_are_allclose(x, np.array([56.125, 68.375, 80.625, 92.875]))
+    assert objects_are_allclose(cdf, np.array([0.63, 0.75, 0.87, 1.0]))
+
+
+def test_histogram_summary_density() -> None:
+    assert objects_are_allclose(
+        HistogramSummary.compute(np.array([0, 1, 1, 3]), nbins=2).density(),
+        np.histogram(np.array([0, 1, 1, 3]), bins=2, density=True)[0],
+    )
+
+
+def test_histogram_summary_rebin() -> None:
+    array = np.random.default_rng(42).normal(size=1000)
+    summary = HistogramSummary.compute(array, nbins=100).rebin(10)
+    assert objects_are_equal(summary.counts, np.histogram(array, bins=10)[0])
+    assert objects_are_allclose(summary.edges, np.histogram(array, bins=10)[1])
+    assert summary.count == 1000
+
+
+@pytest.mark.parametrize("nbins", [0, 3])
+def test_histogram_summary_rebin_incorrect(nbins: int) -> None:
+    with pytest.raises(ValueError, match="Incorrect nbins"):
+        HistogramSummary.compute(np.arange(100), nbins=10).rebin(nbins)
+
 
 ##################################
 #     Tests for adjust_nbins     #
@@ -37,6 +169,24 @@ def test_adjust_nbins_none(dtype: np.dtype) -> None:
     assert adjust_nbins(nbins=None, array=np.array([1, 4, 5, 6], dtype=dtype)) is None
 
 
+############################################
+#     Tests for check_array_or_summary     #
+############################################
+
+
+def test_check_array_or_summary_array() -> None:
+    check_array_or_summary(np.arange(10), summary=None)
+
+
+def test_check_array_or_summary_summary() -> None:
+    check_array_or_summary(None, summary=HistogramSummary.compute(np.arange(10), nbins=2))
+
+
+def test_check_array_or_summary_none() -> None:
+    with pytest.raises(ValueError, match="array and summary cannot both be None"):
+        check_array_or_summary(None, summary=None)
+
+
 ################################
 #     Tests for find_nbins     #
 ################################
@@ -3,7 +3,11 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from analora.plot.utils import auto_yscale_continuous, auto_yscale_discrete
+from analora.plot.utils import (
+    HistogramSummary,
+    auto_yscale_continuous,
+    auto_yscale_discrete,
+)
 
 ############################################
 #     Tests for auto_yscale_continuous     #
@@ -53,6 +57,16 @@ def test_auto_yscale_continuous_symlog(array: np.ndarray) -> None:
     assert auto_yscale_continuous(array, nbins=10) == "symlog"
 
 
+def test_auto_yscale_continuous_summary() -> None:
+    summary = HistogramSummary.compute(np.asarray([1] * 100 + list(range(1, 11))), nbins=10)
+    assert auto_yscale_continuous(summary=summary) == "log"
+
+
+def test_auto_yscale_continuous_no_array_no_summary() -> None:
+    with pytest.raises(ValueError, match="array and summary cannot both be None"):
+        auto_yscale_continuous()
+
+
 ##########################################
 #     Tests for auto_yscale_discrete     #
 ##########################################
@@ -349,3 +349,61 @@ def test_accuracy_state_get_args() -> None:
             "nan_policy": "omit",
         },
     )
+
+
+def test_accuracy_state_class_counts() -> None:
+    assert objects_are_equal(
+        AccuracyState(
+            y_true=np.array([1, 0, 0, 1, 1]),
+            y_pred=np.array([1, 0, 1, 1, 0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        ).class_counts,
+        (np.array([2, 3]), np.array([1, 2])),
+    )
+
+
+def test_accuracy_state_class_counts_cached() -> None:
+    state = AccuracyState(
+        y_true=np.array([1, 0, 0, 1, 1]),
+        y_pred=np.array([1, 0, 1, 1, 0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    )
+    assert state.class_counts is state.class_counts
+
+
+def test_accuracy_state_class_counts_nan_omit() -> None:
+    assert objects_are_equal(
+        AccuracyState(
+            y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+            y_pred=np.array([1, 0, 1, 1, float("nan"), 1]),
+            y_true_name="target",
+            y_pred_name="pred",
+            nan_policy="omit",
+        ).class_counts,
+        (np.array([2, 2]), np.array([1, 2])),
+    )
+
+
+@pytest.mark.parametrize("nan_policy", ["propagate", "raise"])
+def test_accuracy_state_class_counts_nan(nan_policy: str) -> None:
+    assert (
+        AccuracyState(
+            y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+            y_pred=np.array([1, 0, 1, 1, 0, 1]),
+            y_true_name="target",
+            y_pred_name="pred",
+            nan_policy=nan_policy,
+        ).class_counts
+        is None
+    )
+
+
+def test_accuracy_state_class_counts_empty() -> None:
+    assert objects_are_equal(
+        AccuracyState(
+            y_true=np.array([]), y_pred=np.array([]), y_true_name="target", y_pred_name="pred"
+        ).class_counts,
+        (np.array([], dtype=np.int64), np.array([], dtype=np.int64)),
+    )
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+
+from analora.utils.figure import FigureConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def figure() -> plt.Figure:
+    fig, ax = plt.subplots()
+    ax.plot(np.cumsum(np.random.default_rng(42).standard_normal(10000)))
+    yield fig
+    plt.close(fig)
+
+
+##################################
+#     Tests for FigureConfig     #
+##################################
+
+
+def test_figure_config_repr() -> None:
+    assert repr(FigureConfig()) == (
+        "FigureConfig(format='png', dpi=None, figsize=None, quality=None, optimize=False, "
+        "simplify_threshold=None, tight=True, asset_dir=None, asset_url=None)"
+    )
+
+
+def test_figure_config_properties() -> None:
+    config = FigureConfig(format="webp", dpi=100, figsize=[4, 3])
+    assert config.format == "webp"
+    assert config.dpi == 100
+    assert config.figsize == (4, 3)
+    assert config.asset_dir is None
+    assert config.asset_url is None
+
+
+def test_figure_config_asset_dir(tmp_path: Path) -> None:
+    config = FigureConfig(asset_dir=tmp_path.joinpath("assets"))
+    assert config.asset_dir == tmp_path.joinpath("assets")
+    assert config.asset_url == "assets"
+
+
+def test_figure_config_asset_dir_str(tmp_path: Path) -> None:
+    assert FigureConfig(asset_dir=str(tmp_path.joinpath("assets"))).asset_dir == tmp_path.joinpath(
+        "assets"
+    )
+
+
+def test_figure_config_asset_url(tmp_path: Path) -> None:
+    config = FigureConfig(asset_dir=tmp_path, asset_url="../static/")
+    assert config.asset_url == "../static"
+
+
+def test_figure_config_asset_url_empty(tmp_path: Path) -> None:
+    assert FigureConfig(asset_dir=tmp_path, asset_url="").asset_url == ""
+
+
+def test_figure_config_asset_url_root(tmp_path: Path) -> None:
+    assert FigureConfig(asset_dir=tmp_path, asset_url="/").asset_url == "/"
+
+
+@pytest.mark.parametrize(
+    ("format", "mime_type"),
+    [
+        ("png", "image/png"),
+        ("svg", "image/svg+xml"),
+        ("jpeg", "image/jpeg"),
+        ("jpg", "image/jpeg"),
+        ("webp", "image/webp"),
+        ("PNG", "image/png"),
+    ],
+)
+def test_figure_config_mime_type(format: str, mime_type: str) -> None:  # noqa: A002
+    assert FigureConfig(format=format).mime_type == mime_type
+
+
+def test_figure_config_incorrect_format() -> None:
+    with pytest.raises(ValueError, match="Incorrect format: gif"):
+        FigureConfig(format="gif")
+
+
+@pytest.mark.parametrize("quality", [0, 101])
+def test_figure_config_incorrect_quality(quality: int) -> None:
+    with pytest.raises(ValueError, match="Incorrect quality"):
+        FigureConfig(format="jpeg", quality=quality)
+
+
+@pytest.mark.parametrize("simplify_threshold", [-0.1, 2.0])
+def test_figure_config_incorrect_simplify_threshold(simplify_threshold: float) -> None:
+    with pytest.raises(ValueError, match="Incorrect simplify_threshold"):
+        FigureConfig(format="svg", simplify_threshold=simplify_threshold)
+
+
+def test_figure_config_lossy_format_not_available() -> None:
+    with (
+        patch("analora.utils.figure.features.check", return_value=False),
+        pytest.warns(RuntimeWarning, match="Pillow does not support the webp format"),
+    ):
+        config = FigureConfig(format="webp")
+    assert config.format == "png"
+
+
+@pytest.mark.parametrize("name", ["default", "compact", "high", "lossy", "vector"])
+def test_figure_config_from_preset(name: str) -> None:
+    assert isinstance(FigureConfig.from_preset(name), FigureConfig)
+
+
+def test_figure_config_from_preset_compact() -> None:
+    config = FigureConfig.from_preset("compact")
+    assert config.format == "png"
+    assert config.dpi == 72
+
+
+def test_figure_config_from_preset_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect preset: missing"):
+        FigureConfig.from_preset("missing")
+
+
+@pytest.mark.parametrize(
+    ("format", "header"),
+    [
+        ("png", b"\x89PNG"),
+        ("jpeg", b"\xff\xd8\xff"),
+        ("svg", b"<?xml"),
+    ],
+)
+def test_figure_config_encode(figure: plt.Figure, format: str, header: bytes) -> None:  # noqa: A002
+    assert FigureConfig(format=format).encode(figure).startswith(header)
+
+
+def test_figure_config_encode_webp(figure: plt.Figure) -> None:
+    data = FigureConfig(format="webp").encode(figure)
+    assert data[:4] == b"RIFF"
+    assert data[8:12] == b"WEBP"
+
+
+def test_figure_config_encode_dpi(figure: plt.Figure) -> None:
+    assert len(FigureConfig(dpi=50).encode(figure)) < len(FigureConfig(dpi=200).encode(figure))
+
+
+def test_figure_config_encode_optimize(figure: plt.Figure) -> None:
+    assert len(FigureConfig(optimize=True).encode(figure)) <= len(FigureConfig().encode(figure))
+
+
+def test_figure_config_encode_quality(figure: plt.Figure) -> None:
+    assert len(FigureConfig(format="jpeg", quality=10).encode(figure)) < len(
+        FigureConfig(format="jpeg", quality=95).encode(figure)
+    )
+
+
+def test_figure_config_encode_simplify_threshold(figure: plt.Figure) -> None:
+    assert len(FigureConfig(format="svg", simplify_threshold=1.0).encode(figure)) < len(
+        FigureConfig(format="svg", simplify_threshold=0.0).encode(figure)
+    )
+
+
+def test_figure_config_encode_simplify_threshold_restores_rc(figure: plt.Figure) -> None:
+    threshold = plt.rcParams["path.simplify_threshold"]
+    FigureConfig(format="svg", simplify_threshold=1.0).encode(figure)
+    assert plt.rcParams["path.simplify_threshold"] == threshold
+
+
+def test_figure_config_encode_tight_false(figure: plt.Figure) -> None:
+    assert FigureConfig(tight=False).encode(figure).startswith(b"\x89PNG")
+
+
+@pytest.mark.parametrize("format", ["png", "svg", "jpeg", "webp"])
+def test_figure_config_encode_deterministic(format: str) -> None:  # noqa: A002
+    config = FigureConfig(format=format)
+    data = []
+    for _ in range(2):
+        fig, ax = plt.subplots()
+        ax.plot(np.arange(10))
+        data.append(config.encode(fig))
+        plt.close(fig)
+    assert data[0] == data[1]
+
+
+@pytest.mark.parametrize(("fmt", "suffix"), [("png", "png"), ("jpeg", "jpg"), ("svg", "svg")])
+def test_figure_config_write_asset(
+    tmp_path: Path, figure: plt.Figure, fmt: str, suffix: str
+) -> None:
+    config = FigureConfig(format=fmt, asset_dir=tmp_path.joinpath("assets"))
+    data = config.encode(figure)
+    url = config.write_asset(data)
+    name = url.split("/")[-1]
+    assert url == f"assets/{name}"
+    assert name.endswith(f".{suffix}")
+    assert tmp_path.joinpath("assets", name).read_bytes() == data
+
+
+def test_figure_config_write_asset_asset_url_empty(tmp_path: Path) -> None:
+    config = FigureConfig(asset_dir=tmp_path, asset_url="")
+    url = config.write_asset(b"image")
+    assert "/" not in url
+    assert tmp_path.joinpath(url).read_bytes() == b"image"
+
+
+def test_figure_config_write_asset_asset_url_root(tmp_path: Path) -> None:
+    config = FigureConfig(asset_dir=tmp_path, asset_url="/")
+    url = config.write_asset(b"image")
+    assert url.startswith("/")
+    assert not url.startswith("//")
+    assert tmp_path.joinpath(url[1:]).read_bytes() == b"image"
+
+
+def test_figure_config_write_asset_deduplicate(tmp_path: Path) -> None:
+    config = FigureConfig(asset_dir=tmp_path)
+    url1 = config.write_asset(b"image1")
+    url2 = config.write_asset(b"image2")
+    assert url1 != url2
+    assert config.write_asset(b"image1") == url1
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [url1.split("/")[-1], url2.split("/")[-1]]
+    )
+
+
+def test_figure_config_write_asset_existing_file(tmp_path: Path) -> None:
+    config = FigureConfig(asset_dir=tmp_path)
+    url = config.write_asset(b"image")
+    path = tmp_path.joinpath(url.split("/")[-1])
+    mtime = path.stat().st_mtime_ns
+    with patch("analora.utils.figure.tempfile.mkstemp") as mkstemp:
+        config.write_asset(b"image")
+    mkstemp.assert_not_called()
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_figure_config_write_asset_no_asset_dir() -> None:
+    with pytest.raises(RuntimeError, match="the asset directory is not set"):
+        FigureConfig().write_asset(b"image")
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+from typing import TYPE_CHECKING
+
 import pytest
 from matplotlib import pyplot as plt
 
+from analora.utils.figure import FigureConfig
 from analora.utils.html import (
     MISSING_FIGURE_MESSAGE,
     figure2html,
@@ -12,6 +16,9 @@ from analora.utils.html import (
     valid_h_tag,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 #############################
 #     Tests for tags2id     #
 #############################
@@ -119,3 +126,47 @@ def test_figure2html_reactive(reactive: bool) -> None:
 
 def test_figure2html_none() -> None:
     assert figure2html(None) == MISSING_FIGURE_MESSAGE
+
+
+def test_figure2html_default() -> None:
+    fig, _ = plt.subplots()
+    assert figure2html(fig).startswith(
+        '<img style="width:100%; height:auto;" src="data:image/png;charset=utf-8;base64, '
+    )
+
+
+@pytest.mark.parametrize(
+    ("config", "mime_type"),
+    [
+        (FigureConfig(format="svg"), "image/svg+xml"),
+        (FigureConfig(format="jpeg", quality=50), "image/jpeg"),
+        (FigureConfig.from_preset("compact"), "image/png"),
+    ],
+)
+def test_figure2html_config(config: FigureConfig, mime_type: str) -> None:
+    fig, _ = plt.subplots()
+    assert figure2html(fig, reactive=False, config=config).startswith(
+        f'<img src="data:{mime_type};charset=utf-8;base64, '
+    )
+
+
+def test_figure2html_asset_dir(tmp_path: Path) -> None:
+    fig, _ = plt.subplots()
+    config = FigureConfig(asset_dir=tmp_path.joinpath("assets"))
+    html = figure2html(fig, config=config)
+    files = list(tmp_path.joinpath("assets").iterdir())
+    assert len(files) == 1
+    assert html == f'<img style="width:100%; height:auto;" src="assets/{files[0].name}">'
+    assert files[0].name == f"{hashlib.sha256(files[0].read_bytes()).hexdigest()}.png"
+
+
+def test_figure2html_asset_dir_deduplicate(tmp_path: Path) -> None:
+    config = FigureConfig(format="svg", asset_dir=tmp_path, asset_url="figures")
+    htmls = []
+    for _ in range(3):
+        fig, ax = plt.subplots()
+        ax.plot([1, 2, 3])
+        htmls.append(figure2html(fig, reactive=False, config=config, close_fig=True))
+    assert htmls[0] == htmls[1] == htmls[2]
+    assert htmls[0].startswith('<img src="figures/')
+    assert len(list(tmp_path.iterdir())) == 1
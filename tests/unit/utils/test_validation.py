@@ -2,7 +2,23 @@ from __future__ import annotations
 
 import pytest
 
-from analora.utils.validation import check_positive
+from analora.utils.validation import check_num_workers, check_positive
+
+#######################################
+#     Tests for check_num_workers     #
+#######################################
+
+
+@pytest.mark.parametrize("num_workers", [0, 1, 4])
+def test_check_num_workers_correct(num_workers: int) -> None:
+    check_num_workers(num_workers)
+
+
+@pytest.mark.parametrize("num_workers", [-1, -2])
+def test_check_num_workers_incorrect(num_workers: int) -> None:
+    with pytest.raises(ValueError, match=f"Incorrect num_workers: {num_workers}"):
+        check_num_workers(num_workers)
+
 
 ####################################
 #     Tests for check_positive     #